@@ -0,0 +1,75 @@
+"""Benchmark commit ingestion: GitPython per-commit diffs vs. streamed git log.
+
+Builds a synthetic repository in a temporary directory and times both
+strategies over the full history. Run with::
+
+    python benchmarks/bench_commit_ingestion.py --commits 2000 --files-per-commit 5
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import git
+from synthetic_repo import build_repo
+
+from kittylog.git_log import get_log_commits, lazy_files
+
+
+def legacy_commits(repo: git.Repo) -> list[dict]:
+    """Per-commit GitPython extraction used before streaming ingestion."""
+    commits = []
+    for commit in repo.iter_commits("HEAD"):
+        parent = commit.parents[0] if commit.parents else git.NULL_TREE
+        commits.append(
+            {
+                "hash": commit.hexsha,
+                "short_hash": commit.hexsha[:8],
+                "message": commit.message.strip(),
+                "author": str(commit.author),
+                "date": commit.committed_datetime,
+                "summary": commit.summary,
+                "files": [item.a_path for item in commit.diff(parent, create_patch=False)],
+            }
+        )
+    return commits
+
+
+def timed(label: str, func, repeat: int) -> tuple[float, list[dict]]:
+    """Return the best wall time of ``repeat`` runs and the last result."""
+    best = float("inf")
+    result: list[dict] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<12} {best * 1000:10.1f} ms  ({len(result)} commits)")
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commits", type=int, default=1000)
+    parser.add_argument("--files-per-commit", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp)
+        build_repo(path, args.commits, args.files_per_commit)
+        repo = git.Repo(path)
+
+        legacy_time, legacy = timed("gitpython", lambda: legacy_commits(repo), args.repeat)
+        stream_time, streamed = timed("git log -z", lambda: get_log_commits("HEAD", cwd=tmp), args.repeat)
+
+        # File lists deferred to a loader, as used for boundary discovery
+        timed("no files", lambda: get_log_commits("HEAD", cwd=tmp, files=lazy_files(tmp)), args.repeat)
+
+        if legacy != streamed:
+            raise SystemExit("Mismatch between GitPython and streamed commit data")
+        print(f"speedup      {legacy_time / stream_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
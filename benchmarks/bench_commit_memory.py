@@ -0,0 +1,92 @@
+"""Benchmark commit memory: per-commit dictionaries vs. CommitRecord.
+
+Builds synthetic commits shaped like a large history (a few hundred authors,
+several changed files per commit) and reports the memory retained by each
+representation, measured with tracemalloc. Run with::
+
+    python benchmarks/bench_commit_memory.py --commits 500000 --files-per-commit 5
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+from kittylog.commit_record import CommitRecord
+
+TZ = timezone(timedelta(hours=2))
+
+
+def raw_commits(commits: int, files_per_commit: int, authors: int) -> list[tuple[str, str, str, datetime, list[str]]]:
+    """Commit fields as freshly decoded from git (a new author string per commit)."""
+    return [
+        (
+            f"{i:040x}",
+            f"feat: change {i}\n\nBody for commit {i}",
+            f"Author {i % authors}",
+            datetime.fromtimestamp(1_600_000_000 + i * 60, TZ),
+            [f"src/module_{(i + j) % 200}/file_{j}.py" for j in range(files_per_commit)],
+        )
+        for i in range(commits)
+    ]
+
+
+def legacy_commits(raw: list[tuple[str, str, str, datetime, list[str]]]) -> list[dict]:
+    """Commit dictionaries as built before CommitRecord."""
+    return [
+        {
+            "hash": hexsha,
+            "short_hash": hexsha[:8],
+            "message": message,
+            "author": author,
+            "date": date,
+            "summary": message.split("\n", 1)[0],
+            "files": files,
+        }
+        for hexsha, message, author, date, files in raw
+    ]
+
+
+def record_commits(raw: list[tuple[str, str, str, datetime, list[str]]]) -> list[CommitRecord]:
+    """Commit records as built by git_log and commit_index."""
+    return [
+        CommitRecord.from_datetime(hexsha, message, author, date, files) for hexsha, message, author, date, files in raw
+    ]
+
+
+def measure(label: str, build: Callable[[], list]) -> int:
+    """Print and return the bytes still allocated after ``build`` returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} {retained / 1e6:10.1f} MB  ({retained / max(1, len(result)):.0f} B/commit)")
+    del result
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commits", type=int, default=100_000)
+    parser.add_argument("--files-per-commit", type=int, default=5)
+    parser.add_argument("--authors", type=int, default=300)
+    args = parser.parse_args()
+
+    # The raw fields are built fresh inside each measurement so that every
+    # representation pays for the strings it keeps alive
+    def build_legacy() -> list:
+        return legacy_commits(raw_commits(args.commits, args.files_per_commit, args.authors))
+
+    def build_records() -> list:
+        return record_commits(raw_commits(args.commits, args.files_per_commit, args.authors))
+
+    legacy = measure("dict", build_legacy)
+    records = measure("CommitRecord", build_records)
+    print(f"savings      {(1 - records / legacy) * 100:10.1f} %")
+
+
+if __name__ == "__main__":
+    main()
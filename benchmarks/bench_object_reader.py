@@ -0,0 +1,84 @@
+"""Benchmark object reads: GitPython, one git process per object, and ObjectReader.
+
+Builds a synthetic repository in a temporary directory and reports the
+commit objects read per second by each strategy: GitPython attribute
+access, one ``git cat-file`` subprocess per object (sampled, as it is
+slow), and the persistent ``git cat-file --batch-command`` reader, both
+one request at a time and pipelined. Run with::
+
+    python benchmarks/bench_object_reader.py --commits 5000
+"""
+
+import argparse
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import git
+from synthetic_repo import build_repo
+
+from kittylog.commit_record import FileListLoader
+from kittylog.git_log import list_revisions
+from kittylog.git_objects import ObjectReader, parse_commit_object
+
+
+def gitpython_reads(repo: git.Repo, hashes: list[str]) -> int:
+    """Read message, author and date of each commit through GitPython."""
+    for hexsha in hashes:
+        commit = repo.commit(hexsha)
+        _ = (commit.message, commit.author.name, commit.committed_datetime)
+    return len(hashes)
+
+
+def subprocess_reads(cwd: str, hashes: list[str]) -> int:
+    """Read each commit with its own ``git cat-file`` process."""
+    for hexsha in hashes:
+        subprocess.run(["git", "cat-file", "commit", hexsha], cwd=cwd, capture_output=True, check=True)
+    return len(hashes)
+
+
+def reader_reads(reader: ObjectReader, hashes: list[str], pipelined: bool) -> int:
+    """Read and parse each commit through the persistent reader."""
+    files = FileListLoader(dict)
+    objects = reader.read_many(hashes) if pipelined else [reader.read(hexsha) for hexsha in hashes]
+    for obj in objects:
+        assert obj is not None
+        parse_commit_object(obj.hexsha, obj.data, files)
+    return len(objects)
+
+
+def measure(label: str, func: Callable[[], int], repeat: int) -> float:
+    """Print and return the best objects-per-second rate of ``repeat`` runs."""
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = func()
+        best = max(best, count / (time.perf_counter() - start))
+    print(f"{label:<22} {best:12,.0f} objects/s")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commits", type=int, default=2000)
+    parser.add_argument("--subprocess-sample", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        build_repo(Path(tmp), args.commits, files_per_commit=1)
+        hashes = list_revisions("HEAD", cwd=tmp)
+        repo = git.Repo(tmp)
+
+        gitpython = measure("gitpython", lambda: gitpython_reads(repo, hashes), args.repeat)
+        measure("subprocess per object", lambda: subprocess_reads(tmp, hashes[: args.subprocess_sample]), 1)
+        with ObjectReader(tmp) as reader:
+            measure("reader, one at a time", lambda: reader_reads(reader, hashes, pipelined=False), args.repeat)
+            pipelined = measure("reader, pipelined", lambda: reader_reads(reader, hashes, pipelined=True), args.repeat)
+        print(f"speedup                {pipelined / gitpython:12.1f}x over gitpython")
+
+
+if __name__ == "__main__":
+    main()
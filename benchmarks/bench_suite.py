@@ -0,0 +1,173 @@
+"""Benchmark suite: core kittylog operations on a synthetic repository.
+
+Generates a repository of the chosen scale (see ``synthetic_repo.SCALES``),
+times each operation as the best of ``--repeat`` runs with kittylog's
+caches cleared before every run, and compares the results with the stored
+baselines. Run with::
+
+    python benchmarks/bench_suite.py --scale small            # report and compare
+    python benchmarks/bench_suite.py --scale small --save     # record the baseline
+    python benchmarks/bench_suite.py --scale medium --check   # exit 1 on a regression
+
+Baselines are kept in ``benchmarks/baselines.json``, keyed by scale and
+benchmark name. Timings depend on the machine, so none are committed:
+record the baseline on the machine that runs the comparison. ``--check``
+fails when there is no baseline for the scale rather than passing with
+nothing to compare against. Generating the large scale takes
+about half a minute; pass ``--repo DIR`` to build the repository once and
+reuse it.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from synthetic_repo import SCALES, Scale, build_scale, synthetic_ai_output, synthetic_changelog
+
+from kittylog.cache import clear_all_caches
+from kittylog.changelog.boundaries import find_existing_boundaries
+from kittylog.commit_analyzer import get_all_commits_chronological
+from kittylog.commit_index import find_index_path
+from kittylog.constants import EnvDefaults
+from kittylog.postprocess import clean_changelog_content
+from kittylog.prompt import build_changelog_prompt
+from kittylog.prompt.packer import prompt_token_budget
+from kittylog.tag_operations import get_all_boundaries
+
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+
+# Commits given to the prompt builder, as for one large release
+PROMPT_COMMITS = 500
+
+
+@dataclass
+class Benchmark:
+    """One timed operation; ``setup`` runs untimed before every run."""
+
+    name: str
+    run: Callable[[], object]
+    setup: Callable[[], None] = clear_all_caches
+
+
+def _drop_commit_index() -> None:
+    clear_all_caches()
+    path = find_index_path()
+    if path is not None:
+        path.unlink(missing_ok=True)
+
+
+def build_suite(scale: Scale) -> list[Benchmark]:
+    """The benchmarks run against a repository of ``scale``."""
+    model = EnvDefaults.MODEL
+    changelog = synthetic_changelog(max(scale.tags, 10))
+    ai_output = synthetic_ai_output(bullets=50)
+
+    def prompt() -> object:
+        commits = get_all_commits_chronological()[-PROMPT_COMMITS:]
+        return build_changelog_prompt(
+            commits,
+            tag="v99.0.0",
+            from_boundary="v98.0.0",
+            model=model,
+            token_budget=prompt_token_budget(model, EnvDefaults.MAX_OUTPUT_TOKENS),
+        )
+
+    return [
+        Benchmark("commits/cold-index", get_all_commits_chronological, setup=_drop_commit_index),
+        Benchmark("commits/warm-index", get_all_commits_chronological),
+        Benchmark("boundaries/tags", lambda: get_all_boundaries("tags")),
+        Benchmark("boundaries/dates", lambda: get_all_boundaries("dates", date_grouping="daily")),
+        Benchmark("boundaries/gaps", lambda: get_all_boundaries("gaps", gap_threshold_hours=4.0)),
+        Benchmark("find_existing_boundaries", lambda: find_existing_boundaries(changelog), setup=lambda: None),
+        Benchmark("build_changelog_prompt", prompt),
+        Benchmark("clean_changelog_content", lambda: clean_changelog_content(ai_output), setup=lambda: None),
+    ]
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int) -> float:
+    """Return the best wall time of ``repeat`` runs in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        benchmark.setup()
+        start = time.perf_counter()
+        benchmark.run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@contextmanager
+def _repository(scale: Scale, path: Path | None) -> Iterator[Path]:
+    if path is not None:
+        if not (path / ".git").exists():
+            print(f"Generating {scale.commits} commits and {scale.tags} tags in {path} ...", file=sys.stderr)
+            build_scale(path, scale)
+        yield path
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Generating {scale.commits} commits and {scale.tags} tags ...", file=sys.stderr)
+        build_scale(Path(tmp), scale)
+        yield Path(tmp)
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], tolerance: float) -> list[str]:
+    """Print results next to the baseline and return the names of regressed benchmarks."""
+    regressions = []
+    print(f"{'benchmark':<26} {'time':>10} {'baseline':>10} {'ratio':>7}")
+    for name, seconds in results.items():
+        line = f"{name:<26} {seconds * 1000:8.2f}ms"
+        reference = baseline.get(name)
+        if reference:
+            ratio = seconds / reference
+            line += f" {reference * 1000:8.2f}ms {ratio:6.2f}x"
+            if ratio > tolerance:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=SCALES, default="small")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--repo", type=Path, help="Reuse (or create) the synthetic repository in this directory")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="Store the results as the baseline for this scale")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if any benchmark regressed")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Slowdown ratio counted as a regression")
+    parser.add_argument("--json", type=Path, help="Also write the results to this file")
+    args = parser.parse_args()
+
+    scale = SCALES[args.scale]
+    baselines = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    if args.check and args.scale not in baselines:
+        raise SystemExit(f"No {args.scale} baseline in {args.baseline}; record one with --save first")
+    original_cwd = Path.cwd()
+    with _repository(scale, args.repo) as repo:
+        os.chdir(repo)
+        try:
+            results = {benchmark.name: time_benchmark(benchmark, args.repeat) for benchmark in build_suite(scale)}
+        finally:
+            clear_all_caches()
+            os.chdir(original_cwd)
+
+    regressions = compare(results, baselines.get(args.scale, {}), args.tolerance)
+    if args.json:
+        args.json.write_text(json.dumps({args.scale: results}, indent=2) + "\n")
+    if args.save:
+        baselines[args.scale] = results
+        args.baseline.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"Saved {args.scale} baseline to {args.baseline}")
+    if args.check and regressions:
+        raise SystemExit(f"{len(regressions)} benchmark(s) regressed: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
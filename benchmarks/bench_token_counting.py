@@ -0,0 +1,91 @@
+"""Benchmark token counting: legacy chars/4 heuristic vs. the tokenizer layer.
+
+Builds a corpus from a repository's commit messages and text files, then
+reports throughput for each counter and, when a reference is available, the
+mean absolute error of each against exact tiktoken counts. The reference
+needs the encoding's rank file locally (``KITTYLOG_TOKENIZER_DIR`` or the
+tiktoken cache); pass ``--download`` to let tiktoken fetch it. Run with::
+
+    python benchmarks/bench_token_counting.py --repo . --encoding cl100k_base
+"""
+
+import argparse
+import subprocess
+import time
+from pathlib import Path
+
+from kittylog import tokenizer
+from kittylog.tokenizer import BPETokenizer, HeuristicTokenizer, PretokenEstimator, TiktokenTokenizer, Tokenizer
+
+
+def load_corpus(repo: Path, max_files: int) -> list[str]:
+    """Commit messages plus Markdown and Python files from ``repo``."""
+    log = subprocess.run(
+        ["git", "log", "-z", "--format=%B"], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+    texts = [message for message in log.split("\0") if message.strip()]
+    files = sorted([*repo.rglob("*.md"), *repo.rglob("*.py")])[:max_files]
+    texts.extend(path.read_text(encoding="utf-8", errors="replace") for path in files if ".git" not in path.parts)
+    return texts
+
+
+def reference_tokenizer(encoding: str, download: bool) -> Tokenizer | None:
+    """Exact tokenizer for ``encoding``, or None if its ranks are not available."""
+    ranks = tokenizer._find_bpe_ranks(encoding)
+    if ranks is not None:
+        return TiktokenTokenizer(encoding, ranks)
+    if download:
+        import tiktoken
+
+        ranks = tiktoken.get_encoding(encoding)._mergeable_ranks
+        return TiktokenTokenizer(encoding, ranks)
+    return None
+
+
+def timed(label: str, counter: Tokenizer, texts: list[str], reference: list[int] | None) -> list[int]:
+    """Print throughput (and error against ``reference``) for one counter."""
+    chars = sum(len(text) for text in texts)
+    start = time.perf_counter()
+    counts = [counter.count(text) for text in texts]
+    elapsed = time.perf_counter() - start
+    line = f"{label:<12} {elapsed * 1000:9.1f} ms  {chars / elapsed / 1e6:7.2f} MB/s  {sum(counts):>9} tokens"
+    if reference is not None:
+        error = sum(abs(c - r) for c, r in zip(counts, reference, strict=True)) / max(1, sum(reference))
+        line += f"  error {error * 100:5.1f}%"
+    print(line)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repo", type=Path, default=Path())
+    parser.add_argument("--encoding", choices=["cl100k_base", "o200k_base"], default="cl100k_base")
+    parser.add_argument("--max-files", type=int, default=200)
+    parser.add_argument("--download", action="store_true", help="Let tiktoken download the reference ranks")
+    args = parser.parse_args()
+
+    texts = load_corpus(args.repo, args.max_files)
+    print(f"corpus: {len(texts)} texts, {sum(len(t) for t in texts) / 1e6:.2f} MB\n")
+
+    exact = reference_tokenizer(args.encoding, args.download)
+    reference = None
+    if exact is not None:
+        reference = timed("tiktoken", exact, texts, None)
+    else:
+        print("(no local ranks for the reference; accuracy not reported)")
+
+    timed("chars/4", HeuristicTokenizer(), texts, reference)
+    timed("estimate", PretokenEstimator(args.encoding), texts, reference)
+    if exact is not None:
+        timed("bpe", BPETokenizer(args.encoding, exact._encoder._mergeable_ranks), texts, reference)
+
+    model = "gpt-4o" if args.encoding == "o200k_base" else "gpt-4"
+    tokenizer.clear_token_count_cache()
+    for label in ("cold memo", "warm memo"):
+        start = time.perf_counter()
+        tokenizer.count_tokens_batch(texts, model)
+        print(f"{label:<12} {(time.perf_counter() - start) * 1000:9.1f} ms  (count_tokens_batch)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Synthetic git repositories and changelogs for kittylog benchmarks.
+
+Histories are written with a single ``git fast-import`` process, which
+creates 100k commits in seconds instead of the minutes that ``git commit``
+per commit would take. Commits land ten minutes apart with a six-hour
+pause every :data:`GAP_EVERY` commits (so gap mode finds boundaries) and
+tags are spread evenly over history, alternating between annotated and
+lightweight. Generate a repository on its own with::
+
+    python benchmarks/synthetic_repo.py /tmp/big-repo --scale large
+"""
+
+import argparse
+import os
+import subprocess
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "Bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+}
+
+START_TIMESTAMP = 1_600_000_000
+COMMIT_INTERVAL = 10 * 60
+GAP_EVERY = 25
+GAP_SECONDS = 6 * 60 * 60
+
+AUTHORS = 50
+MODULES = 200
+
+# Conventional-commit prefixes so prompts and post-processing see realistic subjects
+_PREFIXES = ("feat", "fix", "refactor", "docs", "perf", "test", "chore")
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Size of a synthetic repository."""
+
+    commits: int
+    tags: int
+    files_per_commit: int = 3
+
+
+SCALES = {
+    "tiny": Scale(commits=200, tags=5),
+    "small": Scale(commits=1_000, tags=10),
+    "medium": Scale(commits=10_000, tags=1_000),
+    "large": Scale(commits=100_000, tags=10_000),
+}
+
+
+def tag_name(index: int) -> str:
+    """Semantic version of the ``index``-th tag (v0.0.1, v0.0.2, ...)."""
+    number = index + 1
+    return f"v{number // 10_000}.{number // 100 % 100}.{number % 100}"
+
+
+def commit_timestamp(index: int) -> int:
+    """Committer timestamp of the ``index``-th commit."""
+    return START_TIMESTAMP + index * COMMIT_INTERVAL + (index // GAP_EVERY) * GAP_SECONDS
+
+
+def _fast_import_stream(scale: Scale) -> Iterator[str]:
+    tag_every = max(1, scale.commits // scale.tags) if scale.tags else 0
+    for i in range(scale.commits):
+        prefix = _PREFIXES[i % len(_PREFIXES)]
+        message = f"{prefix}: change {i} in module {i % MODULES}\n\nBody for commit {i}\n"
+        author = f"Author {i % AUTHORS} <author{i % AUTHORS}@example.com>"
+        lines = [
+            "commit refs/heads/main",
+            f"mark :{i + 1}",
+            f"author {author} {commit_timestamp(i)} +0000",
+            f"committer {author} {commit_timestamp(i)} +0000",
+            f"data {len(message.encode())}",
+            message,
+        ]
+        for j in range(scale.files_per_commit):
+            content = f"commit {i} file {j}\n"
+            lines.append(f"M 100644 inline src/module_{(i + j) % MODULES}/file_{j}.py")
+            lines.append(f"data {len(content.encode())}")
+            lines.append(content)
+        lines.append("")
+        yield "\n".join(lines) + "\n"
+
+        tag_index = (i + 1) // tag_every - 1 if tag_every and (i + 1) % tag_every == 0 else -1
+        if 0 <= tag_index < scale.tags:
+            name = tag_name(tag_index)
+            if tag_index % 2:
+                yield f"reset refs/tags/{name}\nfrom :{i + 1}\n\n"
+            else:
+                note = f"Release {name}\n"
+                yield (
+                    f"tag {name}\nfrom :{i + 1}\n"
+                    f"tagger Bench <bench@example.com> {commit_timestamp(i)} +0000\n"
+                    f"data {len(note.encode())}\n{note}\n"
+                )
+
+
+def build_repo(path: Path, commits: int, files_per_commit: int = 3, tags: int = 0) -> None:
+    """Create a linear history with ``commits`` commits and ``tags`` tags using git fast-import.
+
+    Args:
+        path: Directory to create the repository in
+        commits: Number of commits
+        files_per_commit: Files changed by each commit
+        tags: Number of tags, spread evenly over history
+    """
+    env = {**os.environ, **GIT_ENV}
+    subprocess.run(["git", "init", "-q", str(path)], check=True, env=env)
+    process = subprocess.Popen(["git", "fast-import", "--quiet"], cwd=path, stdin=subprocess.PIPE, env=env)
+    assert process.stdin is not None  # for mypy
+    with process.stdin:
+        for chunk in _fast_import_stream(Scale(commits, tags, files_per_commit)):
+            process.stdin.write(chunk.encode())
+    if process.wait() != 0:
+        raise subprocess.CalledProcessError(process.returncode, "git fast-import")
+    subprocess.run(["git", "symbolic-ref", "HEAD", "refs/heads/main"], cwd=path, check=True, env=env)
+
+
+def build_scale(path: Path, scale: Scale) -> None:
+    """Create a repository of a predefined size."""
+    build_repo(path, scale.commits, scale.files_per_commit, scale.tags)
+
+
+def synthetic_changelog(tags: int, bullets_per_section: int = 4) -> str:
+    """A Keep a Changelog document with one section per tag, newest first."""
+    sections = ["# Changelog", "", "## [Unreleased]", ""]
+    for index in reversed(range(tags)):
+        sections.append(f"## [{tag_name(index).lstrip('v')}] - 2024-01-01")
+        sections.append("")
+        sections.append("### Added")
+        sections.append("")
+        sections.extend(f"- Change {index}.{bullet} in module {bullet}" for bullet in range(bullets_per_section))
+        sections.append("")
+    return "\n".join(sections)
+
+
+def synthetic_ai_output(bullets: int) -> str:
+    """Raw model output with the clutter post-processing removes."""
+    lines = ["Here is the changelog entry:", "", "```markdown", "## [1.2.3] - 2024-01-01", ""]
+    for section in ("Added", "Changed", "Fixed", "Security"):
+        lines.append(f"### {section}")
+        lines.append("")
+        area = section.lower()
+        lines.extend(f"- **Item {i}**: Improved handling of case {i} in the {area} path" for i in range(bullets))
+        lines.append("")
+    lines.append("```")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--scale", choices=SCALES, default="small")
+    args = parser.parse_args()
+    build_scale(args.path, SCALES[args.scale])
+    scale = SCALES[args.scale]
+    print(f"Created {args.path} with {scale.commits} commits and {scale.tags} tags")
+
+
+if __name__ == "__main__":
+    main()
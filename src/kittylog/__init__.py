@@ -1,9 +1,29 @@
 """Changelog Updater - AI-powered changelog updates using git tags."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from kittylog.__version__ import __version__
-from kittylog.changelog.updater import update_changelog
-from kittylog.commit_analyzer import get_commits_between_tags
-from kittylog.tag_operations import determine_new_tags
+
+if TYPE_CHECKING:
+    from kittylog.changelog.updater import update_changelog
+    from kittylog.commit_analyzer import get_commits_between_tags
+    from kittylog.tag_operations import determine_new_tags
+
+# The public API pulls in git and the AI stack; import it on first use so the CLI starts fast
+_LAZY_EXPORTS = {
+    "determine_new_tags": "kittylog.tag_operations",
+    "get_commits_between_tags": "kittylog.commit_analyzer",
+    "update_changelog": "kittylog.changelog.updater",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
+
 
 __all__ = [
     "__version__",
@@ -4,7 +4,10 @@ This module handles AI model integration for generating changelog entries from c
 Based on gac's AI module but specialized for changelog generation.
 """
 
-from collections.abc import Generator
+import threading
+from collections.abc import Generator, Iterable, Mapping, Sequence
+from functools import partial
+from typing import Any
 
 from rich.console import Console
 from rich.panel import Panel
@@ -13,17 +16,81 @@ from kittylog.ai_utils import generate_with_retries, generate_with_retries_strea
 from kittylog.config import load_config
 from kittylog.constants import Audiences, Limits
 from kittylog.errors import AIError
+from kittylog.map_reduce import CompleteFunc, generate_map_reduce, needs_map_reduce
 from kittylog.prompt import build_changelog_prompt, clean_changelog_content
 from kittylog.prompt.json_schema import format_changelog_from_json
+from kittylog.prompt.packer import prompt_token_budget
 from kittylog.providers import PROVIDER_REGISTRY, STREAMING_PROVIDER_REGISTRY
+from kittylog.response_cache import get_cached_response, make_cache_key, store_response
 from kittylog.utils import count_tokens
-from kittylog.utils.logging import get_logger, log_error, log_info
+from kittylog.utils.logging import get_logger, log_debug, log_error, log_info
 
 logger = get_logger(__name__)
 
 
+def _format_diff_section(diff_content: str) -> str:
+    """Format diff content for the user prompt, truncated to Limits.MAX_DIFF_LENGTH characters."""
+    if not diff_content:
+        return ""
+    if len(diff_content) > Limits.MAX_DIFF_LENGTH:
+        diff_content = diff_content[: Limits.MAX_DIFF_LENGTH] + "\n\n... (diff content truncated for brevity)"
+    return f"\n\n## Detailed Changes (Git Diff):\n\n{diff_content}"
+
+
+def _generate_text(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    *,
+    temperature: float,
+    max_tokens: int,
+    max_retries: int,
+    quiet: bool,
+    use_cache: bool,
+    tag: str | None,
+) -> str:
+    """Get the model's raw response to a prompt, from the response cache when possible."""
+    cache_key = make_cache_key(model, system_prompt, user_prompt, temperature, max_tokens) if use_cache else None
+    content = get_cached_response(cache_key) if cache_key else None
+    if content is not None:
+        log_debug(logger, "Using cached response", tag=tag or "unreleased", model=model)
+        return content
+
+    content = generate_with_retries(
+        provider_funcs=PROVIDER_REGISTRY,
+        model=model,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        max_retries=max_retries,
+        quiet=quiet,
+    )
+    if cache_key:
+        store_response(cache_key, content)
+    return content
+
+
+def _generate_map_reduce(
+    commits: Sequence[Mapping[str, Any]], complete: CompleteFunc, *, model: str, **options: Any
+) -> tuple[str, int]:
+    """Run map-reduce generation, returning the final response and the prompt tokens of all calls."""
+    prompt_tokens = 0
+    lock = threading.Lock()
+
+    def counted_complete(system_prompt: str, user_prompt: str) -> str:
+        nonlocal prompt_tokens
+        tokens = count_tokens(system_prompt, model) + count_tokens(user_prompt, model)
+        with lock:
+            prompt_tokens += tokens
+        return complete(system_prompt, user_prompt)
+
+    content = generate_map_reduce(commits, counted_complete, model=model, **options)
+    return content, prompt_tokens
+
+
 def generate_changelog_entry(
-    commits: list[dict],
+    commits: Sequence[Mapping[str, Any]],
     tag: str,
     from_boundary: str | None = None,
     model: str | None = None,
@@ -41,6 +108,10 @@ def generate_changelog_entry(
     context_entries: str = "",
     session_context: str = "",
     detail_level: str = "normal",
+    use_cache: bool = True,
+    map_reduce: bool | None = None,
+    map_reduce_chunk_size: int | None = None,
+    map_reduce_jobs: int | None = None,
 ) -> tuple[str, dict[str, int]]:
     """Generate a changelog entry using AI.
 
@@ -60,6 +131,12 @@ def generate_changelog_entry(
         audience: Target audience slug controlling tone and emphasis
         context_entries: Pre-formatted string of preceding changelog entries for style reference
         session_context: Cumulative list of items already generated in this session
+        use_cache: Whether to answer from (and store into) the on-disk response cache
+        map_reduce: Summarize the commits in chunks and merge the results; None decides
+            automatically (when the commits span several chunks and do not fit one prompt).
+            The diff is not used in this mode.
+        map_reduce_chunk_size: Commits per chunk in map-reduce mode
+        map_reduce_jobs: Chunks summarized concurrently in map-reduce mode
 
     Returns:
         Generated changelog content
@@ -79,63 +156,104 @@ def generate_changelog_entry(
         max_tokens = config.max_output_tokens
     if max_retries is None:
         max_retries = config.max_retries
-
-    # Build the prompt
-    system_prompt, user_prompt = build_changelog_prompt(
-        commits=commits,
-        tag=tag,
-        from_boundary=from_boundary,
-        hint=hint,
-        boundary_mode=boundary_mode,
-        language=language,
-        translate_headings=translate_headings,
-        audience=audience,
-        context_entries=context_entries,
-        session_context=session_context,
-        detail_level=detail_level,
-    )
-
-    # Add diff content to user prompt if available, but limit its size to prevent timeouts
-    if diff_content:
-        # Limit diff content to prevent extremely large prompts
-        if len(diff_content) > Limits.MAX_DIFF_LENGTH:
-            diff_content = diff_content[: Limits.MAX_DIFF_LENGTH] + "\n\n... (diff content truncated for brevity)"
-        user_prompt += f"\n\n## Detailed Changes (Git Diff):\n\n{diff_content}"
-
-    if show_prompt:
-        console = Console()
-        full_prompt = f"SYSTEM PROMPT:\n{system_prompt}\n\nUSER PROMPT:\n{user_prompt}"
-        console.print(
-            Panel(
-                full_prompt,
-                title="Prompt for LLM",
-                border_style="bright_blue",
+    if map_reduce_chunk_size is None:
+        map_reduce_chunk_size = config.map_reduce_chunk_size
+    if map_reduce_jobs is None:
+        map_reduce_jobs = config.map_reduce_jobs
+
+    # Limit diff content to prevent extremely large prompts, then fit commits into what is left
+    diff_section = _format_diff_section(diff_content)
+    token_budget = prompt_token_budget(model, max_tokens)
+    if diff_section:
+        token_budget -= count_tokens(diff_section, model)
+
+    if map_reduce is None:
+        map_reduce = needs_map_reduce(commits, map_reduce_chunk_size, model, token_budget)
+
+    if map_reduce:
+        log_info(
+            logger,
+            "Generating changelog entry by map-reduce",
+            tag=tag or "unreleased",
+            commit_count=len(commits),
+            model=model,
+            chunk_size=map_reduce_chunk_size,
+        )
+    else:
+        # Build the prompt
+        system_prompt, user_prompt = build_changelog_prompt(
+            commits=commits,
+            tag=tag,
+            from_boundary=from_boundary,
+            hint=hint,
+            boundary_mode=boundary_mode,
+            language=language,
+            translate_headings=translate_headings,
+            audience=audience,
+            context_entries=context_entries,
+            session_context=session_context,
+            detail_level=detail_level,
+            model=model,
+            token_budget=token_budget,
+        )
+        user_prompt += diff_section
+
+        if show_prompt:
+            console = Console()
+            full_prompt = f"SYSTEM PROMPT:\n{system_prompt}\n\nUSER PROMPT:\n{user_prompt}"
+            console.print(
+                Panel(
+                    full_prompt,
+                    title="Prompt for LLM",
+                    border_style="bright_blue",
+                )
             )
+
+        # Count tokens
+        prompt_tokens = count_tokens(system_prompt, model) + count_tokens(user_prompt, model)
+        log_info(
+            logger,
+            "Generating changelog entry",
+            tag=tag or "unreleased",
+            commit_count=len(commits),
+            model=model,
+            prompt_tokens=prompt_tokens,
         )
 
-    # Count tokens
-    prompt_tokens = count_tokens(system_prompt, model) + count_tokens(user_prompt, model)
-    log_info(
-        logger,
-        "Generating changelog entry",
-        tag=tag or "unreleased",
-        commit_count=len(commits),
-        model=model,
-        prompt_tokens=prompt_tokens,
+    generate = partial(
+        _generate_text,
+        model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        max_retries=max_retries,
+        quiet=quiet,
+        use_cache=use_cache,
+        tag=tag,
     )
 
     # Generate the changelog content
     try:
-        content = generate_with_retries(
-            provider_funcs=PROVIDER_REGISTRY,
-            model=model,
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            max_retries=max_retries,
-            quiet=quiet,
-        )
+        if map_reduce:
+            content, prompt_tokens = _generate_map_reduce(
+                commits,
+                generate,
+                tag=tag,
+                model=model,
+                token_budget=prompt_token_budget(model, max_tokens),
+                chunk_size=map_reduce_chunk_size,
+                jobs=map_reduce_jobs,
+                from_boundary=from_boundary,
+                hint=hint,
+                boundary_mode=boundary_mode,
+                language=language,
+                translate_headings=translate_headings,
+                audience=audience,
+                context_entries=context_entries,
+                session_context=session_context,
+                detail_level=detail_level,
+            )
+        else:
+            content = generate(system_prompt, user_prompt)
 
         # Clean and format the content
         # First, try to parse as JSON and format with correct audience headers
@@ -193,7 +311,7 @@ def generate_changelog_entry(
 
 
 def generate_changelog_entry_stream(
-    commits: list[dict],
+    commits: Sequence[Mapping[str, Any]],
     tag: str,
     from_boundary: str | None = None,
     model: str | None = None,
@@ -211,6 +329,7 @@ def generate_changelog_entry_stream(
     context_entries: str = "",
     session_context: str = "",
     detail_level: str = "normal",
+    use_cache: bool = True,
 ) -> Generator[tuple[str, dict | None], None, None]:
     """Generate a changelog entry using AI with streaming support.
 
@@ -238,6 +357,7 @@ def generate_changelog_entry_stream(
         context_entries: Pre-formatted string of preceding changelog entries for style reference
         session_context: Cumulative list of items already generated in this session
         detail_level: Output detail level - 'concise', 'normal', or 'detailed'
+        use_cache: Whether to answer from (and store into) the on-disk response cache
 
     Yields:
         Tuple[str, dict | None]:
@@ -267,6 +387,12 @@ def generate_changelog_entry_stream(
     if max_retries is None:
         max_retries = config.max_retries
 
+    # Limit diff content to prevent extremely large prompts, then fit commits into what is left
+    diff_section = _format_diff_section(diff_content)
+    token_budget = prompt_token_budget(model, max_tokens)
+    if diff_section:
+        token_budget -= count_tokens(diff_section, model)
+
     # Build the prompt (same as non-streaming version)
     system_prompt, user_prompt = build_changelog_prompt(
         commits=commits,
@@ -280,14 +406,10 @@ def generate_changelog_entry_stream(
         context_entries=context_entries,
         session_context=session_context,
         detail_level=detail_level,
+        model=model,
+        token_budget=token_budget,
     )
-
-    # Add diff content to user prompt if available, but limit its size to prevent timeouts
-    if diff_content:
-        # Limit diff content to prevent extremely large prompts
-        if len(diff_content) > Limits.MAX_DIFF_LENGTH:
-            diff_content = diff_content[: Limits.MAX_DIFF_LENGTH] + "\n\n... (diff content truncated for brevity)"
-        user_prompt += f"\n\n## Detailed Changes (Git Diff):\n\n{diff_content}"
+    user_prompt += diff_section
 
     if show_prompt:
         console = Console()
@@ -311,28 +433,43 @@ def generate_changelog_entry_stream(
         prompt_tokens=prompt_tokens,
     )
 
+    cache_key = make_cache_key(model, system_prompt, user_prompt, temperature, max_tokens) if use_cache else None
+
     # Generate the changelog content with streaming
     try:
         accumulated_content = []
 
-        for chunk, usage in generate_with_retries_stream(
-            streaming_provider_funcs=STREAMING_PROVIDER_REGISTRY,
-            model=model,
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            max_retries=max_retries,
-            quiet=quiet,
-        ):
+        cached_content = get_cached_response(cache_key) if cache_key else None
+        stream: Iterable[tuple[str, dict | None]]
+        if cached_content is not None:
+            # Replay the cached response as a single chunk
+            log_debug(logger, "Using cached response", tag=tag or "unreleased", model=model)
+            stream = [(cached_content, None), ("", {})]
+        else:
+            stream = generate_with_retries_stream(
+                streaming_provider_funcs=STREAMING_PROVIDER_REGISTRY,
+                model=model,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                max_retries=max_retries,
+                quiet=quiet,
+            )
+
+        for chunk, usage in stream:
             if usage is None:
                 # Content chunk - yield it and accumulate
                 accumulated_content.append(chunk)
                 yield (chunk, None)
             else:
                 # Final yield with token usage
+                full_content = "".join(accumulated_content)
+                if cache_key and cached_content is None:
+                    store_response(cache_key, full_content)
+
                 # Calculate completion tokens from accumulated content
-                completion_tokens = count_tokens("".join(accumulated_content), model)
+                completion_tokens = count_tokens(full_content, model)
                 total_tokens = prompt_tokens + completion_tokens
 
                 token_usage = {
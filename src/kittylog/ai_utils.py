@@ -1,50 +1,142 @@
 """AI utilities for changelog generation.
 
-This module contains retry logic and other AI utilities.
+This module contains retry logic and other AI utilities. Each entry point has
+a sync and an async variant sharing the same model parsing and retry policy.
 """
 
+import asyncio
 import logging
+import random
 import time
-from collections.abc import Callable, Generator
-
-import httpx
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Mapping
+from typing import Any
 
 from kittylog.errors import AIError
+from kittylog.profiling import Phase, timed
 from kittylog.providers import SUPPORTED_PROVIDERS
+from kittylog.providers.rate_limit import MAX_RETRY_AFTER_SECONDS
+from kittylog.tracing import add_event, trace_span
 
 logger = logging.getLogger(__name__)
 
 # Type alias for provider functions (uses ... for flexible kwargs)
 ProviderFunc = Callable[..., str]
 StreamingProviderFunc = Callable[..., Generator[tuple[str, dict | None], None, None]]
+AsyncProviderFunc = Callable[..., Awaitable[str]]
+AsyncStreamingProviderFunc = Callable[..., AsyncGenerator[tuple[str, dict | None], None]]
 
+# Error types that will fail the same way on every attempt
+_NON_RETRYABLE_ERRORS = ("authentication", "model_not_found", "context_length")
 
-def generate_with_retries(
-    provider_funcs: dict[str, ProviderFunc],
-    model: str,
-    system_prompt: str,
-    user_prompt: str,
-    temperature: float,
-    max_tokens: int,
-    max_retries: int,
-    quiet: bool = False,
-) -> str:
-    """Generate content with retry logic using direct API calls."""
-    # Parse model string to determine provider and actual model
+# Longest wait between attempts when the provider did not say how long to wait
+MAX_BACKOFF_SECONDS = 60.0
+
+
+def _resolve_model(model: str) -> tuple[str, str]:
+    """Split a "provider:model" string and validate the provider.
+
+    Returns:
+        Tuple of (provider, model_name)
+
+    Raises:
+        AIError: If the format or provider is invalid
+    """
     if ":" not in model:
         raise AIError.generation_error(f"Invalid model format. Expected 'provider:model', got '{model}'")
 
     provider, model_name = model.split(":", 1)
 
-    # Validate provider
     if provider not in SUPPORTED_PROVIDERS:
         raise AIError.generation_error(f"Unsupported provider: {provider}. Supported providers: {SUPPORTED_PROVIDERS}")
 
-    messages = [
+    return provider, model_name
+
+
+def _build_messages(system_prompt: str, user_prompt: str) -> list[dict[str, str]]:
+    return [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_prompt},
     ]
 
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with jitter, so callers that failed together do not retry together.
+
+    Waits between half and all of ``2**attempt`` seconds, capped at MAX_BACKOFF_SECONDS.
+    """
+    ceiling = min(MAX_BACKOFF_SECONDS, 2.0**attempt)
+    return random.uniform(ceiling / 2, ceiling)
+
+
+def _retry_delay(error: Exception, attempt: int, max_retries: int, quiet: bool) -> float | None:
+    """Decide what to do after a failed attempt.
+
+    Args:
+        error: Exception raised by the attempt
+        attempt: Zero-based attempt number
+        max_retries: Maximum number of attempts
+        quiet: Whether to suppress retry warnings
+
+    Returns:
+        Seconds to wait before the next attempt, or None if no attempts remain
+
+    Raises:
+        AIError: If the error is not worth retrying
+        Exception: The error itself if the provider asked to wait longer than MAX_RETRY_AFTER_SECONDS
+    """
+    from kittylog.errors import classify_error
+
+    if classify_error(error) in _NON_RETRYABLE_ERRORS:
+        raise AIError.generation_error(f"AI generation failed: {error!s}") from error
+
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None and retry_after > MAX_RETRY_AFTER_SECONDS:
+        # Typically an hourly or daily quota: waiting it out would stall the run with nothing to show
+        logger.error(f"Provider asked to retry after {retry_after:.0f}s, longer than kittylog waits: {error!s}")
+        raise error
+
+    if attempt < max_retries - 1:
+        # Wait as long as a rate-limited provider asked (Retry-After), otherwise back off
+        wait_time = retry_after if retry_after is not None else _backoff(attempt)
+        if not quiet:
+            logger.warning(f"AI generation failed (attempt {attempt + 1}), retrying in {wait_time:.1f}s: {error!s}")
+        return wait_time
+
+    logger.error(f"AI generation failed after {max_retries} attempts: {error!s}")
+    return None
+
+
+def _attempt_attributes(attempt: int, provider: str, model_name: str) -> dict[str, Any]:
+    """Attributes of the span recording one LLM attempt."""
+    return {"kittylog.attempt": attempt + 1, "gen_ai.system": provider, "gen_ai.request.model": model_name}
+
+
+def _final_usage(final_usage: dict | None, accumulated_chunks: list[str]) -> dict:
+    """Return the reported stream usage, or an estimate if none was reported."""
+    if final_usage:
+        return final_usage
+    return {
+        "prompt_tokens": 0,
+        "completion_tokens": len("".join(accumulated_chunks)) // 4,
+        "total_tokens": 0,
+    }
+
+
+@timed(Phase.LLM)
+def generate_with_retries(
+    provider_funcs: Mapping[str, ProviderFunc],
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: int,
+    max_retries: int,
+    quiet: bool = False,
+) -> str:
+    """Generate content with retry logic using direct API calls."""
+    provider, model_name = _resolve_model(model)
+    messages = _build_messages(system_prompt, user_prompt)
+
     last_exception: Exception | None = None
 
     for attempt in range(max_retries):
@@ -58,50 +150,95 @@ def generate_with_retries(
                 raise AIError.generation_error(f"Provider function not found for: {provider}")
 
             # API keys are loaded into os.environ via load_dotenv in config/loader.py
-            content = provider_func(model=model_name, messages=messages, temperature=temperature, max_tokens=max_tokens)
+            with trace_span("llm_attempt", **_attempt_attributes(attempt, provider, model_name)):
+                content = provider_func(
+                    model=model_name, messages=messages, temperature=temperature, max_tokens=max_tokens
+                )
 
             if content:
                 return content.strip()
             else:
                 raise AIError.generation_error("Empty response from AI model")
 
-        except (AIError, httpx.HTTPError, TimeoutError, ValueError, TypeError, RuntimeError) as e:
-            last_exception = e
-            # Import classify_error from errors module
-            from kittylog.errors import classify_error
-
-            error_type = classify_error(e)
         except Exception as e:
-            # Re-raise system exceptions that should never be caught
-            if isinstance(e, (KeyboardInterrupt, SystemExit, GeneratorExit)):
-                raise
-            # Use classify_error for unknown exceptions
             last_exception = e
-            from kittylog.errors import classify_error
+            wait_time = _retry_delay(e, attempt, max_retries, quiet)
+            if wait_time is not None:
+                add_event("retry", **{"kittylog.attempt": attempt + 1, "kittylog.wait_seconds": wait_time})
+                time.sleep(wait_time)
 
-            error_type = classify_error(e)
+    # If we get here, all retries failed
+    raise AIError.generation_error(
+        f"AI generation failed after {max_retries} attempts: {last_exception!s}"
+    ) from last_exception
 
-            if error_type in ["authentication", "model_not_found", "context_length"]:
-                # Don't retry these errors
-                raise AIError.generation_error(f"AI generation failed: {e!s}") from e
 
-            if attempt < max_retries - 1:
-                # Exponential backoff
-                wait_time = 2**attempt
-                if not quiet:
-                    logger.warning(f"AI generation failed (attempt {attempt + 1}), retrying in {wait_time}s: {e!s}")
-                time.sleep(wait_time)
+async def agenerate_with_retries(
+    async_provider_funcs: Mapping[str, AsyncProviderFunc],
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: int,
+    max_retries: int,
+    quiet: bool = False,
+) -> str:
+    """Async variant of :func:`generate_with_retries`, backing off with ``asyncio.sleep``.
+
+    Args:
+        async_provider_funcs: Mapping of async provider functions (e.g. ASYNC_PROVIDER_REGISTRY)
+        model: Model string in format "provider:model"
+        system_prompt: System prompt text
+        user_prompt: User prompt text
+        temperature: Temperature parameter
+        max_tokens: Maximum output tokens
+        max_retries: Maximum retry attempts
+        quiet: Whether to suppress retry output
+
+    Returns:
+        Generated content
+
+    Raises:
+        AIError: If generation fails after all retries
+    """
+    provider, model_name = _resolve_model(model)
+    messages = _build_messages(system_prompt, user_prompt)
+
+    last_exception: Exception | None = None
+
+    for attempt in range(max_retries):
+        try:
+            if not quiet and attempt > 0:
+                logger.info(f"Retry attempt {attempt + 1}/{max_retries}")
+
+            provider_func = async_provider_funcs.get(provider)
+            if not provider_func:
+                raise AIError.generation_error(f"Provider function not found for: {provider}")
+
+            with trace_span("llm_attempt", **_attempt_attributes(attempt, provider, model_name)):
+                content = await provider_func(
+                    model=model_name, messages=messages, temperature=temperature, max_tokens=max_tokens
+                )
+
+            if content:
+                return content.strip()
             else:
-                logger.error(f"AI generation failed after {max_retries} attempts: {e!s}")
+                raise AIError.generation_error("Empty response from AI model")
+
+        except Exception as e:
+            last_exception = e
+            wait_time = _retry_delay(e, attempt, max_retries, quiet)
+            if wait_time is not None:
+                add_event("retry", **{"kittylog.attempt": attempt + 1, "kittylog.wait_seconds": wait_time})
+                await asyncio.sleep(wait_time)
 
-    # If we get here, all retries failed
     raise AIError.generation_error(
         f"AI generation failed after {max_retries} attempts: {last_exception!s}"
     ) from last_exception
 
 
 def generate_with_retries_stream(
-    streaming_provider_funcs: dict[str, StreamingProviderFunc],
+    streaming_provider_funcs: Mapping[str, StreamingProviderFunc],
     model: str,
     system_prompt: str,
     user_prompt: str,
@@ -113,7 +250,7 @@ def generate_with_retries_stream(
     """Generate content with streaming and retry logic.
 
     Args:
-        streaming_provider_funcs: Dictionary of streaming provider functions
+        streaming_provider_funcs: Mapping of streaming provider functions
         model: Model string in format "provider:model"
         system_prompt: System prompt text
         user_prompt: User prompt text
@@ -130,20 +267,8 @@ def generate_with_retries_stream(
     Raises:
         AIError: If generation fails after all retries
     """
-    # Parse model string to determine provider and actual model
-    if ":" not in model:
-        raise AIError.generation_error(f"Invalid model format. Expected 'provider:model', got '{model}'")
-
-    provider, model_name = model.split(":", 1)
-
-    # Validate provider
-    if provider not in SUPPORTED_PROVIDERS:
-        raise AIError.generation_error(f"Unsupported provider: {provider}. Supported providers: {SUPPORTED_PROVIDERS}")
-
-    messages = [
-        {"role": "system", "content": system_prompt},
-        {"role": "user", "content": user_prompt},
-    ]
+    provider, model_name = _resolve_model(model)
+    messages = _build_messages(system_prompt, user_prompt)
 
     last_exception: Exception | None = None
 
@@ -161,82 +286,111 @@ def generate_with_retries_stream(
             accumulated_chunks = []
             final_usage = None
 
-            for chunk, usage in streaming_func(
-                model=model_name, messages=messages, temperature=temperature, max_tokens=max_tokens
-            ):
-                if usage is None:
-                    # Content chunk - yield it and accumulate
-                    accumulated_chunks.append(chunk)
-                    yield (chunk, None)
-                else:
-                    # Final yield with usage
-                    final_usage = usage
+            with trace_span("llm_attempt", **_attempt_attributes(attempt, provider, model_name)):
+                for chunk, usage in streaming_func(
+                    model=model_name, messages=messages, temperature=temperature, max_tokens=max_tokens
+                ):
+                    if usage is None:
+                        # Content chunk - yield it and accumulate
+                        accumulated_chunks.append(chunk)
+                        yield (chunk, None)
+                    else:
+                        # Final yield with usage
+                        final_usage = usage
 
             # Verify we got some content
             if not accumulated_chunks:
                 raise AIError.generation_error("Empty response from AI model")
 
             # Yield final usage data
-            if final_usage:
-                yield ("", final_usage)
-            else:
-                # Estimate if not provided
-                yield (
-                    "",
-                    {
-                        "prompt_tokens": 0,
-                        "completion_tokens": len("".join(accumulated_chunks)) // 4,
-                        "total_tokens": 0,
-                    },
-                )
+            yield ("", _final_usage(final_usage, accumulated_chunks))
 
             # Success - exit the retry loop
             return
 
-        except (AIError, httpx.HTTPError, TimeoutError, ValueError, TypeError, RuntimeError) as e:
+        except Exception as e:
             last_exception = e
-            # Import classify_error from errors module
-            from kittylog.errors import classify_error
+            wait_time = _retry_delay(e, attempt, max_retries, quiet)
+            if wait_time is not None:
+                add_event("retry", **{"kittylog.attempt": attempt + 1, "kittylog.wait_seconds": wait_time})
+                time.sleep(wait_time)
 
-            error_type = classify_error(e)
+    # If we get here, all retries failed
+    raise AIError.generation_error(
+        f"AI streaming generation failed after {max_retries} attempts: {last_exception!s}"
+    ) from last_exception
 
-            if error_type in ["authentication", "model_not_found", "context_length"]:
-                # Don't retry these errors
-                raise AIError.generation_error(f"AI generation failed: {e!s}") from e
 
-            if attempt < max_retries - 1:
-                # Exponential backoff
-                wait_time = 2**attempt
-                if not quiet:
-                    logger.warning(f"AI generation failed (attempt {attempt + 1}), retrying in {wait_time}s: {e!s}")
-                time.sleep(wait_time)
-            else:
-                logger.error(f"AI generation failed after {max_retries} attempts: {e!s}")
+async def agenerate_with_retries_stream(
+    async_streaming_provider_funcs: Mapping[str, AsyncStreamingProviderFunc],
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: int,
+    max_retries: int,
+    quiet: bool = False,
+) -> AsyncGenerator[tuple[str, dict | None], None]:
+    """Async variant of :func:`generate_with_retries_stream`.
 
-        except Exception as e:
-            # Re-raise system exceptions that should never be caught
-            if isinstance(e, (KeyboardInterrupt, SystemExit, GeneratorExit)):
-                raise
-            # Use classify_error for unknown exceptions
-            last_exception = e
-            from kittylog.errors import classify_error
+    Args:
+        async_streaming_provider_funcs: Mapping of async streaming provider functions
+        model: Model string in format "provider:model"
+        system_prompt: System prompt text
+        user_prompt: User prompt text
+        temperature: Temperature parameter
+        max_tokens: Maximum output tokens
+        max_retries: Maximum retry attempts
+        quiet: Whether to suppress retry output
 
-            error_type = classify_error(e)
+    Yields:
+        Tuple[str, dict | None]:
+        - (chunk_text, None) for content chunks
+        - ("", usage_dict) for final yield with token usage
 
-            if error_type in ["authentication", "model_not_found", "context_length"]:
-                # Don't retry these errors
-                raise AIError.generation_error(f"AI generation failed: {e!s}") from e
+    Raises:
+        AIError: If generation fails after all retries
+    """
+    provider, model_name = _resolve_model(model)
+    messages = _build_messages(system_prompt, user_prompt)
 
-            if attempt < max_retries - 1:
-                # Exponential backoff
-                wait_time = 2**attempt
-                if not quiet:
-                    logger.warning(f"AI generation failed (attempt {attempt + 1}), retrying in {wait_time}s: {e!s}")
-                time.sleep(wait_time)
-            else:
-                logger.error(f"AI generation failed after {max_retries} attempts: {e!s}")
+    last_exception: Exception | None = None
+
+    for attempt in range(max_retries):
+        try:
+            if not quiet and attempt > 0:
+                logger.info(f"Retry attempt {attempt + 1}/{max_retries}")
+
+            streaming_func = async_streaming_provider_funcs.get(provider)
+            if not streaming_func:
+                raise AIError.generation_error(f"Streaming provider function not found for: {provider}")
+
+            accumulated_chunks = []
+            final_usage = None
+
+            with trace_span("llm_attempt", **_attempt_attributes(attempt, provider, model_name)):
+                async for chunk, usage in streaming_func(
+                    model=model_name, messages=messages, temperature=temperature, max_tokens=max_tokens
+                ):
+                    if usage is None:
+                        accumulated_chunks.append(chunk)
+                        yield (chunk, None)
+                    else:
+                        final_usage = usage
+
+            if not accumulated_chunks:
+                raise AIError.generation_error("Empty response from AI model")
+
+            yield ("", _final_usage(final_usage, accumulated_chunks))
+            return
+
+        except Exception as e:
+            last_exception = e
+            wait_time = _retry_delay(e, attempt, max_retries, quiet)
+            if wait_time is not None:
+                add_event("retry", **{"kittylog.attempt": attempt + 1, "kittylog.wait_seconds": wait_time})
+                await asyncio.sleep(wait_time)
 
-    # If we get here, all retries failed
     raise AIError.generation_error(
         f"AI streaming generation failed after {max_retries} attempts: {last_exception!s}"
     ) from last_exception
@@ -27,6 +27,8 @@ class CacheManager:
     """Centralized cache manager that tracks all registered caches."""
 
     _caches: list[CachedFunction] = []
+    # Caches that are not lru_cache functions (e.g. on-disk caches) report stats through a callable
+    _stats_sources: dict[str, Callable[[], dict]] = {}
 
     @classmethod
     def register(cls, func: Callable) -> Callable:  # Changed return type to match usage
@@ -35,6 +37,12 @@ class CacheManager:
         logger.debug(f"Registered cache function: {func.__name__}")
         return func
 
+    @classmethod
+    def register_stats_source(cls, name: str, stats_func: Callable[[], dict]) -> None:
+        """Register a callable reporting statistics for a cache not built on lru_cache."""
+        cls._stats_sources[name] = stats_func
+        logger.debug(f"Registered cache stats source: {name}")
+
     @classmethod
     def clear_all(cls) -> None:
         """Clear all registered caches."""
@@ -77,6 +85,12 @@ class CacheManager:
             except Exception as e:
                 stats[cache_func.__name__] = {"error": str(e)}
 
+        for name, stats_func in cls._stats_sources.items():
+            try:
+                stats[name] = stats_func()
+            except Exception as e:
+                stats[name] = {"error": str(e)}
+
         return stats
 
 
@@ -120,7 +134,9 @@ def clear_all_caches() -> None:
 
 
 def get_cache_info() -> dict[str, dict]:
-    """Get cache statistics."""
+    """Get cache statistics, including the on-disk LLM response cache."""
+    import kittylog.response_cache  # noqa: F401 - registers its stats source on import
+
     return CacheManager.get_cache_stats()
 
 
@@ -2,6 +2,9 @@
 
 This package provides changelog operations organized by concern:
 
+- **document**: Parsed changelog model shared by the modules below
+  - ChangelogDocument, parse_changelog
+
 - **boundaries**: Boundary detection and version checking
   - find_existing_boundaries, extract_version_boundaries
   - get_latest_version_in_changelog, is_version_in_changelog
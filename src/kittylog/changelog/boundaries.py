@@ -1,7 +1,9 @@
 """Boundary detection and version checking for changelog content.
 
 This module handles finding existing boundaries (versions, dates, gaps)
-and checking version existence in changelog files.
+and checking version existence in changelog files. The line parsing
+primitives live here; the lookups run on the parsed
+:class:`~kittylog.changelog.document.ChangelogDocument`.
 
 Boundary Types:
 - Version: semantic version like 1.0.0, v1.0.0, v1.0.0-beta.1
@@ -233,16 +235,11 @@ def find_existing_boundaries(content: str) -> set[str]:
     Returns:
         Set of existing boundary identifiers (excluding 'unreleased')
     """
-    existing_boundaries: set[str] = set()
+    from kittylog.changelog.document import parse_changelog
 
-    for line in content.split("\n"):
-        parsed = _parse_line(line)
-        if parsed is None:
-            continue
-
-        normalized = _normalize_boundary(parsed)
-        if normalized is not None:
-            existing_boundaries.add(normalized)
+    existing_boundaries = {
+        section.identifier for section in parse_changelog(content).sections if section.identifier is not None
+    }
 
     logger.debug(f"Found existing boundaries: {existing_boundaries}")
     return existing_boundaries
@@ -275,27 +272,20 @@ def extract_version_boundaries(content: str) -> list[dict]:
         - line: line number (1-based)
         - raw_line: original line text
     """
-    lines = content.split("\n")
-    boundaries: list[dict] = []
+    from kittylog.changelog.document import parse_changelog
 
-    for i, line in enumerate(lines):
-        parsed = _parse_line(line)
-        if parsed is None:
-            continue
-
-        # Skip non-version boundaries
-        if parsed.boundary_type != BoundaryType.VERSION:
-            continue
+    boundaries: list[dict] = []
 
-        # Calculate line number (first boundary gets i+1, others get i+2)
+    for section in parse_changelog(content).versions():
+        # Calculate line number (first boundary gets start+1, others get start+2)
         # This quirky behavior is preserved for backward compatibility
-        line_num = i + 1 if len(boundaries) == 0 else i + 2
+        line_num = section.start + 1 if len(boundaries) == 0 else section.start + 2
 
         boundaries.append(
             {
-                "identifier": parsed.content,
+                "identifier": section.version,
                 "line": line_num,
-                "raw_line": line,
+                "raw_line": section.header,
             }
         )
 
@@ -311,12 +301,12 @@ def get_latest_version_in_changelog(content: str) -> str | None:
     Returns:
         The latest version string or None if not found
     """
-    boundaries = extract_version_boundaries(content)
-    if not boundaries:
-        return None
+    from kittylog.changelog.document import parse_changelog
+
+    versions = parse_changelog(content).versions()
 
     # Return the first version (latest in Keep a Changelog format)
-    return boundaries[0]["identifier"]
+    return versions[0].version if versions else None
 
 
 def is_version_in_changelog(content: str, version: str) -> bool:
@@ -329,13 +319,6 @@ def is_version_in_changelog(content: str, version: str) -> bool:
     Returns:
         True if version exists, False otherwise
     """
-    boundaries = extract_version_boundaries(content)
-
-    # Normalize the search version for comparison
-    version_patterns = [
-        version,
-        version.lstrip("v"),
-        f"v{version}" if not version.startswith("v") else version,
-    ]
+    from kittylog.changelog.document import parse_changelog
 
-    return any(boundary["identifier"] in version_patterns for boundary in boundaries)
+    return parse_changelog(content).find_version(version) is not None
@@ -4,8 +4,9 @@ This module handles content-level operations like limiting bullets
 and extracting entries for context.
 """
 
-import re
+from collections import Counter
 
+from kittylog.changelog.document import parse_changelog, parse_subsections
 from kittylog.constants import Limits
 
 
@@ -19,27 +20,16 @@ def limit_bullets_in_sections(content_lines: list[str], max_bullets: int = Limit
     Returns:
         List of lines with bullet points limited per section
     """
-    limited_lines = []
-    current_section = None
-    section_bullet_count = {}
+    # Bullets are counted per heading, so repeated headings share one limit
+    counts: Counter[str] = Counter()
+    dropped: set[int] = set()
+    for subsection in parse_subsections(content_lines):
+        for index in subsection.bullets:
+            counts[subsection.title] += 1
+            if counts[subsection.title] > max_bullets:
+                dropped.add(index)
 
-    for line in content_lines:
-        stripped_line = line.strip()
-
-        # Handle section headers
-        if stripped_line.startswith("### "):
-            current_section = stripped_line
-            section_bullet_count[current_section] = 0
-            limited_lines.append(line)
-        elif stripped_line.startswith("- ") and current_section:
-            # Handle bullet points - limit to max_bullets per section
-            if section_bullet_count.get(current_section, 0) < max_bullets:
-                limited_lines.append(line)
-                section_bullet_count[current_section] = section_bullet_count.get(current_section, 0) + 1
-        else:
-            limited_lines.append(line)
-
-    return limited_lines
+    return [line for index, line in enumerate(content_lines) if index not in dropped]
 
 
 def extract_preceding_entries(content: str, n: int = 3) -> str:
@@ -58,38 +48,26 @@ def extract_preceding_entries(content: str, n: int = 3) -> str:
     if n <= 0 or not content:
         return ""
 
-    lines = content.split("\n")
-    entries = []
-    current_entry_lines: list[str] = []
-    in_entry = False
-
-    for line in lines:
-        # Check for version header (not Unreleased)
-        match = re.match(r"##\s*\[\s*([^\]]+)\s*\]", line, re.IGNORECASE)
-        if match:
-            version = match.group(1).strip()
-            # Skip unreleased section
-            if version.lower() == "unreleased":
-                continue
-
-            # Save previous entry if we were in one
-            if in_entry and current_entry_lines:
-                entries.append("\n".join(current_entry_lines))
-                if len(entries) >= n:
-                    break
-
-            # Start new entry
-            current_entry_lines = [line]
-            in_entry = True
-        elif in_entry:
-            # Stop at the next major header (# )
-            if line.startswith("# ") and not line.startswith("## "):
-                break
-            current_entry_lines.append(line)
-
-    # Don't forget the last entry if we're still in one
-    if in_entry and current_entry_lines and len(entries) < n:
-        entries.append("\n".join(current_entry_lines))
+    document = parse_changelog(content)
+    lines = document.lines
+    # Bracketed headers (including Unreleased) delimit entries
+    boundaries = [section for section in document.sections if section.boundary is not None]
+    entries: list[str] = []
+
+    for position, section in enumerate(boundaries):
+        # Skip unreleased section
+        if section.is_unreleased:
+            continue
+
+        end = boundaries[position + 1].start if position + 1 < len(boundaries) else len(lines)
+        entry_lines = lines[section.start : end]
+        # Stop at the next major header (# )
+        title = next((i for i, line in enumerate(entry_lines) if line.startswith("# ")), None)
+        if title is not None:
+            entry_lines = entry_lines[:title]
+        entries.append("\n".join(entry_lines))
+        if title is not None or len(entries) >= n:
+            break
 
     if not entries:
         return ""
@@ -0,0 +1,311 @@
+"""Parsed changelog document model.
+
+A :class:`ChangelogDocument` is a changelog split into lines once, with every
+``## `` section located: its header, its line span and its parsed boundary.
+An index maps boundary identifiers to sections, so looking up a version is a
+dictionary access instead of a scan with a fresh regex per line. Subsections
+(``### `` headings) and their bullets are parsed on demand, per section.
+
+The document keeps the original lines, so ``ChangelogDocument(content).text()``
+returns ``content`` unchanged. Edits splice lines in place and only parse the
+lines they insert; the spans of later sections are shifted, not re-parsed.
+
+:func:`parse_changelog` memoizes documents by content for the lookup helpers
+in this package. Those documents are shared and must not be edited; call
+:meth:`ChangelogDocument.copy` first.
+"""
+
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field, replace
+
+from kittylog.cache import cached_maxsize
+from kittylog.changelog.boundaries import BoundaryType, ParsedBoundary, _normalize_boundary, _parse_line
+
+# Headers like "##[1.0.0]" count as sections too; they don't start with "## "
+_BRACKET_HEADER = re.compile(r"^##\s*\[")
+
+
+def is_section_header(line: str) -> bool:
+    """Return whether a line starts an H2 (``## ``) changelog section."""
+    return line.startswith("## ") or (line.startswith("##") and _BRACKET_HEADER.match(line) is not None)
+
+
+@dataclass
+class Subsection:
+    """A ``### `` heading inside a section.
+
+    Attributes:
+        title: Heading text without the ``### `` marker
+        start: Line index of the heading
+        end: Line index after the subsection (exclusive)
+        bullets: Line indices of the bullet items in the subsection
+    """
+
+    title: str
+    start: int
+    end: int
+    bullets: list[int] = field(default_factory=list)
+
+
+@dataclass(eq=False)
+class Section:
+    """An H2 section of the changelog.
+
+    Attributes:
+        header: The header line as written
+        start: Line index of the header
+        end: Line index after the section (exclusive): the next header or the end of the file
+        boundary: Parsed bracketed boundary, or None for other ``## `` headers
+    """
+
+    header: str
+    start: int
+    end: int
+    boundary: ParsedBoundary | None
+
+    @property
+    def bracketed(self) -> bool:
+        """Whether the header is a bracketed ``## [...]`` header."""
+        return _BRACKET_HEADER.match(self.header) is not None
+
+    @property
+    def boundary_type(self) -> BoundaryType | None:
+        return self.boundary.boundary_type if self.boundary else None
+
+    @property
+    def is_unreleased(self) -> bool:
+        return self.boundary_type == BoundaryType.UNRELEASED
+
+    @property
+    def is_version(self) -> bool:
+        return self.boundary_type == BoundaryType.VERSION
+
+    @property
+    def version(self) -> str | None:
+        """The version as written in the header (may include a 'v' prefix), for version sections."""
+        return self.boundary.content if self.boundary and self.is_version else None
+
+    @property
+    def identifier(self) -> str | None:
+        """Normalized boundary identifier, as reported by find_existing_boundaries."""
+        return _normalize_boundary(self.boundary) if self.boundary else None
+
+
+def _lookup_keys(section: Section) -> list[str]:
+    """Index keys of a section: versions without 'v', other boundaries by identifier, all lowercased."""
+    if section.boundary is None:
+        # Plain "## 1.0.0 - date" headers are found by their first word
+        words = section.header[2:].split()
+        return [words[0].strip("[]").lstrip("v").lower()] if words else []
+    if section.is_unreleased:
+        return ["unreleased"]
+    if section.is_version:
+        return [section.boundary.content.lstrip("v").lower()]
+    keys = [section.boundary.content.lower()]
+    identifier = section.identifier
+    if identifier and identifier.lower() not in keys:
+        keys.append(identifier.lower())
+    return keys
+
+
+def parse_subsections(lines: list[str], start: int = 0, end: int | None = None) -> list[Subsection]:
+    """Parse the ``### `` subsections and their ``- `` bullets in ``lines[start:end]``.
+
+    Also used on generated entries, which have subsections but no ``## `` header.
+    """
+    end = len(lines) if end is None else end
+    subsections: list[Subsection] = []
+    for index in range(start, end):
+        stripped = lines[index].strip()
+        if stripped.startswith("### "):
+            if subsections:
+                subsections[-1].end = index
+            subsections.append(Subsection(title=stripped[4:].strip(), start=index, end=end))
+        elif subsections and stripped.startswith("- "):
+            subsections[-1].bullets.append(index)
+    return subsections
+
+
+def _parse_sections(lines: Iterable[str], offset: int) -> list[Section]:
+    """Parse the section headers among ``lines``, numbering them from ``offset``."""
+    return [
+        Section(header=line, start=offset + i, end=offset + i + 1, boundary=_parse_line(line))
+        for i, line in enumerate(lines)
+        if is_section_header(line)
+    ]
+
+
+class ChangelogDocument:
+    """A changelog parsed into a header and H2 sections with an identifier index."""
+
+    def __init__(self, content: str = "") -> None:
+        self.lines: list[str] = content.split("\n")
+        self.sections: list[Section] = _parse_sections(self.lines, 0)
+        self._index: dict[str, Section] = {}
+        self._unreleased: Section | None = None
+        self._reindex()
+
+    @classmethod
+    def from_lines(cls, lines: list[str]) -> "ChangelogDocument":
+        """Build a document from lines (copied)."""
+        return cls("\n".join(lines))
+
+    def copy(self) -> "ChangelogDocument":
+        """Return an independent copy that can be edited without re-parsing."""
+        clone = ChangelogDocument.__new__(ChangelogDocument)
+        clone.lines = list(self.lines)
+        clone.sections = [replace(section) for section in self.sections]
+        clone._index = {}
+        clone._unreleased = None
+        clone._reindex()
+        return clone
+
+    def _reindex(self) -> None:
+        """Recompute section ends and the identifier index from the section starts."""
+        self._index.clear()
+        self._unreleased = None
+        for i, section in enumerate(self.sections):
+            section.end = self.sections[i + 1].start if i + 1 < len(self.sections) else len(self.lines)
+            if section.is_unreleased and self._unreleased is None:
+                self._unreleased = section
+        # Bracketed boundaries take precedence over plain "## 1.0.0" headers with the same key
+        for section in sorted(self.sections, key=lambda s: s.boundary is None):
+            for key in _lookup_keys(section):
+                self._index.setdefault(key, section)
+
+    def text(self) -> str:
+        """Serialize the document back to changelog text."""
+        return "\n".join(self.lines)
+
+    @property
+    def header_end(self) -> int:
+        """Line index where the first section starts (the end of the title/intro block)."""
+        return self.sections[0].start if self.sections else len(self.lines)
+
+    @property
+    def unreleased(self) -> Section | None:
+        """The first Unreleased section, if any."""
+        return self._unreleased
+
+    def versions(self) -> list[Section]:
+        """Version sections in document order."""
+        return [section for section in self.sections if section.is_version]
+
+    def find(self, identifier: str) -> Section | None:
+        """Find a section by boundary identifier ("1.0.0", "v1.0.0", "2024-01-15", "Unreleased", ...).
+
+        Args:
+            identifier: Boundary identifier, with or without a 'v' prefix for versions
+
+        Returns:
+            The first matching section, or None
+        """
+        key = identifier.strip().lower()
+        section = self._index.get(key)
+        if section is None and key.startswith("v"):
+            section = self._index.get(key.lstrip("v"))
+        return section
+
+    def find_version(self, version: str) -> Section | None:
+        """Find a version section, ignoring a 'v' prefix on either side."""
+        section = self._index.get(version.strip().lstrip("v").lower())
+        return section if section is not None and section.is_version else None
+
+    def section_after(self, section: Section) -> Section | None:
+        """The section following ``section``, if any."""
+        position = self.sections.index(section)
+        return self.sections[position + 1] if position + 1 < len(self.sections) else None
+
+    def section_lines(self, section: Section) -> list[str]:
+        """Lines of a section, header included."""
+        return self.lines[section.start : section.end]
+
+    def section_text(self, section: Section) -> str:
+        return "\n".join(self.section_lines(section))
+
+    def subsections(self, section: Section) -> list[Subsection]:
+        """Parse the ``### `` subsections and bullets of a section."""
+        return parse_subsections(self.lines, section.start + 1, section.end)
+
+    def splice(self, start: int, end: int, new_lines: list[str]) -> None:
+        """Replace ``lines[start:end]`` with ``new_lines``, updating sections incrementally.
+
+        Sections whose header is replaced are dropped, headers in ``new_lines``
+        become sections, and sections after ``end`` are shifted.
+        """
+        delta = len(new_lines) - (end - start)
+        self.lines[start:end] = new_lines
+        before = [section for section in self.sections if section.start < start]
+        after = [section for section in self.sections if section.start >= end]
+        for section in after:
+            section.start += delta
+        self.sections = before + _parse_sections(new_lines, start) + after
+        self._reindex()
+
+    def insert(self, index: int, new_lines: list[str]) -> None:
+        """Insert lines before line ``index``."""
+        self.splice(index, index, new_lines)
+
+    def insert_many(self, insertions: Sequence[tuple[int, list[str]]]) -> None:
+        """Insert blocks of lines at positions of the current document in one merge pass.
+
+        Positions refer to the document before any of the insertions; blocks
+        at the same position are inserted in the given order. The cost is
+        linear in the size of the document and the inserted lines, where
+        calling :meth:`insert` per block is quadratic.
+
+        Args:
+            insertions: (line index, lines) pairs
+        """
+        if not insertions:
+            return
+        ordered = sorted(insertions, key=lambda insertion: insertion[0])
+        lines: list[str] = []
+        sections: list[Section] = []
+        old_sections = iter(self.sections)
+        pending = next(old_sections, None)
+        copied = 0
+
+        def copy_until(position: int) -> None:
+            nonlocal pending, copied
+            offset = len(lines) - copied
+            while pending is not None and pending.start < position:
+                pending.start += offset
+                sections.append(pending)
+                pending = next(old_sections, None)
+            lines.extend(self.lines[copied:position])
+            copied = position
+
+        for position, block in ordered:
+            copy_until(max(copied, min(position, len(self.lines))))
+            sections.extend(_parse_sections(block, len(lines)))
+            lines.extend(block)
+        copy_until(len(self.lines))
+
+        self.lines = lines
+        self.sections = sections
+        self._reindex()
+
+    def replace_section(self, section: Section, new_lines: list[str]) -> None:
+        """Replace a whole section (header included) with ``new_lines``."""
+        self.splice(section.start, section.end, new_lines)
+
+    def remove_section(self, section: Section) -> None:
+        """Remove a whole section, header included."""
+        self.splice(section.start, section.end, [])
+
+
+@cached_maxsize(16)
+def parse_changelog(content: str) -> ChangelogDocument:
+    """Parse changelog content, reusing the document when the same content is parsed again.
+
+    The returned document is shared; copy it before editing.
+
+    Args:
+        content: The changelog content
+
+    Returns:
+        Parsed document
+    """
+    return ChangelogDocument(content)
@@ -1,10 +1,17 @@
 """Insertion point detection for changelog content.
 
 This module handles finding where to insert new entries in changelog files,
-including version-aware insertion and section detection.
+including version-aware insertion and section detection. All lookups run
+on the parsed :class:`~kittylog.changelog.document.ChangelogDocument`.
 """
 
 import re
+from collections.abc import Sequence
+
+from kittylog.changelog.document import ChangelogDocument, Section, parse_changelog
+
+_VERSION_LIKE = re.compile(r"v?\d+\.\d+")
+_LEADING_NUMBER = re.compile(r"^(\d+)")
 
 
 def find_end_of_unreleased_section(lines: list[str], start_line: int) -> int:
@@ -28,6 +35,23 @@ def find_end_of_unreleased_section(lines: list[str], start_line: int) -> int:
     return len(lines)
 
 
+def end_of_unreleased_section(document: ChangelogDocument, section: Section) -> int:
+    """Find the end of the unreleased section in a parsed document.
+
+    Same result as find_end_of_unreleased_section: the line before the next
+    section header (normally a blank line), or the end of the file.
+
+    Args:
+        document: The parsed changelog
+        section: The unreleased section
+
+    Returns:
+        The line index where the unreleased section ends
+    """
+    following = document.section_after(section)
+    return following.start - 1 if following is not None else len(document.lines)
+
+
 def find_unreleased_section(content: str) -> int | None:
     """Find the line number of the unreleased section header.
 
@@ -37,11 +61,8 @@ def find_unreleased_section(content: str) -> int | None:
     Returns:
         The line index of the unreleased section header, or None if not found
     """
-    lines = content.split("\n")
-    for i, line in enumerate(lines):
-        if re.match(r"^##\s*\[\s*Unreleased\s*\]", line, re.IGNORECASE):
-            return i
-    return None
+    section = parse_changelog(content).unreleased
+    return section.start if section is not None else None
 
 
 def find_version_section(content: str, version: str) -> tuple[int, int] | None:
@@ -54,27 +75,18 @@ def find_version_section(content: str, version: str) -> tuple[int, int] | None:
     Returns:
         Tuple of (start_line, end_line) or None if version not found
     """
-    lines = content.split("\n")
-    start_line = None
-
-    # Find the version section
-    for i, line in enumerate(lines):
-        # Match patterns like ## [1.0.0], ## [v1.0.0], ## 1.0.0, etc.
-        version_pattern = rf"##\s*\[?\s*v?{re.escape(version.lstrip('v'))}\s*\]?"
-        if re.match(version_pattern, line, re.IGNORECASE):
-            start_line = i
-            break
-
-    if start_line is None:
+    # Matches ## [1.0.0], ## [v1.0.0], ## 1.0.0, etc.
+    section = parse_changelog(content).find(version)
+    if section is None:
         return None
+    return (section.start, section.end)
 
-    # Find the end of the section (next version section or end of file)
-    for i in range(start_line + 1, len(lines)):
-        if lines[i].startswith("## "):
-            return (start_line, i)
 
-    # If we reach the end of the file
-    return (start_line, len(lines))
+def _after_first_non_empty_line(lines: list[str]) -> int:
+    for i, line in enumerate(lines):
+        if line.strip():
+            return i + 1
+    return len(lines)
 
 
 def find_insertion_point(content: str) -> int:
@@ -86,44 +98,40 @@ def find_insertion_point(content: str) -> int:
     Returns:
         The line index where new entries should be inserted
     """
-    lines = content.split("\n")
+    return _insertion_point(parse_changelog(content))
+
+
+def _insertion_point(document: ChangelogDocument) -> int:
+    lines = document.lines
 
     # Look for unreleased section - if it exists, insert after it
-    for i, line in enumerate(lines):
-        if re.match(r"^##\s*\[\s*Unreleased\s*\]", line, re.IGNORECASE):
-            # Check if this is the only section (no version sections)
-            has_version_sections = any(
-                re.match(r"^##\s*\[\s*", lines[line_idx])
-                and not re.match(r"^##\s*\[\s*Unreleased\s*\]", lines[line_idx], re.IGNORECASE)
-                for line_idx in range(i + 1, len(lines))
-            )
-
-            if not has_version_sections:
-                # Only unreleased section exists, insert after first non-empty line
-                for j, content_line in enumerate(lines):
-                    if content_line.strip():
-                        return j + 1
-                return len(lines)
-            else:
-                # Has version sections, find end of unreleased section
-                end_line = find_end_of_unreleased_section(lines, i)
-                # Return the position after the unreleased section (where version starts)
-                return end_line + 1 if end_line < len(lines) else end_line
+    unreleased = document.unreleased
+    if unreleased is not None:
+        # Check if this is the only section (no version sections)
+        has_version_sections = any(
+            section.bracketed and not section.is_unreleased
+            for section in document.sections
+            if section.start > unreleased.start
+        )
+
+        if not has_version_sections:
+            # Only unreleased section exists, insert after first non-empty line
+            return _after_first_non_empty_line(lines)
+
+        # Has version sections, find end of unreleased section
+        end_line = end_of_unreleased_section(document, unreleased)
+        # Return the position after the unreleased section (where version starts)
+        return end_line + 1 if end_line < len(lines) else end_line
 
     # If no unreleased section, insert after the header but before the first version
-    for i, line in enumerate(lines):
-        if line.startswith("## ["):
-            return i
+    for section in document.sections:
+        if section.header.startswith("## ["):
+            return section.start
 
     # If no sections found, handle special cases
-    has_any_header = any(re.match(r"^##\s*\[\s*", line) for line in lines)
-
-    if not has_any_header:
+    if not any(section.bracketed for section in document.sections):
         # Insert after the first non-empty line
-        for i, line in enumerate(lines):
-            if line.strip():
-                return i + 1
-        return len(lines)
+        return _after_first_non_empty_line(lines)
 
     # Insert at the end of the header section
     for i, line in enumerate(lines):
@@ -137,6 +145,52 @@ def find_insertion_point(content: str) -> int:
     return len(lines)
 
 
+def version_key(version_str: str) -> list[tuple[int, int | str]]:
+    """Extract version components for sorting (e.g. "v1.0.0a1" -> [(0, 1), (0, 0), (0, 0), (1, "a1")]).
+
+    Numbers are tagged 0 and text is tagged 1, so any two keys compare without a
+    TypeError: a name like "nightly" sorts above every numbered version.
+    """
+    # Remove 'v' prefix if present and any extra characters
+    version_str = version_str.lstrip("v").strip()
+    # Split by dots and convert to integers where possible
+    parts: list[tuple[int, int | str]] = []
+    for part in version_str.split("."):
+        try:
+            # Handle pre-release versions like "1.0.0a1"
+            if part.isdigit():
+                parts.append((0, int(part)))
+            else:
+                # Split alphanumeric parts (e.g., "0a1" -> [0, "a1"])
+                numeric_match = _LEADING_NUMBER.match(part)
+                if numeric_match:
+                    parts.append((0, int(numeric_match.group(1))))
+                    remainder = part[len(numeric_match.group(1)) :]
+                    if remainder:
+                        parts.append((1, remainder))
+                else:
+                    parts.append((1, part))
+        except ValueError:
+            parts.append((1, part))
+    return parts
+
+
+def ordered_version_sections(document: ChangelogDocument) -> list[Section]:
+    """Return the sections that take part in version ordering, in document order.
+
+    These are single-bracketed, non-Unreleased headers starting with a
+    ``major.minor`` number, e.g. ``## [1.2.0]`` or ``## [v2.0] - 2024-01-01``.
+    """
+    return [
+        section
+        for section in document.sections
+        if section.boundary is not None
+        and not section.boundary.is_double_bracket
+        and not section.is_unreleased
+        and _VERSION_LIKE.match(section.boundary.content)
+    ]
+
+
 def find_insertion_point_by_version(content: str, new_version: str) -> int:
     """Find where to insert a new changelog entry based on semantic version ordering.
 
@@ -147,64 +201,144 @@ def find_insertion_point_by_version(content: str, new_version: str) -> int:
     Returns:
         The line index where the new entry should be inserted to maintain version order
     """
-    lines = content.split("\n")
-
-    def version_key(version_str: str) -> list[int | str]:
-        """Extract version components for sorting."""
-        # Remove 'v' prefix if present and any extra characters
-        version_str = version_str.lstrip("v").strip()
-        # Split by dots and convert to integers where possible
-        parts: list[int | str] = []
-        for part in version_str.split("."):
-            try:
-                # Handle pre-release versions like "1.0.0a1"
-                if part.isdigit():
-                    parts.append(int(part))
-                else:
-                    # Split alphanumeric parts (e.g., "0a1" -> [0, "a1"])
-                    numeric_match = re.match(r"^(\d+)", part)
-                    if numeric_match:
-                        parts.append(int(numeric_match.group(1)))
-                        remainder = part[len(numeric_match.group(1)) :]
-                        if remainder:
-                            parts.append(remainder)
-                    else:
-                        parts.append(part)
-            except ValueError:
-                parts.append(part)
-        return parts
-
-    # Normalize the new version for comparison
-    new_version_normalized = new_version.lstrip("v")
-    new_version_key = version_key(new_version_normalized)
-
-    # Find all version sections and their positions
-    version_positions = []
-    for i, line in enumerate(lines):
-        match = re.match(r"##\s*\[\s*([^\]]+)\s*\]", line, re.IGNORECASE)
-        if match:
-            version_text = match.group(1).strip()
-            if version_text.lower() != "unreleased" and re.match(r"v?\d+\.\d+", version_text):
-                version_positions.append((i, version_text, version_key(version_text)))
+    return _insertion_point_by_version(parse_changelog(content), new_version)
+
+
+def _insertion_point_by_version(document: ChangelogDocument, new_version: str) -> int:
+    version_sections = ordered_version_sections(document)
 
     # If no version sections found, use the original insertion point logic
-    if not version_positions:
-        return find_insertion_point(content)
+    if not version_sections:
+        return _insertion_point(document)
 
     # Find the correct position by comparing version keys
     # Versions should be in descending order (newest first)
-    for position, _version_text, version_components in version_positions:
+    new_version_key = version_key(new_version)
+    for section in version_sections:
         # If new version is greater than current version, insert before it
-        if new_version_key > version_components:
-            return position
-
-    # If new version is smaller than all existing versions, insert after the last one
-    # Find the end of the last version section
-    last_position = version_positions[-1][0]
-    for i in range(last_position + 1, len(lines)):
-        # If we hit another version section or end of file, insert here
-        if re.match(r"##\s*\[", lines[i]) or i == len(lines) - 1:
-            return i if i < len(lines) - 1 else len(lines)
-
-    # Fallback to end of file
+        if new_version_key > version_key(section.boundary.content):  # type: ignore[union-attr]
+            return section.start
+
+    # If new version is smaller than all existing versions, insert before the next
+    # bracketed section after the last one, or at the end of the file
+    return _end_of_version_sections(document, version_sections[-1])
+
+
+def _end_of_version_sections(document: ChangelogDocument, last: Section) -> int:
+    lines = document.lines
+    for section in document.sections:
+        if section.start > last.start and section.bracketed:
+            return section.start if section.start < len(lines) - 1 else len(lines)
     return len(lines)
+
+
+def insert_version_sections(content: str, sections: Sequence[tuple[str, str]]) -> str:
+    """Insert many version sections in semantic version order in a single merge pass.
+
+    The result is the same as inserting each section in turn, newest first,
+    at find_insertion_point_by_version, but the changelog is parsed once and
+    rebuilt once instead of being re-scanned and re-joined per section.
+    Names that are not numbered versions, such as "nightly", sort above them.
+
+    Args:
+        content: The existing changelog content
+        sections: (version, section text) pairs, in any order
+
+    Returns:
+        The updated changelog content
+    """
+    if not sections:
+        return content
+
+    document = parse_changelog(content)
+    version_sections = ordered_version_sections(document)
+    existing_keys = [version_key(section.boundary.content) for section in version_sections]  # type: ignore[union-attr]
+    fallback = find_insertion_point(content) if not version_sections else None
+
+    # Newest first; sections sharing a position keep that order, as one-by-one insertion would.
+    # The first existing version older than a new one can only move down as the new versions
+    # get older, so one pointer walks the existing versions for all of them.
+    keyed = sorted(((version_key(version), text) for version, text in sections), key=lambda item: item[0], reverse=True)
+    insertions: list[tuple[int, list[str]]] = []
+    index = 0
+    for key, text in keyed:
+        if fallback is not None:
+            position = fallback
+        else:
+            while index < len(existing_keys) and not key > existing_keys[index]:
+                index += 1
+            if index < len(version_sections):
+                position = version_sections[index].start
+            else:
+                position = _end_of_version_sections(document, version_sections[-1])
+        insertions.append((position, text.split("\n")))
+
+    updated = document.copy()
+    updated.insert_many(insertions)
+    return updated.text()
+
+
+def insert_version_section(document: ChangelogDocument, version: str, text: str) -> None:
+    """Insert one version section into an editable document, in semantic version order.
+
+    For adding sections one at a time to a document kept between saves: the
+    section goes where find_insertion_point_by_version would put it, found
+    from the document's sections, and its lines are spliced in, so earlier
+    sections are neither re-parsed nor merged again.
+
+    Args:
+        document: Document to edit (not one shared by parse_changelog)
+        version: The version of the section (e.g., "1.0.0" or "v1.0.0")
+        text: Section text
+    """
+    document.insert(_insertion_point_by_version(document, version), text.split("\n"))
+
+
+def insert_section_at(document: ChangelogDocument, position: int, text: str) -> None:
+    """Insert one section at a line position of an editable document, on top of what is there.
+
+    One step of insert_sections_at: a blank line is added after the section
+    when the line below it is not blank.
+
+    Args:
+        document: Document to edit (not one shared by parse_changelog)
+        position: Line index to insert at
+        text: Section text
+    """
+    block = text.split("\n")
+    if position < len(document.lines) and document.lines[position].strip():
+        block.append("")
+    document.insert(position, block)
+
+
+def insert_sections_at(content: str, position: int, sections: Sequence[str]) -> str:
+    """Insert sections at one line position, each on top of the previous one, in a single pass.
+
+    Matches inserting the sections one by one at ``position``: the last
+    section ends up first, and a blank line is added after a section when
+    the line below it is not blank.
+
+    Args:
+        content: The existing changelog content
+        position: Line index to insert at
+        sections: Section texts, oldest first
+
+    Returns:
+        The updated changelog content
+    """
+    if not sections:
+        return content
+
+    document = parse_changelog(content)
+    below = document.lines[position] if position < len(document.lines) else None
+    blocks: list[list[str]] = []
+    for text in sections:
+        block = text.split("\n")
+        if below is not None and below.strip():
+            block.append("")
+        blocks.append(block)
+        below = block[0]
+
+    updated = document.copy()
+    updated.insert_many([(position, [line for block in reversed(blocks) for line in block])])
+    return updated.text()
@@ -8,6 +8,8 @@ import logging
 from pathlib import Path
 
 from kittylog.errors import ChangelogError
+from kittylog.profiling import Phase, timed
+from kittylog.tracing import is_tracing, set_attributes
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +70,7 @@ def _ensure_spacing_between_entries(content: str) -> str:
     return content
 
 
+@timed(Phase.WRITE)
 def write_changelog(file_path: str, content: str) -> None:
     """Write content to a changelog file.
 
@@ -83,6 +86,8 @@ def write_changelog(file_path: str, content: str) -> None:
         content = _ensure_spacing_between_entries(content)
 
         Path(file_path).write_text(content, encoding="utf-8")
+        if is_tracing():
+            set_attributes(**{"file.path": file_path, "kittylog.bytes_written": len(content.encode("utf-8"))})
 
         logger.info(f"Successfully wrote changelog to {file_path}")
     except (PermissionError, FileNotFoundError, OSError) as e:
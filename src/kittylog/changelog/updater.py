@@ -5,15 +5,14 @@ io and parser modules for file operations and parsing.
 """
 
 import logging
-import re
 
 from kittylog.ai import generate_changelog_entry
 from kittylog.changelog.content import limit_bullets_in_sections
+from kittylog.changelog.document import ChangelogDocument, parse_changelog
 from kittylog.changelog.insertion import (
-    find_end_of_unreleased_section,
+    end_of_unreleased_section,
     find_insertion_point,
     find_insertion_point_by_version,
-    find_unreleased_section,
 )
 from kittylog.commit_analyzer import get_commits_between_tags, get_git_diff
 from kittylog.errors import AIError
@@ -109,17 +108,10 @@ def handle_unreleased_section_update(
     unreleased_commits = get_commits_between_tags(latest_tag, None)
     current_commit_is_tagged = is_current_commit_tagged()
 
-    lines = existing_content.split("\n")
-
     # Smart removal logic: remove unreleased section if appropriate
     if current_commit_is_tagged and not unreleased_commits:
         logger.debug("Current commit is tagged and up to date - removing unreleased section")
-        unreleased_line = find_unreleased_section(existing_content)
-        if unreleased_line is not None:
-            end_line = find_end_of_unreleased_section(lines, unreleased_line)
-            # Remove entire unreleased section including header
-            del lines[unreleased_line:end_line]
-        return "\n".join(lines)
+        return _remove_unreleased_section(existing_content)
 
     # If no unreleased commits, don't add unreleased section
     if not unreleased_commits:
@@ -129,7 +121,9 @@ def handle_unreleased_section_update(
 
     # Generate and add AI content for unreleased section
     try:
-        diff_content = (get_git_diff(latest_tag, None, max_lines=500) if latest_tag else "") if include_diff else ""
+        diff_content = ""
+        if include_diff and latest_tag:
+            diff_content = get_git_diff(latest_tag, None, max_lines=500, model=model)
 
         new_entry, _token_usage = generate_changelog_entry(
             commits=unreleased_commits,
@@ -193,7 +187,7 @@ def handle_version_update(
         previous_tag = from_boundary
 
         # Generate AI content
-        diff_content = get_git_diff(from_boundary, to_boundary, max_lines=500) if include_diff else ""
+        diff_content = get_git_diff(from_boundary, to_boundary, max_lines=500, model=model) if include_diff else ""
 
         from datetime import datetime
 
@@ -235,38 +229,45 @@ def handle_version_update(
         raise
 
 
+def _remove_unreleased_section(existing_content: str) -> str:
+    """Remove the unreleased section, header included, keeping the blank line before the next section."""
+    document = parse_changelog(existing_content)
+    unreleased = document.unreleased
+    if unreleased is None:
+        return existing_content
+
+    document = document.copy()
+    document.splice(unreleased.start, end_of_unreleased_section(document, unreleased), [])
+    return document.text()
+
+
 def _insert_unreleased_entry(existing_content: str, new_entry: str) -> str:
     """Helper function to insert content into the unreleased section.
 
     Extracted from the duplicated _update_unreleased_section function.
     """
-    lines = existing_content.split("\n")
+    document = parse_changelog(existing_content).copy()
+    lines = document.lines
 
     # Find the unreleased section
-    unreleased_line = find_unreleased_section(existing_content)
+    unreleased = document.unreleased
 
-    if unreleased_line is not None:
-        end_line = find_end_of_unreleased_section(lines, unreleased_line)
+    if unreleased is not None:
+        end_line = end_of_unreleased_section(document, unreleased)
         logger.debug(f"Found existing unreleased section ending at line: {end_line}")
 
-        # Find content start and replace existing content
-        content_start_line = unreleased_line + 1
+        # Find content start and replace existing content, keep header
+        content_start_line = unreleased.start + 1
         while content_start_line < len(lines) and not lines[content_start_line].strip():
             content_start_line += 1
 
-        # Remove existing content, keep header
-        del lines[content_start_line:end_line]
-        insert_line = content_start_line
+        document.splice(content_start_line, max(content_start_line, end_line), new_entry.split("\n"))
     else:
         # Create new unreleased section after header
         insert_line = find_insertion_point(existing_content)
-        lines.insert(insert_line, "## [Unreleased]")
-        lines.insert(insert_line + 1, "")
-        insert_line += 2
+        document.insert(insert_line, ["## [Unreleased]", "", *new_entry.split("\n")])
 
-    # Insert new content
-    lines.insert(insert_line, new_entry)
-    return "\n".join(lines)
+    return document.text()
 
 
 def _update_version_section(
@@ -276,71 +277,37 @@ def _update_version_section(
 ) -> str:
     """Handle updating a tagged version section of the changelog."""
     # For tagged versions, find and replace the existing version section
-    version = tag_name.lstrip("v")
-    lines = existing_content.split("\n")
-
-    # Find the existing version section
-    version_start = None
-    version_pattern = rf"##\s*\[\s*{re.escape(version)}\s*\]"
+    document = parse_changelog(existing_content).copy()
+    existing_section = document.find_version(tag_name)
 
-    for i, line in enumerate(lines):
-        if re.match(version_pattern, line, re.IGNORECASE):
-            version_start = i
-            break
-
-    if version_start is not None:
+    if existing_section is not None:
         # Replace existing version section
-        # Find the end of this version section
-        version_end = len(lines)
-        for j in range(version_start + 1, len(lines)):
-            if lines[j].startswith("## "):
-                version_end = j
-                break
-
-        # Replace the section
-        new_lines = version_section.split("\n")
-        lines[version_start:version_end] = new_lines
+        document.replace_section(existing_section, version_section.split("\n"))
         logger.debug(f"Replaced existing version section for {tag_name}")
     else:
         # Insert new version section at the appropriate position
         insert_point = find_insertion_point_by_version(existing_content, tag_name)
+        document.insert(insert_point, version_section.split("\n"))
+        logger.debug(f"Inserted new version section for {tag_name} at line {insert_point}")
 
-        # Insert the version section
-        for line in reversed(version_section.split("\n")):
-            lines.insert(insert_point, line)
+    return _normalize_version_spacing(document)
 
-        logger.debug(f"Inserted new version section for {tag_name} at line {insert_point}")
 
-    # Post-process: normalize spacing to have exactly 2 blank lines between version sections
+def _normalize_version_spacing(document: ChangelogDocument) -> str:
+    """Serialize a changelog with exactly 2 blank lines between version sections."""
+    lines = document.lines
 
-    # Parse all sections first
-    header_lines = []
+    # Split into the header, the unreleased section and the version sections at "## [" headers
+    starts = [section.start for section in document.sections if section.header.startswith("## [")]
+    header_lines = lines[: starts[0]] if starts else list(lines)
     version_sections = []
-    unreleased_section = []
-    i = 0
-
-    while i < len(lines):
-        line = lines[i]
-
-        if line.startswith("## [Unreleased]"):
-            # Extract unreleased section
-            unreleased_section.append(line)
-            i += 1
-            while i < len(lines) and not lines[i].startswith("## ["):
-                unreleased_section.append(lines[i])
-                i += 1
-        elif line.startswith("## ["):
-            # Extract version section
-            section_content = [line]
-            i += 1
-            while i < len(lines) and not lines[i].startswith("## ["):
-                section_content.append(lines[i])
-                i += 1
-            version_sections.append(section_content)
+    unreleased_section: list[str] = []
+
+    for start, end in zip(starts, [*starts[1:], len(lines)], strict=True):
+        if lines[start].startswith("## [Unreleased]"):
+            unreleased_section.extend(lines[start:end])
         else:
-            # Header content
-            header_lines.append(line)
-            i += 1
+            version_sections.append(lines[start:end])
 
     # Rebuild with exact 2 blank lines between version sections
     result_lines = header_lines.copy() if header_lines else ["# Changelog"]
@@ -357,18 +324,8 @@ def _update_version_section(
 
     # Add version sections with exactly 2 blank lines between them
     for j, section in enumerate(version_sections):
-        # Clean section: normalize internal blanks but preserve one blank between subsections
-        clean_section = []
-        i = 0
-        while i < len(section):
-            line = section[i]
-            clean_section.append(line)
-            i += 1
-
-            # Collapse consecutive blanks to single blanks (except keep one blank after headers)
-            while i < len(section) and section[i].strip() == "":
-                # Skip additional consecutive blanks
-                i += 1
+        # Clean section: drop the blank lines following any line
+        clean_section = [line for i, line in enumerate(section) if i == 0 or line.strip() != ""]
 
         # Strip trailing blanks completely
         while clean_section and clean_section[-1].strip() == "":
@@ -388,13 +345,7 @@ def _update_version_section(
 def _remove_unreleased_section_if_empty(existing_content: str, unreleased_commits: list) -> str:
     """Remove unreleased section if there are no unreleased commits."""
     if not unreleased_commits:
-        lines = existing_content.split("\n")
-        unreleased_line = find_unreleased_section(existing_content)
-
-        if unreleased_line is not None:
-            end_line = find_end_of_unreleased_section(lines, unreleased_line)
-            del lines[unreleased_line:end_line]
-            return "\n".join(lines)
+        return _remove_unreleased_section(existing_content)
 
     return existing_content
 
@@ -3,32 +3,78 @@
 Defines the Click-based command-line interface and delegates execution to the main workflow.
 """
 
+import importlib
 import logging
 import sys
 from collections.abc import Callable
+from contextlib import nullcontext
+from dataclasses import asdict
+from typing import Any
 
 import click
 
-from kittylog import __version__
-from kittylog.auth_cli import auth as auth_cli
-from kittylog.config import ChangelogOptions, WorkflowOptions
+from kittylog import __version__, run_stamp
+from kittylog.config import ChangelogOptions, WorkflowOptions, load_config
 from kittylog.config import config as config_cli
 from kittylog.constants import Audiences, DateGrouping, EnvDefaults, GroupingMode, Logging
 from kittylog.errors import AIError, ChangelogError, ConfigError, GitError, handle_error
-from kittylog.init_cli import init as init_cli
-from kittylog.language_cli import language as language_cli
-from kittylog.main import main_business_logic
-from kittylog.model_cli import model as model_cli
-from kittylog.output import get_output_manager
-from kittylog.release_cli import release as release_cli
-from kittylog.ui.banner import print_banner
-from kittylog.ui.prompts import interactive_configuration
-from kittylog.utils.logging import setup_command_logging
-
-# No need for lazy loading - breaking compatibility for cleaner code
+from kittylog.profiling import ProfileSession, format_report, profile_session, write_json_report
+from kittylog.tracing import trace_file_from_env, trace_run
+
+# Everything that pulls in git, rich, httpx or the providers is imported when a command
+# runs, so `kittylog --help` and early exits stay fast.
 
 logger = logging.getLogger(__name__)
 
+# Subcommands imported on first use: name -> ("module:attribute", one-line help shown by --help)
+LAZY_SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    "auth": ("kittylog.auth_cli:auth", "Manage OAuth authentication for AI providers."),
+    "init": ("kittylog.init_cli:init", "Interactively set up $HOME/.kittylog.env for kittylog."),
+    "language": ("kittylog.language_cli:language", "Set the language for changelog entries interactively."),
+    "model": ("kittylog.model_cli:model", "Interactively update provider/model/API key without language prompts."),
+    "release": ("kittylog.release_cli:release", "Prepare changelog for a release."),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports its lazy subcommands only when they are invoked."""
+
+    def __init__(self, *args: Any, lazy_subcommands: dict[str, tuple[str, str]] | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            target, _help = self.lazy_subcommands[cmd_name]
+            module_name, attribute = target.split(":")
+            self.add_command(getattr(importlib.import_module(module_name), attribute), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List subcommands from the recorded help of lazy ones, without importing them."""
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_subcommands and name not in self.commands:
+                command = click.Command(name, help=self.lazy_subcommands[name][1])
+            else:
+                command = self.commands[name]
+            if not command.hidden:
+                rows.append((name, command))
+        if rows:
+            limit = formatter.width - 6 - max(len(name) for name, _command in rows)
+            with formatter.section("Commands"):
+                formatter.write_dl([(name, command.get_short_help_str(limit)) for name, command in rows])
+
+
+def main_business_logic(**kwargs: Any) -> tuple[bool, Any]:
+    """Run the changelog workflow, importing it (and git and the AI stack) on first use."""
+    from kittylog.main import main_business_logic as run_workflow
+
+    return run_workflow(**kwargs)
+
 
 def _build_cli_options(
     *,
@@ -47,6 +93,8 @@ def _build_cli_options(
     context_entries: int,
     incremental_save: bool,
     detail: str,
+    jobs: int,
+    no_cache: bool,
     # Changelog options
     file: str,
     from_tag: str | None,
@@ -78,6 +126,8 @@ def _build_cli_options(
         context_entries_count=context_entries,
         incremental_save=incremental_save,
         detail_level=detail,
+        jobs=jobs,
+        no_cache=no_cache,
     )
 
     changelog_opts = ChangelogOptions(
@@ -109,6 +159,18 @@ def workflow_options(f: Callable) -> Callable:
         default=True,
         help="Save entries incrementally as they are generated (default: enabled)",
     )(f)
+    f = click.option(
+        "--jobs",
+        "-j",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Number of changelog entries to generate concurrently (default: 1, or KITTYLOG_JOBS)",
+    )(f)
+    f = click.option(
+        "--no-cache",
+        is_flag=True,
+        help="Always call the AI provider instead of reusing cached responses",
+    )(f)
     return f
 
 
@@ -206,9 +268,37 @@ def logging_options(f: Callable) -> Callable:
     return f
 
 
+def profiling_options(f: Callable) -> Callable:
+    """Decorator for performance profiling and tracing options.
+
+    Adds options for timing each phase of the run and exporting the results.
+    """
+    f = click.option("--profile", is_flag=True, help="Print a per-phase and per-boundary timing report")(f)
+    f = click.option(
+        "--profile-json",
+        type=click.Path(dir_okay=False, writable=True),
+        default=None,
+        help="Write the timing report, including every timed call, as JSON (implies --profile)",
+    )(f)
+    f = click.option(
+        "--profile-stats",
+        type=click.Path(dir_okay=False, writable=True),
+        default=None,
+        help="Dump cProfile statistics of the main thread for pstats/snakeviz (implies --profile)",
+    )(f)
+    f = click.option(
+        "--trace",
+        type=click.Path(dir_okay=False, writable=True),
+        default=None,
+        help="Append an OpenTelemetry (OTLP/JSON) trace of the run to this file (or set KITTYLOG_TRACE_FILE)",
+    )(f)
+    return f
+
+
 def common_options(f: Callable) -> Callable:
     """All common options combined."""
     f = workflow_options(f)
+    f = profiling_options(f)
     f = changelog_options(f)
     f = model_options(f)
     f = logging_options(f)
@@ -248,6 +338,50 @@ def _validate_cli_options(
         raise click.UsageError("--gap-threshold is incompatible with --grouping-mode dates")
 
 
+# Options that run the workflow on specific entries, preview it, or observe it; runs using them are never skipped
+_UNSKIPPABLE_OPTIONS = (
+    "from_tag",
+    "to_tag",
+    "all",
+    "dry_run",
+    "show_prompt",
+    "no_cache",
+    "profile",
+    "profile_json",
+    "profile_stats",
+    "trace",
+)
+
+# Options that only change how much is printed
+_OUTPUT_OPTIONS = ("quiet", "verbose", "log_level", "interactive")
+
+
+def _run_stamp_key(version: str | None, options: dict[str, Any]) -> str | None:
+    """Return the stamp key of a routine missing-entries run, or None if the run must not be skipped.
+
+    Only unattended runs qualify: interactive runs ask for their options first.
+    """
+    if version or (options.get("interactive", True) and not options.get("quiet")):
+        return None
+    if any(options.get(name) for name in _UNSKIPPABLE_OPTIONS) or trace_file_from_env():
+        return None
+    run_options = {name: value for name, value in options.items() if name not in _OUTPUT_OPTIONS}
+    return run_stamp.options_key(run_options, asdict(load_config()))
+
+
+def _report_profile(session: ProfileSession, json_path: str | None, stats_path: str | None) -> None:
+    """Print the timing report of a profiled run and say where its exports were written."""
+    from kittylog.output import get_output_manager
+
+    output = get_output_manager()
+    output.panel(format_report(session), title="Profile (ms)", style="magenta")
+    if json_path:
+        write_json_report(session, json_path)
+        output.info(f"Wrote timing report to {json_path}")
+    if stats_path:
+        output.info(f"Wrote cProfile statistics to {stats_path} (view with: python -m pstats {stats_path})")
+
+
 # Interactive configuration is now imported from kittylog.ui.prompts
 
 
@@ -287,6 +421,19 @@ def update_cli(version: str | None = None, **kwargs) -> None:
     include_diff = kwargs.get("include_diff", False)
     audience = kwargs.get("audience")
 
+    # Routine runs with nothing new to document stop here, before git and the AI stack are imported
+    stamp_key = _run_stamp_key(version, kwargs)
+    if stamp_key is not None and run_stamp.is_unchanged(stamp_key):
+        if not quiet:
+            from kittylog.output import get_output_manager
+
+            get_output_manager().info("No missing changelog entries found (nothing changed since the last run)")
+        return
+
+    from kittylog.output import get_output_manager
+    from kittylog.ui.prompts import interactive_configuration
+    from kittylog.utils.logging import setup_command_logging
+
     try:
         setup_command_logging(log_level, verbose, quiet)
         logger.info("Starting kittylog")
@@ -299,8 +446,6 @@ def update_cli(version: str | None = None, **kwargs) -> None:
             )
         elif quiet:
             # In quiet mode, apply same defaults as interactive_configuration would
-            from kittylog.config import load_config
-
             config = load_config()
             grouping_mode = grouping_mode or "tags"
             gap_threshold = gap_threshold or 4.0
@@ -314,6 +459,10 @@ def update_cli(version: str | None = None, **kwargs) -> None:
         to_tag = kwargs.get("to_tag")
         _validate_cli_options(grouping_mode, from_tag, to_tag, gap_threshold, date_grouping)
 
+        jobs = kwargs.get("jobs")
+        if jobs is None:
+            jobs = load_config().jobs
+
         # Build parameter objects using helper
         workflow_opts, changelog_opts = _build_cli_options(
             dry_run=kwargs.get("dry_run", False),
@@ -330,6 +479,8 @@ def update_cli(version: str | None = None, **kwargs) -> None:
             context_entries=kwargs.get("context_entries", 0),
             incremental_save=kwargs.get("incremental_save", True),
             detail=kwargs.get("detail", "normal"),
+            jobs=jobs,
+            no_cache=kwargs.get("no_cache", False),
             file=kwargs.get("file", "CHANGELOG.md"),
             from_tag=from_tag,
             to_tag=to_tag,
@@ -347,14 +498,36 @@ def update_cli(version: str | None = None, **kwargs) -> None:
 
             # Process specific version
             changelog_opts.to_tag = git_tag
-        # Modern main_business_logic call with parameter objects
-        success, _token_usage = main_business_logic(
-            changelog_opts=changelog_opts,
-            workflow_opts=workflow_opts,
-            model=model,
-            hint=hint,
+        profile_json = kwargs.get("profile_json")
+        profile_stats = kwargs.get("profile_stats")
+        profiling = (
+            profile_session(profile_stats) if kwargs.get("profile") or profile_json or profile_stats else nullcontext()
+        )
+
+        trace_path = kwargs.get("trace") or trace_file_from_env()
+        tracing = (
+            trace_run(
+                trace_path,
+                "kittylog update",
+                **{"kittylog.grouping_mode": changelog_opts.grouping_mode, "kittylog.dry_run": workflow_opts.dry_run},
+            )
+            if trace_path
+            else nullcontext()
         )
 
+        # Modern main_business_logic call with parameter objects
+        with tracing as root_span, profiling as session, run_stamp.recording(stamp_key):
+            success, _token_usage = main_business_logic(
+                changelog_opts=changelog_opts,
+                workflow_opts=workflow_opts,
+                model=model,
+                hint=hint,
+            )
+            if root_span is not None:
+                root_span.set_attributes(**{"kittylog.success": success})
+        if session is not None:
+            _report_profile(session, profile_json, profile_stats)
+
         if not success:
             sys.exit(1)
     except KeyboardInterrupt:
@@ -366,12 +539,14 @@ def update_cli(version: str | None = None, **kwargs) -> None:
         sys.exit(1)
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, invoke_without_command=True, lazy_subcommands=LAZY_SUBCOMMANDS)
 @click.option("--version", is_flag=True, help="Show the kittylog version")
 @click.pass_context
 def cli(ctx, version):
     """kittylog - Generate polished changelog entries from your git history."""
     if version:
+        from kittylog.output import get_output_manager
+
         output = get_output_manager()
         output.echo(f"kittylog version: {__version__}")
         sys.exit(0)
@@ -380,6 +555,9 @@ def cli(ctx, version):
     # We check for quiet flag manually in sys.argv to avoid printing in quiet mode
     # before the command options are parsed and logging is set up.
     if "-q" not in sys.argv and "--quiet" not in sys.argv:
+        from kittylog.output import get_output_manager
+        from kittylog.ui.banner import print_banner
+
         print_banner(get_output_manager())
 
     # If no subcommand was invoked, run the update command by default
@@ -387,20 +565,17 @@ def cli(ctx, version):
         ctx.invoke(update_cli)
 
 
-# Add subcommands
+# Add subcommands (the rest are in LAZY_SUBCOMMANDS)
 cli.add_command(update_cli, "update")
-cli.add_command(release_cli, "release")
 cli.add_command(config_cli, "config")
-cli.add_command(init_cli, "init")
-cli.add_command(language_cli, "language")
-cli.add_command(model_cli, "model")
-cli.add_command(auth_cli, "auth")
 
 
-@click.command(context_settings=language_cli.context_settings)
+@click.command()
 @click.pass_context
 def lang(ctx):
     """Set the language for changelog entries interactively. (Alias for 'language')"""
+    from kittylog.language_cli import language as language_cli
+
     ctx.forward(language_cli)
 
 
@@ -5,7 +5,7 @@ based on commit patterns and time gaps.
 """
 
 import logging
-import subprocess
+from collections.abc import Collection, Mapping
 from datetime import date, timedelta
 from typing import Any
 
@@ -13,43 +13,46 @@ import git
 from git import InvalidGitRepositoryError
 
 from kittylog.cache import cached
+from kittylog.commit_index import get_indexed_commits, get_indexed_commits_by_hash
+from kittylog.commit_record import CommitRecord
+from kittylog.constants import Limits
+from kittylog.diff_selection import read_selected_diff
 from kittylog.errors import GitError
+from kittylog.git_log import list_revisions_with_parents
+from kittylog.git_objects import empty_tree, get_object_reader
+from kittylog.profiling import Phase, timed
+from kittylog.tag_catalog import get_tag_catalog
 from kittylog.tag_operations import get_repo
-from kittylog.utils import run_subprocess
+from kittylog.tracing import add_event, is_tracing, set_attributes
 
 logger = logging.getLogger(__name__)
 
-# Type aliases for better readability
-CommitDict = dict[str, Any]
+# Type aliases for better readability; commits are read-only CommitRecord mappings
+CommitDict = Mapping[str, Any]
 BoundaryDict = dict[str, Any]
 
 
+def _make_boundary(commit: CommitDict, boundary_type: str, identifier: str) -> BoundaryDict:
+    """Copy a commit into a new boundary dict instead of mutating the shared cached commit.
+
+    The file list is left out: boundaries never need it, and reading it would
+    make boundary discovery diff every tree in history.
+    """
+    boundary = {key: commit[key] for key in commit if key != "files"}
+    boundary.update(boundary_type=boundary_type, identifier=identifier)
+    return boundary
+
+
 @cached
-def get_all_commits_chronological() -> list[dict]:
+def get_all_commits_chronological() -> list[CommitRecord]:
     """Get all commits in chronological order with metadata.
 
     Returns:
-        List of commit dictionaries with hash, message, author, date, and files.
+        List of commit records with hash, message, author, date, and files.
     """
     try:
-        repo = get_repo()
-        commits = []
-
-        # Get all commits in chronological order (oldest first)
-        for commit in repo.iter_commits(repo.active_branch):
-            commit_info = {
-                "hash": commit.hexsha,
-                "short_hash": commit.hexsha[:8],
-                "message": commit.message.strip(),
-                "author": str(commit.author),
-                "date": commit.committed_datetime,
-                "summary": commit.summary,
-                "files": [
-                    item.a_path
-                    for item in commit.diff(commit.parents[0] if commit.parents else None, create_patch=False)
-                ],
-            }
-            commits.append(commit_info)
+        # Read all commits through the persistent index (newest first)
+        commits = get_indexed_commits("HEAD")
 
         # Reverse to get chronological order (oldest first)
         commits.reverse()
@@ -74,24 +77,18 @@ def get_all_tags_with_dates() -> list[dict]:
         List of tag dictionaries with identifier, hash, date, and commit info.
     """
     try:
-        repo = get_repo()
-        tags = []
-
-        for tag in repo.tags:
-            try:
-                tag_info = {
-                    "identifier": tag.name,
-                    "hash": tag.commit.hexsha,
-                    "short_hash": tag.commit.hexsha[:8],
-                    "date": tag.commit.committed_datetime,
-                    "message": tag.commit.message.strip(),
-                    "author": str(tag.commit.author),
-                    "summary": tag.commit.summary,
-                }
-                tags.append(tag_info)
-            except (AttributeError, ValueError) as e:
-                logger.warning(f"Failed to process tag {tag.name}: {e}")
-                continue
+        tags = [
+            {
+                "identifier": tag.name,
+                "hash": tag.commit,
+                "short_hash": tag.commit[:8],
+                "date": tag.date,
+                "message": tag.message,
+                "author": tag.author,
+                "summary": tag.summary,
+            }
+            for tag in get_tag_catalog()
+        ]
 
         # Sort tags by commit date
         tags.sort(key=lambda t: t["date"])  # type: ignore[arg-type, return-value]  # Dict values are datetime objects, mypy can't infer this
@@ -145,10 +142,8 @@ def get_commits_by_date_boundaries(date_grouping: str = "daily") -> list[dict]:
     boundaries = []
     for _group_date, group_commits in sorted(grouped_commits.items()):
         boundary_commit = group_commits[-1]  # Last commit in the group
-        boundary_commit["boundary_type"] = "date"
         # Use the actual commit date as the identifier - this gives us the last day of the period
-        boundary_commit["identifier"] = boundary_commit["date"].date().isoformat()
-        boundaries.append(boundary_commit)
+        boundaries.append(_make_boundary(boundary_commit, "date", boundary_commit["date"].date().isoformat()))
 
     logger.debug(f"Found {len(boundaries)} date-based boundaries with {date_grouping} grouping")
     return boundaries
@@ -164,21 +159,16 @@ def get_commits_by_gap_boundaries(gap_threshold_hours: float = 4.0) -> list[dict
         List of boundary commit dictionaries with additional 'boundary_type' field
     """
     commits = get_all_commits_chronological()
+    dates = [commit["date"] for commit in commits]
     if len(commits) < 2:
         # If 0 or 1 commits, all are boundaries
-        for commit in commits:
-            commit["boundary_type"] = "gap"
-        return commits
-
-    # Add boundary_type to all commits first
-    for commit in commits:
-        commit["boundary_type"] = "gap"
+        return [
+            _make_boundary(commit, "gap", day.strftime("%Y-%m-%d")) for commit, day in zip(commits, dates, strict=True)
+        ]
 
     # Calculate all gaps for statistical analysis
-    gaps = []
-    for i in range(1, len(commits)):
-        time_gap_hours = (commits[i]["date"] - commits[i - 1]["date"]).total_seconds() / 3600
-        gaps.append(time_gap_hours)
+    gap_seconds = [(dates[i] - dates[i - 1]).total_seconds() for i in range(1, len(dates))]
+    gaps = [seconds / 3600 for seconds in gap_seconds]
 
     # Analyze commit patterns for irregular repositories
     if gaps:
@@ -205,29 +195,21 @@ def get_commits_by_gap_boundaries(gap_threshold_hours: float = 4.0) -> list[dict
             )
 
     # First commit is always a boundary
-    first_commit = commits[0]
-    first_commit["identifier"] = first_commit["date"].strftime("%Y-%m-%d")
-    boundaries = [first_commit]
+    boundaries = [_make_boundary(commits[0], "gap", dates[0].strftime("%Y-%m-%d"))]
     gap_threshold_seconds = gap_threshold_hours * 3600
 
-    for i in range(1, len(commits)):
-        current_commit = commits[i]
-        previous_commit = commits[i - 1]
-
-        # Calculate time gap between commits
-        time_gap = (current_commit["date"] - previous_commit["date"]).total_seconds()
-
+    for i, time_gap in enumerate(gap_seconds, start=1):
         # If gap exceeds threshold, mark current commit as boundary
         if time_gap > gap_threshold_seconds:
             # Use the commit date as the identifier for display purposes
-            current_commit["identifier"] = current_commit["date"].strftime("%Y-%m-%d")
-            boundaries.append(current_commit)
+            boundaries.append(_make_boundary(commits[i], "gap", dates[i].strftime("%Y-%m-%d")))
 
     logger.debug(f"Found {len(boundaries)} gap boundaries with {gap_threshold_hours} hour threshold")
     return boundaries
 
 
-def get_commits_between_tags(from_tag: str | None, to_tag: str | None) -> list[dict]:
+@timed(Phase.COMMITS)
+def get_commits_between_tags(from_tag: str | None, to_tag: str | None) -> list[CommitRecord]:
     """Get commits between two tags or from a tag to HEAD.
 
     Args:
@@ -235,11 +217,9 @@ def get_commits_between_tags(from_tag: str | None, to_tag: str | None) -> list[d
         to_tag: Ending tag (inclusive). If None, goes to HEAD.
 
     Returns:
-        List of commit dictionaries with hash, message, author, date, and files.
+        List of commit records with hash, message, author, date, and files.
     """
     try:
-        repo = get_repo()
-
         # Build revision range
         if from_tag and to_tag:
             rev_range = f"{from_tag}..{to_tag}"
@@ -254,30 +234,7 @@ def get_commits_between_tags(from_tag: str | None, to_tag: str | None) -> list[d
 
         logger.debug(f"Getting commits for range: {rev_range}")
 
-        commits = []
-        for commit in repo.iter_commits(rev_range):
-            try:
-                # Determine parent commits for diff
-                parent_commits = list(commit.parents)
-                if parent_commits:
-                    changed_files = [item.a_path for item in commit.diff(parent_commits[0], create_patch=False)]
-                else:
-                    # Initial commit has no parents
-                    changed_files = [item.a_path for item in commit.diff(git.NULL_TREE, create_patch=False)]
-
-                commit_info = {
-                    "hash": commit.hexsha,
-                    "short_hash": commit.hexsha[:8],
-                    "message": commit.message.strip(),
-                    "author": str(commit.author),
-                    "date": commit.committed_datetime,
-                    "summary": commit.summary,
-                    "files": changed_files,
-                }
-                commits.append(commit_info)
-            except (AttributeError, ValueError, IndexError) as e:
-                logger.warning(f"Failed to process commit {commit.hexsha}: {e}")
-                continue
+        commits = get_indexed_commits(rev_range)
 
         logger.debug(f"Found {len(commits)} commits between {from_tag or 'beginning'} and {to_tag or 'HEAD'}")
         return commits
@@ -293,7 +250,7 @@ def get_commits_between_tags(from_tag: str | None, to_tag: str | None) -> list[d
 
 def get_commits_between_boundaries(
     from_boundary: BoundaryDict | None, to_boundary: BoundaryDict | None, mode: str
-) -> list[CommitDict]:
+) -> list[CommitRecord]:
     """Get commits between two boundaries based on the specified mode.
 
     Args:
@@ -302,7 +259,7 @@ def get_commits_between_boundaries(
         mode: Boundary detection mode ('tags', 'dates', or 'gaps')
 
     Returns:
-        List of commit dictionaries
+        List of commit records
     """
     try:
         if mode == "tags":
@@ -330,7 +287,8 @@ def get_commits_between_boundaries(
         ) from e
 
 
-def get_commits_between_hashes(from_hash: str | None, to_hash: str | None) -> list[dict]:
+@timed(Phase.COMMITS)
+def get_commits_between_hashes(from_hash: str | None, to_hash: str | None) -> list[CommitRecord]:
     """Get commits between two commit hashes.
 
     Args:
@@ -338,11 +296,9 @@ def get_commits_between_hashes(from_hash: str | None, to_hash: str | None) -> li
         to_hash: Ending commit hash (inclusive). If None, goes to HEAD.
 
     Returns:
-        List of commit dictionaries
+        List of commit records
     """
     try:
-        repo = get_repo()
-
         # Build revision range
         if from_hash and to_hash:
             rev_range = f"{from_hash}..{to_hash}"
@@ -355,28 +311,7 @@ def get_commits_between_hashes(from_hash: str | None, to_hash: str | None) -> li
 
         logger.debug(f"Getting commits for hash range: {rev_range}")
 
-        commits = []
-        for commit in repo.iter_commits(rev_range):
-            try:
-                parent_commits = list(commit.parents)
-                if parent_commits:
-                    changed_files = [item.a_path for item in commit.diff(parent_commits[0], create_patch=False)]
-                else:
-                    changed_files = [item.a_path for item in commit.diff(git.NULL_TREE, create_patch=False)]
-
-                commit_info = {
-                    "hash": commit.hexsha,
-                    "short_hash": commit.hexsha[:8],
-                    "message": commit.message.strip(),
-                    "author": str(commit.author),
-                    "date": commit.committed_datetime,
-                    "summary": commit.summary,
-                    "files": changed_files,
-                }
-                commits.append(commit_info)
-            except (AttributeError, ValueError, IndexError) as e:
-                logger.warning(f"Failed to process commit {commit.hexsha}: {e}")
-                continue
+        commits = get_indexed_commits(rev_range)
 
         logger.debug(f"Found {len(commits)} commits for hash range")
         return commits
@@ -390,46 +325,117 @@ def get_commits_between_hashes(from_hash: str | None, to_hash: str | None) -> li
         ) from e
 
 
-def get_git_diff(from_hash: str | None = None, to_hash: str | None = "HEAD", max_lines: int = 500) -> str:
-    """Get git diff between two commits with optional truncation.
+@timed(Phase.COMMITS)
+def partition_commits_by_boundaries(
+    boundaries: list[BoundaryDict], only: Collection[int] | None = None
+) -> list[list[CommitDict]]:
+    """Split history into per-boundary commit buckets in a single pass.
+
+    Bucket ``i`` holds the commits reachable from ``boundaries[i]`` that are
+    not reachable from any earlier boundary, which for linear history is
+    exactly ``get_commits_between_boundaries(boundaries[i - 1], boundaries[i])``.
+    The commit graph is read once for all boundaries, so the cost is linear
+    in the size of history instead of one walk per boundary.
 
     Args:
-        from_hash: Starting commit hash. If None, uses the parent of to_hash.
-        to_hash: Ending commit hash. Defaults to HEAD.
-        max_lines: Maximum number of lines to include in the diff
+        boundaries: Boundary dicts with a ``hash`` key, oldest first
+        only: Indices of the buckets to populate. Commit details are only read
+            for these buckets; all other buckets are returned empty.
 
     Returns:
-        The git diff output, possibly truncated if too long
+        One list of commit records per boundary, newest commit first
     """
+    if not boundaries:
+        return []
+
     try:
-        rev_range = f"{from_hash}..{to_hash}" if from_hash else f"HEAD^1..{to_hash}"
-
-        # Use git command for better compatibility and speed
-        diff_cmd = ["git", "diff", rev_range]
-        try:
-            diff_output = run_subprocess(diff_cmd)
-            diff_content = diff_output.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError, OSError):
-            # Fallback to repository object if subprocess fails
-            repo = get_repo()
-            if from_hash:
-                from_commit = repo.commit(from_hash)
-                to_commit = repo.commit(to_hash)
-                diff_content = repo.git.diff(from_commit, to_commit)
-            else:
-                # Diff of the last commit
-                diff_content = repo.git.diff("HEAD^1", "HEAD")
-
-        # Truncate if too long
-        if diff_content and len(diff_content.splitlines()) > max_lines:
-            lines = diff_content.splitlines()
-            truncated = lines[:max_lines]
-            diff_content = "\n".join(truncated) + f"\n\n... (diff truncated to {max_lines} lines)"
-
-        logger.debug(f"Generated diff with {len(diff_content or '')} characters")
-        return diff_content or ""
+        tips = list(dict.fromkeys(boundary["hash"] for boundary in boundaries))
+        graph = list_revisions_with_parents(tips)
+
+        parents = dict(graph)
+        owner: dict[str, int] = {}
+        for index, boundary in enumerate(boundaries):
+            # Claim every commit reachable from this boundary that no earlier boundary claimed
+            stack = [boundary["hash"]]
+            while stack:
+                hexsha = stack.pop()
+                if hexsha in owner:
+                    continue
+                owner[hexsha] = index
+                stack.extend(parent for parent in parents.get(hexsha, ()) if parent not in owner)
+
+        wanted = set(range(len(boundaries))) if only is None else set(only)
+        hashes = [hexsha for hexsha, _parents in graph if owner.get(hexsha) in wanted]
+
+        buckets: list[list[CommitDict]] = [[] for _ in boundaries]
+        for commit in get_indexed_commits_by_hash(hashes):
+            buckets[owner[commit["hash"]]].append(commit)
+
+        logger.debug(f"Partitioned {len(graph)} commits into {len(boundaries)} boundary buckets")
+        if is_tracing():
+            set_attributes(**{"kittylog.boundary_count": len(boundaries), "kittylog.commit_count": len(hashes)})
+            for index in sorted(wanted):
+                name = boundaries[index].get("identifier", boundaries[index]["hash"])
+                count = len(buckets[index])
+                add_event("boundary_commits", **{"kittylog.boundary": name, "kittylog.commit_count": count})
+        return buckets
+
+    except (KeyError, git.GitCommandError, git.GitError) as e:
+        logger.error(f"Failed to partition commits by boundaries: {e!s}")
+        raise GitError(
+            f"Failed to partition commits by boundaries: {e!s}",
+            command="git rev-list --parents",
+            stderr=str(e),
+        ) from e
 
-    except (InvalidGitRepositoryError, git.GitCommandError, git.GitError, ValueError) as e:
+
+def get_git_diff(
+    from_hash: str | None = None,
+    to_hash: str | None = "HEAD",
+    max_lines: int = 500,
+    max_chars: int = Limits.MAX_DIFF_LENGTH,
+    model: str | None = None,
+    token_budget: int = Limits.MAX_DIFF_TOKENS,
+) -> str:
+    """Get a diffstat and the most informative hunks of the diff between two commits.
+
+    The diffstat covers every changed file. Lockfiles, vendored and
+    generated files are left out of the patch; the remaining hunks are
+    ranked by significance and packed into ``token_budget`` with a per-file
+    cap (see :mod:`kittylog.diff_selection`).
+
+    Args:
+        from_hash: Starting commit hash. If None, uses the parent of to_hash
+            (or the empty tree for a root commit).
+        to_hash: Ending commit hash. Defaults to HEAD.
+        max_lines: Maximum number of patch lines to include
+        max_chars: Maximum length of the returned text
+        model: Model whose tokenizer counts the budget (defaults to the configured default model)
+        token_budget: Maximum tokens of patch text to include
+
+    Returns:
+        Diffstat followed by the selected hunks, or an empty string if the
+        diff could not be read
+    """
+    to_hash = to_hash or "HEAD"
+
+    try:
+        # Resolve both ends in one round trip before starting any git diff
+        base_rev = from_hash or f"{to_hash}^1"
+        base, tip = get_object_reader().info_many([f"{base_rev}^{{commit}}", f"{to_hash}^{{commit}}"])
+        if tip is None or (base is None and from_hash):
+            logger.warning(f"Failed to get git diff: unknown revision {to_hash if tip is None else from_hash}")
+            return ""
+        # A root commit is diffed against the empty tree
+        rev_range = f"{base.hexsha if base else empty_tree(tip.hexsha)}..{tip.hexsha}"
+
+        diff_content = read_selected_diff(
+            rev_range, model=model, token_budget=token_budget, max_chars=max_chars, max_lines=max_lines
+        )
+        logger.debug(f"Generated diff with {len(diff_content)} characters")
+        return diff_content
+
+    except (git.GitCommandError, git.GitError, ValueError) as e:
         logger.warning(f"Failed to get git diff: {e}")
         return ""
 
@@ -0,0 +1,283 @@
+"""Persistent commit metadata index for kittylog.
+
+Commit objects are immutable, so the records built from them can be
+stored once and reused by every later run. The index is a SQLite database
+under ``<git common dir>/kittylog/`` keyed by commit SHA. Range queries list
+the SHAs in the range with ``git rev-list`` (which never reads trees), read
+known commits from the database and read only the unknown ones, through the
+shared ``git cat-file`` process of :mod:`kittylog.git_objects`, so a repeat
+run only parses commits added since the previous run (whether on the same
+branch, another branch or after a rebase).
+
+New commits are indexed without their changed-file lists, which need a
+tree diff per commit. The lists are read in one batch the first time any
+commit of a query is asked for its files and are then written back, so
+paths that only need dates (boundary discovery) never diff a tree.
+"""
+
+import logging
+import sqlite3
+import subprocess
+from collections.abc import Iterable, Mapping
+from functools import partial
+from pathlib import Path
+
+from kittylog.commit_record import CommitRecord, FileListLoader
+from kittylog.git_log import get_log_commits, lazy_files, list_revisions, read_commit_files
+from kittylog.git_objects import read_commits
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored row layout changes; older databases are rebuilt
+SCHEMA_VERSION = 3
+
+INDEX_DIR_NAME = "kittylog"
+INDEX_FILE_NAME = "commits.sqlite3"
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS commits (
+    hash TEXT PRIMARY KEY,
+    message TEXT NOT NULL,
+    author TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    utc_offset INTEGER NOT NULL,
+    summary TEXT NOT NULL,
+    files TEXT
+) WITHOUT ROWID;
+"""
+
+
+# The files column is NULL until the commit's file list has been read
+_Row = tuple[str, str, str, int, int, str, str | None]
+
+
+def _row_from_commit(commit: CommitRecord) -> _Row:
+    return (
+        commit.hash,
+        commit.message,
+        commit.author,
+        commit.timestamp,
+        commit.utc_offset,
+        commit.summary,
+        commit.joined_files if commit.files_loaded else None,
+    )
+
+
+def _commit_from_row(row: _Row, loader: FileListLoader) -> CommitRecord:
+    hexsha, message, author, timestamp, utc_offset, summary, files = row
+    return CommitRecord(
+        hexsha, message, author, timestamp, utc_offset, files=loader if files is None else files, summary=summary
+    )
+
+
+def _read_and_store_files(path: Path, cwd: str | None, hashes: list[str]) -> dict[str, str]:
+    """Read file lists from git and write them back to the index at ``path``."""
+    files = read_commit_files(hashes, cwd=cwd)
+    try:
+        with CommitIndex(path, cwd=cwd) as index:
+            index.store_files(files)
+    except (sqlite3.Error, OSError) as e:
+        logger.debug(f"Could not store file lists in commit index at {path}: {e}")
+    return files
+
+
+def find_index_path(cwd: str | None = None) -> Path | None:
+    """Locate the index file for the repository containing ``cwd``.
+
+    The common git directory is used so that all worktrees share one index.
+
+    Args:
+        cwd: Directory inside the repository (defaults to the current directory)
+
+    Returns:
+        Path of the index database, or None if not inside a git repository
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--path-format=absolute", "--git-common-dir"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return Path(result.stdout.strip()) / INDEX_DIR_NAME / INDEX_FILE_NAME
+
+
+class CommitIndex:
+    """SQLite-backed store of commit records keyed by SHA."""
+
+    def __init__(self, path: Path, cwd: str | None = None):
+        """Open (and if needed create) the index database.
+
+        Args:
+            path: Database file path
+            cwd: Directory to run git in (defaults to the current directory)
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened or initialised
+            OSError: If the index directory cannot be created
+        """
+        self.path = path
+        self.cwd = cwd
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), timeout=30)
+        try:
+            self._initialise()
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def _initialise(self) -> None:
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            if version:
+                logger.debug(f"Rebuilding commit index (schema {version} -> {SCHEMA_VERSION})")
+            with self._conn:
+                self._conn.execute("DROP TABLE IF EXISTS commits")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "CommitIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM commits").fetchone()
+        return int(count)
+
+    def _lookup(self, hashes: list[str], loader: FileListLoader) -> dict[str, CommitRecord]:
+        found: dict[str, CommitRecord] = {}
+        for start in range(0, len(hashes), _LOOKUP_BATCH_SIZE):
+            batch = hashes[start : start + _LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            cursor = self._conn.execute(
+                "SELECT hash, message, author, timestamp, utc_offset, summary, files"
+                f" FROM commits WHERE hash IN ({placeholders})",
+                batch,
+            )
+            for row in cursor:
+                found[row[0]] = _commit_from_row(row, loader)
+        return found
+
+    def _store(self, commits: Iterable[CommitRecord]) -> int:
+        rows = [_row_from_commit(commit) for commit in commits]
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO commits VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def store_files(self, files: Mapping[str, str]) -> None:
+        """Record the changed-file lists of indexed commits.
+
+        Args:
+            files: File lists joined with NUL, keyed by commit hash
+        """
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE commits SET files = ? WHERE hash = ?", [(joined, hexsha) for hexsha, joined in files.items()]
+            )
+
+    def get_commits(self, rev_range: str) -> list[CommitRecord]:
+        """Return the commits in a revision range, reading git only for unknown ones.
+
+        Args:
+            rev_range: Revision range understood by ``git rev-list``
+
+        Returns:
+            Commit records in ``git log`` order (newest first)
+
+        Raises:
+            git.GitCommandError: If git fails
+        """
+        return self.get_commits_by_hash(list_revisions(rev_range, cwd=self.cwd))
+
+    def get_commits_by_hash(self, hashes: list[str]) -> list[CommitRecord]:
+        """Return specific commits, reading git only for unknown ones.
+
+        Args:
+            hashes: Full commit hashes
+
+        Returns:
+            Commit records in the order the hashes were given
+
+        Raises:
+            git.GitCommandError: If git fails
+        """
+        # File lists are read for all commits of this query at once, when first needed
+        loader = FileListLoader(partial(_read_and_store_files, self.path, self.cwd))
+        found = self._lookup(hashes, loader)
+        missing = [hexsha for hexsha in hashes if hexsha not in found]
+        if missing:
+            new_commits = read_commits(missing, loader, cwd=self.cwd)
+            self._store(new_commits)
+            found.update((commit.hash, commit) for commit in new_commits)
+            logger.debug(f"Indexed {len(new_commits)} new commits")
+        return [found[hexsha] for hexsha in hashes]
+
+
+def get_indexed_commits(rev_range: str, cwd: str | None = None) -> list[CommitRecord]:
+    """Get commits for a range through the persistent index.
+
+    Falls back to streaming straight from ``git log`` when the index cannot
+    be used (outside a repository, read-only ``.git`` directory, corrupt
+    database), so the index is purely an optimisation.
+
+    Args:
+        rev_range: Revision range understood by ``git log``
+        cwd: Directory to run git in (defaults to the current directory)
+
+    Returns:
+        Commit records in ``git log`` order (newest first)
+
+    Raises:
+        git.GitCommandError: If git fails
+    """
+    path = find_index_path(cwd)
+    if path is not None:
+        try:
+            with CommitIndex(path, cwd=cwd) as index:
+                return index.get_commits(rev_range)
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Commit index unavailable at {path}, reading git directly: {e}")
+    return get_log_commits(rev_range, cwd=cwd, files=lazy_files(cwd))
+
+
+def get_indexed_commits_by_hash(hashes: list[str], cwd: str | None = None) -> list[CommitRecord]:
+    """Get specific commits through the persistent index.
+
+    Like :func:`get_indexed_commits`, falls back to reading git directly when
+    the index cannot be used.
+
+    Args:
+        hashes: Full commit hashes
+        cwd: Directory to run git in (defaults to the current directory)
+
+    Returns:
+        Commit records in the order the hashes were given
+
+    Raises:
+        git.GitCommandError: If git fails
+    """
+    if not hashes:
+        return []
+    path = find_index_path(cwd)
+    if path is not None:
+        try:
+            with CommitIndex(path, cwd=cwd) as index:
+                return index.get_commits_by_hash(hashes)
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Commit index unavailable at {path}, reading git directly: {e}")
+    return read_commits(hashes, lazy_files(cwd), cwd=cwd)
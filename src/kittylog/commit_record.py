@@ -0,0 +1,239 @@
+"""Compact, immutable commit records for kittylog.
+
+Histories with hundreds of thousands of commits used to be held as one
+dictionary per commit, each with its own author string, tz-aware datetime
+and list of file names. :class:`CommitRecord` stores the same data in
+slots: author names are interned so each distinct author is held once,
+dates are kept as an epoch timestamp plus UTC offset, and the changed
+files are kept as a single NUL-joined string that is only split when
+``files`` is read.
+
+Listing changed files needs a tree diff per commit, which dominates the
+cost of reading history, so records can also be created without them.
+Such records share a :class:`FileListLoader` that reads the file lists of
+all its pending commits in one batch the first time any of them is asked
+for ``files``, e.g. when the prompt builder formats them.
+
+Records implement the read-only :class:`~collections.abc.Mapping`
+interface with the keys of the former commit dictionaries, so existing
+``commit["hash"]`` / ``commit.get("files")`` callers keep working and
+records compare equal to dictionaries with the same content. Code that
+needs extra keys (such as boundary metadata) builds a new dictionary with
+:meth:`CommitRecord.to_dict` instead of mutating the shared record.
+"""
+
+import sys
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+# Keys of the mapping view, in the order of the former commit dictionaries
+COMMIT_KEYS = ("hash", "short_hash", "message", "author", "date", "summary", "files")
+
+# Separator for file lists; NUL cannot appear in a git path
+FILES_SEPARATOR = "\0"
+
+# Commits share a handful of UTC offsets; reuse one tzinfo per offset
+_TIMEZONES: dict[int, timezone] = {}
+
+
+def _timezone(utc_offset: int) -> timezone:
+    tz = _TIMEZONES.get(utc_offset)
+    if tz is None:
+        tz = _TIMEZONES[utc_offset] = timezone(timedelta(seconds=utc_offset))
+    return tz
+
+
+class FileListLoader:
+    """Reads changed-file lists for a group of commits in one batch on first use."""
+
+    def __init__(self, fetch: Callable[[list[str]], Mapping[str, str]]):
+        """Create a loader.
+
+        Args:
+            fetch: Called with the pending commit hashes; returns their file
+                lists joined with :data:`FILES_SEPARATOR`, keyed by hash
+        """
+        self._fetch = fetch
+        self._pending: list[str] = []
+        self._loaded: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def add(self, hexsha: str) -> None:
+        """Schedule a commit for the next batch."""
+        with self._lock:
+            self._pending.append(hexsha)
+
+    def is_loaded(self, hexsha: str) -> bool:
+        """Return whether the file list of a commit has been read."""
+        return hexsha in self._loaded
+
+    def joined_files(self, hexsha: str) -> str:
+        """Return the joined file list of a commit, reading the pending batch if needed."""
+        joined = self._loaded.get(hexsha)
+        if joined is not None:
+            return joined
+        with self._lock:
+            if hexsha not in self._loaded:
+                batch = list(dict.fromkeys([*self._pending, hexsha]))
+                self._pending = []
+                self._loaded.update(self._fetch(batch))
+            return self._loaded.get(hexsha, "")
+
+
+class CommitRecord(Mapping[str, Any]):
+    """Immutable commit metadata with a dict-compatible read-only view.
+
+    Attributes:
+        hash: Full commit hash
+        message: Commit message, stripped
+        author: Author name (interned)
+        timestamp: Commit date as seconds since the epoch
+        utc_offset: UTC offset of the commit date in seconds
+    """
+
+    __slots__ = ("_files", "_summary", "author", "hash", "message", "timestamp", "utc_offset")
+
+    hash: str
+    message: str
+    author: str
+    timestamp: int
+    utc_offset: int
+    _summary: str | None
+    _files: str | FileListLoader
+
+    def __init__(
+        self,
+        hash: str,
+        message: str,
+        author: str,
+        timestamp: int,
+        utc_offset: int = 0,
+        files: Iterable[str] | str | FileListLoader = (),
+        summary: str | None = None,
+    ):
+        """Create a record.
+
+        Args:
+            hash: Full commit hash
+            message: Commit message, stripped
+            author: Author name
+            timestamp: Commit date as seconds since the epoch
+            utc_offset: UTC offset of the commit date in seconds
+            files: Changed file paths, an already NUL-joined string of them, or
+                the loader to read them from when first needed
+            summary: First line of the unstripped message, if it differs from
+                the first line of ``message``
+        """
+        if summary is not None and summary == message.split("\n", 1)[0]:
+            summary = None
+        setter = object.__setattr__
+        setter(self, "hash", hash)
+        setter(self, "message", message)
+        setter(self, "author", sys.intern(author))
+        setter(self, "timestamp", timestamp)
+        setter(self, "utc_offset", utc_offset)
+        setter(self, "_summary", summary)
+        if isinstance(files, FileListLoader):
+            files.add(hash)
+        elif not isinstance(files, str):
+            files = FILES_SEPARATOR.join(files)
+        setter(self, "_files", files)
+
+    @classmethod
+    def from_datetime(
+        cls,
+        hash: str,
+        message: str,
+        author: str,
+        date: datetime,
+        files: Iterable[str] | str | FileListLoader = (),
+        summary: str | None = None,
+    ) -> "CommitRecord":
+        """Create a record from a tz-aware commit date."""
+        offset = date.utcoffset()
+        return cls(
+            hash,
+            message,
+            author,
+            int(date.timestamp()),
+            int(offset.total_seconds()) if offset is not None else 0,
+            files,
+            summary,
+        )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (
+            type(self),
+            (self.hash, self.message, self.author, self.timestamp, self.utc_offset, self.joined_files, self._summary),
+        )
+
+    @property
+    def short_hash(self) -> str:
+        """First eight characters of the commit hash."""
+        return self.hash[:8]
+
+    @property
+    def date(self) -> datetime:
+        """Commit date in the committer's time zone."""
+        return datetime.fromtimestamp(self.timestamp, _timezone(self.utc_offset))
+
+    @property
+    def summary(self) -> str:
+        """First line of the commit message."""
+        if self._summary is not None:
+            return self._summary
+        return self.message.split("\n", 1)[0]
+
+    @property
+    def files(self) -> list[str]:
+        """Changed file paths; a new list is built on every access."""
+        joined = self.joined_files
+        return joined.split(FILES_SEPARATOR) if joined else []
+
+    @property
+    def joined_files(self) -> str:
+        """Changed file paths joined with :data:`FILES_SEPARATOR`."""
+        if isinstance(self._files, FileListLoader):
+            return self._files.joined_files(self.hash)
+        return self._files
+
+    @property
+    def files_loaded(self) -> bool:
+        """Whether ``files`` can be read without running git."""
+        return not isinstance(self._files, FileListLoader) or self._files.is_loaded(self.hash)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in COMMIT_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(COMMIT_KEYS)
+
+    def __len__(self) -> int:
+        return len(COMMIT_KEYS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in COMMIT_KEYS
+
+    def __repr__(self) -> str:
+        return f"CommitRecord(hash={self.hash!r}, summary={self.summary!r}, author={self.author!r}, date={self.date!r})"
+
+    def to_dict(self, **extra: Any) -> dict[str, Any]:
+        """Return a new commit dictionary, optionally with extra keys.
+
+        Args:
+            **extra: Additional keys, e.g. ``boundary_type`` and ``identifier``
+
+        Returns:
+            A dictionary owned by the caller
+        """
+        return {key: getattr(self, key) for key in COMMIT_KEYS} | extra
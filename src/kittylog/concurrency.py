@@ -0,0 +1,68 @@
+"""Bounded concurrent execution helpers for kittylog.
+
+Changelog entries for different boundaries are independent LLM calls, so they
+can be generated in parallel. Results are still consumed in submission order
+so that entries are inserted and saved in version order.
+"""
+
+import contextvars
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _run_inline(func: Callable[[T], R], item: T) -> "Future[R]":
+    """Run ``func`` in the calling thread and capture its outcome in a future."""
+    future: Future[R] = Future()
+    try:
+        future.set_result(func(item))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def map_in_order(func: Callable[[T], R], items: Iterable[T], jobs: int = 1) -> Iterator[tuple[T, "Future[R]"]]:
+    """Apply ``func`` to items with at most ``jobs`` calls in flight, yielding in input order.
+
+    Each item is paired with a completed future; calling ``future.result()``
+    returns the value or re-raises the exception from ``func``, so callers keep
+    their per-item error handling. With ``jobs <= 1`` items are processed
+    lazily in the calling thread, one at a time, exactly as a plain loop would.
+
+    Args:
+        func: Function to apply to each item
+        items: Items to process
+        jobs: Maximum number of concurrent calls
+
+    Yields:
+        ``(item, future)`` pairs in the order the items were given
+    """
+    if jobs <= 1:
+        for item in items:
+            yield item, _run_inline(func, item)
+        return
+
+    pending = list(items)
+    if not pending:
+        return
+
+    workers = min(jobs, len(pending))
+    logger.debug(f"Running {len(pending)} tasks with {workers} workers")
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kittylog")
+    try:
+        # Run each call in a copy of the caller's context so context variables (e.g. the
+        # boundary being profiled) carry over into the worker threads
+        futures = [executor.submit(contextvars.copy_context().run, func, item) for item in pending]
+        for item, future in zip(pending, futures, strict=True):
+            # Block until this item is done; later items keep running meanwhile
+            future.exception()
+            yield item, future
+    finally:
+        # Don't start queued work if the consumer stopped early or failed
+        executor.shutdown(wait=True, cancel_futures=True)
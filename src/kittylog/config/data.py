@@ -38,6 +38,9 @@ class KittylogConfigData:
 
     # Advanced configuration
     context_entries: int = EnvDefaults.CONTEXT_ENTRIES
+    jobs: int = EnvDefaults.JOBS
+    map_reduce_chunk_size: int = EnvDefaults.MAP_REDUCE_CHUNK_SIZE
+    map_reduce_jobs: int = EnvDefaults.MAP_REDUCE_JOBS
 
     def apply_defaults(self) -> "KittylogConfigData":
         """Apply default values for None fields.
@@ -59,6 +62,9 @@ class KittylogConfigData:
             audience=self.audience,
             translate_headings=self.translate_headings,
             context_entries=self.context_entries,
+            jobs=self.jobs,
+            map_reduce_chunk_size=self.map_reduce_chunk_size,
+            map_reduce_jobs=self.map_reduce_jobs,
         )
 
     def validate(self) -> None:
@@ -79,6 +85,14 @@ class KittylogConfigData:
         if self.max_retries < 1:
             raise ValueError(f"Invalid max_retries: must be at least 1, got {self.max_retries}")
 
+        # Concurrency validation
+        if self.jobs < 1:
+            raise ValueError(f"Invalid jobs: must be at least 1, got {self.jobs}")
+        if self.map_reduce_chunk_size < 1:
+            raise ValueError(f"Invalid map_reduce_chunk_size: must be at least 1, got {self.map_reduce_chunk_size}")
+        if self.map_reduce_jobs < 1:
+            raise ValueError(f"Invalid map_reduce_jobs: must be at least 1, got {self.map_reduce_jobs}")
+
         # Gap threshold validation
         if self.gap_threshold_hours <= 0:
             raise ValueError(f"Invalid gap_threshold_hours: must be positive, got {self.gap_threshold_hours}")
@@ -116,6 +130,9 @@ class KittylogConfigData:
             "audience": self.audience,
             "translate_headings": self.translate_headings,
             "context_entries": self.context_entries,
+            "jobs": self.jobs,
+            "map_reduce_chunk_size": self.map_reduce_chunk_size,
+            "map_reduce_jobs": self.map_reduce_jobs,
         }
 
     @classmethod
@@ -142,4 +159,7 @@ class KittylogConfigData:
             audience=config_dict.get("audience", EnvDefaults.AUDIENCE),
             translate_headings=config_dict.get("translate_headings", EnvDefaults.TRANSLATE_HEADINGS),
             context_entries=config_dict.get("context_entries", EnvDefaults.CONTEXT_ENTRIES),
+            jobs=config_dict.get("jobs", EnvDefaults.JOBS),
+            map_reduce_chunk_size=config_dict.get("map_reduce_chunk_size", EnvDefaults.MAP_REDUCE_CHUNK_SIZE),
+            map_reduce_jobs=config_dict.get("map_reduce_jobs", EnvDefaults.MAP_REDUCE_JOBS),
         )
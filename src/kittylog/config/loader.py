@@ -163,6 +163,11 @@ def load_config() -> KittylogConfigData:
             if os.getenv("KITTYLOG_TRANSLATE_HEADINGS") is not None
             else EnvDefaults.TRANSLATE_HEADINGS
         ),
+        jobs=_safe_int(os.getenv("KITTYLOG_JOBS"), EnvDefaults.JOBS, min_value=1),
+        map_reduce_chunk_size=_safe_int(
+            os.getenv("KITTYLOG_MAP_REDUCE_CHUNK_SIZE"), EnvDefaults.MAP_REDUCE_CHUNK_SIZE, min_value=1
+        ),
+        map_reduce_jobs=_safe_int(os.getenv("KITTYLOG_MAP_REDUCE_JOBS"), EnvDefaults.MAP_REDUCE_JOBS, min_value=1),
     )
 
 
@@ -27,6 +27,8 @@ class WorkflowOptions:
     context_entries_count: int = field(default_factory=lambda: EnvDefaults.CONTEXT_ENTRIES)
     incremental_save: bool = True
     detail_level: str = "normal"  # concise, normal, or detailed
+    jobs: int = field(default_factory=lambda: EnvDefaults.JOBS)
+    no_cache: bool = False  # Bypass the on-disk LLM response cache
 
 
 @dataclass
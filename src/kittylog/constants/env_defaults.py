@@ -19,3 +19,12 @@ class EnvDefaults:
     LOG_LEVEL: str = "WARNING"
     LANGUAGE: str = "English"
     CONTEXT_ENTRIES: int = 10  # Number of preceding entries for AI context (0 = disabled)
+    JOBS: int = 1  # Number of changelog entries generated concurrently
+    HTTP_MAX_CONNECTIONS: int = 20
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0  # Seconds an idle provider connection is kept open
+    RESPONSE_CACHE_MAX_SIZE_MB: float = 50.0  # Total size of cached LLM responses
+    RESPONSE_CACHE_MAX_AGE_DAYS: float = 30.0  # Days a cached LLM response stays valid
+    MAP_REDUCE_CHUNK_SIZE: int = 200  # Commits per chunk when a release is summarized by map-reduce
+    MAP_REDUCE_JOBS: int = 4  # Chunks summarized concurrently in map-reduce mode
+    CONTEXT_WINDOW_TOKENS: int = 32768  # Context window assumed for models not in the packer's table
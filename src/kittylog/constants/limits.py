@@ -5,6 +5,10 @@ class Limits:
     """Limits and thresholds for various operations."""
 
     MAX_DIFF_LENGTH = 5000
+    MAX_DIFF_TOKENS = 1200  # Tokens of selected diff hunks in the prompt
+    MAX_DIFF_TOKENS_PER_FILE = 300  # So one large file cannot crowd out the rest
+    MAX_DIFF_SCAN_LENGTH = 500_000  # Patch characters read from git before hunks are ranked
+    MAX_DIFF_SCAN_LINES = 20_000
     MAX_GAP_THRESHOLD_HOURS = 168  # 1 week
     PREVIEW_LINE_COUNT = 50
     MAX_BULLETS_PER_SECTION = 6
@@ -0,0 +1,445 @@
+"""Budget-aware selection of diff hunks for the prompt.
+
+Cutting a release diff after its first few thousand characters mostly shows
+the model lockfiles, vendored code and generated files, because those
+change in bulk and often sort first. This module chooses what to show
+instead:
+
+* :func:`classify_path` sorts each changed file into a :class:`FileKind`.
+  Lockfiles, vendored and generated files are left out of the patch that
+  is read from git; they still appear in the diffstat.
+* :func:`parse_patch` splits the remaining patch into files and hunks, and
+  :func:`score_hunk` ranks each hunk by its significant changed lines
+  (blank and comment-only lines don't count), weighted by file kind, with a
+  bonus for changed definitions.
+* :func:`select_hunks` packs the highest-ranked hunks under a token budget
+  counted with the prompt model's tokenizer. A per-file cap keeps one large
+  file from crowding out the rest, and the chosen hunks are rendered in
+  diff order so the excerpt still reads like a patch.
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+
+from kittylog.constants import EnvDefaults, Limits
+from kittylog.git_diff import (
+    TRUNCATION_NOTE,
+    DiffExcerpt,
+    FileDiffStat,
+    format_diff_for_prompt,
+    read_diff_excerpt,
+    read_diffstat,
+)
+from kittylog.tokenizer import count_tokens_batch
+
+logger = logging.getLogger(__name__)
+
+
+class FileKind(str, Enum):
+    """What a changed file is, as far as the changelog is concerned."""
+
+    SOURCE = "source"
+    TEST = "test"
+    LOCKFILE = "lockfile"
+    VENDORED = "vendored"
+    GENERATED = "generated"
+
+
+# Files whose patches are never shown; the diffstat still lists them
+LOW_VALUE_KINDS = frozenset({FileKind.LOCKFILE, FileKind.VENDORED, FileKind.GENERATED})
+
+# Multiplier for hunk scores by file kind
+_KIND_WEIGHTS = {
+    FileKind.SOURCE: 1.0,
+    FileKind.TEST: 0.4,
+    FileKind.LOCKFILE: 0.0,
+    FileKind.VENDORED: 0.0,
+    FileKind.GENERATED: 0.0,
+}
+
+# Score added per changed definition line, counted up to _MAX_DEFINITIONS times
+_DEFINITION_BONUS = 2.0
+_MAX_DEFINITIONS = 3
+
+# A hunk cut to fit the budget must keep at least this many lines
+_MIN_HUNK_LINES = 3
+_CUT_ATTEMPTS = 3
+
+# Low-value files excluded by pathspec; past this the command line gets long,
+# and the rest are read but never selected
+_MAX_EXCLUDED_PATHS = 200
+
+_LOCKFILE_NAMES = frozenset(
+    {
+        "bun.lockb",
+        "cargo.lock",
+        "composer.lock",
+        "flake.lock",
+        "gemfile.lock",
+        "go.sum",
+        "gradle.lockfile",
+        "mix.lock",
+        "package-lock.json",
+        "packages.lock.json",
+        "pipfile.lock",
+        "pnpm-lock.yaml",
+        "podfile.lock",
+        "poetry.lock",
+        "pubspec.lock",
+        "npm-shrinkwrap.json",
+        "uv.lock",
+        "yarn.lock",
+    }
+)
+_VENDORED_DIRS = frozenset({"vendor", "vendored", "third_party", "third-party", "node_modules", "bower_components"})
+_GENERATED_DIRS = frozenset({"dist", "__generated__", "generated", "__snapshots__"})
+_GENERATED_NAME = re.compile(
+    r"(\.min\.(js|css)|\.map|\.pb\.(go|h|cc)|_pb2(_grpc)?\.pyi?|\.g\.dart|\.freezed\.dart|\.designer\.cs|\.snap)$"
+    r"|\.generated\."
+)
+_TEST_DIRS = frozenset({"test", "tests", "__tests__", "spec", "specs", "testing"})
+_TEST_NAME = re.compile(r"^(test_.*|.*_test\.\w+|.*\.(test|spec)\.\w+|.*Tests?\.(java|kt|cs|swift)|conftest\.py)$")
+
+# Changed lines that carry no meaning of their own
+_COMMENT_LINE = re.compile(r"^(#|//|/\*|\*|--|<!--|\"\"\"|''')")
+# In prose "#", "*" and "--" start headings, bullets and rules, so only markup comments are skipped
+_PROSE_COMMENT_LINE = re.compile(r"^(<!--|\.\.\s)")
+_PROSE_SUFFIXES = (".md", ".markdown", ".mdx", ".rst", ".txt", ".adoc")
+# Changed lines that define or export something
+_DEFINITION_LINE = re.compile(
+    r"^(async\s+)?(def|class|function|fn|func|interface|struct|enum|trait|impl|type|module|export|public|protected)\b"
+    r"|^(pub(\(\w+\))?|const|let|var)\s+\w+"
+)
+
+
+def classify_path(path: str) -> FileKind:
+    """Classify a changed file by its path.
+
+    Args:
+        path: Repository-relative path
+
+    Returns:
+        The kind of file
+    """
+    *dirs, name = path.split("/")
+    lowered_dirs = {part.lower() for part in dirs}
+    lowered_name = name.lower()
+    if lowered_dirs & _VENDORED_DIRS:
+        return FileKind.VENDORED
+    if lowered_name in _LOCKFILE_NAMES:
+        return FileKind.LOCKFILE
+    if lowered_dirs & _GENERATED_DIRS or _GENERATED_NAME.search(lowered_name):
+        return FileKind.GENERATED
+    if lowered_dirs & _TEST_DIRS or _TEST_NAME.match(name):
+        return FileKind.TEST
+    return FileKind.SOURCE
+
+
+@dataclass(frozen=True)
+class Hunk:
+    """One ``@@`` section of a file's patch.
+
+    Attributes:
+        header: The ``@@ -a,b +c,d @@`` line
+        lines: Context, added and removed lines
+    """
+
+    header: str
+    lines: list[str]
+
+    @property
+    def text(self) -> str:
+        return "\n".join([self.header, *self.lines])
+
+    def head(self, line_count: int) -> "Hunk":
+        """Return the hunk cut after ``line_count`` lines."""
+        return Hunk(self.header, self.lines[:line_count])
+
+
+@dataclass(frozen=True)
+class FilePatch:
+    """The patch of one file.
+
+    Attributes:
+        path: Path after the change
+        header: ``diff --git`` line and extended headers, without ``index``
+        hunks: Hunks in patch order
+    """
+
+    path: str
+    header: str
+    hunks: list[Hunk] = field(default_factory=list)
+
+    @property
+    def kind(self) -> FileKind:
+        return classify_path(self.path)
+
+    @property
+    def is_prose(self) -> bool:
+        return self.path.lower().endswith(_PROSE_SUFFIXES)
+
+
+@dataclass(frozen=True)
+class DiffSelection:
+    """Hunks chosen to fit a budget.
+
+    Attributes:
+        text: Chosen hunks with their file headers, in diff order
+        truncated: Whether any significant hunk was cut or left out
+    """
+
+    text: str
+    truncated: bool
+
+
+def _path_from_diff_line(line: str) -> str:
+    # "diff --git a/<old> b/<new>"; used when there is no "+++ b/" line
+    _, _, new = line.rpartition(" b/")
+    return new.strip('"')
+
+
+def parse_patch(text: str) -> list[FilePatch]:
+    """Split ``git diff`` output into files and hunks.
+
+    Args:
+        text: Patch text, possibly cut in the middle of a file
+
+    Returns:
+        One entry per file, in patch order
+    """
+    patches: list[FilePatch] = []
+    header: list[str] = []
+    hunks: list[Hunk] = []
+    path = ""
+    hunk_header: str | None = None
+    hunk_lines: list[str] = []
+
+    def finish_hunk() -> None:
+        if hunk_header is not None:
+            hunks.append(Hunk(hunk_header, hunk_lines))
+
+    def finish_file() -> None:
+        finish_hunk()
+        if header:
+            patches.append(FilePatch(path, "\n".join(header), hunks))
+
+    for line in text.split("\n"):
+        if line.startswith("diff --git "):
+            finish_file()
+            header, hunks, hunk_header, hunk_lines = [line], [], None, []
+            path = _path_from_diff_line(line)
+        elif line.startswith("@@") and header:
+            finish_hunk()
+            hunk_header, hunk_lines = line, []
+        elif hunk_header is not None:
+            hunk_lines.append(line)
+        elif header and not line.startswith("index "):
+            header.append(line)
+            if line.startswith("+++ b/"):
+                path = line[len("+++ b/") :]
+    finish_file()
+    return patches
+
+
+def score_hunk(hunk: Hunk, kind: FileKind, prose: bool = False) -> float:
+    """Rank a hunk by how much it says about the change.
+
+    Args:
+        hunk: Hunk to score
+        kind: Kind of the file the hunk belongs to
+        prose: Whether the file is documentation, where ``#`` starts a heading rather than a comment
+
+    Returns:
+        Score; 0 for hunks that only touch blank or comment lines
+    """
+    comment_line = _PROSE_COMMENT_LINE if prose else _COMMENT_LINE
+    significant = 0
+    definitions = 0
+    for line in hunk.lines:
+        if not line or line[0] not in "+-":
+            continue
+        body = line[1:].strip()
+        if not body or comment_line.match(body):
+            continue
+        significant += 1
+        if _DEFINITION_LINE.match(body):
+            definitions += 1
+    if not significant:
+        return 0.0
+    # Diminishing returns, so many small hunks can beat one huge one
+    return _KIND_WEIGHTS[kind] * (math.sqrt(significant) + _DEFINITION_BONUS * min(definitions, _MAX_DEFINITIONS))
+
+
+def _cut_hunk(hunk: Hunk, tokens_left: int, chars_left: int, lines_left: int, model: str) -> tuple[Hunk, int] | None:
+    """Cut a hunk to the longest prefix that fits, or None if too little would remain."""
+    keep = min(len(hunk.lines), lines_left - 1)
+    if keep < _MIN_HUNK_LINES:
+        return None
+    length = len(hunk.header) + 1
+    for index, line in enumerate(hunk.lines[:keep]):
+        length += len(line) + 1
+        if length > chars_left:
+            keep = index
+            break
+    # Token counts are not linear in lines, so shrink until the count fits
+    for _ in range(_CUT_ATTEMPTS):
+        if keep < _MIN_HUNK_LINES:
+            return None
+        cut = hunk.head(keep)
+        cost = count_tokens_batch([cut.text], model)[0]
+        if cost <= tokens_left:
+            return cut, cost
+        keep = int(keep * tokens_left / cost * 0.9)
+    return None
+
+
+def select_hunks(
+    patches: Sequence[FilePatch],
+    model: str,
+    token_budget: int,
+    per_file_tokens: int,
+    max_chars: int,
+    max_lines: int,
+) -> DiffSelection:
+    """Pack the highest-scoring hunks into a budget.
+
+    Hunks are taken best first. A hunk that doesn't fit whole is cut to what
+    is left of the budget if at least a few lines survive. A file's header
+    is paid for with its first chosen hunk.
+
+    Args:
+        patches: Parsed patch
+        model: Model whose tokenizer counts the budget
+        token_budget: Maximum tokens of the selected text
+        per_file_tokens: Maximum tokens for any one file, header included
+        max_chars: Maximum length of the selected text
+        max_lines: Maximum lines of the selected text
+
+    Returns:
+        The chosen hunks, rendered in diff order
+    """
+    keys = [(f, h) for f, patch in enumerate(patches) for h in range(len(patch.hunks))]
+    hunk_tokens = dict(zip(keys, count_tokens_batch([patches[f].hunks[h].text for f, h in keys], model), strict=True))
+    header_tokens = count_tokens_batch([patch.header for patch in patches], model)
+
+    kinds = [(patch.kind, patch.is_prose) for patch in patches]
+    scores = {(f, h): score_hunk(patches[f].hunks[h], *kinds[f]) for f, h in keys}
+    ranked = sorted((key for key in keys if scores[key] > 0), key=lambda key: (-scores[key], key))
+
+    chosen: dict[tuple[int, int], Hunk] = {}
+    file_tokens = [0] * len(patches)
+    tokens = chars = lines = 0
+    truncated = False
+    for key in ranked:
+        file_index, hunk_index = key
+        patch = patches[file_index]
+        hunk = patch.hunks[hunk_index]
+        cost = hunk_tokens[key]
+        extra_tokens = extra_chars = extra_lines = 0
+        if not file_tokens[file_index]:
+            extra_tokens = header_tokens[file_index]
+            extra_chars = len(patch.header) + 1
+            extra_lines = patch.header.count("\n") + 1
+
+        tokens_left = min(per_file_tokens - file_tokens[file_index], token_budget - tokens) - extra_tokens
+        chars_left = max_chars - chars - extra_chars
+        lines_left = max_lines - lines - extra_lines
+        if cost > tokens_left or len(hunk.text) + 1 > chars_left or len(hunk.lines) + 1 > lines_left:
+            truncated = True
+            cut = _cut_hunk(hunk, tokens_left, chars_left, lines_left, model)
+            if cut is None:
+                continue
+            hunk, cost = cut
+
+        chosen[key] = hunk
+        file_tokens[file_index] += cost + extra_tokens
+        tokens += cost + extra_tokens
+        chars += len(hunk.text) + 1 + extra_chars
+        lines += len(hunk.lines) + 1 + extra_lines
+
+    parts: list[str] = []
+    for file_index, patch in enumerate(patches):
+        selected = [chosen[(file_index, h)] for h in range(len(patch.hunks)) if (file_index, h) in chosen]
+        if selected:
+            parts.append(patch.header)
+            parts.extend(hunk.text for hunk in selected)
+    logger.debug(f"Selected {len(chosen)} of {len(keys)} hunks ({tokens} tokens) from {len(patches)} files")
+    return DiffSelection("\n".join(parts), truncated)
+
+
+def _omitted_note(entries: Sequence[FileDiffStat]) -> str:
+    counts = Counter(classify_path(entry.path).value for entry in entries)
+    if not counts:
+        return ""
+    listed = ", ".join(f"{count} {kind}" for kind, count in sorted(counts.items()))
+    return f"Not shown below (see the diffstat): {listed} files"
+
+
+def _exclude_pathspecs(entries: Sequence[FileDiffStat]) -> list[str]:
+    if not entries:
+        return []
+    paths = dict.fromkeys(path for entry in entries for path in (entry.path, entry.old_path) if path)
+    # ":/" keeps the rest of the repository in scope from any subdirectory
+    return [":/", *(f":(exclude,literal){path}" for path in list(paths)[:_MAX_EXCLUDED_PATHS])]
+
+
+def read_selected_diff(
+    rev_range: str,
+    model: str | None = None,
+    token_budget: int = Limits.MAX_DIFF_TOKENS,
+    per_file_tokens: int = Limits.MAX_DIFF_TOKENS_PER_FILE,
+    max_chars: int = Limits.MAX_DIFF_LENGTH,
+    max_lines: int = 500,
+    cwd: str | None = None,
+) -> str:
+    """Read a diffstat and the most informative hunks of a revision range.
+
+    Args:
+        rev_range: Range understood by ``git diff``
+        model: Model whose tokenizer counts the budget
+        token_budget: Maximum tokens of selected patch text
+        per_file_tokens: Maximum tokens of patch text for any one file
+        max_chars: Maximum length of the returned text
+        max_lines: Maximum lines of selected patch text
+        cwd: Directory to run git in (defaults to the current directory)
+
+    Returns:
+        Diffstat, a note on omitted low-value files, and the selected hunks,
+        at most ``max_chars`` long
+
+    Raises:
+        git.GitCommandError: If git is unavailable or exits with an error
+    """
+    stat = read_diffstat(rev_range, cwd=cwd)
+    low_value = [entry for entry in stat.files if classify_path(entry.path) in LOW_VALUE_KINDS]
+    stat_text = format_diff_for_prompt(stat, DiffExcerpt("", False))
+    note = _omitted_note(low_value)
+    head = "\n\n".join(part for part in (stat_text, note) if part)
+    budget = max_chars - len(head) - len("\n\n") - len(TRUNCATION_NOTE)
+    if budget <= 0:
+        return head[:max_chars]
+
+    excerpt = read_diff_excerpt(
+        rev_range,
+        max_chars=Limits.MAX_DIFF_SCAN_LENGTH,
+        max_lines=Limits.MAX_DIFF_SCAN_LINES,
+        cwd=cwd,
+        pathspecs=_exclude_pathspecs(low_value),
+    )
+    selection = select_hunks(
+        parse_patch(excerpt.text),
+        model=model or EnvDefaults.MODEL,
+        token_budget=token_budget,
+        per_file_tokens=per_file_tokens,
+        max_chars=budget,
+        max_lines=max_lines,
+    )
+    patch = selection.text
+    if patch and (selection.truncated or excerpt.truncated):
+        patch += TRUNCATION_NOTE
+    return "\n\n".join(part for part in (head, patch) if part)
@@ -5,8 +5,6 @@ import sys
 from collections.abc import Callable
 from typing import TypeVar
 
-from kittylog.output import get_output_manager
-
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
@@ -141,9 +139,9 @@ class AIError(KittylogError):
         return cls(message, error_type="connection")
 
     @classmethod
-    def rate_limit_error(cls, message: str) -> "AIError":
-        """Create a rate limit error."""
-        return cls(message, error_type="rate_limit")
+    def rate_limit_error(cls, message: str, retry_after: float | None = None) -> "AIError":
+        """Create a rate limit error, with the seconds the provider asked to wait if it said."""
+        return cls(message, error_type="rate_limit", retry_after=retry_after)
 
     @classmethod
     def timeout_error(cls, message: str) -> "AIError":
@@ -213,6 +211,8 @@ def handle_error(error: Exception, exit_program: bool = False, quiet: bool = Fal
         quiet: If True, suppress non-error output
     """
 
+    from kittylog.output import get_output_manager
+
     error_message = format_error_for_user(error)
     output = get_output_manager()
     output.error(error_message)
@@ -294,6 +294,10 @@ def classify_error(error: Exception) -> str:
         - 'authentication', 'model_not_found', 'context_length',
         - 'rate_limit', 'timeout', or 'unknown'
     """
+    # Errors raised from HTTP status codes know their type; messages are only matched for the rest
+    if isinstance(error, AIError) and error.error_type in ("authentication", "rate_limit", "timeout"):
+        return error.error_type
+
     error_str = str(error).lower()
 
     if "authentication" in error_str or "unauthorized" in error_str or "api key" in error_str:
@@ -0,0 +1,309 @@
+"""Size-capped diff reading and structured diffstats for kittylog.
+
+The prompt only has room for a few kilobytes of diff, but a release diff
+can be hundreds of megabytes. :func:`read_diff_excerpt` streams ``git diff``
+from a pipe and stops reading (and stops git) as soon as its line or
+character budget is spent, so memory use is bounded by the budget rather
+than by the size of the release.
+
+:func:`read_diffstat` summarises the whole range from a single
+``git diff --raw --numstat -z`` call, which never produces patch text: one
+entry per file with its status, line counts, rename source and a binary
+marker. :func:`format_diff_for_prompt` combines the two so the prompt sees
+every changed file (largest changes first) even when the patch excerpt
+only covers the first few of them.
+
+With ``-z`` both sections are NUL-terminated; raw entries come first and
+start with a colon, numstat entries follow in the same file order::
+
+    :<modes> <shas> <status>\\0<path>[\\0<path>]\\0...<added>\\t<deleted>\\t<path>\\0...
+
+Renames and copies carry two paths; their numstat entry has an empty path
+followed by the source and destination paths as separate fields.
+"""
+
+import logging
+import subprocess
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+
+import git
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from the git pipe per iteration
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Files listed individually in the prompt's diffstat; the rest are summarised
+MAX_DIFFSTAT_FILES = 40
+
+_DIFF_OPTIONS = ["-M", "--no-color", "--no-ext-diff", "--no-relative"]
+
+# Appended to a patch excerpt that was cut
+TRUNCATION_NOTE = "\n\n... (diff truncated; see the diffstat above for all changed files)"
+
+
+@dataclass(frozen=True)
+class FileDiffStat:
+    """Diffstat entry for one changed file.
+
+    Attributes:
+        path: Path after the change (the destination of renames and copies)
+        status: Status letter (A, C, D, M, R, T or U)
+        added: Added lines, or None for binary files
+        deleted: Deleted lines, or None for binary files
+        old_path: Source path of renames and copies
+    """
+
+    path: str
+    status: str
+    added: int | None
+    deleted: int | None
+    old_path: str | None = None
+
+    @property
+    def binary(self) -> bool:
+        """Whether git reported the file as binary."""
+        return self.added is None
+
+    @property
+    def churn(self) -> int:
+        """Changed lines, used to rank files."""
+        return (self.added or 0) + (self.deleted or 0)
+
+    def format(self) -> str:
+        """Render the entry as one diffstat line."""
+        name = f"{self.old_path} -> {self.path}" if self.old_path else self.path
+        counts = "binary" if self.binary else f"+{self.added} -{self.deleted}"
+        return f"{self.status} {name} ({counts})"
+
+
+@dataclass(frozen=True)
+class DiffStat:
+    """Per-file statistics for a diff."""
+
+    files: list[FileDiffStat] = field(default_factory=list)
+
+    @property
+    def added(self) -> int:
+        return sum(entry.added or 0 for entry in self.files)
+
+    @property
+    def deleted(self) -> int:
+        return sum(entry.deleted or 0 for entry in self.files)
+
+    def format(self, max_files: int = MAX_DIFFSTAT_FILES) -> str:
+        """Render a summary line and the largest changes, one file per line.
+
+        Args:
+            max_files: Files listed individually; the remainder is counted
+
+        Returns:
+            Diffstat text, or an empty string if nothing changed
+        """
+        if not self.files:
+            return ""
+        binary = sum(1 for entry in self.files if entry.binary)
+        summary = f"{len(self.files)} files changed, +{self.added} -{self.deleted}"
+        if binary:
+            summary += f", {binary} binary"
+        ranked = sorted(self.files, key=lambda entry: (entry.binary, -entry.churn))
+        lines = [summary, *(entry.format() for entry in ranked[:max_files])]
+        if len(ranked) > max_files:
+            lines.append(f"... and {len(ranked) - max_files} more files")
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class DiffExcerpt:
+    """The beginning of a patch, cut to a budget.
+
+    Attributes:
+        text: Patch text that fit the budget
+        truncated: Whether the patch continued past the budget
+    """
+
+    text: str
+    truncated: bool
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode("utf-8", errors="replace")
+
+
+def build_diff_command(rev_range: str, *options: str, pathspecs: Sequence[str] = ()) -> list[str]:
+    """Build a ``git diff`` command whose output is not affected by user configuration."""
+    return ["git", "diff", *_DIFF_OPTIONS, *options, rev_range, "--", *pathspecs]
+
+
+def _run_git(cmd: list[str], cwd: str | None) -> bytes:
+    try:
+        result = subprocess.run(cmd, cwd=cwd, capture_output=True, check=False)
+    except OSError as e:
+        raise git.GitCommandError(cmd, 127, str(e)) from e
+    if result.returncode != 0:
+        raise git.GitCommandError(cmd, result.returncode, _decode(result.stderr).strip())
+    return result.stdout
+
+
+def parse_diffstat(output: bytes) -> DiffStat:
+    """Parse ``git diff --raw --numstat -z`` output.
+
+    Args:
+        output: Raw command output
+
+    Returns:
+        Diffstat with one entry per changed file, in git's order
+    """
+    tokens: Iterator[bytes] = iter(output.split(b"\0"))
+    statuses: list[str] = []
+    counts: list[tuple[int | None, int | None, str, str | None]] = []
+
+    for token in tokens:
+        if not token:
+            continue
+        if token.startswith(b":"):
+            status = _decode(token.rsplit(b" ", 1)[-1])[:1]
+            # Skip the path(s); the numstat entry repeats them
+            for _ in range(2 if status in ("R", "C") else 1):
+                next(tokens, b"")
+            statuses.append(status)
+            continue
+
+        added, deleted, path = token.split(b"\t", 2)
+        old_path = None
+        if not path:
+            old_path = _decode(next(tokens, b""))
+            path = next(tokens, b"")
+        counts.append(
+            (
+                None if added == b"-" else int(added),
+                None if deleted == b"-" else int(deleted),
+                _decode(path),
+                old_path,
+            )
+        )
+
+    files = [
+        FileDiffStat(path=path, status=status, added=added, deleted=deleted, old_path=old_path)
+        for status, (added, deleted, path, old_path) in zip(statuses, counts, strict=False)
+    ]
+    return DiffStat(files)
+
+
+def read_diffstat(rev_range: str, cwd: str | None = None) -> DiffStat:
+    """Read per-file statistics for a revision range without producing patch text.
+
+    Args:
+        rev_range: Range understood by ``git diff`` (e.g. ``v1.0..HEAD``)
+        cwd: Directory to run git in (defaults to the current directory)
+
+    Returns:
+        Diffstat of the range
+
+    Raises:
+        git.GitCommandError: If git is unavailable or exits with an error
+    """
+    return parse_diffstat(_run_git(build_diff_command(rev_range, "--raw", "--numstat", "-z"), cwd))
+
+
+def read_diff_excerpt(
+    rev_range: str,
+    max_chars: int,
+    max_lines: int,
+    cwd: str | None = None,
+    pathspecs: Sequence[str] = (),
+) -> DiffExcerpt:
+    """Stream a patch from ``git diff``, stopping once the budget is spent.
+
+    Git is stopped as soon as enough output has been read, so the cost is
+    bounded by the budget rather than by the size of the diff.
+
+    Args:
+        rev_range: Range understood by ``git diff``
+        max_chars: Maximum characters of patch text to keep
+        max_lines: Maximum lines of patch text to keep
+        cwd: Directory to run git in (defaults to the current directory)
+        pathspecs: Git pathspecs limiting (or, with ``:(exclude)``, trimming)
+            the files in the patch
+
+    Returns:
+        The kept patch text and whether the patch was cut
+
+    Raises:
+        git.GitCommandError: If git is unavailable or exits with an error
+    """
+    cmd = build_diff_command(rev_range, pathspecs=pathspecs)
+    logger.debug(f"Streaming diff with: {' '.join(cmd)}")
+    try:
+        process = subprocess.Popen(
+            cmd, cwd=cwd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+    except OSError as e:
+        raise git.GitCommandError(cmd, 127, str(e)) from e
+
+    assert process.stdout is not None  # for mypy
+    chunks: list[bytes] = []
+    size = 0
+    lines = 0
+    truncated = False
+    try:
+        # Characters are at most as many as bytes, so a byte budget one past
+        # max_chars is enough to tell whether anything was cut
+        while size <= max_chars and lines < max_lines:
+            chunk = process.stdout.read(_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+            lines += chunk.count(b"\n")
+        else:
+            # The budget is spent, but git may also have just finished: only
+            # a patch with more output to come was cut
+            chunk = process.stdout.read(_READ_CHUNK_SIZE)
+            if chunk:
+                chunks.append(chunk)
+                truncated = True
+    finally:
+        process.stdout.close()
+        if truncated and process.poll() is None:
+            # Don't let git produce the rest of the diff
+            process.kill()
+        stderr = process.stderr.read() if process.stderr else b""
+        if process.stderr:
+            process.stderr.close()
+        returncode = process.wait()
+
+    if not truncated and returncode != 0:
+        raise git.GitCommandError(cmd, returncode, _decode(stderr).strip())
+
+    text = _decode(b"".join(chunks)).rstrip("\n")
+    kept = text.split("\n")[:max_lines]
+    if len(kept) < text.count("\n") + 1:
+        truncated = True
+    text = "\n".join(kept)
+    if len(text) > max_chars:
+        # Cut at a line boundary where possible
+        text = text[:max_chars]
+        text = text[: text.rfind("\n")] if "\n" in text else text
+        truncated = True
+    return DiffExcerpt(text, truncated)
+
+
+def format_diff_for_prompt(stat: DiffStat, excerpt: DiffExcerpt) -> str:
+    """Combine a diffstat and a patch excerpt into prompt text.
+
+    Args:
+        stat: Statistics for the whole range
+        excerpt: Beginning of the patch
+
+    Returns:
+        Diffstat followed by the patch excerpt, with a note when it was cut
+    """
+    parts = []
+    stat_text = stat.format()
+    if stat_text:
+        parts.append(f"Diffstat:\n{stat_text}")
+    if excerpt.text:
+        parts.append(excerpt.text + (TRUNCATION_NOTE if excerpt.truncated else ""))
+    return "\n\n".join(parts)
@@ -0,0 +1,369 @@
+"""Streaming commit ingestion from ``git log`` for kittylog.
+
+This module replaces per-commit GitPython tree diffs with a single
+``git log --name-status -z`` subprocess per revision range. The output is
+parsed incrementally, so commit records are produced as the pipe is
+read instead of after the whole history has been materialised.
+
+Each record is written as NUL-separated fields preceded by an empty field,
+which can never be a status letter or file name and therefore marks the
+start of a commit::
+
+    \\0<hash>\\0<author>\\0<date>\\0<message>\\0\\n<status>\\0<path>[\\0<path>]\\0...
+
+Listing changed files is what makes ``git log`` expensive, since it diffs
+every commit's tree against its parent. Callers that may not need file
+lists pass a :class:`~kittylog.commit_record.FileListLoader`; the log is
+then read without the diff section and the loader fetches the file lists
+of all those commits with one :func:`read_commit_files` call on first use.
+"""
+
+import logging
+import subprocess
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from functools import partial
+
+import git
+
+from kittylog.commit_record import CommitRecord, FileListLoader
+
+logger = logging.getLogger(__name__)
+
+# Format string for one commit record (see module docstring)
+LOG_FORMAT = "%x00%H%x00%an%x00%cI%x00%B"
+
+# Number of positional fields following the record marker
+_FIELD_COUNT = 4
+
+# Bytes read from the git pipe per iteration
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+def build_log_command(rev_range: str | None, with_files: bool = True) -> list[str]:
+    """Build the ``git log`` command used to stream commits for a range.
+
+    Rename detection and first-parent diffs for merges mirror what
+    ``commit.diff(commit.parents[0])`` reports through GitPython. Name-status
+    output is used rather than ``--name-only`` because the rename source is
+    needed to reproduce GitPython's file ordering (see :func:`_ordered_files`). The
+    explicit flags keep user configuration (signatures, relative paths,
+    external diff drivers) from changing the output format.
+
+    Args:
+        rev_range: Revision range understood by ``git log`` (e.g. ``v1.0..v2.0``),
+            or None to read individual commit hashes from stdin without walking
+            their history
+        with_files: Whether to list changed files; without them git only
+            walks commits and never reads trees
+
+    Returns:
+        Command as a list of arguments
+    """
+    revisions = ["--no-walk=unsorted", "--stdin"] if rev_range is None else [rev_range]
+    diff_options = ["--name-status", "-M", "--diff-merges=first-parent"] if with_files else []
+    return [
+        "git",
+        "log",
+        "-z",
+        *diff_options,
+        "--no-show-signature",
+        "--no-relative",
+        "--no-ext-diff",
+        "--no-color",
+        f"--format={LOG_FORMAT}",
+        *revisions,
+        "--",
+    ]
+
+
+def _decode(raw: bytes) -> str:
+    """Decode a field from git output, tolerating invalid UTF-8."""
+    return raw.decode("utf-8", errors="replace")
+
+
+def _split_tokens(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Split a stream of byte chunks into NUL-terminated tokens.
+
+    Tokens may span chunk boundaries; a trailing unterminated token is
+    emitted once the stream ends.
+    """
+    pending = b""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        parts = (pending + chunk).split(b"\0")
+        pending = parts.pop()
+        yield from parts
+    if pending:
+        yield pending
+
+
+def _ordered_files(entries: list[tuple[bytes, bytes]]) -> list[str]:
+    """Order changed paths the way ``commit.diff(parent)`` lists them.
+
+    GitPython diffs the commit against its parent, i.e. in the reverse
+    direction of ``git log``. Git emits a rename at the position of its
+    destination, which for the reversed diff is the pre-rename path, so
+    entries are sorted by their source path while reporting the new path.
+
+    Args:
+        entries: ``(sort_key, path)`` pairs in ``git log`` order
+
+    Returns:
+        Changed file paths
+    """
+    entries.sort(key=lambda entry: entry[0])
+    return [_decode(path) for _key, path in entries]
+
+
+def _build_commit(
+    fields: list[bytes], entries: list[tuple[bytes, bytes]], files: FileListLoader | None
+) -> CommitRecord:
+    """Build a commit record from parsed record fields."""
+    raw_message = _decode(fields[3])
+    return CommitRecord.from_datetime(
+        _decode(fields[0]),
+        raw_message.strip(),
+        _decode(fields[1]),
+        datetime.fromisoformat(_decode(fields[2])),
+        files=_ordered_files(entries) if files is None else files,
+        summary=raw_message.split("\n", 1)[0],
+    )
+
+
+def parse_log_stream(chunks: Iterable[bytes], files: FileListLoader | None = None) -> Iterator[CommitRecord]:
+    """Parse ``git log`` output produced with :data:`LOG_FORMAT`.
+
+    Args:
+        chunks: Raw byte chunks read from the git process
+        files: Loader for the file lists of output read without the diff
+            section; None to take the file lists from the output
+
+    Yields:
+        Commit records in the order git emitted them
+    """
+    fields: list[bytes] | None = None
+    entries: list[tuple[bytes, bytes]] = []
+    # Status token of the diff entry being read and the paths collected for it
+    status = b""
+    paths: list[bytes] = []
+
+    for token in _split_tokens(chunks):
+        if fields is not None and len(fields) < _FIELD_COUNT:
+            fields.append(token)
+            continue
+
+        if token == b"":
+            # An empty token starts a new record
+            if fields is not None:
+                yield _build_commit(fields, entries, files)
+            fields = []
+            entries = []
+            status = b""
+            continue
+
+        if fields is None:
+            # Output that precedes the first record marker is not ours to parse
+            continue
+
+        if not status:
+            # The diff section is separated from the header by a newline
+            status = token.lstrip(b"\n")
+            paths = []
+            continue
+
+        paths.append(token)
+        # Renames and copies carry a source and a destination path
+        if status[:1] in (b"R", b"C") and len(paths) < 2:
+            continue
+        entries.append((paths[0], paths[-1]))
+        status = b""
+
+    if fields is not None and len(fields) == _FIELD_COUNT:
+        yield _build_commit(fields, entries, files)
+
+
+def _stream_log(
+    cmd: list[str], cwd: str | None, stdin: bytes | None = None, files: FileListLoader | None = None
+) -> Iterator[CommitRecord]:
+    """Run a ``git log`` command and parse its output as it is produced."""
+    logger.debug(f"Streaming commits with: {' '.join(cmd)}")
+
+    try:
+        process = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdin=subprocess.PIPE if stdin is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except OSError as e:
+        raise git.GitCommandError(cmd, 127, str(e)) from e
+
+    if process.stdin is not None:
+        # git reads all of stdin before emitting any output, so this cannot deadlock
+        try:
+            process.stdin.write(stdin or b"")
+        except BrokenPipeError:
+            # git exited early; the error is reported through its exit status
+            pass
+        finally:
+            process.stdin.close()
+
+    assert process.stdout is not None  # for mypy
+    stdout = process.stdout
+    completed = False
+    try:
+        yield from parse_log_stream(iter(lambda: stdout.read(_READ_CHUNK_SIZE), b""), files)
+        completed = True
+    finally:
+        stdout.close()
+        if not completed and process.poll() is None:
+            # Consumer stopped early; don't wait for the rest of history
+            process.kill()
+        stderr = process.stderr.read() if process.stderr else b""
+        if process.stderr:
+            process.stderr.close()
+        returncode = process.wait()
+
+    if returncode != 0:
+        raise git.GitCommandError(cmd, returncode, _decode(stderr).strip())
+
+
+def iter_log_commits(
+    rev_range: str, cwd: str | None = None, files: FileListLoader | None = None
+) -> Iterator[CommitRecord]:
+    """Stream commits for a revision range from a single ``git log`` process.
+
+    Args:
+        rev_range: Revision range understood by ``git log``
+        cwd: Directory to run git in (defaults to the current directory)
+        files: Loader to defer file lists to; None to read them now
+
+    Yields:
+        Commit records in ``git log`` order (newest first)
+
+    Raises:
+        git.GitCommandError: If git is unavailable or exits with an error
+    """
+    return _stream_log(build_log_command(rev_range, with_files=files is None), cwd, files=files)
+
+
+def iter_log_commits_by_hash(
+    hashes: Iterable[str], cwd: str | None = None, files: FileListLoader | None = None
+) -> Iterator[CommitRecord]:
+    """Stream specific commits, without their history, from a single ``git log`` process.
+
+    Args:
+        hashes: Full commit hashes to read
+        cwd: Directory to run git in (defaults to the current directory)
+        files: Loader to defer file lists to; None to read them now
+
+    Yields:
+        Commit records in the order the hashes were given
+
+    Raises:
+        git.GitCommandError: If git is unavailable or a hash is unknown
+    """
+    stdin = "".join(f"{hexsha}\n" for hexsha in hashes).encode()
+    return _stream_log(build_log_command(None, with_files=files is None), cwd, stdin=stdin, files=files)
+
+
+def get_log_commits(rev_range: str, cwd: str | None = None, files: FileListLoader | None = None) -> list[CommitRecord]:
+    """Collect all commits for a revision range.
+
+    Args:
+        rev_range: Revision range understood by ``git log``
+        cwd: Directory to run git in (defaults to the current directory)
+        files: Loader to defer file lists to; None to read them now
+
+    Returns:
+        List of commit records in ``git log`` order (newest first)
+    """
+    return list(iter_log_commits(rev_range, cwd=cwd, files=files))
+
+
+def read_commit_files(hashes: list[str], cwd: str | None = None) -> dict[str, str]:
+    """Read the changed-file lists of specific commits with one ``git log`` call.
+
+    Args:
+        hashes: Full commit hashes
+        cwd: Directory to run git in (defaults to the current directory)
+
+    Returns:
+        File lists joined with NUL, keyed by commit hash
+
+    Raises:
+        git.GitCommandError: If git is unavailable or a hash is unknown
+    """
+    if not hashes:
+        return {}
+    commits = iter_log_commits_by_hash(hashes, cwd=cwd)
+    files = {commit.hash: commit.joined_files for commit in commits}
+    logger.debug(f"Read changed files of {len(files)} commits")
+    return files
+
+
+def lazy_files(cwd: str | None = None) -> FileListLoader:
+    """Create a loader that reads file lists straight from git when first needed.
+
+    Args:
+        cwd: Directory to run git in (defaults to the current directory)
+
+    Returns:
+        A new, empty loader
+    """
+    return FileListLoader(partial(read_commit_files, cwd=cwd))
+
+
+def _run_rev_list(args: list[str], cwd: str | None) -> list[str]:
+    """Run ``git rev-list`` and return its output lines."""
+    cmd = ["git", "rev-list", *args, "--"]
+    try:
+        result = subprocess.run(cmd, cwd=cwd, capture_output=True, check=False)
+    except OSError as e:
+        raise git.GitCommandError(cmd, 127, str(e)) from e
+    if result.returncode != 0:
+        raise git.GitCommandError(cmd, result.returncode, _decode(result.stderr).strip())
+    return _decode(result.stdout).splitlines()
+
+
+def list_revisions(rev_range: str, cwd: str | None = None) -> list[str]:
+    """List the commit hashes in a revision range without reading any trees.
+
+    Args:
+        rev_range: Revision range understood by ``git rev-list``
+        cwd: Directory to run git in (defaults to the current directory)
+
+    Returns:
+        Full commit hashes in ``git log`` order (newest first)
+
+    Raises:
+        git.GitCommandError: If git is unavailable or exits with an error
+    """
+    return _run_rev_list([rev_range], cwd)
+
+
+def list_revisions_with_parents(revisions: list[str], cwd: str | None = None) -> list[tuple[str, list[str]]]:
+    """List every commit reachable from any of ``revisions`` with its parents.
+
+    Only the commit graph is read, so this is cheap even for large histories.
+
+    Args:
+        revisions: Revisions to walk from
+        cwd: Directory to run git in (defaults to the current directory)
+
+    Returns:
+        ``(hash, parent hashes)`` pairs in ``git log`` order (newest first)
+
+    Raises:
+        git.GitCommandError: If git is unavailable or exits with an error
+    """
+    if not revisions:
+        return []
+    graph = []
+    for line in _run_rev_list(["--parents", *revisions], cwd):
+        hexsha, *parents = line.split()
+        graph.append((hexsha, parents))
+    return graph
@@ -0,0 +1,393 @@
+"""Persistent ``git cat-file`` object reader for kittylog.
+
+Resolving a revision or reading a commit through GitPython attribute
+access, or through a one-off ``git`` subprocess, pays process start-up
+or object-parse overhead on every call. :class:`ObjectReader` keeps one
+long-lived ``git cat-file --batch-command --buffer`` process per
+directory and multiplexes every request over its pipes. Both kinds of
+request share that one process: ``info`` (what ``--batch-check`` reports)
+and ``contents`` (what ``--batch`` reports).
+
+Requests are pipelined: up to :data:`PIPELINE_DEPTH` commands are written
+followed by ``flush``, then all of their answers are read. The commands of
+one round fit in the pipe buffer, so the writes never block on git.
+Answers have one of these shapes::
+
+    <oid> <type> <size>\\n               (info)
+    <oid> <type> <size>\\n<data>\\n       (contents)
+    <name> missing\\n | <name> ambiguous\\n
+
+Git releases older than 2.36 don't have ``--batch-command``. For them the
+reader falls back to ``git cat-file --batch`` and discards the contents
+of info requests.
+
+Readers are shared through :func:`get_object_reader` and are closed by
+:func:`close_object_readers`, which also runs at interpreter exit and when
+caches are cleared.
+"""
+
+import atexit
+import contextlib
+import logging
+import subprocess
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+import git
+
+from kittylog.cache import CacheManager
+from kittylog.commit_record import CommitRecord, FileListLoader
+
+logger = logging.getLogger(__name__)
+
+# Commands written before their answers are read; ~50 bytes each stays well
+# inside the 64 KiB pipe buffer
+PIPELINE_DEPTH = 256
+
+# Exit status of git for unknown options (pre-2.36 git and --batch-command)
+_USAGE_ERROR = 129
+
+# Trees with no entries, by object ID length; diffs of root commits start here
+EMPTY_TREE = {
+    40: "4b825dc642cb6eb9a060e54bf8d69288fbee4904",
+    64: "6ef19b41225c5369f1c104d45d8d85efa9b057b53b14b4b9b939dd74decc5321",
+}
+
+
+@dataclass(frozen=True)
+class ObjectInfo:
+    """What ``git cat-file --batch-check`` reports for an object.
+
+    Attributes:
+        hexsha: Full object ID
+        type: Object type (commit, tree, blob or tag)
+        size: Size of the object's contents in bytes
+    """
+
+    hexsha: str
+    type: str
+    size: int
+
+
+@dataclass(frozen=True)
+class GitObject:
+    """An object and its raw contents.
+
+    Attributes:
+        hexsha: Full object ID
+        type: Object type (commit, tree, blob or tag)
+        data: Raw contents
+    """
+
+    hexsha: str
+    type: str
+    data: bytes
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode("utf-8", errors="replace")
+
+
+class ObjectReader:
+    """One long-lived ``git cat-file`` process that answers object requests.
+
+    The reader is thread-safe; requests from different threads are
+    serialised over the one process. The process is started on the first
+    request and restarted if it dies.
+    """
+
+    def __init__(self, cwd: str | None = None):
+        """Create a reader.
+
+        Args:
+            cwd: Directory to run git in (defaults to the current directory)
+        """
+        self.cwd = cwd
+        self._process: subprocess.Popen[bytes] | None = None
+        self._legacy = False
+        self._lock = threading.Lock()
+
+    @property
+    def _command(self) -> list[str]:
+        if self._legacy:
+            return ["git", "cat-file", "--batch"]
+        return ["git", "cat-file", "--batch-command", "--buffer"]
+
+    def _start(self) -> "subprocess.Popen[bytes]":
+        if self._process is None or self._process.poll() is not None:
+            cmd = self._command
+            logger.debug(f"Starting object reader: {' '.join(cmd)}")
+            try:
+                self._process = subprocess.Popen(
+                    cmd, cwd=self.cwd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                )
+            except OSError as e:
+                raise git.GitCommandError(cmd, 127, str(e)) from e
+        return self._process
+
+    def _fail(self, process: "subprocess.Popen[bytes]") -> git.GitCommandError:
+        """Reap a process that stopped answering and describe why."""
+        self._process = None
+        for stream in (process.stdin, process.stdout):
+            if stream is not None:
+                with contextlib.suppress(OSError):
+                    stream.close()
+        process.kill()
+        stderr = process.stderr.read() if process.stderr else b""
+        if process.stderr:
+            process.stderr.close()
+        returncode = process.wait()
+        return git.GitCommandError(self._command, returncode, _decode(stderr).strip())
+
+    def _round(self, revisions: Sequence[str], with_data: bool) -> list[GitObject | ObjectInfo | None]:
+        process = self._start()
+        assert process.stdin is not None and process.stdout is not None  # for mypy
+        if self._legacy:
+            payload = "".join(f"{revision}\n" for revision in revisions)
+        else:
+            command = "contents" if with_data else "info"
+            payload = "".join(f"{command} {revision}\n" for revision in revisions) + "flush\n"
+        try:
+            process.stdin.write(payload.encode())
+            process.stdin.flush()
+            return [self._read_answer(process.stdout, with_data) for _ in revisions]
+        except (BrokenPipeError, EOFError) as e:
+            error = self._fail(process)
+            if process.returncode == _USAGE_ERROR and not self._legacy:
+                logger.debug("git cat-file has no --batch-command; falling back to --batch")
+                self._legacy = True
+                return self._round(revisions, with_data)
+            raise error from e
+        except BaseException:
+            # A half-read answer would desynchronise the pipe; start over next time
+            self._fail(process)
+            raise
+
+    def _read_answer(self, stdout: IO[bytes], with_data: bool) -> GitObject | ObjectInfo | None:
+        header = stdout.readline()
+        if not header:
+            raise EOFError("git cat-file closed its output")
+        if header.endswith((b" missing\n", b" ambiguous\n")):
+            return None
+        raw_hexsha, raw_type, raw_size = header.split()
+        hexsha, object_type, size = _decode(raw_hexsha), _decode(raw_type), int(raw_size)
+        if self._legacy or with_data:
+            data = stdout.read(size + 1)
+            if len(data) != size + 1:
+                raise EOFError("git cat-file closed its output")
+            if with_data:
+                return GitObject(hexsha, object_type, data[:size])
+        return ObjectInfo(hexsha, object_type, size)
+
+    def _request(self, revisions: Sequence[str], with_data: bool) -> list:
+        for revision in revisions:
+            if not revision or "\n" in revision:
+                raise ValueError(f"Invalid revision: {revision!r}")
+        answers: list = []
+        with self._lock:
+            for start in range(0, len(revisions), PIPELINE_DEPTH):
+                answers.extend(self._round(revisions[start : start + PIPELINE_DEPTH], with_data))
+        return answers
+
+    def info_many(self, revisions: Sequence[str]) -> list[ObjectInfo | None]:
+        """Look up the type and size of several objects in one round trip.
+
+        Args:
+            revisions: Object IDs or revision expressions (e.g. ``HEAD^1``, ``v1.0^{commit}``)
+
+        Returns:
+            One entry per revision, None where the revision does not resolve
+
+        Raises:
+            git.GitCommandError: If git is unavailable or the process fails
+            ValueError: If a revision is empty or contains a newline
+        """
+        return self._request(revisions, with_data=False)
+
+    def read_many(self, revisions: Sequence[str]) -> list[GitObject | None]:
+        """Read several objects in one round trip.
+
+        Args:
+            revisions: Object IDs or revision expressions
+
+        Returns:
+            One entry per revision, None where the revision does not resolve
+
+        Raises:
+            git.GitCommandError: If git is unavailable or the process fails
+            ValueError: If a revision is empty or contains a newline
+        """
+        return self._request(revisions, with_data=True)
+
+    def info(self, revision: str) -> ObjectInfo | None:
+        """Look up the type and size of one object (None if it does not resolve)."""
+        return self.info_many([revision])[0]
+
+    def read(self, revision: str) -> GitObject | None:
+        """Read one object (None if it does not resolve)."""
+        return self.read_many([revision])[0]
+
+    def resolve(self, revision: str) -> str | None:
+        """Return the full object ID a revision names, or None if it does not resolve."""
+        info = self.info(revision)
+        return info.hexsha if info is not None else None
+
+    def close(self) -> None:
+        """Stop the git process; a later request starts a new one."""
+        with self._lock:
+            process, self._process = self._process, None
+        if process is None:
+            return
+        for stream in (process.stdin, process.stdout, process.stderr):
+            if stream is not None:
+                with contextlib.suppress(OSError):
+                    stream.close()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def __enter__(self) -> "ObjectReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class _ReaderPool:
+    """Object readers shared per directory; clearing closes them."""
+
+    __name__ = "object_readers"
+
+    def __init__(self) -> None:
+        self._readers: dict[str, ObjectReader] = {}
+        self._lock = threading.Lock()
+
+    def get(self, cwd: str | None) -> ObjectReader:
+        directory = str(Path(cwd or ".").resolve())
+        with self._lock:
+            reader = self._readers.get(directory)
+            if reader is None:
+                reader = self._readers[directory] = ObjectReader(directory)
+            return reader
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            readers = list(self._readers.values())
+            self._readers.clear()
+        for reader in readers:
+            reader.close()
+
+
+_pool = _ReaderPool()
+CacheManager.register(_pool)  # type: ignore[arg-type]
+atexit.register(_pool.cache_clear)
+
+
+def get_object_reader(cwd: str | None = None) -> ObjectReader:
+    """Return the shared object reader for a directory.
+
+    Args:
+        cwd: Directory inside the repository (defaults to the current directory)
+
+    Returns:
+        The reader, created on first use
+    """
+    return _pool.get(cwd)
+
+
+def close_object_readers() -> None:
+    """Stop every shared object reader."""
+    _pool.cache_clear()
+
+
+def empty_tree(hexsha: str) -> str:
+    """Return the ID of the empty tree in the object format of ``hexsha``."""
+    return EMPTY_TREE[len(hexsha)]
+
+
+def _parse_person(line: bytes) -> tuple[bytes, int, int]:
+    """Split an ``author``/``committer`` header value into name, timestamp and UTC offset."""
+    name, _, rest = line.partition(b" <")
+    _email, _, when = rest.rpartition(b"> ")
+    timestamp, _, tz = when.partition(b" ")
+    offset = 0
+    if len(tz) == 5:
+        minutes = int(tz[1:3]) * 60 + int(tz[3:5])
+        offset = (-60 if tz[:1] == b"-" else 60) * minutes
+    return name, int(timestamp), offset
+
+
+def _decode_as(raw: bytes, encoding: str) -> str:
+    try:
+        return raw.decode(encoding, errors="replace")
+    except LookupError:
+        # Unknown encoding name in the commit header
+        return _decode(raw)
+
+
+def parse_commit_object(hexsha: str, data: bytes, files: FileListLoader) -> CommitRecord:
+    """Build a commit record from the raw contents of a commit object.
+
+    The record matches what ``git log`` reports: author name, committer date
+    and the message re-encoded to UTF-8 from the commit's ``encoding``
+    header.
+
+    Args:
+        hexsha: Full commit hash
+        data: Raw commit object
+        files: Loader for the commit's changed-file list
+
+    Returns:
+        The commit record
+    """
+    headers, _, raw_message = data.partition(b"\n\n")
+    author = b""
+    timestamp = offset = 0
+    encoding = "utf-8"
+    for line in headers.split(b"\n"):
+        key, _, value = line.partition(b" ")
+        if key == b"author":
+            author = _parse_person(value)[0]
+        elif key == b"committer":
+            _name, timestamp, offset = _parse_person(value)
+        elif key == b"encoding":
+            encoding = _decode(value)
+    message = _decode_as(raw_message, encoding)
+    return CommitRecord(
+        hexsha,
+        message.strip(),
+        _decode_as(author, encoding),
+        timestamp,
+        offset,
+        files=files,
+        summary=message.split("\n", 1)[0],
+    )
+
+
+def read_commits(hashes: Sequence[str], files: FileListLoader, cwd: str | None = None) -> list[CommitRecord]:
+    """Read specific commits through the shared object reader.
+
+    Args:
+        hashes: Full commit hashes
+        files: Loader the commits' file lists are deferred to
+        cwd: Directory to run git in (defaults to the current directory)
+
+    Returns:
+        Commit records in the order the hashes were given
+
+    Raises:
+        git.GitCommandError: If git is unavailable or a hash is not a known commit
+    """
+    objects = get_object_reader(cwd).read_many(hashes)
+    commits = []
+    for hexsha, obj in zip(hashes, objects, strict=True):
+        if obj is None or obj.type != "commit":
+            raise git.GitCommandError(["git", "cat-file", "commit", hexsha], 128, f"Not a known commit: {hexsha}")
+        commits.append(parse_commit_object(obj.hexsha, obj.data, files))
+    logger.debug(f"Read {len(commits)} commit objects")
+    return commits
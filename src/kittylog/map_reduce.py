@@ -0,0 +1,200 @@
+"""Hierarchical (map-reduce) changelog generation for very large releases.
+
+Releases with tens of thousands of commits do not fit one prompt, however
+hard the commits are packed. Map-reduce generation splits the commits into
+chunks and summarizes every chunk into the audience's JSON sections in
+parallel (map). The partial results are merged and deduplicated, and a
+final call consolidates them into one entry (reduce). When even the merged
+drafts exceed the context budget, groups of drafts are consolidated first,
+over as many rounds as needed.
+
+The functions here only build prompts and combine results; the actual model
+call is a ``complete(system_prompt, user_prompt) -> str`` callable supplied
+by :mod:`kittylog.ai`, which adds caching and retries.
+"""
+
+import json
+import logging
+import re
+from collections.abc import Callable, Mapping, Sequence
+from functools import partial
+from typing import Any
+
+from kittylog.concurrency import map_in_order
+from kittylog.constants import Audiences
+from kittylog.prompt import build_changelog_prompt
+from kittylog.prompt.json_schema import merge_json_sections, parse_json_response
+from kittylog.prompt.packer import format_commit
+from kittylog.prompt.system import build_system_prompt
+from kittylog.prompt.user import build_reduce_prompt
+from kittylog.tokenizer import count_tokens, count_tokens_batch
+
+logger = logging.getLogger(__name__)
+
+CompleteFunc = Callable[[str, str], str]
+
+# Upper bound on intermediate reduce rounds; each round shrinks the drafts by at least half
+MAX_REDUCE_ROUNDS = 8
+
+
+def chunk_commits(commits: Sequence[Mapping[str, Any]], chunk_size: int) -> list[Sequence[Mapping[str, Any]]]:
+    """Split commits into consecutive chunks of at most ``chunk_size`` commits."""
+    chunk_size = max(1, chunk_size)
+    return [commits[start : start + chunk_size] for start in range(0, len(commits), chunk_size)]
+
+
+def needs_map_reduce(commits: Sequence[Mapping[str, Any]], chunk_size: int, model: str, token_budget: int) -> bool:
+    """Return whether a release is too large to summarize in a single call.
+
+    Releases of at most one chunk always use a single (packed) prompt.
+
+    Args:
+        commits: Commits of the release
+        chunk_size: Commits per map chunk
+        model: Model name used for token counting
+        token_budget: Prompt token budget of a single call
+
+    Returns:
+        True if the full commit listing exceeds the budget and spans several chunks
+    """
+    if len(commits) <= chunk_size:
+        return False
+    return sum(count_tokens_batch([format_commit(commit) for commit in commits], model)) > token_budget
+
+
+def parse_partial_result(content: str) -> dict[str, list[str]]:
+    """Parse a map or intermediate reduce response into sections.
+
+    Responses that are not valid JSON fall back to their bullet lines, filed
+    under "changed" (remapped to the audience's schema when merged).
+    """
+    parsed = parse_json_response(content)
+    if parsed is not None:
+        return parsed
+    items = [match.strip() for match in re.findall(r"^\s*[-*]\s+(.+)$", content, re.MULTILINE)]
+    logger.warning(f"Partial changelog result was not JSON; recovered {len(items)} bullet items")
+    return {"changed": items} if items else {}
+
+
+def _group_by_tokens(parts: list[dict[str, list[str]]], budget: int, model: str) -> list[list[dict[str, list[str]]]]:
+    """Group consecutive partial results so each group's JSON fits ``budget`` tokens (at least two per group)."""
+    costs = count_tokens_batch([json.dumps(part, ensure_ascii=False) for part in parts], model)
+    groups: list[list[dict[str, list[str]]]] = []
+    current: list[dict[str, list[str]]] = []
+    used = 0
+    for part, cost in zip(parts, costs, strict=True):
+        if len(current) >= 2 and used + cost > budget:
+            groups.append(current)
+            current, used = [], 0
+        current.append(part)
+        used += cost
+    if current:
+        groups.append(current)
+    return groups
+
+
+def generate_map_reduce(
+    commits: Sequence[Mapping[str, Any]],
+    complete: CompleteFunc,
+    *,
+    tag: str | None,
+    model: str,
+    token_budget: int,
+    chunk_size: int,
+    jobs: int = 1,
+    from_boundary: str | None = None,
+    hint: str = "",
+    boundary_mode: str = "tags",
+    language: str | None = None,
+    translate_headings: bool = False,
+    audience: str | None = None,
+    context_entries: str = "",
+    session_context: str = "",
+    detail_level: str = "normal",
+) -> str:
+    """Generate a changelog entry for a large release by map-reduce.
+
+    Map prompts carry only the chunk's commits and the hint; the language,
+    preceding entries and session context are applied in the final reduce.
+
+    Args:
+        commits: Commits of the release
+        complete: Function sending (system_prompt, user_prompt) to the model and returning its response
+        tag: The target boundary identifier
+        model: Model name used for token counting
+        token_budget: Prompt token budget of a single call
+        chunk_size: Commits per map chunk
+        jobs: Maximum number of map or reduce calls in flight
+        from_boundary: The previous boundary identifier (for context)
+        hint: Additional context hint
+        boundary_mode: The boundary mode ('tags', 'dates', 'gaps')
+        language: Optional language for the generated changelog
+        translate_headings: Whether to translate section headings into the selected language
+        audience: Target audience slug controlling tone and emphasis
+        context_entries: Pre-formatted string of preceding changelog entries
+        session_context: Cumulative list of items already generated in this session
+        detail_level: Output detail level - 'concise', 'normal', or 'detailed'
+
+    Returns:
+        Raw response of the final reduce call (JSON in the audience's schema)
+    """
+    resolved_audience = Audiences.resolve(audience) if audience else "developers"
+    chunks = chunk_commits(commits, chunk_size)
+    logger.info(f"Summarizing {len(commits)} commits in {len(chunks)} chunks ({jobs} at a time)")
+
+    def summarize_chunk(chunk: Sequence[Mapping[str, Any]]) -> dict[str, list[str]]:
+        system_prompt, user_prompt = build_changelog_prompt(
+            commits=chunk,
+            tag=tag,
+            from_boundary=from_boundary,
+            hint=hint,
+            boundary_mode=boundary_mode,
+            audience=resolved_audience,
+            detail_level=detail_level,
+            model=model,
+            token_budget=token_budget,
+        )
+        return parse_partial_result(complete(system_prompt, user_prompt))
+
+    parts = [future.result() for _chunk, future in map_in_order(summarize_chunk, chunks, jobs)]
+
+    system_prompt = build_system_prompt(audience=resolved_audience, detail_level=detail_level)
+    reduce_prompt = partial(
+        build_reduce_prompt,
+        tag=tag,
+        from_boundary=from_boundary,
+        hint=hint,
+        boundary_mode=boundary_mode,
+        audience=resolved_audience,
+        commit_count=len(commits),
+    )
+
+    def consolidate(group: list[dict[str, list[str]]]) -> dict[str, list[str]]:
+        sections = merge_json_sections(group, resolved_audience)
+        return parse_partial_result(complete(system_prompt, reduce_prompt(sections)))
+
+    # Tokens left for the drafts themselves in a reduce call
+    overhead = count_tokens(system_prompt, model) + count_tokens(
+        reduce_prompt({}, language=language, context_entries=context_entries, session_context=session_context),
+        model,
+    )
+    drafts_budget = token_budget - overhead
+
+    for round_number in range(1, MAX_REDUCE_ROUNDS + 1):
+        sections = merge_json_sections(parts, resolved_audience)
+        if len(parts) <= 1 or count_tokens(json.dumps(sections, indent=2, ensure_ascii=False), model) <= drafts_budget:
+            break
+        groups = _group_by_tokens(parts, drafts_budget, model)
+        logger.info(f"Reduce round {round_number}: consolidating {len(parts)} drafts in {len(groups)} groups")
+        parts = [future.result() for _group, future in map_in_order(consolidate, groups, jobs)]
+    else:
+        logger.warning("Drafts still exceed the context budget after the last reduce round")
+
+    final_prompt = reduce_prompt(
+        merge_json_sections(parts, resolved_audience),
+        language=language,
+        translate_headings=translate_headings,
+        context_entries=context_entries,
+        session_context=session_context,
+    )
+    return complete(system_prompt, final_prompt)
@@ -3,7 +3,10 @@
 from collections.abc import Callable
 from typing import Any
 
-from kittylog.commit_analyzer import get_commits_between_boundaries
+from kittylog.changelog.document import ChangelogDocument
+from kittylog.changelog.insertion import insert_section_at, insert_sections_at
+from kittylog.commit_analyzer import get_commits_between_boundaries, partition_commits_by_boundaries
+from kittylog.concurrency import map_in_order
 from kittylog.errors import AIError, GitError
 from kittylog.tag_operations import get_all_boundaries
 from kittylog.utils.text import format_version_for_changelog
@@ -147,11 +150,12 @@ def handle_boundary_range_mode(
 
     output.info(f"Processing range: {from_name} to {to_name} ({to_date})")
 
-    # Get commits for the range
+    # Get commits for the range: the bucket of to_boundary once from_boundary has claimed its history
     try:
-        commits = get_commits_between_boundaries(
-            from_boundary=from_boundary, to_boundary=to_boundary, mode=to_boundary.get("mode", "tags")
-        )
+        if from_boundary:
+            commits = partition_commits_by_boundaries([from_boundary, to_boundary], only=[1])[1]
+        else:
+            commits = partition_commits_by_boundaries([to_boundary])[0]
     except (GitError, KeyError, ValueError) as e:
         raise GitError(
             f"Failed to get commits for range {from_name} to {to_name}: {e}",
@@ -202,6 +206,7 @@ def handle_update_all_mode(
     quiet: bool = False,
     dry_run: bool = False,
     incremental_save: bool = True,
+    jobs: int = 1,
     **kwargs: Any,
 ) -> tuple[bool, str]:
     """Handle update all mode workflow.
@@ -214,6 +219,7 @@ def handle_update_all_mode(
         yes: Auto-accept without previews
         dry_run: Preview changes without saving
         incremental_save: Save after each entry is generated instead of all at once
+        jobs: Maximum number of entries to generate concurrently
         **kwargs: Additional arguments for entry generation
 
     Returns:
@@ -243,12 +249,23 @@ def handle_update_all_mode(
 
     output.info(f"Found {len(boundaries)} boundaries for mode {mode}")
 
+    # Split history into per-boundary commit buckets with a single walk
+    try:
+        commit_buckets = partition_commits_by_boundaries(boundaries)
+    except GitError as e:
+        raise GitError(
+            f"Failed to get commits for boundaries in mode {mode}: {e}",
+            command="git rev-list --parents",
+            stderr=str(e),
+        ) from e
+
     success = True
 
     # Collect all boundary entries first, processing in chronological order (oldest first)
     # This ensures the AI has historical context from previously generated entries
     boundary_entries = []
 
+    tasks = []
     for i, boundary in enumerate(boundaries):
         boundary_name = boundary.get("identifier", boundary.get("hash", "unknown"))
         raw_date = boundary.get("date", "")
@@ -257,25 +274,28 @@ def handle_update_all_mode(
 
         output.info(f"Processing boundary: {boundary_name} ({boundary_date})")
 
-        # Get commits for this boundary
-        try:
-            commits = get_commits_between_boundaries(
-                from_boundary=None,  # From beginning
-                to_boundary=boundary,
-                mode=mode,
-            )
-        except (GitError, KeyError, ValueError) as e:
-            output.warning(f"Failed to get commits for boundary {boundary_name}: {e}")
-            success = False
-            continue
-
+        # Commits since the previous boundary
+        commits = commit_buckets[i]
         if not commits:
             output.info(f"No commits found for boundary {boundary_name}, skipping")
             continue
 
-        # Generate changelog entry
+        previous_name = None
+        if i > 0:
+            previous_name = boundaries[i - 1].get("identifier", boundaries[i - 1].get("hash"))
+
+        tasks.append((i, boundary_name, boundary_date, commits, previous_name))
+
+    def generate(task: tuple) -> str:
+        i, boundary_name, _boundary_date, commits, previous_name = task
+        return generate_entry_func(
+            commits=commits, tag=boundary_name, from_boundary=previous_name, position=i, **kwargs
+        )
+
+    # Generate entries (concurrently when jobs > 1); results arrive in boundary order
+    for (i, boundary_name, boundary_date, _commits, _previous), future in map_in_order(generate, tasks, jobs):
         try:
-            entry = generate_entry_func(commits=commits, tag=boundary_name, from_boundary=None, **kwargs)
+            entry = future.result()
 
             if not entry.strip():
                 output.warning(f"AI generated empty content for boundary {boundary_name}")
@@ -327,36 +347,25 @@ def handle_update_all_mode(
                     insert_point = i
                     break
 
-        # Insert entries in chronological order (oldest first)
-        # Each insert at fixed position pushes older entries down, resulting in newest on top
-        for entry_data in boundary_entries:
-            # Split the version section into lines
-            version_lines = entry_data["version_section"].split("\n")
-
-            # Insert at the fixed position
-            current_pos = insert_point
-            for line in version_lines:
-                lines.insert(current_pos, line)
-                current_pos += 1
-
-            # Add spacing between entries
-            if current_pos < len(lines) and lines[current_pos].strip():
-                lines.insert(current_pos, "")
-                current_pos += 1
-
-            # Save incrementally after each successful insertion
-            existing_content = "\n".join(lines)
-            if incremental_save and not dry_run:
+        # Insert entries in chronological order (oldest first); each one goes on top of the
+        # previous, resulting in newest on top. The sections are merged in one pass; when saving
+        # incrementally each one is inserted into a document kept between saves
+        if incremental_save and not dry_run:
+            document = ChangelogDocument(existing_content)
+            for entry_data in boundary_entries:
+                insert_section_at(document, insert_point, entry_data["version_section"])
+                existing_content = document.text()
                 write_changelog(changelog_file, existing_content)
                 if not quiet:
                     progress = f"({entry_data['index'] + 1}/{len(boundaries)})"
                     output.success(f"✓ Saved changelog entry for {entry_data['boundary_name']} {progress}")
-            else:
-                if not quiet:
+        else:
+            if not quiet:
+                for entry_data in boundary_entries:
                     progress = f"({entry_data['index'] + 1}/{len(boundaries)})"
                     output.info(f"✓ Prepared changelog entry for {entry_data['boundary_name']} {progress}")
-        # Reconstruct the content
-        existing_content = "\n".join(lines)
+            sections = [entry_data["version_section"] for entry_data in boundary_entries]
+            existing_content = insert_sections_at(existing_content, insert_point, sections)
 
     # Note: Entries are already saved incrementally above if incremental_save is enabled
     # Only do final save if incremental_save is disabled
@@ -1,10 +1,18 @@
 """Missing entries mode handler for kittylog."""
 
 from kittylog.changelog.boundaries import find_existing_boundaries
-from kittylog.changelog.insertion import find_insertion_point_by_version
-from kittylog.commit_analyzer import get_commits_between_boundaries, get_commits_between_tags
+from kittylog.changelog.document import ChangelogDocument
+from kittylog.changelog.insertion import (
+    insert_section_at,
+    insert_sections_at,
+    insert_version_section,
+    insert_version_sections,
+)
+from kittylog.commit_analyzer import partition_commits_by_boundaries
+from kittylog.concurrency import map_in_order
 from kittylog.errors import AIError, GitError
-from kittylog.tag_operations import get_all_boundaries, get_tag_date
+from kittylog.run_stamp import mark_up_to_date
+from kittylog.tag_operations import boundary_key, get_boundary_catalog, get_tag_date
 from kittylog.utils.text import format_version_for_changelog
 
 
@@ -31,8 +39,8 @@ def determine_missing_entries(changelog_file: str, mode: str = "tags", **kwargs)
         # If changelog doesn't exist, all tags are missing
         existing_versions = set()
 
-    # Get all boundaries based on mode
-    all_boundaries = get_all_boundaries(mode=mode, **kwargs)
+    # Get all boundaries based on mode (indexed once per run and shared with the handler)
+    all_boundaries = get_boundary_catalog(mode, **kwargs).boundaries
 
     # Debug logging
     from kittylog.utils.logging import get_logger
@@ -47,26 +55,16 @@ def determine_missing_entries(changelog_file: str, mode: str = "tags", **kwargs)
     if mode == "tags":
         # For tags mode, normalize by stripping 'v' prefix for comparison since
         # find_existing_boundaries normalizes changelog versions the same way
-        missing_boundaries = []
-        for boundary in all_boundaries:
-            # Use the same identifier logic as the rest of the function
-            identifier = boundary.get("identifier") or boundary.get("name") or boundary.get("display_name") or "unknown"
-            if identifier.lstrip("v") not in existing_versions:
-                missing_boundaries.append(identifier)
+        missing_boundaries = [
+            boundary_key(boundary)
+            for boundary in all_boundaries
+            if boundary_key(boundary).lstrip("v") not in existing_versions
+        ]
     else:
         # For dates and gaps modes, use the boundary identifier directly
-        missing_boundaries = []
-        for boundary in all_boundaries:
-            # Try multiple keys that might represent the boundary identifier
-            # Fall back to commit hash, not datetime string
-            identifier = (
-                boundary.get("identifier")
-                or boundary.get("name")
-                or boundary.get("display_name")
-                or boundary.get("hash", "unknown")
-            )
-            if identifier not in existing_versions:
-                missing_boundaries.append(identifier)
+        missing_boundaries = [
+            boundary_key(boundary) for boundary in all_boundaries if boundary_key(boundary) not in existing_versions
+        ]
 
     logger.debug(f"Missing boundaries determined: {missing_boundaries}")
     return missing_boundaries
@@ -81,6 +79,7 @@ def handle_missing_entries_mode(
     quiet: bool = False,
     dry_run: bool = False,
     incremental_save: bool = True,
+    jobs: int = 1,
     **kwargs,
 ) -> tuple[bool, str]:
     """Handle missing entries mode workflow.
@@ -94,6 +93,7 @@ def handle_missing_entries_mode(
         yes: Auto-accept without previews
         dry_run: Preview changes without saving
         incremental_save: Save after each entry is generated instead of all at once
+        jobs: Maximum number of entries to generate concurrently
         **kwargs: Additional arguments for entry generation
 
     Returns:
@@ -111,6 +111,7 @@ def handle_missing_entries_mode(
 
     if not missing_boundaries:
         output.info("No missing changelog entries found")
+        mark_up_to_date(changelog_file)
         try:
             existing_content = read_changelog(changelog_file)
         except FileNotFoundError:
@@ -124,66 +125,54 @@ def handle_missing_entries_mode(
 
     success = True
 
-    # Get all boundaries to find the ones we need to process
-    all_boundaries = get_all_boundaries(mode=mode, date_grouping=date_grouping, gap_threshold_hours=gap_threshold)
-
-    # Create a mapping from identifier to boundary dict
-    boundary_map = {}
-    for boundary in all_boundaries:
-        # Use the same identifier logic as determine_missing_entries
-        identifier = (
-            boundary.get("identifier")
-            or boundary.get("name")
-            or boundary.get("display_name")
-            or boundary.get("hash", "unknown")
+    # The boundaries indexed by determine_missing_entries, to look up the missing ones and their position in history
+    catalog = get_boundary_catalog(mode, date_grouping=date_grouping, gap_threshold_hours=gap_threshold)
+
+    # Split history into per-boundary commit buckets with a single walk, reading
+    # commit details only for the boundaries that are missing
+    try:
+        commit_buckets = partition_commits_by_boundaries(
+            catalog.boundaries,
+            only=[position for b_id in missing_boundaries if (position := catalog.position(b_id)) is not None],
         )
-        boundary_map[identifier] = boundary
+    except GitError as e:
+        output.warning(f"Failed to get commits for missing boundaries: {e}")
+        return False, updated_content
 
-    # Process each missing boundary and save immediately after each one
-    # This ensures the changelog is updated iteratively as each entry is generated
+    # Gather the work for each missing boundary up front so entries can be generated concurrently
+    tasks = []
     for i, boundary_id in enumerate(missing_boundaries):
-        try:
-            boundary = boundary_map[boundary_id]
+        position = catalog.position(boundary_id)
+        if position is None:
+            output.warning(f"Failed to process boundary {boundary_id}: not found in {mode} boundaries")
+            success = False
+            continue
+        boundary = catalog.boundaries[position]
 
-            # Find the previous boundary to use as a starting point
-            boundary_idx = -1
-            for idx, b in enumerate(all_boundaries):
-                # Calculate identifier for comparison matches how boundary_map specific keys were created
-                b_id = b.get("identifier") or b.get("name") or b.get("display_name") or b.get("hash", "unknown")
-                if b_id == boundary_id:
-                    boundary_idx = idx
-                    break
+        # Commits since the previous boundary
+        commits = commit_buckets[position]
+        tag = boundary.get("name", boundary_id) if mode == "tags" else boundary_id
 
-            prev_boundary = all_boundaries[boundary_idx - 1] if boundary_idx > 0 else None
+        if not commits:
+            output.info(f"No commits found for {boundary_id}, skipping")
+            continue
 
-            # Get commits for this boundary
-            if mode == "tags":
-                # For tags mode, use the existing tag-based function
-                tag_name = boundary.get("name", boundary_id)
-                from_tag_name = prev_boundary.get("name", prev_boundary.get("identifier")) if prev_boundary else None
-
-                commits = get_commits_between_tags(
-                    from_tag=from_tag_name,  # From previous tag
-                    to_tag=tag_name,
-                )
-                tag = tag_name
-            else:
-                # For dates and gaps modes, use the boundary-aware function
-                commits = get_commits_between_boundaries(
-                    from_boundary=prev_boundary,  # From previous boundary
-                    to_boundary=boundary,
-                    mode=mode,
-                )
-                tag = boundary_id
-
-            if not commits:
-                output.info(f"No commits found for {boundary_id}, skipping")
-                continue
+        output.info(f"Processing missing boundary: {boundary_id} ({len(commits)} commits)")
+        tasks.append((i, boundary_id, boundary, tag, commits))
 
-            output.info(f"Processing missing boundary: {boundary_id} ({len(commits)} commits)")
+    def generate(task: tuple) -> str:
+        i, _boundary_id, _boundary, tag, commits = task
+        return generate_entry_func(commits=commits, tag=tag, from_boundary=None, position=i, **kwargs)
 
-            # Generate changelog entry
-            entry = generate_entry_func(commits=commits, tag=tag, from_boundary=None, **kwargs)
+    # Results arrive in version order. New sections are merged into the original content in one
+    # pass; with incremental saving each one is inserted into a document kept between saves
+    original_content = updated_content
+    new_sections: list[tuple[str, str]] = []
+    document = ChangelogDocument(original_content) if incremental_save and not dry_run else None
+    dates_insert_point = _find_insertion_point_for_dates_gaps(document.lines) if document is not None else 0
+    for (i, boundary_id, boundary, tag, _commits), future in map_in_order(generate, tasks, jobs):
+        try:
+            entry = future.result()
 
             if not entry.strip():
                 output.warning(f"AI generated empty content for {boundary_id}")
@@ -196,7 +185,7 @@ def handle_missing_entries_mode(
                 # For tags mode, get tag date
                 tag_date = get_tag_date(tag)
                 version_date = tag_date.strftime("%Y-%m-%d") if tag_date else datetime.now().strftime("%Y-%m-%d")
-                version_name = format_version_for_changelog(tag, updated_content)
+                version_name = format_version_for_changelog(tag, original_content)
             else:
                 # For dates and gaps modes, use boundary date
                 boundary_date = boundary.get("date")
@@ -207,34 +196,16 @@ def handle_missing_entries_mode(
                 version_name = boundary_id
 
             # Create version section without leading newlines - spacing is handled by write_changelog
-            version_section = f"## [{version_name}] - {version_date}\n\n{entry}"
-
-            # Insert and save immediately
-            if mode == "tags":
-                # For tags mode, use version-aware insertion
-                insert_point = find_insertion_point_by_version(updated_content, boundary_id)
-                lines = updated_content.split("\n")
-                for j, line in enumerate(version_section.split("\n")):
-                    lines.insert(insert_point + j, line)
-                updated_content = "\n".join(lines)
-            else:
-                # For dates and gaps modes, insert after header/unreleased section
-                lines = updated_content.split("\n")
-                insert_point = _find_insertion_point_for_dates_gaps(lines)
-
-                for j, line in enumerate(version_section.split("\n")):
-                    lines.insert(insert_point + j, line)
-
-                # Add spacing if needed
-                end_pos = insert_point + len(version_section.split("\n"))
-                if end_pos < len(lines) and lines[end_pos].strip():
-                    lines.insert(end_pos, "")
-
-                updated_content = "\n".join(lines)
+            section = f"## [{version_name}] - {version_date}\n\n{entry}"
+            new_sections.append((boundary_id, section))
 
             # Save immediately after each entry if incremental_save is enabled
-            if incremental_save and not dry_run:
-                write_changelog(changelog_file, updated_content)
+            if document is not None:
+                if mode == "tags":
+                    insert_version_section(document, boundary_id, section)
+                else:
+                    insert_section_at(document, dates_insert_point, section)
+                write_changelog(changelog_file, document.text())
                 if not quiet:
                     progress = f"({i + 1}/{len(missing_boundaries)})"
                     output.success(f"✓ Saved changelog entry for {boundary_id} {progress}")
@@ -248,7 +219,29 @@ def handle_missing_entries_mode(
             success = False
             continue
 
-    return success, updated_content
+    if document is not None:
+        return success, document.text()
+    return success, _insert_new_sections(original_content, new_sections, mode)
+
+
+def _insert_new_sections(content: str, sections: list[tuple[str, str]], mode: str) -> str:
+    """Insert generated sections into the changelog in a single merge pass.
+
+    Args:
+        content: Changelog content before any of the new sections
+        sections: (boundary identifier, section text) pairs in generation order
+        mode: Boundary mode ('tags', 'dates', or 'gaps')
+
+    Returns:
+        The updated changelog content
+    """
+    if mode == "tags":
+        # For tags mode, use version-aware insertion
+        return insert_version_sections(content, sections)
+
+    # For dates and gaps modes, insert after header/unreleased section, newest on top
+    insert_point = _find_insertion_point_for_dates_gaps(content.split("\n"))
+    return insert_sections_at(content, insert_point, [text for _boundary_id, text in sections])
 
 
 def _find_insertion_point_for_dates_gaps(lines: list[str]) -> int:
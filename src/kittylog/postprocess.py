@@ -6,6 +6,8 @@ but before they're written to the changelog file, ensuring proper spacing and fo
 
 import re
 
+from kittylog.profiling import Phase, timed
+
 # Mapping from developer headers to audience-specific headers
 HEADER_MAPPING: dict[str, dict[str, str]] = {
     "users": {
@@ -55,6 +57,7 @@ def remap_headers_for_audience(content: str, audience: str) -> str:
     return content
 
 
+@timed(Phase.POSTPROCESS)
 def clean_changelog_content(content: str, preserve_version_header: bool = False, audience: str = "developers") -> str:
     """Clean and format AI-generated changelog content.
 
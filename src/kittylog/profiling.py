@@ -0,0 +1,241 @@
+"""Per-phase timing of changelog runs.
+
+Instrumented functions record a span (phase, boundary, duration) while a
+profiling session is active, as started by ``kittylog --profile``. Without
+a session a span costs one global lookup, so the instrumentation stays in
+place in normal runs.
+
+The same hooks open spans in the run's trace when one is being recorded
+(see :mod:`kittylog.tracing`).
+
+Spans are attributed to the boundary whose entry is being generated (see
+:func:`boundary_scope`); work shared by all boundaries, such as reading the
+boundaries or partitioning history, is reported on its own. Phases nest
+(the LLM call happens inside entry generation) and entries may be generated
+concurrently, so phase totals can add up to more than the wall time.
+"""
+
+import contextvars
+import cProfile
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+from kittylog.tracing import is_tracing, trace_span
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Label for spans recorded outside of any boundary
+SHARED = "(shared)"
+
+
+class Phase:
+    """Names of the instrumented phases, in pipeline order."""
+
+    BOUNDARIES = "boundaries"
+    COMMITS = "commits"
+    PROMPT = "prompt"
+    LLM = "llm"
+    POSTPROCESS = "postprocess"
+    WRITE = "write"
+
+    ORDER = (BOUNDARIES, COMMITS, PROMPT, LLM, POSTPROCESS, WRITE)
+
+
+@dataclass(frozen=True)
+class Span:
+    """One timed call of an instrumented function."""
+
+    phase: str
+    name: str
+    boundary: str | None
+    start: float  # seconds since the session started
+    duration: float
+    thread: str
+
+
+@dataclass
+class PhaseStats:
+    """Aggregate timing of one phase."""
+
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, duration: float) -> None:
+        self.calls += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+
+@dataclass
+class ProfileSession:
+    """Spans recorded during one run."""
+
+    started: float = field(default_factory=time.perf_counter)
+    wall: float | None = None
+    spans: list[Span] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, phase: str, name: str, start: float, end: float) -> None:
+        span = Span(phase, name, _boundary.get(), start - self.started, end - start, threading.current_thread().name)
+        with self._lock:
+            self.spans.append(span)
+
+    def elapsed(self) -> float:
+        """Wall time of the session, up to now if it is still running."""
+        return self.wall if self.wall is not None else time.perf_counter() - self.started
+
+    def by_phase(self) -> dict[str, PhaseStats]:
+        """Aggregate timing per phase, in pipeline order."""
+        return _aggregate(self.spans)
+
+    def by_boundary(self) -> dict[str, dict[str, PhaseStats]]:
+        """Per-phase timing for each boundary in the order first seen, shared work last."""
+        groups: dict[str, list[Span]] = {}
+        for span in self.spans:
+            groups.setdefault(span.boundary or SHARED, []).append(span)
+        shared = groups.pop(SHARED, None)
+        result = {boundary: _aggregate(spans) for boundary, spans in groups.items()}
+        if shared:
+            result[SHARED] = _aggregate(shared)
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form of the session."""
+        return {
+            "wall_seconds": self.elapsed(),
+            "phases": {phase: asdict(stats) for phase, stats in self.by_phase().items()},
+            "boundaries": {
+                boundary: {phase: asdict(stats) for phase, stats in phases.items()}
+                for boundary, phases in self.by_boundary().items()
+            },
+            "spans": [asdict(span) for span in self.spans],
+        }
+
+
+def _aggregate(spans: list[Span]) -> dict[str, PhaseStats]:
+    stats: dict[str, PhaseStats] = {}
+    for span in spans:
+        stats.setdefault(span.phase, PhaseStats()).add(span.duration)
+    rank = {phase: i for i, phase in enumerate(Phase.ORDER)}
+    return dict(sorted(stats.items(), key=lambda item: rank.get(item[0], len(rank))))
+
+
+_session: ProfileSession | None = None
+_boundary: contextvars.ContextVar[str | None] = contextvars.ContextVar("kittylog_profile_boundary", default=None)
+# Phase of the innermost running span, so calls nested in the same phase are not counted twice
+_phase: contextvars.ContextVar[str | None] = contextvars.ContextVar("kittylog_profile_phase", default=None)
+
+
+def get_session() -> ProfileSession | None:
+    """Return the active profiling session, if any."""
+    return _session
+
+
+def timed(phase: str) -> Callable[[F], F]:
+    """Decorator recording each call of the function as a span of ``phase``."""
+
+    def decorator(func: F) -> F:
+        name = func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            session = _session
+            if (session is None and not is_tracing()) or _phase.get() == phase:
+                return func(*args, **kwargs)
+            token = _phase.set(phase)
+            start = time.perf_counter()
+            try:
+                attributes: dict[str, Any] = {"kittylog.phase": phase, "kittylog.boundary": _boundary.get()}
+                with trace_span(name, **attributes):
+                    return func(*args, **kwargs)
+            finally:
+                if session is not None:
+                    session.record(phase, name, start, time.perf_counter())
+                _phase.reset(token)
+
+        return cast("F", wrapper)
+
+    return decorator
+
+
+@contextmanager
+def boundary_scope(boundary: str | None) -> Iterator[None]:
+    """Attribute spans recorded in the enclosed block (in this thread or context) to ``boundary``.
+
+    When tracing, the block is also recorded as a span of its own.
+    """
+    token = _boundary.set(boundary)
+    try:
+        attributes: dict[str, Any] = {"kittylog.boundary": boundary}
+        with trace_span("generate_entry", **attributes):
+            yield
+    finally:
+        _boundary.reset(token)
+
+
+@contextmanager
+def profile_session(pstats_path: str | Path | None = None) -> Iterator[ProfileSession]:
+    """Record spans for the duration of the block.
+
+    Args:
+        pstats_path: Also run cProfile over the calling thread and dump its
+            statistics here (readable with ``python -m pstats``)
+
+    Yields:
+        The session, complete once the block exits
+    """
+    global _session
+    session = ProfileSession()
+    profiler = cProfile.Profile() if pstats_path else None
+    _session = session
+    if profiler:
+        profiler.enable()
+    try:
+        yield session
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(str(pstats_path))
+        session.wall = time.perf_counter() - session.started
+        _session = None
+
+
+def _format_row(label: str, phases: dict[str, PhaseStats], columns: list[str], width: int) -> str:
+    cells = [f"{phases[phase].total * 1000:>10.1f}" if phase in phases else f"{'-':>10}" for phase in columns]
+    return f"{label:<{width}} " + " ".join(cells)
+
+
+def format_report(session: ProfileSession) -> str:
+    """Render the aggregate and per-boundary breakdown as a plain-text report."""
+    wall = session.elapsed()
+    phases = session.by_phase()
+    if not phases:
+        return f"Total: {wall * 1000:.1f} ms (no instrumented phases ran)"
+
+    lines = [f"{'phase':<12} {'calls':>6} {'total ms':>10} {'max ms':>10} {'% wall':>7}"]
+    for phase, stats in phases.items():
+        share = stats.total / wall * 100 if wall else 0.0
+        total, longest = stats.total * 1000, stats.max * 1000
+        lines.append(f"{phase:<12} {stats.calls:>6} {total:>10.1f} {longest:>10.1f} {share:>6.1f}%")
+    lines.append(f"{'wall':<12} {'':>6} {wall * 1000:>10.1f}")
+
+    boundaries = session.by_boundary()
+    columns = list(phases)
+    width = max(12, *(len(boundary) for boundary in boundaries))
+    lines.append("")
+    lines.append(f"{'boundary':<{width}} " + " ".join(f"{phase:>10}" for phase in columns))
+    lines.extend(_format_row(boundary, stats, columns, width) for boundary, stats in boundaries.items())
+    return "\n".join(lines)
+
+
+def write_json_report(session: ProfileSession, path: str | Path) -> None:
+    """Write the session, including every span, as JSON."""
+    Path(path).write_text(json.dumps(session.to_dict(), indent=2) + "\n", encoding="utf-8")
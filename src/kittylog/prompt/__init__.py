@@ -5,6 +5,7 @@ to generate changelog entries from git commit data.
 
 Submodules:
 - **detail_limits**: Detail level configuration (concise/normal/detailed)
+- **packer**: Fits commits into a model's context window
 - **system**: System prompt dispatcher
 - **system_developers**: Developer audience system prompt
 - **system_users**: End user audience system prompt
@@ -12,14 +13,20 @@ Submodules:
 - **user**: User prompt builder with commit data
 """
 
-from kittylog.constants import Audiences
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from kittylog.constants import Audiences, EnvDefaults
 from kittylog.postprocess import clean_changelog_content
+from kittylog.profiling import Phase, timed
 from kittylog.prompt.system import build_system_prompt
 from kittylog.prompt.user import build_user_prompt
+from kittylog.tokenizer import count_tokens
 
 
+@timed(Phase.PROMPT)
 def build_changelog_prompt(
-    commits: list[dict],
+    commits: Sequence[Mapping[str, Any]],
     tag: str | None,
     from_boundary: str | None = None,
     hint: str = "",
@@ -30,6 +37,8 @@ def build_changelog_prompt(
     context_entries: str = "",
     session_context: str = "",
     detail_level: str = "normal",
+    model: str | None = None,
+    token_budget: int | None = None,
 ) -> tuple[str, str]:
     """Build prompts for AI changelog generation.
 
@@ -45,12 +54,16 @@ def build_changelog_prompt(
         context_entries: Pre-formatted string of preceding changelog entries for style reference
         session_context: Cumulative list of items already generated in this session
         detail_level: Output detail level - 'concise', 'normal', or 'detailed'
+        model: Model the prompts are for, used to count tokens
+        token_budget: Maximum tokens for both prompts; commits are packed to fit when set
 
     Returns:
         Tuple of (system_prompt, user_prompt)
     """
     resolved_audience = Audiences.resolve(audience) if audience else "developers"
     system_prompt = build_system_prompt(audience=resolved_audience, detail_level=detail_level)
+    if token_budget is not None:
+        token_budget -= count_tokens(system_prompt, model or EnvDefaults.MODEL)
     user_prompt = build_user_prompt(
         commits,
         tag,
@@ -62,6 +75,8 @@ def build_changelog_prompt(
         audience=audience,
         context_entries=context_entries,
         session_context=session_context,
+        token_budget=token_budget,
+        model=model,
     )
 
     return system_prompt, user_prompt
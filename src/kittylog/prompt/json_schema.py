@@ -7,6 +7,8 @@ functions to convert JSON responses to properly formatted markdown.
 import json
 import re
 
+from kittylog.profiling import Phase, timed
+
 # JSON keys and their corresponding markdown headers for each audience
 AUDIENCE_SCHEMAS: dict[str, dict[str, str]] = {
     "developers": {
@@ -163,6 +165,47 @@ def _remap_json_keys(data: dict[str, list[str]], audience: str) -> dict[str, lis
     return result
 
 
+def _item_key(item: str) -> str:
+    """Normalize a changelog item for duplicate detection."""
+    return re.sub(r"[^\w]+", " ", item.casefold()).strip()
+
+
+def merge_json_sections(parts: list[dict[str, list[str]]], audience: str) -> dict[str, list[str]]:
+    """Merge several parsed JSON responses into one, dropping duplicate items.
+
+    Keys are remapped to the audience's schema first. Sections follow the
+    audience's section order (unknown keys last) and items keep their first
+    occurrence; items that differ only in case, punctuation or spacing count
+    as duplicates, also across sections.
+
+    Args:
+        parts: Parsed JSON responses (section key -> items)
+        audience: The target audience for key remapping
+
+    Returns:
+        Merged section key -> items mapping
+    """
+    combined: dict[str, list[str]] = {}
+    for part in parts:
+        for key, items in _remap_json_keys(part, audience).items():
+            combined.setdefault(key, []).extend(items)
+
+    order = SECTION_ORDER.get(audience, SECTION_ORDER["developers"])
+    keys = [key for key in order if key in combined] + [key for key in combined if key not in order]
+
+    seen: set[str] = set()
+    merged: dict[str, list[str]] = {}
+    for key in keys:
+        for item in combined[key]:
+            item = item.strip()
+            normalized = _item_key(item.removeprefix("- "))
+            if not normalized or normalized in seen:
+                continue
+            seen.add(normalized)
+            merged.setdefault(key, []).append(item)
+    return merged
+
+
 def json_to_markdown(data: dict[str, list[str]], audience: str) -> str:
     """Convert parsed JSON to markdown with correct section headers.
 
@@ -200,6 +243,7 @@ def json_to_markdown(data: dict[str, list[str]], audience: str) -> str:
     return "\n".join(sections).strip()
 
 
+@timed(Phase.POSTPROCESS)
 def format_changelog_from_json(content: str, audience: str) -> str | None:
     """Parse JSON response and format as markdown with correct headers.
 
@@ -0,0 +1,323 @@
+"""Fit commit data into a model's context window.
+
+A release with thousands of commits produces a prompt far larger than any
+context window. :func:`pack_commits` renders commits at decreasing levels of
+detail until they fit a token budget:
+
+1. Every commit in full (the normal prompt format) if that already fits.
+2. Near-identical messages merged, bot commits (dependency bumps, CI
+   updates) summarized in one block, bodies trimmed and file lists
+   collapsed to directories.
+3. Commits ranked by importance (breaking changes, features and fixes
+   before docs, chores and merges; more files touched ranks higher) and
+   admitted in rank order, compact if possible, as a one-line subject
+   otherwise, and omitted when even that no longer fits. Omitted commits
+   are counted in a closing note so the model knows the list is partial.
+
+Kept commits are always listed in their original order.
+"""
+
+import os
+import re
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from kittylog.constants import EnvDefaults
+from kittylog.tokenizer import count_tokens, count_tokens_batch
+
+# Context window sizes by model name prefix (after stripping "provider:" and "org/").
+# More specific prefixes come first; unknown models use EnvDefaults.CONTEXT_WINDOW_TOKENS.
+_CONTEXT_WINDOWS: tuple[tuple[str, int], ...] = (
+    ("gpt-4.1", 1_047_576),
+    ("gpt-4o", 128_000),
+    ("chatgpt-4o", 128_000),
+    ("gpt-4-turbo", 128_000),
+    ("gpt-4.5", 128_000),
+    ("gpt-4-32k", 32_768),
+    ("gpt-4", 8_192),
+    ("gpt-3.5", 16_385),
+    ("gpt-5", 400_000),
+    ("gpt-oss", 131_072),
+    ("o1", 200_000),
+    ("o3", 200_000),
+    ("o4", 200_000),
+    ("claude", 200_000),
+    ("gemini", 1_048_576),
+    ("deepseek", 128_000),
+    ("mistral", 128_000),
+    ("llama", 128_000),
+    ("qwen", 131_072),
+    ("kimi", 131_072),
+    ("glm", 128_000),
+)
+
+# Share of the context window kept free to absorb token-count estimation error
+SAFETY_MARGIN = 0.1
+
+_CONVENTIONAL_RE = re.compile(r"^(?P<type>[a-zA-Z]+)(?:\([^)]*\))?(?P<breaking>!)?:")
+
+# Importance by conventional-commit type; unrecognised subjects use _DEFAULT_WEIGHT
+_TYPE_WEIGHTS = {
+    "security": 60,
+    "sec": 60,
+    "feat": 50,
+    "feature": 50,
+    "fix": 40,
+    "perf": 35,
+    "revert": 30,
+    "refactor": 20,
+    "docs": 10,
+    "deps": 8,
+    "build": 8,
+    "test": 5,
+    "tests": 5,
+    "ci": 3,
+    "chore": 3,
+    "style": 2,
+}
+_DEFAULT_WEIGHT = 25
+_BREAKING_BONUS = 100
+_MERGE_WEIGHT = 2
+_BOT_WEIGHT = 4
+
+_BOT_AUTHORS = ("[bot]", "dependabot", "renovate", "github-actions", "pre-commit-ci")
+
+_MAX_FILES_LISTED = 10
+_COMPACT_BODY_LINES = 3
+_COMPACT_LINE_LENGTH = 200
+_MINIMAL_SUBJECT_LENGTH = 120
+_BOT_SUBJECTS_LISTED = 10
+
+
+def context_window_for_model(model: str) -> int:
+    """Return the context window size of a model in tokens.
+
+    ``KITTYLOG_CONTEXT_WINDOW`` overrides the built-in table, e.g. for local
+    models served with a smaller context.
+
+    Args:
+        model: Model name, optionally prefixed with "provider:"
+
+    Returns:
+        Context window size in tokens
+    """
+    from kittylog.config.loader import _safe_int
+
+    override = _safe_int(os.getenv("KITTYLOG_CONTEXT_WINDOW"), 0, min_value=1)
+    if override:
+        return override
+
+    name = model.split(":", 1)[-1].rsplit("/", 1)[-1].lower()
+    for prefix, window in _CONTEXT_WINDOWS:
+        if name.startswith(prefix):
+            return window
+    return EnvDefaults.CONTEXT_WINDOW_TOKENS
+
+
+def prompt_token_budget(model: str, max_output_tokens: int) -> int:
+    """Return the number of tokens available for the prompt.
+
+    Args:
+        model: Model name, optionally prefixed with "provider:"
+        max_output_tokens: Tokens reserved for the response
+
+    Returns:
+        Prompt token budget (may be negative for nonsensical settings)
+    """
+    window = context_window_for_model(model)
+    return int(window * (1 - SAFETY_MARGIN)) - max_output_tokens
+
+
+def format_commit(commit: Mapping[str, Any]) -> str:
+    """Render a commit in full, as listed in the user prompt."""
+    text = f"**Commit {commit['short_hash']}** by {commit['author']}\n"
+    text += f"Date: {commit['date'].strftime('%Y-%m-%d %H:%M:%S')}\n"
+    text += f"Message: {commit['message']}\n"
+
+    files = commit.get("files")
+    if files:
+        text += f"Files changed: {', '.join(files[:_MAX_FILES_LISTED])}"
+        if len(files) > _MAX_FILES_LISTED:
+            text += f" (and {len(files) - _MAX_FILES_LISTED} more)"
+        text += "\n"
+
+    return text + "\n"
+
+
+def _subject(commit: Mapping[str, Any]) -> str:
+    message = commit.get("message") or ""
+    return message.strip().split("\n", 1)[0].strip()
+
+
+def _truncate(text: str, length: int) -> str:
+    return text if len(text) <= length else text[: length - 3].rstrip() + "..."
+
+
+def _is_bot(commit: Mapping[str, Any]) -> bool:
+    author = str(commit.get("author") or "").lower()
+    return any(marker in author for marker in _BOT_AUTHORS)
+
+
+def _is_merge(commit: Mapping[str, Any]) -> bool:
+    return _subject(commit).startswith(("Merge pull request", "Merge branch", "Merge remote-tracking branch"))
+
+
+def commit_type(commit: Mapping[str, Any]) -> str:
+    """Return the conventional-commit type of a commit ("merge", "other" if none)."""
+    if _is_merge(commit):
+        return "merge"
+    match = _CONVENTIONAL_RE.match(_subject(commit))
+    return match.group("type").lower() if match else "other"
+
+
+def rank_commit(commit: Mapping[str, Any]) -> float:
+    """Score a commit's importance for the changelog; higher is more important.
+
+    Args:
+        commit: Commit dictionary
+
+    Returns:
+        Importance score
+    """
+    if _is_merge(commit):
+        return _MERGE_WEIGHT
+    subject = _subject(commit)
+    match = _CONVENTIONAL_RE.match(subject)
+    weight: float = _TYPE_WEIGHTS.get(match.group("type").lower(), _DEFAULT_WEIGHT) if match else _DEFAULT_WEIGHT
+    if (match and match.group("breaking")) or "BREAKING CHANGE" in (commit.get("message") or ""):
+        weight += _BREAKING_BONUS
+    return weight + min(len(commit.get("files") or []), 20) / 2
+
+
+def _duplicate_key(commit: Mapping[str, Any]) -> str:
+    # Ignore case, numbers, hashes and punctuation: "Fix typo (#12)" == "fix typo (#15)"
+    return re.sub(r"[^a-z]+", " ", _subject(commit).lower()).strip()
+
+
+def collapse_files(files: list[str]) -> str:
+    """Summarize a file list by directory, e.g. ``src/kittylog/ (4), tests/ (2)``."""
+    directories = Counter("/".join(path.split("/")[:2]) + "/" if path.count("/") >= 2 else path for path in files)
+    parts = [f"{name} ({count})" if count > 1 else name for name, count in directories.most_common(_MAX_FILES_LISTED)]
+    if len(directories) > _MAX_FILES_LISTED:
+        parts.append(f"and {len(directories) - _MAX_FILES_LISTED} more")
+    return ", ".join(parts)
+
+
+@dataclass
+class _Group:
+    """Commits rendered as one prompt block: a commit and its duplicates, or all bot commits."""
+
+    commits: list[Mapping[str, Any]]
+    position: int
+    bots: bool = False
+    score: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.score = _BOT_WEIGHT if self.bots else rank_commit(self.commits[0])
+
+    def compact(self) -> str:
+        if self.bots:
+            subjects = [_truncate(_subject(commit), _MINIMAL_SUBJECT_LENGTH) for commit in self.commits]
+            text = f"**Automated commits** ({len(subjects)} by bots): " + "; ".join(subjects[:_BOT_SUBJECTS_LISTED])
+            if len(subjects) > _BOT_SUBJECTS_LISTED:
+                text += f"; and {len(subjects) - _BOT_SUBJECTS_LISTED} more"
+            return text + "\n\n"
+
+        commit = self.commits[0]
+        text = f"**Commit {commit['short_hash']}**"
+        if len(self.commits) > 1:
+            text += f" (and {len(self.commits) - 1} similar)"
+        text += f": {_truncate(_subject(commit), _COMPACT_LINE_LENGTH)}\n"
+        body = [line.strip() for line in (commit.get("message") or "").strip().split("\n")[1:] if line.strip()]
+        for line in body[:_COMPACT_BODY_LINES]:
+            text += f"  {_truncate(line, _COMPACT_LINE_LENGTH)}\n"
+        files = commit.get("files")
+        if files:
+            text += f"Files: {collapse_files(files)}\n"
+        return text + "\n"
+
+    def minimal(self) -> str:
+        if self.bots:
+            return f"- {len(self.commits)} automated commits (dependency and tooling updates)\n"
+        commit = self.commits[0]
+        suffix = f" (x{len(self.commits)})" if len(self.commits) > 1 else ""
+        return f"- {commit['short_hash']} {_truncate(_subject(commit), _MINIMAL_SUBJECT_LENGTH)}{suffix}\n"
+
+
+def _group_commits(commits: Sequence[Mapping[str, Any]]) -> list[_Group]:
+    groups: list[_Group] = []
+    by_key: dict[str, _Group] = {}
+    bot_commits: list[Mapping[str, Any]] = []
+    bot_position = -1
+
+    for position, commit in enumerate(commits):
+        if _is_bot(commit):
+            bot_commits.append(commit)
+            bot_position = position if bot_position < 0 else bot_position
+            continue
+        key = _duplicate_key(commit)
+        if key and key in by_key:
+            by_key[key].commits.append(commit)
+            continue
+        group = _Group([commit], position)
+        groups.append(group)
+        if key:
+            by_key[key] = group
+
+    if bot_commits:
+        groups.append(_Group(bot_commits, bot_position, bots=True))
+    groups.sort(key=lambda group: group.position)
+    return groups
+
+
+def _omission_note(omitted: Sequence[Mapping[str, Any]]) -> str:
+    types = Counter(commit_type(commit) for commit in omitted)
+    breakdown = ", ".join(f"{name} x{count}" for name, count in types.most_common())
+    return (
+        f"Note: {len(omitted)} lower-priority commits ({breakdown}) were omitted to fit the context window. "
+        "Describe the changes listed above; do not invent details for omitted commits.\n\n"
+    )
+
+
+def pack_commits(commits: Sequence[Mapping[str, Any]], budget_tokens: int, model: str) -> str:
+    """Render commits for the user prompt within a token budget.
+
+    Args:
+        commits: Commit dictionaries, in the order they should be listed
+        budget_tokens: Tokens available for the rendered commits
+        model: Model name used for token counting
+
+    Returns:
+        Rendered commits (the body of the "Commits to analyze" section)
+    """
+    full = [format_commit(commit) for commit in commits]
+    if sum(count_tokens_batch(full, model)) <= budget_tokens:
+        return "".join(full)
+
+    groups = _group_commits(commits)
+    compact = [group.compact() for group in groups]
+    compact_costs = count_tokens_batch(compact, model)
+    if sum(compact_costs) <= budget_tokens:
+        return "".join(compact)
+
+    minimal = [group.minimal() for group in groups]
+    minimal_costs = count_tokens_batch(minimal, model)
+
+    # Reserve room for the omission note (its exact size depends on what is omitted)
+    remaining = budget_tokens - count_tokens(_omission_note(commits), model)
+    chosen: dict[int, str] = {}
+    for index in sorted(range(len(groups)), key=lambda i: (-groups[i].score, groups[i].position)):
+        if compact_costs[index] <= remaining:
+            chosen[index] = compact[index]
+            remaining -= compact_costs[index]
+        elif minimal_costs[index] <= remaining:
+            chosen[index] = minimal[index]
+            remaining -= minimal_costs[index]
+
+    omitted = [commit for index, group in enumerate(groups) if index not in chosen for commit in group.commits]
+    text = "".join(chosen[index] for index in sorted(chosen))
+    if omitted:
+        text += _omission_note(omitted)
+    return text
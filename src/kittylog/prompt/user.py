@@ -3,8 +3,14 @@
 This module builds the user prompt with commit data and context.
 """
 
-from kittylog.constants import Audiences
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from kittylog.constants import Audiences, EnvDefaults
 from kittylog.prompt.json_schema import AUDIENCE_SCHEMAS, SECTION_ORDER
+from kittylog.prompt.packer import format_commit, pack_commits
+from kittylog.tokenizer import count_tokens
 
 
 def _get_section_names_for_audience(audience: str) -> str:
@@ -96,20 +102,18 @@ ANTI-DUPLICATION:
 RESPOND WITH ONLY THE JSON OBJECT. No explanations, no markdown formatting outside the JSON."""
 
 
-def build_user_prompt(
-    commits: list[dict],
+def _build_context_sections(
     tag: str | None,
-    from_boundary: str | None = None,
-    hint: str = "",
-    boundary_mode: str = "tags",
-    language: str | None = None,
-    translate_headings: bool = False,
-    audience: str | None = None,
-    context_entries: str = "",
-    session_context: str = "",
+    from_boundary: str | None,
+    hint: str,
+    boundary_mode: str,
+    language: str | None,
+    translate_headings: bool,
+    audience: str | None,
+    context_entries: str,
+    session_context: str,
 ) -> str:
-    """Build the user prompt with commit data."""
-
+    """Build the sections that precede the changes to analyze (version, hint, language, audience, context)."""
     # Start with boundary context
     if tag is None:
         version_context = "Generate a changelog entry for unreleased changes.\n"
@@ -213,32 +217,95 @@ def build_user_prompt(
             "If you see similar content in the commits, either SKIP IT or describe a different aspect.\n\n"
         )
 
-    # Format commits
-    commits_section = "## Commits to analyze:\n\n"
+    return version_context + hint_section + language_section + audience_section + context_section + session_section
 
-    for commit in commits:
-        commits_section += f"**Commit {commit['short_hash']}** by {commit['author']}\n"
-        commits_section += f"Date: {commit['date'].strftime('%Y-%m-%d %H:%M:%S')}\n"
-        commits_section += f"Message: {commit['message']}\n"
 
-        if commit.get("files"):
-            commits_section += f"Files changed: {', '.join(commit['files'][:10])}"
-            if len(commit["files"]) > 10:
-                commits_section += f" (and {len(commit['files']) - 10} more)"
-            commits_section += "\n"
+def build_user_prompt(
+    commits: Sequence[Mapping[str, Any]],
+    tag: str | None,
+    from_boundary: str | None = None,
+    hint: str = "",
+    boundary_mode: str = "tags",
+    language: str | None = None,
+    translate_headings: bool = False,
+    audience: str | None = None,
+    context_entries: str = "",
+    session_context: str = "",
+    token_budget: int | None = None,
+    model: str | None = None,
+) -> str:
+    """Build the user prompt with commit data.
 
-        commits_section += "\n"
+    When ``token_budget`` is given, commits are packed (ranked, deduplicated
+    and compressed) so the whole prompt fits in that many tokens of ``model``.
+    """
+
+    prefix = _build_context_sections(
+        tag,
+        from_boundary,
+        hint,
+        boundary_mode,
+        language,
+        translate_headings,
+        audience,
+        context_entries,
+        session_context,
+    )
 
     # Instructions - audience-specific
-    instructions = _build_instructions(resolved_audience)
-
-    return (
-        version_context
-        + hint_section
-        + language_section
-        + audience_section
-        + context_section
-        + session_section
-        + commits_section
-        + instructions
+    instructions = _build_instructions(Audiences.resolve(audience))
+
+    # Format commits, packing them into whatever the other sections leave of the budget
+    commits_section = "## Commits to analyze:\n\n"
+    if token_budget is None:
+        commits_section += "".join(format_commit(commit) for commit in commits)
+    else:
+        model = model or EnvDefaults.MODEL
+        fixed_tokens = count_tokens(prefix + commits_section + instructions, model)
+        commits_section += pack_commits(commits, token_budget - fixed_tokens, model)
+
+    return prefix + commits_section + instructions
+
+
+def build_reduce_prompt(
+    sections: dict[str, list[str]],
+    tag: str | None,
+    from_boundary: str | None = None,
+    hint: str = "",
+    boundary_mode: str = "tags",
+    language: str | None = None,
+    translate_headings: bool = False,
+    audience: str | None = None,
+    context_entries: str = "",
+    session_context: str = "",
+    commit_count: int = 0,
+) -> str:
+    """Build the user prompt that consolidates draft changelog items into one entry.
+
+    Used by map-reduce generation: the drafts are the merged JSON results of
+    summarizing each chunk of a large release separately.
+    """
+    prefix = _build_context_sections(
+        tag,
+        from_boundary,
+        hint,
+        boundary_mode,
+        language,
+        translate_headings,
+        audience,
+        context_entries,
+        session_context,
     )
+
+    drafts_section = (
+        "## Draft changelog items to consolidate:\n\n"
+        f"The release is too large to analyze at once, so its {commit_count} commits were summarized in batches. "
+        "Treat these draft items as the commits to analyze:\n\n"
+        f"```json\n{json.dumps(sections, indent=2, ensure_ascii=False)}\n```\n\n"
+        "CONSOLIDATION:\n"
+        "- Merge items that describe the same change into a single item\n"
+        "- Drop minor items (typos, internal chores) when a section gets long\n"
+        "- Re-check each item's section against the classification rules below\n\n"
+    )
+
+    return prefix + drafts_section + _build_instructions(Audiences.resolve(audience))
@@ -2,6 +2,8 @@
 
 This module provides a unified interface to all AI providers. Provider classes
 are registered and wrapper functions are auto-generated with error handling.
+A provider's module is only imported the first time its name is looked up, so
+importing this package stays cheap.
 
 Usage:
     from kittylog.providers import PROVIDER_REGISTRY
@@ -9,74 +11,57 @@ Usage:
     # Get the function for a provider
     func = PROVIDER_REGISTRY["openai"]
     result = func(model="gpt-4", messages=[...], temperature=0.7, max_tokens=1000)
+
+    # Or, from async code
+    result = await ASYNC_PROVIDER_REGISTRY["openai"](model="gpt-4", messages=[...], temperature=0.7, max_tokens=1000)
 """
 
-# Import provider classes for registration
-from .anthropic import AnthropicProvider
-from .azure_openai import AzureOpenAIProvider
-from .cerebras import CerebrasProvider
-from .chutes import ChutesProvider
-from .claude_code import ClaudeCodeProvider
-from .custom_anthropic import CustomAnthropicProvider
-from .custom_openai import CustomOpenAIProvider
-from .deepseek import DeepSeekProvider
-from .fireworks import FireworksProvider
-from .gemini import GeminiProvider
-from .groq import GroqProvider
-from .kimi_coding import KimiCodingProvider
-from .lmstudio import LMStudioProvider
-from .minimax import MiniMaxProvider
-from .mistral import MistralProvider
-from .moonshot import MoonshotProvider
-from .ollama import OllamaProvider
-from .openai import OpenAIProvider
-from .openrouter import OpenRouterProvider
-from .qwen import QwenProvider
 from .registry import (
+    ASYNC_PROVIDER_REGISTRY,
+    ASYNC_STREAMING_PROVIDER_REGISTRY,
     PROVIDER_REGISTRY,
     STREAMING_PROVIDER_REGISTRY,
+    register_lazy_provider,
     register_provider,
 )
-from .replicate import ReplicateProvider
-from .streamlake import StreamLakeProvider
-from .synthetic import SyntheticProvider
-from .together import TogetherProvider
-from .zai import ZAICodingProvider, ZAIProvider
 
-# Register all providers - this populates PROVIDER_REGISTRY automatically
-register_provider("anthropic", AnthropicProvider)
-register_provider("azure-openai", AzureOpenAIProvider)
-register_provider("cerebras", CerebrasProvider)
-register_provider("chutes", ChutesProvider)
-register_provider("claude-code", ClaudeCodeProvider)
-register_provider("custom-anthropic", CustomAnthropicProvider)
-register_provider("custom-openai", CustomOpenAIProvider)
-register_provider("deepseek", DeepSeekProvider)
-register_provider("fireworks", FireworksProvider)
-register_provider("gemini", GeminiProvider)
-register_provider("groq", GroqProvider)
-register_provider("kimi-coding", KimiCodingProvider)
-register_provider("lm-studio", LMStudioProvider)
-register_provider("minimax", MiniMaxProvider)
-register_provider("mistral", MistralProvider)
-register_provider("moonshot", MoonshotProvider)
-register_provider("ollama", OllamaProvider)
-register_provider("openai", OpenAIProvider)
-register_provider("openrouter", OpenRouterProvider)
-register_provider("qwen", QwenProvider)
-register_provider("replicate", ReplicateProvider)
-register_provider("streamlake", StreamLakeProvider)
-register_provider("synthetic", SyntheticProvider)
-register_provider("together", TogetherProvider)
-register_provider("zai", ZAIProvider)
-register_provider("zai-coding", ZAICodingProvider)
+# Register all providers by module path - this populates PROVIDER_REGISTRY without importing them
+register_lazy_provider("anthropic", "kittylog.providers.anthropic:AnthropicProvider")
+register_lazy_provider("azure-openai", "kittylog.providers.azure_openai:AzureOpenAIProvider")
+register_lazy_provider("cerebras", "kittylog.providers.cerebras:CerebrasProvider")
+register_lazy_provider("chutes", "kittylog.providers.chutes:ChutesProvider")
+register_lazy_provider("claude-code", "kittylog.providers.claude_code:ClaudeCodeProvider")
+register_lazy_provider("custom-anthropic", "kittylog.providers.custom_anthropic:CustomAnthropicProvider")
+register_lazy_provider("custom-openai", "kittylog.providers.custom_openai:CustomOpenAIProvider")
+register_lazy_provider("deepseek", "kittylog.providers.deepseek:DeepSeekProvider")
+register_lazy_provider("fireworks", "kittylog.providers.fireworks:FireworksProvider")
+register_lazy_provider("gemini", "kittylog.providers.gemini:GeminiProvider")
+register_lazy_provider("groq", "kittylog.providers.groq:GroqProvider")
+register_lazy_provider("kimi-coding", "kittylog.providers.kimi_coding:KimiCodingProvider")
+register_lazy_provider("lm-studio", "kittylog.providers.lmstudio:LMStudioProvider")
+register_lazy_provider("minimax", "kittylog.providers.minimax:MiniMaxProvider")
+register_lazy_provider("mistral", "kittylog.providers.mistral:MistralProvider")
+register_lazy_provider("moonshot", "kittylog.providers.moonshot:MoonshotProvider")
+register_lazy_provider("ollama", "kittylog.providers.ollama:OllamaProvider")
+register_lazy_provider("openai", "kittylog.providers.openai:OpenAIProvider")
+register_lazy_provider("openrouter", "kittylog.providers.openrouter:OpenRouterProvider")
+register_lazy_provider("qwen", "kittylog.providers.qwen:QwenProvider")
+register_lazy_provider("replicate", "kittylog.providers.replicate:ReplicateProvider")
+register_lazy_provider("streamlake", "kittylog.providers.streamlake:StreamLakeProvider")
+register_lazy_provider("synthetic", "kittylog.providers.synthetic:SyntheticProvider")
+register_lazy_provider("together", "kittylog.providers.together:TogetherProvider")
+register_lazy_provider("zai", "kittylog.providers.zai:ZAIProvider")
+register_lazy_provider("zai-coding", "kittylog.providers.zai:ZAICodingProvider")
 
 # List of supported provider names - derived from registry keys
 SUPPORTED_PROVIDERS = sorted(PROVIDER_REGISTRY.keys())
 
 __all__ = [
+    "ASYNC_PROVIDER_REGISTRY",
+    "ASYNC_STREAMING_PROVIDER_REGISTRY",
     "PROVIDER_REGISTRY",
     "STREAMING_PROVIDER_REGISTRY",
     "SUPPORTED_PROVIDERS",
+    "register_lazy_provider",
     "register_provider",
 ]
@@ -18,6 +18,9 @@ class AzureOpenAIProvider(OpenAICompatibleProvider):
         base_url="https://placeholder.openai.azure.com",
     )
 
+    # Endpoint settings are read from the environment at construction
+    reuse_instance = False
+
     def __init__(self, config: ProviderConfig):
         super().__init__(config)
         # Azure OpenAI requires additional env vars for endpoint and version
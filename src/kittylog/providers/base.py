@@ -1,16 +1,24 @@
 """Base configured provider class to eliminate code duplication."""
 
+import asyncio
 import json
 import os
 from abc import ABC, abstractmethod
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator, Mapping
 from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
 from kittylog.errors import AIError
+from kittylog.providers import http_client, rate_limit
 from kittylog.providers.protocol import ProviderProtocol
+from kittylog.tracing import SPAN_KIND_CLIENT, http_request_attributes, http_response_attributes, trace_span
+
+
+def _streamed_body_size(response: httpx.Response) -> dict[str, Any]:
+    """Body size of a streamed response, which http_response_attributes cannot read from ``content``."""
+    return {"http.response.body.size": response.num_bytes_downloaded}
 
 
 @dataclass
@@ -24,6 +32,7 @@ class ProviderConfig:
         path: API endpoint path (e.g., "/v1/chat/completions"). If None, uses class default.
         timeout: Request timeout in seconds
         headers: Default HTTP headers
+        max_concurrency: Maximum number of requests in flight at once across threads
     """
 
     name: str
@@ -32,6 +41,7 @@ class ProviderConfig:
     path: str | None = None  # If None, use the class's default_path
     timeout: int = 120
     headers: dict[str, str] | None = None
+    max_concurrency: int = 4
 
     def __post_init__(self):
         """Initialize default headers if not provided."""
@@ -51,10 +61,16 @@ class BaseConfiguredProvider(ABC, ProviderProtocol):
     Implements ProviderProtocol for type safety.
 
     Class Attributes:
+        config: The provider's configuration. Subclasses define it; the registry reads it
+            from the class to name the provider and size its concurrency limit.
         default_path: Default API path for this provider type. Subclasses should override.
+        reuse_instance: Whether the registry may share one instance across calls. Providers
+            that read environment or credentials in ``__init__`` set this to False.
     """
 
+    config: ProviderConfig  # Subclasses define their configuration
     default_path: str = ""  # Subclasses should override with their default path
+    reuse_instance: bool = True
 
     def __init__(self, config: ProviderConfig):
         self.config = config
@@ -151,6 +167,99 @@ class BaseConfiguredProvider(ABC, ProviderProtocol):
         path = self.config.path if self.config.path is not None else self.default_path
         return f"{base}{path}"
 
+    def _prepare_request(
+        self, model: str, messages: list[dict], temperature: float, max_tokens: int, **kwargs
+    ) -> tuple[str, dict[str, str], dict[str, Any]]:
+        """Build the URL, headers and body for a request.
+
+        Shared by the sync and async, plain and streaming request paths.
+
+        Returns:
+            Tuple of (url, headers, body)
+
+        Raises:
+            AIError: If any part of the request cannot be built
+        """
+        try:
+            url = self._get_api_url(model)
+        except AIError:
+            raise
+        except Exception as e:
+            raise AIError.model_error(f"Error calling {self.config.name} AI API: {e!s}") from e
+
+        try:
+            headers = self._build_headers()
+        except AIError:
+            raise
+        except Exception as e:
+            raise AIError.model_error(f"Error calling {self.config.name} AI API: {e!s}") from e
+
+        try:
+            body = self._build_request_body(messages, temperature, max_tokens, model, **kwargs)
+        except AIError:
+            raise
+        except Exception as e:
+            raise AIError.model_error(f"Error calling {self.config.name} AI API: {e!s}") from e
+
+        # Add model to body if not already present
+        if "model" not in body:
+            body["model"] = model
+
+        return url, headers, body
+
+    def _translate_http_error(self, error: Exception) -> AIError:
+        """Map an exception raised while calling the API to the matching AIError.
+
+        Args:
+            error: Exception from the HTTP layer or response handling
+
+        Returns:
+            AIError to raise in its place
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            if status == 401:
+                return AIError.authentication_error(f"{self.config.name} API: Invalid API key or authentication failed")
+            if status == 429:
+                return AIError.rate_limit_error(
+                    f"{self.config.name} API: Rate limit exceeded",
+                    retry_after=rate_limit.retry_after_seconds(error.response.headers),
+                )
+            if status >= 500:
+                return AIError.connection_error(f"{self.config.name} API: Server error (HTTP {status})")
+            return AIError.model_error(f"{self.config.name} API error: HTTP {status} - {error.response.text}")
+        if isinstance(error, httpx.TimeoutException):
+            return AIError.timeout_error(f"{self.config.name} API request timed out")
+        if isinstance(error, httpx.RequestError):
+            return AIError.connection_error(f"{self.config.name} API network error: {error}")
+        return AIError.model_error(f"Error calling {self.config.name} AI API: {error!s}")
+
+    @staticmethod
+    def _sse_payload(line: str) -> str | None:
+        """Return the data payload of an SSE line, or None for blank lines and comments."""
+        if not line or line.startswith(":"):
+            return None
+        # Remove "data: " prefix from SSE
+        if line.startswith("data: "):
+            return line[6:]
+        return line
+
+    @staticmethod
+    def _estimate_usage(accumulated_content: list[str]) -> dict[str, int]:
+        """Estimate token usage when the stream did not report it."""
+        return {
+            "prompt_tokens": 0,
+            "completion_tokens": len("".join(accumulated_content)) // 4,
+            "total_tokens": 0,
+        }
+
+    def _observe_rate_limits(self, response: httpx.Response) -> None:
+        """Learn the provider's rate limits from a response's headers (see :mod:`kittylog.providers.rate_limit`)."""
+        # Pacing is best effort: a response without readable headers must not fail the request
+        headers = getattr(response, "headers", None)
+        if isinstance(headers, Mapping):
+            rate_limit.observe_response(self.config.name, response.status_code, headers)
+
     def _make_http_request(self, url: str, body: dict[str, Any], headers: dict[str, str]) -> dict[str, Any]:
         """Make the HTTP request with standardized error handling.
 
@@ -165,32 +274,43 @@ class BaseConfiguredProvider(ABC, ProviderProtocol):
         Raises:
             AIError: For any API-related errors
         """
-        try:
-            response = httpx.post(url, json=body, headers=headers, timeout=self.config.timeout)
-            response.raise_for_status()
-            return response.json()
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise AIError.authentication_error(
-                    f"{self.config.name} API: Invalid API key or authentication failed"
-                ) from e
-            elif e.response.status_code == 429:
-                raise AIError.rate_limit_error(f"{self.config.name} API: Rate limit exceeded") from e
-            elif e.response.status_code >= 500:
-                raise AIError.connection_error(
-                    f"{self.config.name} API: Server error (HTTP {e.response.status_code})"
-                ) from e
-            else:
-                raise AIError.model_error(
-                    f"{self.config.name} API error: HTTP {e.response.status_code} - {e.response.text}"
-                ) from e
-        except httpx.TimeoutException as e:
-            raise AIError.timeout_error(f"{self.config.name} API request timed out") from e
-        except httpx.RequestError as e:
-            raise AIError.connection_error(f"{self.config.name} API network error: {e}") from e
-        except Exception as e:
-            raise AIError.model_error(f"Error calling {self.config.name} AI API: {e!s}") from e
+        with trace_span("POST", kind=SPAN_KIND_CLIENT, **http_request_attributes(self.config.name, url)) as span:
+            try:
+                response = http_client.post(url, json=body, headers=headers, timeout=self.config.timeout)
+                if span is not None:
+                    span.set_attributes(**http_response_attributes(response))
+                self._observe_rate_limits(response)
+                response.raise_for_status()
+                return response.json()
+            except AIError:
+                raise
+            except Exception as e:
+                raise self._translate_http_error(e) from e
+
+    async def _amake_http_request(self, url: str, body: dict[str, Any], headers: dict[str, str]) -> dict[str, Any]:
+        """Async counterpart of :meth:`_make_http_request`.
+
+        Providers that override ``_make_http_request`` with a custom flow (polling,
+        re-authentication) have it run in a worker thread so it is not bypassed.
+
+        Raises:
+            AIError: For any API-related errors
+        """
+        if type(self)._make_http_request is not BaseConfiguredProvider._make_http_request:
+            return await asyncio.to_thread(self._make_http_request, url, body, headers)
+
+        with trace_span("POST", kind=SPAN_KIND_CLIENT, **http_request_attributes(self.config.name, url)) as span:
+            try:
+                response = await http_client.apost(url, json=body, headers=headers, timeout=self.config.timeout)
+                if span is not None:
+                    span.set_attributes(**http_response_attributes(response))
+                self._observe_rate_limits(response)
+                response.raise_for_status()
+                return response.json()
+            except AIError:
+                raise
+            except Exception as e:
+                raise self._translate_http_error(e) from e
 
     def generate(
         self, model: str, messages: list[dict], temperature: float = 0.7, max_tokens: int = 1024, **kwargs
@@ -210,36 +330,34 @@ class BaseConfiguredProvider(ABC, ProviderProtocol):
         Raises:
             AIError: For any API-related errors
         """
-        # Build request components
-        try:
-            url = self._get_api_url(model)
-        except AIError:
-            raise
-        except Exception as e:
-            raise AIError.model_error(f"Error calling {self.config.name} AI API: {e!s}") from e
-
-        try:
-            headers = self._build_headers()
-        except AIError:
-            raise
-        except Exception as e:
-            raise AIError.model_error(f"Error calling {self.config.name} AI API: {e!s}") from e
+        url, headers, body = self._prepare_request(model, messages, temperature, max_tokens, **kwargs)
+        tokens = rate_limit.estimate_request_tokens(messages, max_tokens, model)
+        rate_limit.wait_for_capacity(self.config.name, tokens)
+        response_data = self._make_http_request(url, body, headers)
+        return self._parse_response(response_data)
 
-        try:
-            body = self._build_request_body(messages, temperature, max_tokens, model, **kwargs)
-        except AIError:
-            raise
-        except Exception as e:
-            raise AIError.model_error(f"Error calling {self.config.name} AI API: {e!s}") from e
+    async def agenerate(
+        self, model: str, messages: list[dict], temperature: float = 0.7, max_tokens: int = 1024, **kwargs
+    ) -> str:
+        """Generate text using the AI provider without blocking the event loop.
 
-        # Add model to body if not already present
-        if "model" not in body:
-            body["model"] = model
+        Args:
+            model: Model name to use
+            messages: List of message dictionaries
+            temperature: Temperature parameter (0.0-2.0)
+            max_tokens: Maximum tokens in response
+            **kwargs: Additional provider-specific parameters
 
-        # Make HTTP request
-        response_data = self._make_http_request(url, body, headers)
+        Returns:
+            Generated text content
 
-        # Parse response
+        Raises:
+            AIError: For any API-related errors
+        """
+        url, headers, body = self._prepare_request(model, messages, temperature, max_tokens, **kwargs)
+        tokens = rate_limit.estimate_request_tokens(messages, max_tokens, model)
+        await rate_limit.await_capacity(self.config.name, tokens)
+        response_data = await self._amake_http_request(url, body, headers)
         return self._parse_response(response_data)
 
     @abstractmethod
@@ -276,103 +394,124 @@ class BaseConfiguredProvider(ABC, ProviderProtocol):
         Raises:
             AIError: For any API-related errors
         """
-        # Build request components
-        try:
-            url = self._get_api_url(model)
-        except AIError:
-            raise
-        except Exception as e:
-            raise AIError.model_error(f"Error calling {self.config.name} AI API: {e!s}") from e
-
-        try:
-            headers = self._build_headers()
-        except AIError:
-            raise
-        except Exception as e:
-            raise AIError.model_error(f"Error calling {self.config.name} AI API: {e!s}") from e
-
-        try:
-            body = self._build_request_body(messages, temperature, max_tokens, model, **kwargs)
-        except AIError:
-            raise
-        except Exception as e:
-            raise AIError.model_error(f"Error calling {self.config.name} AI API: {e!s}") from e
-
-        # Add model to body if not already present
-        if "model" not in body:
-            body["model"] = model
+        url, headers, body = self._prepare_request(model, messages, temperature, max_tokens, **kwargs)
 
         # Enable streaming in request body
         body["stream"] = True
+        tokens = rate_limit.estimate_request_tokens(messages, max_tokens, model)
+        rate_limit.wait_for_capacity(self.config.name, tokens)
 
         # Make streaming HTTP request
         accumulated_content = []
         usage_dict: dict | None = None
 
-        try:
-            with (
-                httpx.Client(timeout=self.config.timeout) as client,
-                client.stream("POST", url, json=body, headers=headers) as response,
-            ):
-                response.raise_for_status()
+        with trace_span("POST", kind=SPAN_KIND_CLIENT, **http_request_attributes(self.config.name, url)) as span:
+            try:
+                with http_client.get_client(url).stream(
+                    "POST", url, json=body, headers=headers, timeout=self.config.timeout
+                ) as response:
+                    if span is not None:
+                        span.set_attributes(**http_response_attributes(response))
+                    self._observe_rate_limits(response)
+                    response.raise_for_status()
+
+                    # Parse SSE stream
+                    for line in response.iter_lines():
+                        payload = self._sse_payload(line)
+                        if payload is None:
+                            continue
+
+                        # Check for stream end marker
+                        if payload == "[DONE]":
+                            break
+
+                        # Parse the chunk
+                        content_chunk, chunk_usage = self._parse_stream_chunk(payload)
+
+                        # Yield content chunks as they arrive
+                        if content_chunk:
+                            accumulated_content.append(content_chunk)
+                            yield (content_chunk, None)
+
+                        # Capture usage data if present
+                        if chunk_usage:
+                            usage_dict = chunk_usage
+
+                    if span is not None:
+                        span.set_attributes(**_streamed_body_size(response))
+
+            except AIError:
+                raise
+            except Exception as e:
+                raise self._translate_http_error(e) from e
+
+        # Final yield with token usage (estimated if not provided)
+        yield ("", usage_dict if usage_dict is not None else self._estimate_usage(accumulated_content))
+
+    async def agenerate_stream(
+        self, model: str, messages: list[dict], temperature: float = 0.7, max_tokens: int = 1024, **kwargs
+    ) -> AsyncGenerator[tuple[str, dict | None], None]:
+        """Generate text with streaming support without blocking the event loop.
 
-                # Parse SSE stream
-                for line in response.iter_lines():
-                    if not line or line.startswith(":"):
-                        continue
-
-                    # Remove "data: " prefix from SSE
-                    if line.startswith("data: "):
-                        line = line[6:]
-
-                    # Check for stream end marker
-                    if line == "[DONE]":
-                        break
-
-                    # Parse the chunk
-                    content_chunk, chunk_usage = self._parse_stream_chunk(line)
-
-                    # Yield content chunks as they arrive
-                    if content_chunk:
-                        accumulated_content.append(content_chunk)
-                        yield (content_chunk, None)
-
-                    # Capture usage data if present
-                    if chunk_usage:
-                        usage_dict = chunk_usage
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise AIError.authentication_error(
-                    f"{self.config.name} API: Invalid API key or authentication failed"
-                ) from e
-            elif e.response.status_code == 429:
-                raise AIError.rate_limit_error(f"{self.config.name} API: Rate limit exceeded") from e
-            elif e.response.status_code >= 500:
-                raise AIError.connection_error(
-                    f"{self.config.name} API: Server error (HTTP {e.response.status_code})"
-                ) from e
-            else:
-                raise AIError.model_error(
-                    f"{self.config.name} API error: HTTP {e.response.status_code} - {e.response.text}"
-                ) from e
-        except httpx.TimeoutException as e:
-            raise AIError.timeout_error(f"{self.config.name} API request timed out") from e
-        except httpx.RequestError as e:
-            raise AIError.connection_error(f"{self.config.name} API network error: {e}") from e
-        except Exception as e:
-            raise AIError.model_error(f"Error calling {self.config.name} AI API: {e!s}") from e
+        Args:
+            model: Model name to use
+            messages: List of message dictionaries
+            temperature: Temperature parameter (0.0-2.0)
+            max_tokens: Maximum tokens in response
+            **kwargs: Additional provider-specific parameters
 
-        # Final yield with token usage
-        if usage_dict is None:
-            # Estimate usage if not provided
-            usage_dict = {
-                "prompt_tokens": 0,
-                "completion_tokens": len("".join(accumulated_content)) // 4,
-                "total_tokens": 0,
-            }
+        Yields:
+            Tuple[str, dict | None]:
+            - (chunk_text, None) for content chunks
+            - ("", usage_dict) for final yield with token usage
+
+        Raises:
+            AIError: For any API-related errors
+        """
+        url, headers, body = self._prepare_request(model, messages, temperature, max_tokens, **kwargs)
+        body["stream"] = True
+        tokens = rate_limit.estimate_request_tokens(messages, max_tokens, model)
+        await rate_limit.await_capacity(self.config.name, tokens)
+
+        accumulated_content = []
+        usage_dict: dict | None = None
 
-        yield ("", usage_dict)
+        with trace_span("POST", kind=SPAN_KIND_CLIENT, **http_request_attributes(self.config.name, url)) as span:
+            try:
+                async with http_client.get_async_client(url).stream(
+                    "POST", url, json=body, headers=headers, timeout=self.config.timeout
+                ) as response:
+                    self._observe_rate_limits(response)
+                    if response.is_error:
+                        # Read the body so error messages can include it
+                        await response.aread()
+                    if span is not None:
+                        span.set_attributes(**http_response_attributes(response))
+                    response.raise_for_status()
+
+                    async for line in response.aiter_lines():
+                        payload = self._sse_payload(line)
+                        if payload is None:
+                            continue
+                        if payload == "[DONE]":
+                            break
+
+                        content_chunk, chunk_usage = self._parse_stream_chunk(payload)
+                        if content_chunk:
+                            accumulated_content.append(content_chunk)
+                            yield (content_chunk, None)
+                        if chunk_usage:
+                            usage_dict = chunk_usage
+
+                    if span is not None:
+                        span.set_attributes(**_streamed_body_size(response))
+
+            except AIError:
+                raise
+            except Exception as e:
+                raise self._translate_http_error(e) from e
+
+        yield ("", usage_dict if usage_dict is not None else self._estimate_usage(accumulated_content))
 
 
 class OpenAICompatibleProvider(BaseConfiguredProvider):
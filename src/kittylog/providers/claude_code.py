@@ -10,6 +10,7 @@ import os
 import httpx
 
 from kittylog.errors import AIError
+from kittylog.providers import http_client
 from kittylog.providers.base import AnthropicCompatibleProvider, ProviderConfig
 
 logger = logging.getLogger(__name__)
@@ -74,7 +75,8 @@ class ClaudeCodeProvider(AnthropicCompatibleProvider):
     def _make_http_request(self, url: str, body: dict, headers: dict[str, str]) -> dict:
         """Override to handle Claude Code OAuth re-authentication on 401 errors."""
         try:
-            response = httpx.post(url, json=body, headers=headers, timeout=self.config.timeout)
+            response = http_client.post(url, json=body, headers=headers, timeout=self.config.timeout)
+            self._observe_rate_limits(response)
             response.raise_for_status()
             return response.json()
 
@@ -102,7 +104,7 @@ class ClaudeCodeProvider(AnthropicCompatibleProvider):
 
                         try:
                             # Retry the request
-                            response = httpx.post(url, json=body, headers=headers, timeout=self.config.timeout)
+                            response = http_client.post(url, json=body, headers=headers, timeout=self.config.timeout)
                             response.raise_for_status()
                             return response.json()
                         except Exception as retry_error:
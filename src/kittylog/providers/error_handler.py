@@ -1,5 +1,6 @@
 """Centralized error handling decorator for AI providers."""
 
+import inspect
 from collections.abc import Callable
 from functools import wraps
 from typing import Any
@@ -7,11 +8,49 @@ from typing import Any
 import httpx
 
 from kittylog.errors import AIError
+from kittylog.providers.rate_limit import retry_after_seconds
+
+
+def _translate_provider_error(provider_name: str, e: Exception) -> AIError:
+    """Map an exception raised by a provider call to the matching AIError."""
+    if isinstance(e, httpx.ConnectError):
+        return AIError.connection_error(f"{provider_name}: {e}")
+    if isinstance(e, httpx.TimeoutException):
+        return AIError.timeout_error(f"{provider_name}: {e}")
+    if isinstance(e, httpx.HTTPStatusError):
+        if e.response.status_code == 401:
+            return AIError.authentication_error(f"{provider_name}: Invalid API key or authentication failed")
+        elif e.response.status_code == 429:
+            return AIError.rate_limit_error(
+                f"{provider_name}: Rate limit exceeded. Please try again later.",
+                retry_after=retry_after_seconds(e.response.headers),
+            )
+        elif e.response.status_code == 404:
+            return AIError.model_error(f"{provider_name}: Model not found or endpoint not available")
+        elif e.response.status_code >= 500:
+            return AIError.generation_error(f"{provider_name}: Server error (HTTP {e.response.status_code})")
+        else:
+            return AIError.generation_error(f"{provider_name}: HTTP {e.response.status_code}: {e.response.text}")
+
+    # Handle any other unexpected exceptions
+    if "authentication" in str(e).lower() or "unauthorized" in str(e).lower():
+        return AIError.authentication_error(f"Error calling {provider_name} API: {e}")
+    elif "rate limit" in str(e).lower() or "quota" in str(e).lower():
+        return AIError.rate_limit_error(f"Error calling {provider_name} API: {e}")
+    elif "timeout" in str(e).lower():
+        return AIError.timeout_error(f"Error calling {provider_name} API: {e}")
+    elif "connection" in str(e).lower():
+        return AIError.connection_error(f"Error calling {provider_name} API: {e}")
+    else:
+        # Handle all other exceptions with the standard format
+        return AIError.generation_error(f"Error calling {provider_name} API: {e}")
 
 
 def handle_provider_errors(provider_name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Decorator to standardize error handling across all AI providers.
 
+    Works with plain functions, coroutine functions and async generator functions.
+
     Args:
         provider_name: Name of the AI provider for error messages
 
@@ -20,6 +59,33 @@ def handle_provider_errors(provider_name: str) -> Callable[[Callable[..., Any]],
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.isasyncgenfunction(func):
+
+            @wraps(func)
+            async def async_gen_wrapper(*args, **kwargs):
+                try:
+                    async for item in func(*args, **kwargs):
+                        yield item
+                except AIError:
+                    raise
+                except Exception as e:
+                    raise _translate_provider_error(provider_name, e) from e
+
+            return async_gen_wrapper
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except AIError:
+                    raise
+                except Exception as e:
+                    raise _translate_provider_error(provider_name, e) from e
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
@@ -27,42 +93,8 @@ def handle_provider_errors(provider_name: str) -> Callable[[Callable[..., Any]],
             except AIError:
                 # Re-raise AIError exceptions as-is without wrapping
                 raise
-            except httpx.ConnectError as e:
-                raise AIError.connection_error(f"{provider_name}: {e}") from e
-            except httpx.TimeoutException as e:
-                raise AIError.timeout_error(f"{provider_name}: {e}") from e
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 401:
-                    raise AIError.authentication_error(
-                        f"{provider_name}: Invalid API key or authentication failed"
-                    ) from e
-                elif e.response.status_code == 429:
-                    raise AIError.rate_limit_error(
-                        f"{provider_name}: Rate limit exceeded. Please try again later."
-                    ) from e
-                elif e.response.status_code == 404:
-                    raise AIError.model_error(f"{provider_name}: Model not found or endpoint not available") from e
-                elif e.response.status_code >= 500:
-                    raise AIError.generation_error(
-                        f"{provider_name}: Server error (HTTP {e.response.status_code})"
-                    ) from e
-                else:
-                    raise AIError.generation_error(
-                        f"{provider_name}: HTTP {e.response.status_code}: {e.response.text}"
-                    ) from e
             except Exception as e:
-                # Handle any other unexpected exceptions
-                if "authentication" in str(e).lower() or "unauthorized" in str(e).lower():
-                    raise AIError.authentication_error(f"Error calling {provider_name} API: {e}") from e
-                elif "rate limit" in str(e).lower() or "quota" in str(e).lower():
-                    raise AIError.rate_limit_error(f"Error calling {provider_name} API: {e}") from e
-                elif "timeout" in str(e).lower():
-                    raise AIError.timeout_error(f"Error calling {provider_name} API: {e}") from e
-                elif "connection" in str(e).lower():
-                    raise AIError.connection_error(f"Error calling {provider_name} API: {e}") from e
-                else:
-                    # Handle all other exceptions with the standard format
-                    raise AIError.generation_error(f"Error calling {provider_name} API: {e}") from e
+                raise _translate_provider_error(provider_name, e) from e
 
         return wrapper
 
@@ -0,0 +1,234 @@
+"""Shared HTTP connection pool for AI providers.
+
+Every provider request used to open a new connection (``httpx.post`` or a
+fresh ``httpx.Client``), paying a TCP and TLS handshake for each boundary in a
+multi-entry run. This module keeps one keep-alive ``httpx.Client`` per
+scheme/host/port for the life of the process, so repeated requests to a
+provider reuse warm connections. HTTP/2 is negotiated when the optional ``h2``
+package is installed (``pip install kittylog[http2]``).
+
+Async callers get ``httpx.AsyncClient`` pools with the same settings. Async
+clients are bound to the event loop that created them, so they are kept per
+running loop and closed with :func:`aclose_clients`.
+
+Pool limits come from the environment:
+
+- ``KITTYLOG_HTTP_MAX_CONNECTIONS``: connections per host (default 20)
+- ``KITTYLOG_HTTP_MAX_KEEPALIVE_CONNECTIONS``: idle connections kept open (default 10)
+- ``KITTYLOG_HTTP_KEEPALIVE_EXPIRY``: seconds an idle connection is kept (default 30)
+- ``KITTYLOG_HTTP2``: set to ``false`` to disable HTTP/2
+"""
+
+import asyncio
+import atexit
+import importlib.util
+import logging
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from kittylog.constants import EnvDefaults
+
+logger = logging.getLogger(__name__)
+
+_clients: dict[str, httpx.Client] = {}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool configuration.
+
+    Attributes:
+        max_connections: Maximum concurrent connections per host
+        max_keepalive_connections: Maximum idle connections kept open per host
+        keepalive_expiry: Seconds an idle connection stays open
+        http2: Whether to negotiate HTTP/2 with servers that support it
+    """
+
+    max_connections: int = EnvDefaults.HTTP_MAX_CONNECTIONS
+    max_keepalive_connections: int = EnvDefaults.HTTP_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float = EnvDefaults.HTTP_KEEPALIVE_EXPIRY
+    http2: bool = True
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_pool_settings() -> PoolSettings:
+    """Read pool settings from the environment.
+
+    Returns:
+        PoolSettings with invalid or missing values replaced by defaults
+    """
+    from kittylog.config.loader import _safe_float, _safe_int
+
+    return PoolSettings(
+        max_connections=_safe_int(
+            os.getenv("KITTYLOG_HTTP_MAX_CONNECTIONS"), EnvDefaults.HTTP_MAX_CONNECTIONS, min_value=1
+        ),
+        max_keepalive_connections=_safe_int(
+            os.getenv("KITTYLOG_HTTP_MAX_KEEPALIVE_CONNECTIONS"),
+            EnvDefaults.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            min_value=0,
+        ),
+        keepalive_expiry=_safe_float(os.getenv("KITTYLOG_HTTP_KEEPALIVE_EXPIRY"), EnvDefaults.HTTP_KEEPALIVE_EXPIRY),
+        http2=(os.getenv("KITTYLOG_HTTP2") or "true").lower() != "false",
+    )
+
+
+def _pool_key(url: str) -> str:
+    parsed = httpx.URL(url)
+    port = f":{parsed.port}" if parsed.port else ""
+    return f"{parsed.scheme}://{parsed.host}{port}"
+
+
+def _client_options(key: str, settings: PoolSettings) -> dict[str, Any]:
+    http2 = settings.http2 and _http2_available()
+    logger.debug(f"Opening HTTP connection pool for {key} (http2={http2})")
+    limits = httpx.Limits(
+        max_connections=settings.max_connections,
+        max_keepalive_connections=settings.max_keepalive_connections,
+        keepalive_expiry=settings.keepalive_expiry,
+    )
+    return {"limits": limits, "http2": http2}
+
+
+def _create_client(key: str, settings: PoolSettings) -> httpx.Client:
+    return httpx.Client(**_client_options(key, settings))
+
+
+def _create_async_client(key: str, settings: PoolSettings) -> httpx.AsyncClient:
+    return httpx.AsyncClient(**_client_options(key, settings))
+
+
+def get_client(url: str) -> httpx.Client:
+    """Get the pooled client for the host serving ``url``.
+
+    Clients are created on first use and shared by all threads and providers
+    talking to the same scheme, host and port.
+
+    Args:
+        url: Request URL (only its origin is used as the pool key)
+
+    Returns:
+        Shared keep-alive client
+    """
+    key = _pool_key(url)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None or client.is_closed:
+            client = _create_client(key, get_pool_settings())
+            _clients[key] = client
+        return client
+
+
+def post(url: str, *, json: Any, headers: dict[str, str], timeout: float) -> httpx.Response:
+    """Send a POST request over the shared pool.
+
+    Args:
+        url: Request URL
+        json: JSON-serialisable request body
+        headers: Request headers
+        timeout: Request timeout in seconds
+
+    Returns:
+        The HTTP response
+
+    Raises:
+        httpx.HTTPError: If the request fails
+    """
+    return get_client(url).post(url, json=json, headers=headers, timeout=timeout)
+
+
+def get(url: str, *, headers: dict[str, str], timeout: float) -> httpx.Response:
+    """Send a GET request over the shared pool.
+
+    Args:
+        url: Request URL
+        headers: Request headers
+        timeout: Request timeout in seconds
+
+    Returns:
+        The HTTP response
+
+    Raises:
+        httpx.HTTPError: If the request fails
+    """
+    return get_client(url).get(url, headers=headers, timeout=timeout)
+
+
+def get_async_client(url: str) -> httpx.AsyncClient:
+    """Get the pooled async client for the host serving ``url`` on the running event loop.
+
+    Args:
+        url: Request URL (only its origin is used as the pool key)
+
+    Returns:
+        Shared keep-alive async client
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    key = _pool_key(url)
+    with _clients_lock:
+        loop_clients = _async_clients.setdefault(loop, {})
+        client = loop_clients.get(key)
+        if client is None or client.is_closed:
+            client = _create_async_client(key, get_pool_settings())
+            loop_clients[key] = client
+        return client
+
+
+async def apost(url: str, *, json: Any, headers: dict[str, str], timeout: float) -> httpx.Response:
+    """Send a POST request over the shared async pool.
+
+    Args:
+        url: Request URL
+        json: JSON-serialisable request body
+        headers: Request headers
+        timeout: Request timeout in seconds
+
+    Returns:
+        The HTTP response
+
+    Raises:
+        httpx.HTTPError: If the request fails
+    """
+    return await get_async_client(url).post(url, json=json, headers=headers, timeout=timeout)
+
+
+async def aclose_clients() -> None:
+    """Close the async clients opened on the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        clients = list(_async_clients.pop(loop, {}).values())
+    for client in clients:
+        await client.aclose()
+
+
+def close_clients() -> None:
+    """Close every pooled client and their connections.
+
+    Called automatically at interpreter exit; safe to call more than once.
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:  # pragma: no cover - best effort during shutdown
+            logger.debug(f"Error closing HTTP client: {e}")
+
+
+atexit.register(close_clients)
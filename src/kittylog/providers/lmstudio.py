@@ -15,8 +15,12 @@ class LMStudioProvider(OpenAICompatibleProvider):
         api_key_env="LMSTUDIO_API_KEY",
         base_url="http://localhost:1234",
         # Uses default path: /v1/chat/completions
+        max_concurrency=1,  # Local server runs one model at a time
     )
 
+    # Endpoint settings are read from the environment at construction
+    reuse_instance = False
+
     def __init__(self, config: ProviderConfig):
         super().__init__(config)
         # Allow configurable API URL via environment
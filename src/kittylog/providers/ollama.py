@@ -15,6 +15,7 @@ class OllamaProvider(OpenAICompatibleProvider):
         api_key_env="OLLAMA_API_KEY",
         base_url="http://localhost:11434",
         # Uses default_path: /api/chat
+        max_concurrency=1,  # Local server runs one model at a time
     )
 
     def _get_api_key(self) -> str:
@@ -16,6 +16,9 @@ class QwenProvider(OpenAICompatibleProvider):
         base_url=QWEN_DEFAULT_API_URL,
     )
 
+    # OAuth token is loaded at construction and may be refreshed between calls
+    reuse_instance = False
+
     def __init__(self, config: ProviderConfig):
         """Initialize with OAuth authentication."""
         super().__init__(config)
@@ -0,0 +1,269 @@
+"""Client-side pacing of AI provider requests.
+
+Each provider gets a request bucket and a token bucket. Their sizes and refill
+rates are learned from the rate limit headers of the provider's responses
+(``x-ratelimit-*`` as sent by OpenAI-compatible APIs, ``anthropic-ratelimit-*``),
+and a ``Retry-After`` on a 429 or 503 pauses every request to that provider.
+Until a provider has reported its limits, its requests are not delayed.
+
+A request reserves one request and its estimated tokens before it is sent, and
+waits until both buckets cover the reservation. Concurrent requests therefore
+queue in arrival order and are spread out to stay just under the provider's
+limits, rather than bursting into 429s and backing off.
+"""
+
+import asyncio
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from kittylog.tokenizer import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# Fraction of a provider's reported throughput to use, leaving headroom for other clients of the same key
+UTILIZATION = 0.95
+# Window assumed for a limit reported without a reset time (rate limits are usually per minute)
+DEFAULT_WINDOW_SECONDS = 60.0
+# Longest Retry-After honoured. Longer waits (hourly or daily quotas) fail the request instead of stalling the run
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+# (limit, remaining, reset) header names, with {} standing for "requests" or "tokens"
+_HEADER_FORMATS = (
+    ("x-ratelimit-limit-{}", "x-ratelimit-remaining-{}", "x-ratelimit-reset-{}"),
+    ("anthropic-ratelimit-{}-limit", "anthropic-ratelimit-{}-remaining", "anthropic-ratelimit-{}-reset"),
+)
+# Durations like "20ms", "1s" or "6m0s"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+# Reset values above this are Unix timestamps rather than durations
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+@dataclass
+class TokenBucket:
+    """A bucket of ``capacity`` units refilled at ``rate`` units per second.
+
+    The level goes negative while reservations wait for the bucket to refill.
+    """
+
+    capacity: float
+    rate: float
+    level: float
+    updated: float
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take ``amount`` units and return the seconds until the bucket covers them."""
+        self.refill(now)
+        # A request larger than the whole bucket only has to wait for a full one
+        self.level -= min(amount, self.capacity)
+        return 0.0 if self.level >= 0 else -self.level / self.rate
+
+
+@dataclass
+class ProviderLimits:
+    """What is known about one provider's rate limits."""
+
+    buckets: dict[str, TokenBucket] = field(default_factory=dict)  # "requests" and/or "tokens"
+    blocked_until: float = 0.0
+
+
+class RateLimiter:
+    """Request and token buckets for every provider, shared by all threads."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limits: dict[str, ProviderLimits] = {}
+
+    def reserve(self, provider: str, tokens: int) -> float:
+        """Reserve one request and ``tokens`` tokens for ``provider``.
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._lock:
+            limits = self._limits.get(provider)
+            if limits is None:
+                return 0.0
+            now = self._clock()
+            amounts = {"requests": 1, "tokens": tokens}
+            waits = [bucket.reserve(amounts[kind], now) for kind, bucket in limits.buckets.items()]
+            return max(0.0, limits.blocked_until - now, *waits)
+
+    def observe(self, provider: str, status_code: int, headers: Mapping[str, str]) -> None:
+        """Update ``provider``'s buckets from the rate limit headers of a response."""
+        headers = {name.lower(): value for name, value in headers.items()}
+        reported = parse_rate_limit_headers(headers)
+        retry_after = retry_after_seconds(headers) if status_code in (429, 503) else None
+        if not reported and retry_after is None:
+            return
+
+        with self._lock:
+            now = self._clock()
+            limits = self._limits.setdefault(provider, ProviderLimits())
+            for kind, (limit, remaining, reset) in reported.items():
+                # The bucket refills what has been used by the time the limit resets
+                used_per_second = (limit - remaining) / reset if reset and limit > remaining else None
+                rate = UTILIZATION * (used_per_second or limit / DEFAULT_WINDOW_SECONDS)
+                bucket = limits.buckets.get(kind)
+                if bucket is None:
+                    limits.buckets[kind] = TokenBucket(limit, rate, remaining, now)
+                    continue
+                bucket.refill(now)
+                bucket.capacity, bucket.rate = limit, rate
+                # Keep local reservations the provider has not seen yet
+                bucket.level = min(bucket.level, remaining)
+            if retry_after is not None:
+                pause = min(retry_after, MAX_RETRY_AFTER_SECONDS)
+                limits.blocked_until = max(limits.blocked_until, now + pause)
+                logger.debug(f"{provider} asked to retry after {retry_after:.1f}s")
+
+    def reset(self) -> None:
+        """Forget every provider's limits."""
+        with self._lock:
+            self._limits.clear()
+
+
+_limiter = RateLimiter()
+
+
+def wait_for_capacity(provider: str, tokens: int) -> float:
+    """Block until ``provider`` has capacity for a request of ``tokens`` tokens.
+
+    Returns:
+        Seconds waited
+    """
+    wait = _limiter.reserve(provider, tokens)
+    if wait > 0:
+        logger.debug(f"Waiting {wait:.2f}s for {provider} rate limit capacity")
+        time.sleep(wait)
+    return wait
+
+
+async def await_capacity(provider: str, tokens: int) -> float:
+    """Async counterpart of :func:`wait_for_capacity`."""
+    wait = _limiter.reserve(provider, tokens)
+    if wait > 0:
+        logger.debug(f"Waiting {wait:.2f}s for {provider} rate limit capacity")
+        await asyncio.sleep(wait)
+    return wait
+
+
+def observe_response(provider: str, status_code: int, headers: Mapping[str, str]) -> None:
+    """Learn ``provider``'s rate limits from a response."""
+    _limiter.observe(provider, status_code, headers)
+
+
+def reset_rate_limits() -> None:
+    """Forget every provider's learned rate limits."""
+    _limiter.reset()
+
+
+def estimate_request_tokens(messages: list[dict], max_tokens: int, model: str) -> int:
+    """Estimate the tokens a request counts against a token limit: its prompt plus the completion allowance.
+
+    The prompt is counted with the same tokenizer as the prompt packer, so both agree on what fits.
+    """
+    return sum(count_tokens(str(message.get("content", "")), model) for message in messages) + max_tokens
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> dict[str, tuple[float, float, float | None]]:
+    """Read the request and token limits reported in response headers, looked up by lower-case name.
+
+    Returns:
+        Mapping of "requests" and/or "tokens" to (limit, remaining, seconds until reset or None)
+    """
+    reported: dict[str, tuple[float, float, float | None]] = {}
+    for kind in ("requests", "tokens"):
+        for limit_header, remaining_header, reset_header in _HEADER_FORMATS:
+            limit = headers.get(limit_header.format(kind))
+            remaining = headers.get(remaining_header.format(kind))
+            if limit is None or remaining is None:
+                continue
+            try:
+                limit_value, remaining_value = float(limit), float(remaining)
+            except ValueError:
+                continue
+            if limit_value > 0:
+                reset = _seconds_until(headers.get(reset_header.format(kind)))
+                reported[kind] = (limit_value, max(0.0, remaining_value), reset)
+                break
+    return reported
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> float | None:
+    """Read how long response headers ask the client to wait, or None if they do not say.
+
+    Headers are looked up by lower-case name (``httpx.Headers`` matches any case).
+    """
+    if not isinstance(headers, Mapping):
+        return None
+    milliseconds = headers.get("retry-after-ms")
+    if milliseconds is not None:
+        try:
+            return max(0.0, float(milliseconds) / 1000)
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+def _seconds_until(reset: str | None) -> float | None:
+    """Parse a reset header: a duration ("1s", "6m0s"), seconds, a Unix timestamp or an RFC 3339 time."""
+    if not reset:
+        return None
+    try:
+        value = float(reset)
+    except ValueError:
+        pass
+    else:
+        return max(0.0, value - time.time()) if value > _EPOCH_THRESHOLD else value
+    parts = _DURATION_PART.findall(reset)
+    if parts and "".join(number + unit for number, unit in parts) == reset:
+        return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+    if reset[-1:] in ("Z", "z"):
+        # datetime.fromisoformat only accepts a "Z" offset from Python 3.11
+        reset = reset[:-1] + "+00:00"
+    try:
+        date = datetime.fromisoformat(reset)
+    except ValueError:
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+__all__ = [
+    "MAX_RETRY_AFTER_SECONDS",
+    "RateLimiter",
+    "TokenBucket",
+    "await_capacity",
+    "estimate_request_tokens",
+    "observe_response",
+    "parse_rate_limit_headers",
+    "reset_rate_limits",
+    "retry_after_seconds",
+    "wait_for_capacity",
+]
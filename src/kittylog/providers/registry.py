@@ -1,23 +1,145 @@
 """Provider registry for AI providers."""
 
-from collections.abc import Callable, Generator
+import asyncio
+import importlib
+import threading
+import weakref
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Iterator, MutableMapping
 from functools import wraps
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 if TYPE_CHECKING:
     from kittylog.providers.base import BaseConfiguredProvider
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Providers registered by "module:Class" path, imported the first time their name is looked up
+_LAZY_PROVIDERS: dict[str, str] = {}
+_LAZY_PROVIDERS_LOCK = threading.RLock()
+
+
+class ProviderRegistry(MutableMapping[str, F], Generic[F]):
+    """Provider name -> provider function, importing lazily registered providers on first lookup.
+
+    Membership tests, ``len()`` and iterating over names never import a provider
+    module; looking up a function (including via ``values()``/``items()``) does.
+    """
+
+    def __init__(self) -> None:
+        self._funcs: dict[str, F] = {}
+
+    def __getitem__(self, name: str) -> F:
+        if name not in self._funcs:
+            _load_provider(name)
+        return self._funcs[name]
+
+    def __setitem__(self, name: str, func: F) -> None:
+        self._funcs[name] = func
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self._funcs:
+            _load_provider(name)
+        del self._funcs[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._funcs or name in _LAZY_PROVIDERS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(dict.fromkeys([*self._funcs, *_LAZY_PROVIDERS]))
+
+    def __len__(self) -> int:
+        return len(self._funcs.keys() | _LAZY_PROVIDERS.keys())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({sorted(self)})"
+
+
 # Global registry for provider functions
-PROVIDER_REGISTRY: dict[str, Callable[..., str]] = {}
-STREAMING_PROVIDER_REGISTRY: dict[str, Callable[..., Generator[tuple[str, dict | None], None, None]]] = {}
+PROVIDER_REGISTRY: ProviderRegistry[Callable[..., str]] = ProviderRegistry()
+STREAMING_PROVIDER_REGISTRY: ProviderRegistry[Callable[..., Generator[tuple[str, dict | None], None, None]]] = (
+    ProviderRegistry()
+)
+ASYNC_PROVIDER_REGISTRY: ProviderRegistry[Callable[..., Awaitable[str]]] = ProviderRegistry()
+ASYNC_STREAMING_PROVIDER_REGISTRY: ProviderRegistry[Callable[..., AsyncGenerator[tuple[str, dict | None], None]]] = (
+    ProviderRegistry()
+)
+
+# Per-provider limits on concurrent requests, shared by the plain and streaming functions
+_PROVIDER_SEMAPHORES: dict[str, threading.BoundedSemaphore] = {}
+_PROVIDER_SEMAPHORES_LOCK = threading.Lock()
+# Async callers get per-event-loop semaphores with the same limits
+_ASYNC_PROVIDER_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_provider_semaphore(provider_class: type["BaseConfiguredProvider"]) -> threading.BoundedSemaphore:
+    """Get the semaphore capping concurrent requests to a provider.
+
+    Args:
+        provider_class: A provider class with a `config` class attribute
+
+    Returns:
+        Semaphore sized by the provider's ``max_concurrency`` setting
+    """
+    config = provider_class.config
+    with _PROVIDER_SEMAPHORES_LOCK:
+        semaphore = _PROVIDER_SEMAPHORES.get(config.name)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(max(1, config.max_concurrency))
+            _PROVIDER_SEMAPHORES[config.name] = semaphore
+        return semaphore
+
+
+def get_async_provider_semaphore(provider_class: type["BaseConfiguredProvider"]) -> asyncio.Semaphore:
+    """Get the semaphore capping concurrent async requests to a provider on the running loop.
+
+    Args:
+        provider_class: A provider class with a `config` class attribute
+
+    Returns:
+        Semaphore sized by the provider's ``max_concurrency`` setting
+    """
+    config = provider_class.config
+    loop = asyncio.get_running_loop()
+    with _PROVIDER_SEMAPHORES_LOCK:
+        loop_semaphores = _ASYNC_PROVIDER_SEMAPHORES.setdefault(loop, {})
+        semaphore = loop_semaphores.get(config.name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, config.max_concurrency))
+            loop_semaphores[config.name] = semaphore
+        return semaphore
+
+
+def _instance_factory(provider_class: type["BaseConfiguredProvider"]) -> Callable[[], "BaseConfiguredProvider"]:
+    """Return a callable giving the provider instance to use for a call.
+
+    Instances are created once and reused (they hold no per-request state and
+    their HTTP connections live in the shared pool), unless the provider opts
+    out with ``reuse_instance = False``.
+    """
+    if not getattr(provider_class, "reuse_instance", True):
+        return lambda: provider_class(provider_class.config)
+
+    instance: BaseConfiguredProvider | None = None
+    lock = threading.Lock()
+
+    def get_instance() -> "BaseConfiguredProvider":
+        nonlocal instance
+        with lock:
+            if instance is None:
+                instance = provider_class(provider_class.config)
+            return instance
+
+    return get_instance
 
 
 def create_provider_func(provider_class: type["BaseConfiguredProvider"]) -> Callable[..., str]:
     """Create a provider function from a provider class.
 
     This function creates a callable that:
-    1. Instantiates the provider class
-    2. Calls generate() with the provided arguments
+    1. Reuses a provider instance (see _instance_factory)
+    2. Calls generate() with the provided arguments, holding the provider's concurrency slot
     3. Is wrapped with @handle_provider_errors for consistent error handling
 
     Args:
@@ -29,14 +151,16 @@ def create_provider_func(provider_class: type["BaseConfiguredProvider"]) -> Call
     from kittylog.providers.error_handler import handle_provider_errors
 
     provider_name = provider_class.config.name
+    get_instance = _instance_factory(provider_class)
 
     @handle_provider_errors(provider_name)
     @wraps(provider_class.generate)
     def provider_func(model: str, messages: list[dict[str, Any]], temperature: float, max_tokens: int, **kwargs) -> str:
-        provider = provider_class(provider_class.config)
-        return provider.generate(
-            model=model, messages=messages, temperature=temperature, max_tokens=max_tokens, **kwargs
-        )
+        provider = get_instance()
+        with get_provider_semaphore(provider_class):
+            return provider.generate(
+                model=model, messages=messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+            )
 
     # Add metadata for introspection
     provider_func.__name__ = f"call_{provider_name.lower().replace(' ', '_').replace('.', '_')}_api"
@@ -51,9 +175,9 @@ def create_streaming_provider_func(
     """Create a streaming provider function from a provider class.
 
     This function creates a callable that:
-    1. Instantiates the provider class
+    1. Reuses a provider instance (see _instance_factory)
     2. Calls generate_stream() with the provided arguments
-    3. Yields chunks as they're received
+    3. Yields chunks as they're received, holding the provider's concurrency slot until the stream ends
     4. Is wrapped with @handle_provider_errors for consistent error handling
 
     Args:
@@ -65,16 +189,18 @@ def create_streaming_provider_func(
     from kittylog.providers.error_handler import handle_provider_errors
 
     provider_name = provider_class.config.name
+    get_instance = _instance_factory(provider_class)
 
     @handle_provider_errors(provider_name)
     @wraps(provider_class.generate_stream)
     def streaming_provider_func(
         model: str, messages: list[dict[str, Any]], temperature: float, max_tokens: int, **kwargs
     ) -> Generator[tuple[str, dict | None], None, None]:
-        provider = provider_class(provider_class.config)
-        yield from provider.generate_stream(
-            model=model, messages=messages, temperature=temperature, max_tokens=max_tokens, **kwargs
-        )
+        provider = get_instance()
+        with get_provider_semaphore(provider_class):
+            yield from provider.generate_stream(
+                model=model, messages=messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+            )
 
     # Add metadata for introspection
     streaming_provider_func.__name__ = f"stream_{provider_name.lower().replace(' ', '_').replace('.', '_')}_api"
@@ -83,8 +209,77 @@ def create_streaming_provider_func(
     return streaming_provider_func
 
 
+def create_async_provider_func(provider_class: type["BaseConfiguredProvider"]) -> Callable[..., Awaitable[str]]:
+    """Create an async provider function from a provider class.
+
+    The async counterpart of :func:`create_provider_func`, calling agenerate().
+
+    Args:
+        provider_class: A provider class with a `config` class attribute
+
+    Returns:
+        A coroutine function that can be used to generate text
+    """
+    from kittylog.providers.error_handler import handle_provider_errors
+
+    provider_name = provider_class.config.name
+    get_instance = _instance_factory(provider_class)
+
+    @handle_provider_errors(provider_name)
+    @wraps(provider_class.agenerate)
+    async def async_provider_func(
+        model: str, messages: list[dict[str, Any]], temperature: float, max_tokens: int, **kwargs
+    ) -> str:
+        provider = get_instance()
+        async with get_async_provider_semaphore(provider_class):
+            return await provider.agenerate(
+                model=model, messages=messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+            )
+
+    async_provider_func.__name__ = f"acall_{provider_name.lower().replace(' ', '_').replace('.', '_')}_api"
+    async_provider_func.__doc__ = f"Call {provider_name} API asynchronously to generate text."
+
+    return async_provider_func
+
+
+def create_async_streaming_provider_func(
+    provider_class: type["BaseConfiguredProvider"],
+) -> Callable[..., AsyncGenerator[tuple[str, dict | None], None]]:
+    """Create an async streaming provider function from a provider class.
+
+    The async counterpart of :func:`create_streaming_provider_func`, iterating agenerate_stream().
+
+    Args:
+        provider_class: A provider class with a `config` class attribute
+
+    Returns:
+        An async generator function that can be used to stream text
+    """
+    from kittylog.providers.error_handler import handle_provider_errors
+
+    provider_name = provider_class.config.name
+    get_instance = _instance_factory(provider_class)
+
+    @handle_provider_errors(provider_name)
+    @wraps(provider_class.agenerate_stream)
+    async def async_streaming_provider_func(
+        model: str, messages: list[dict[str, Any]], temperature: float, max_tokens: int, **kwargs
+    ) -> AsyncGenerator[tuple[str, dict | None], None]:
+        provider = get_instance()
+        async with get_async_provider_semaphore(provider_class):
+            async for chunk in provider.agenerate_stream(
+                model=model, messages=messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+            ):
+                yield chunk
+
+    async_streaming_provider_func.__name__ = f"astream_{provider_name.lower().replace(' ', '_').replace('.', '_')}_api"
+    async_streaming_provider_func.__doc__ = f"Stream text asynchronously from {provider_name} API."
+
+    return async_streaming_provider_func
+
+
 def register_provider(name: str, provider_class: type["BaseConfiguredProvider"]) -> None:
-    """Register a provider class and auto-generate its function.
+    """Register a provider class and auto-generate its functions.
 
     Args:
         name: Provider name (e.g., "openai", "anthropic")
@@ -92,10 +287,43 @@ def register_provider(name: str, provider_class: type["BaseConfiguredProvider"])
     """
     PROVIDER_REGISTRY[name] = create_provider_func(provider_class)
     STREAMING_PROVIDER_REGISTRY[name] = create_streaming_provider_func(provider_class)
+    ASYNC_PROVIDER_REGISTRY[name] = create_async_provider_func(provider_class)
+    ASYNC_STREAMING_PROVIDER_REGISTRY[name] = create_async_streaming_provider_func(provider_class)
+    with _LAZY_PROVIDERS_LOCK:
+        # An eager registration replaces a lazy one of the same name
+        _LAZY_PROVIDERS.pop(name, None)
+
+
+def register_lazy_provider(name: str, target: str) -> None:
+    """Register a provider without importing it; its module is imported when the name is first looked up.
+
+    Args:
+        name: Provider name (e.g., "openai", "anthropic")
+        target: Provider class as "module:ClassName" (e.g., "kittylog.providers.openai:OpenAIProvider")
+    """
+    with _LAZY_PROVIDERS_LOCK:
+        _LAZY_PROVIDERS[name] = target
+
+
+def _load_provider(name: str) -> None:
+    """Import a lazily registered provider and register its functions."""
+    with _LAZY_PROVIDERS_LOCK:
+        target = _LAZY_PROVIDERS.get(name)
+        if target is None:
+            # Unknown name (the lookup raises KeyError), or another thread loaded it while we waited
+            return
+        module_name, class_name = target.split(":")
+        register_provider(name, getattr(importlib.import_module(module_name), class_name))
 
 
 __all__ = [
+    "ASYNC_PROVIDER_REGISTRY",
+    "ASYNC_STREAMING_PROVIDER_REGISTRY",
     "PROVIDER_REGISTRY",
     "STREAMING_PROVIDER_REGISTRY",
+    "ProviderRegistry",
+    "get_async_provider_semaphore",
+    "get_provider_semaphore",
+    "register_lazy_provider",
     "register_provider",
 ]
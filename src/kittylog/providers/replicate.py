@@ -6,6 +6,7 @@ import time
 import httpx
 
 from kittylog.errors import AIError
+from kittylog.providers import http_client, rate_limit
 from kittylog.providers.base import GenericHTTPProvider, ProviderConfig
 
 
@@ -76,7 +77,7 @@ class ReplicateProvider(GenericHTTPProvider):
         """Override to handle Replicate's async prediction workflow."""
         try:
             # Create prediction
-            response = httpx.post(url, json=body, headers=headers, timeout=self.config.timeout)
+            response = http_client.post(url, json=body, headers=headers, timeout=self.config.timeout)
             response.raise_for_status()
             prediction_data = response.json()
 
@@ -89,7 +90,7 @@ class ReplicateProvider(GenericHTTPProvider):
             elapsed_time = 0
 
             while elapsed_time < max_wait_time:
-                get_response = httpx.get(get_url, headers=headers, timeout=self.config.timeout)
+                get_response = http_client.get(get_url, headers=headers, timeout=self.config.timeout)
                 get_response.raise_for_status()
                 status_data = get_response.json()
 
@@ -109,7 +110,10 @@ class ReplicateProvider(GenericHTTPProvider):
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:
-                raise AIError.rate_limit_error(f"Replicate API rate limit exceeded: {e.response.text}") from e
+                raise AIError.rate_limit_error(
+                    f"Replicate API rate limit exceeded: {e.response.text}",
+                    retry_after=rate_limit.retry_after_seconds(e.response.headers),
+                ) from e
             elif e.response.status_code == 401:
                 raise AIError.authentication_error(f"Replicate API authentication failed: {e.response.text}") from e
             raise AIError.model_error(f"Replicate API error: {e.response.status_code} - {e.response.text}") from e
@@ -0,0 +1,285 @@
+"""Content-addressed cache of LLM responses.
+
+Re-running kittylog on the same boundary (after a failed write, a CI retry or
+a ``--dry-run``) sends exactly the same prompt again. Responses are stored in a
+SQLite database keyed by a hash of everything that determines the request
+(provider:model, system prompt, user prompt, temperature and max tokens), so a
+repeat run is answered from disk instead of the provider.
+
+The cache lives in ``$KITTYLOG_CACHE_DIR`` (default ``$XDG_CACHE_HOME/kittylog``
+or ``~/.cache/kittylog``) and is shared by every repository, which is safe
+because the key covers the whole prompt. It is configured from the environment:
+
+- ``KITTYLOG_CACHE``: set to ``false`` to disable the cache
+- ``KITTYLOG_CACHE_DIR``: directory holding the database
+- ``KITTYLOG_CACHE_MAX_SIZE_MB``: total size of stored responses (default 50)
+- ``KITTYLOG_CACHE_MAX_AGE_DAYS``: days a response stays valid (default 30)
+
+Any database or filesystem error is logged and treated as a miss, so the cache
+is purely an optimisation.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from kittylog.cache import CacheManager
+from kittylog.constants import EnvDefaults
+
+logger = logging.getLogger(__name__)
+
+# Bump when the key derivation or row layout changes; older databases are rebuilt
+SCHEMA_VERSION = 1
+
+CACHE_DIR_NAME = "kittylog"
+CACHE_FILE_NAME = "responses.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+
+@dataclass(frozen=True)
+class ResponseCacheSettings:
+    """Response cache configuration.
+
+    Attributes:
+        enabled: Whether responses are read from and written to the cache
+        directory: Directory holding the cache database
+        max_size_bytes: Total size of stored responses before least recently used ones are evicted
+        max_age_seconds: Age after which a stored response is no longer used
+    """
+
+    enabled: bool
+    directory: Path
+    max_size_bytes: int
+    max_age_seconds: float
+
+    @property
+    def path(self) -> Path:
+        return self.directory / CACHE_FILE_NAME
+
+
+def _default_cache_dir() -> Path:
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / CACHE_DIR_NAME
+
+
+def get_cache_settings() -> ResponseCacheSettings:
+    """Read response cache settings from the environment.
+
+    Returns:
+        ResponseCacheSettings with invalid or missing values replaced by defaults
+    """
+    from kittylog.config.loader import _safe_float
+
+    max_size_mb = _safe_float(os.getenv("KITTYLOG_CACHE_MAX_SIZE_MB"), EnvDefaults.RESPONSE_CACHE_MAX_SIZE_MB)
+    max_age_days = _safe_float(os.getenv("KITTYLOG_CACHE_MAX_AGE_DAYS"), EnvDefaults.RESPONSE_CACHE_MAX_AGE_DAYS)
+    cache_dir = os.getenv("KITTYLOG_CACHE_DIR")
+
+    return ResponseCacheSettings(
+        enabled=(os.getenv("KITTYLOG_CACHE") or "true").lower() != "false",
+        directory=Path(cache_dir).expanduser() if cache_dir else _default_cache_dir(),
+        max_size_bytes=max(0, int(max_size_mb * 1024 * 1024)),
+        max_age_seconds=max(0.0, max_age_days * 86400),
+    )
+
+
+def make_cache_key(model: str, system_prompt: str, user_prompt: str, temperature: float, max_tokens: int) -> str:
+    """Derive the cache key for a request.
+
+    Args:
+        model: Model string in format "provider:model"
+        system_prompt: System prompt text
+        user_prompt: User prompt text
+        temperature: Temperature parameter
+        max_tokens: Maximum output tokens
+
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    payload = json.dumps(
+        [SCHEMA_VERSION, model, system_prompt, user_prompt, float(temperature), int(max_tokens)],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _count(name: str, amount: int = 1) -> None:
+    with _stats_lock:
+        _stats[name] += amount
+
+
+def _connect(settings: ResponseCacheSettings) -> sqlite3.Connection:
+    settings.directory.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(settings.path), timeout=30)
+    try:
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS responses")
+        with conn:
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+
+def get_cached_response(key: str, settings: ResponseCacheSettings | None = None) -> str | None:
+    """Look up a stored response.
+
+    Args:
+        key: Cache key from :func:`make_cache_key`
+        settings: Cache settings (read from the environment if not given)
+
+    Returns:
+        The stored response, or None on a miss or if the cache is disabled
+    """
+    settings = settings or get_cache_settings()
+    if not settings.enabled:
+        return None
+
+    now = time.time()
+    try:
+        conn = _connect(settings)
+        try:
+            row = conn.execute(
+                "SELECT content FROM responses WHERE key = ? AND created >= ?",
+                (key, now - settings.max_age_seconds),
+            ).fetchone()
+            if row is not None:
+                with conn:
+                    conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError) as e:
+        logger.debug(f"Response cache unavailable at {settings.path}: {e}")
+        row = None
+
+    if row is None:
+        _count("misses")
+        return None
+    _count("hits")
+    return str(row[0])
+
+
+def store_response(key: str, content: str, settings: ResponseCacheSettings | None = None) -> None:
+    """Store a response and evict expired or excess entries.
+
+    Args:
+        key: Cache key from :func:`make_cache_key`
+        content: Response text
+        settings: Cache settings (read from the environment if not given)
+    """
+    settings = settings or get_cache_settings()
+    if not settings.enabled:
+        return
+
+    now = time.time()
+    size = len(content.encode("utf-8"))
+    try:
+        conn = _connect(settings)
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (key, content, size, now, now),
+                )
+                evicted = _evict(conn, settings, now)
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError) as e:
+        logger.debug(f"Could not store response in cache at {settings.path}: {e}")
+        return
+
+    _count("stores")
+    if evicted:
+        _count("evictions", evicted)
+        logger.debug(f"Evicted {evicted} cached responses")
+
+
+def _evict(conn: sqlite3.Connection, settings: ResponseCacheSettings, now: float) -> int:
+    """Drop expired entries, then least recently used ones until under the size limit."""
+    evicted = conn.execute("DELETE FROM responses WHERE created < ?", (now - settings.max_age_seconds,)).rowcount
+
+    (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+    if total <= settings.max_size_bytes:
+        return evicted
+
+    stale = []
+    for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed ASC"):
+        if total <= settings.max_size_bytes:
+            break
+        stale.append((key,))
+        total -= size
+    conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+    return evicted + len(stale)
+
+
+def clear_response_cache(settings: ResponseCacheSettings | None = None) -> None:
+    """Delete every stored response and reset the hit/miss counters.
+
+    Args:
+        settings: Cache settings (read from the environment if not given)
+    """
+    settings = settings or get_cache_settings()
+    try:
+        settings.path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Could not remove response cache at {settings.path}: {e}")
+    with _stats_lock:
+        for name in _stats:
+            _stats[name] = 0
+
+
+def response_cache_stats() -> dict:
+    """Return hit/miss counters for this process plus the size of the stored cache.
+
+    Returns:
+        Dictionary with ``hits``, ``misses``, ``hit_rate``, ``stores``, ``evictions``,
+        ``currsize`` (stored responses), ``size_bytes``, ``maxsize_bytes`` and ``path``
+    """
+    settings = get_cache_settings()
+    with _stats_lock:
+        stats: dict = dict(_stats)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / lookups if lookups > 0 else 0
+    stats["enabled"] = settings.enabled
+    stats["path"] = str(settings.path)
+    stats["maxsize_bytes"] = settings.max_size_bytes
+    stats["currsize"] = 0
+    stats["size_bytes"] = 0
+
+    if settings.path.exists():
+        try:
+            conn = sqlite3.connect(str(settings.path), timeout=30)
+            try:
+                count, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            finally:
+                conn.close()
+            stats["currsize"] = int(count)
+            stats["size_bytes"] = int(size)
+        except sqlite3.Error as e:
+            logger.debug(f"Could not read response cache at {settings.path}: {e}")
+
+    return stats
+
+
+CacheManager.register_stats_source("llm_response_cache", response_cache_stats)
@@ -0,0 +1,198 @@
+"""Fingerprint stamp that lets routine runs exit early when nothing changed.
+
+Hooks and CI call kittylog on every push, and most of those runs find that
+every boundary already has a changelog entry. When a run finds nothing
+missing, the state that result depended on is stamped into
+``.git/kittylog/stamp.json``: the commit HEAD points at, a digest of the tag
+refs, a digest of the changelog, and a key of the run's options and effective
+configuration. The next run with the same key compares the stamp with the
+repository and stops if nothing changed.
+
+Git's files are read directly, so the check imports neither git nor the AI
+stack. Repositories this module cannot read (``GIT_DIR`` overrides, the
+reftable ref format) simply never take the fast path.
+"""
+
+import contextvars
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Any
+
+from kittylog import __version__
+
+logger = logging.getLogger(__name__)
+
+STAMP_FILE = Path("kittylog") / "stamp.json"
+
+# Prefixes of every name find_changelog_file looks for, so a changelog appearing
+# next to the one that was found invalidates the stamp
+_CHANGELOG_PREFIXES = ("CHANGELOG", "CHANGES", "HISTORY")
+
+_recording: contextvars.ContextVar[dict[str, Any] | None] = contextvars.ContextVar("kittylog_run_stamp", default=None)
+
+
+def options_key(*parts: Any) -> str:
+    """Return a key for the options and configuration of a run.
+
+    The key also covers the kittylog version and the working directory, which
+    decides the repository and changelog a run works on.
+    """
+    payload = json.dumps([__version__, str(Path.cwd()), *parts], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def is_unchanged(key: str) -> bool:
+    """Return whether the last run with ``key`` found nothing missing and nothing changed since."""
+    dirs = _git_dirs()
+    if dirs is None:
+        return False
+    try:
+        stamp = json.loads((dirs[0] / STAMP_FILE).read_text(encoding="utf-8"))
+        if stamp.pop("key", None) != key:
+            return False
+        return stamp == _fingerprint(*dirs, stamp["changelog_file"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return False
+
+
+def mark_up_to_date(changelog_file: str) -> None:
+    """Record that the current run found no missing entries in ``changelog_file``.
+
+    The state of the repository is captured now and stamped when the enclosing
+    :func:`recording` block completes. Outside such a block this does nothing.
+    """
+    pending = _recording.get()
+    dirs = _git_dirs()
+    if pending is None or dirs is None:
+        return
+    try:
+        pending["stamp"] = _fingerprint(*dirs, changelog_file)
+    except (OSError, ValueError):
+        logger.debug("Could not fingerprint the repository", exc_info=True)
+
+
+@contextmanager
+def recording(key: str | None) -> Iterator[None]:
+    """Stamp the repository under ``key`` if the enclosed run marks itself up to date.
+
+    Any existing stamp is removed first, so a run that does not finish cleanly
+    leaves no stale stamp behind. With a ``key`` of None nothing is recorded.
+    """
+    dirs = _git_dirs() if key is not None else None
+    if dirs is None:
+        yield
+        return
+    path = dirs[0] / STAMP_FILE
+    with suppress(OSError):
+        path.unlink(missing_ok=True)
+    pending: dict[str, Any] = {}
+    token = _recording.set(pending)
+    try:
+        yield
+    finally:
+        _recording.reset(token)
+    if "stamp" not in pending:
+        return
+    try:
+        path.parent.mkdir(exist_ok=True)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps({"key": key, **pending["stamp"]}), encoding="utf-8")
+        temporary.replace(path)
+    except OSError:
+        logger.debug("Could not write the run stamp", exc_info=True)
+
+
+def _fingerprint(git_dir: Path, common_dir: Path, changelog_file: str) -> dict[str, Any]:
+    """Return the state of the repository a missing-entries run depends on."""
+    changelog = Path(changelog_file)
+    try:
+        changelog_digest = hashlib.sha256(changelog.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        changelog_digest = None
+    return {
+        "head": _resolve_head(git_dir, common_dir),
+        "tags": _tags_digest(common_dir),
+        "changelog_file": changelog_file,
+        "changelog": changelog_digest,
+        "changelog_candidates": sorted(
+            path.as_posix()
+            for directory in (Path(), Path("docs"))
+            if directory.is_dir()
+            for path in directory.iterdir()
+            if path.name.upper().startswith(_CHANGELOG_PREFIXES)
+        ),
+    }
+
+
+def _git_dirs() -> tuple[Path, Path] | None:
+    """Return the git directory of the working directory's repository and its common directory.
+
+    Linked worktrees keep HEAD in their own git directory and refs in the
+    common one. Returns None when the repository cannot be read here.
+    """
+    if "GIT_DIR" in os.environ:
+        return None
+    cwd = Path.cwd()
+    for directory in (cwd, *cwd.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            git_dir = dot_git
+            break
+        if dot_git.is_file():
+            content = dot_git.read_text(encoding="utf-8").strip()
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = (directory / content.removeprefix("gitdir:").strip()).resolve()
+            break
+    else:
+        return None
+
+    common_dir = git_dir
+    commondir_file = git_dir / "commondir"
+    if commondir_file.is_file():
+        common_dir = (git_dir / commondir_file.read_text(encoding="utf-8").strip()).resolve()
+    if (common_dir / "reftable").exists():
+        return None
+    return git_dir, common_dir
+
+
+def _packed_refs(common_dir: Path) -> list[str]:
+    try:
+        return (common_dir / "packed-refs").read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return []
+
+
+def _resolve_head(git_dir: Path, common_dir: Path) -> str:
+    """Return the commit HEAD points at, or the name of its branch if that has no commits yet."""
+    head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    if not head.startswith("ref:"):
+        return head
+    ref = head.removeprefix("ref:").strip()
+    loose = common_dir / ref
+    if loose.is_file():
+        return loose.read_text(encoding="utf-8").strip()
+    for line in _packed_refs(common_dir):
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return ref
+
+
+def _tags_digest(common_dir: Path) -> str:
+    """Return a digest of every tag ref, packed or loose."""
+    digest = hashlib.sha256()
+    for line in _packed_refs(common_dir):
+        if " refs/tags/" in line:
+            digest.update(f"{line}\n".encode())
+    tags_dir = common_dir / "refs" / "tags"
+    if tags_dir.is_dir():
+        for path in sorted(tags_dir.rglob("*")):
+            if path.is_file():
+                digest.update(f"{path.relative_to(common_dir).as_posix()} ".encode() + path.read_bytes())
+    return digest.hexdigest()
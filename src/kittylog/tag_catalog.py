@@ -0,0 +1,267 @@
+"""Tag catalog read from a single ``git for-each-ref`` call.
+
+Iterating ``repo.tags`` through GitPython reads the tag object and the
+commit object of every tag separately, which dominates start-up in
+repositories with thousands of tags. The catalog lists all tags, their
+target objects, peeled commit IDs and the commit metadata the tag helpers
+need in one ``git for-each-ref refs/tags`` invocation.
+
+Catalogs are memoized per refs state: a fingerprint of the ref storage
+(``packed-refs``, the loose ``refs/tags`` directories and the reftable
+stack) is taken on every lookup, and the catalog is only re-read when the
+fingerprint changes, e.g. after ``git tag``.
+
+Each record is written as NUL-terminated fields; the newline for-each-ref
+appends after a record ends up in front of the next record's first field::
+
+    <refname>\\0<objectname>\\0<objecttype>\\0<*objectname>\\0<*objecttype>\\0<date>\\0<author>\\0<message>\\0...
+"""
+
+import logging
+import os
+import subprocess
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import git
+
+from kittylog.cache import cached, cached_maxsize
+
+logger = logging.getLogger(__name__)
+
+# Fields of the ref itself, then of the commit a lightweight tag points to, then of the
+# commit an annotated tag peels to (the "*" fields are empty for lightweight tags)
+_FIELDS = (
+    "%(refname)",
+    "%(objectname)",
+    "%(objecttype)",
+    "%(*objectname)",
+    "%(*objecttype)",
+    "%(committerdate:iso-strict)",
+    "%(authorname)",
+    "%(contents)",
+    "%(*committerdate:iso-strict)",
+    "%(*authorname)",
+    "%(*contents)",
+)
+FOR_EACH_REF_FORMAT = "".join(f"{field}%00" for field in _FIELDS)
+
+_TAG_PREFIX = "refs/tags/"
+
+
+@dataclass(frozen=True)
+class TagRecord:
+    """A tag and the commit it points to.
+
+    Attributes:
+        name: Tag name without the ``refs/tags/`` prefix
+        object_hash: Object the ref points to (the tag object for annotated tags)
+        commit: Peeled commit hash
+        annotated: Whether the tag is an annotated tag object
+        date: Committer date of the commit
+        author: Author name of the commit
+        message: Commit message, stripped
+    """
+
+    name: str
+    object_hash: str
+    commit: str
+    annotated: bool
+    date: datetime
+    author: str
+    message: str
+
+    @property
+    def summary(self) -> str:
+        """First line of the commit message."""
+        return self.message.split("\n", 1)[0]
+
+
+class TagCatalog:
+    """All tags of a repository, indexed by name and by peeled commit."""
+
+    def __init__(self, records: list[TagRecord]):
+        self.records = records
+        self._by_name = {record.name: record for record in records}
+        self._by_commit: dict[str, list[TagRecord]] = {}
+        for record in records:
+            self._by_commit.setdefault(record.commit, []).append(record)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[TagRecord]:
+        return iter(self.records)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def get(self, name: str) -> TagRecord | None:
+        """Return the record of a tag, or None if there is no such tag."""
+        return self._by_name.get(name)
+
+    def names(self) -> list[str]:
+        """Tag names in refname order."""
+        return [record.name for record in self.records]
+
+    def tags_at(self, commit: str) -> list[TagRecord]:
+        """Return the tags whose peeled commit is ``commit``."""
+        return self._by_commit.get(commit, [])
+
+
+def parse_for_each_ref(output: str) -> list[TagRecord]:
+    """Parse ``git for-each-ref`` output produced with :data:`FOR_EACH_REF_FORMAT`.
+
+    Tags that do not peel to a commit (e.g. tags of trees or blobs) are skipped.
+
+    Args:
+        output: Raw command output
+
+    Returns:
+        Tag records in output order
+    """
+    tokens = output.split("\0")
+    records: list[TagRecord] = []
+    for start in range(0, len(tokens) - len(_FIELDS) + 1, len(_FIELDS)):
+        (
+            refname,
+            object_hash,
+            object_type,
+            peeled_hash,
+            peeled_type,
+            date,
+            author,
+            message,
+            peeled_date,
+            peeled_author,
+            peeled_message,
+        ) = tokens[start : start + len(_FIELDS)]
+        name = refname.lstrip("\n").removeprefix(_TAG_PREFIX)
+        annotated = object_type == "tag"
+
+        commit_type, commit = (peeled_type, peeled_hash) if annotated else (object_type, object_hash)
+        if annotated:
+            date, author, message = peeled_date, peeled_author, peeled_message
+        if commit_type != "commit":
+            logger.warning(f"Skipping tag {name}: it points to a {commit_type or 'non-commit object'}")
+            continue
+
+        try:
+            commit_date = datetime.fromisoformat(date)
+        except ValueError as e:
+            logger.warning(f"Failed to process tag {name}: {e}")
+            continue
+
+        records.append(
+            TagRecord(
+                name=name,
+                object_hash=object_hash,
+                commit=commit,
+                annotated=annotated,
+                date=commit_date,
+                author=author,
+                message=message.strip(),
+            )
+        )
+    return records
+
+
+def read_tag_catalog(cwd: str | None = None) -> TagCatalog:
+    """Read all tags with a single ``git for-each-ref`` call.
+
+    Args:
+        cwd: Directory to run git in (defaults to the current directory)
+
+    Returns:
+        The tag catalog
+
+    Raises:
+        git.GitCommandError: If git is unavailable or exits with an error
+    """
+    cmd = ["git", "for-each-ref", f"--format={FOR_EACH_REF_FORMAT}", _TAG_PREFIX]
+    try:
+        result = subprocess.run(cmd, cwd=cwd, capture_output=True, check=False)
+    except OSError as e:
+        raise git.GitCommandError(cmd, 127, str(e)) from e
+    if result.returncode != 0:
+        raise git.GitCommandError(cmd, result.returncode, result.stderr.decode("utf-8", errors="replace").strip())
+
+    records = parse_for_each_ref(result.stdout.decode("utf-8", errors="replace"))
+    logger.debug(f"Read {len(records)} tags with git for-each-ref")
+    return TagCatalog(records)
+
+
+@cached
+def _git_common_dir(cwd: str) -> str | None:
+    """Return the common git directory of the repository containing ``cwd`` (None outside one)."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--path-format=absolute", "--git-common-dir"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return result.stdout.strip()
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def refs_fingerprint(common_dir: str) -> tuple:
+    """Fingerprint the tag ref storage of a repository.
+
+    Creating, moving or deleting a loose ref renames a file in its directory,
+    which changes the directory's mtime; packing rewrites ``packed-refs`` and
+    reftable updates rewrite ``tables.list``.
+
+    Args:
+        common_dir: The repository's common git directory
+
+    Returns:
+        A hashable value that changes whenever the tags change
+    """
+    root = Path(common_dir)
+    directories = []
+    for directory, _subdirectories, _files in os.walk(root / "refs" / "tags"):
+        directories.append((directory, _stat_key(Path(directory))))
+    return (
+        _stat_key(root / "packed-refs"),
+        _stat_key(root / "reftable" / "tables.list"),
+        tuple(directories),
+    )
+
+
+@cached_maxsize(4)
+def _load_catalog(cwd: str, fingerprint: tuple) -> TagCatalog:
+    return read_tag_catalog(cwd)
+
+
+def get_tag_catalog(cwd: str | None = None) -> TagCatalog:
+    """Return the tag catalog, re-reading it only when the refs have changed.
+
+    Args:
+        cwd: Directory inside the repository (defaults to the current directory)
+
+    Returns:
+        The tag catalog
+
+    Raises:
+        git.GitCommandError: If the directory is not in a git repository or git fails
+    """
+    directory = str(Path(cwd or ".").resolve())
+    common_dir = _git_common_dir(directory)
+    if common_dir is None:
+        raise git.GitCommandError(["git", "rev-parse", "--git-common-dir"], 128, f"Not a git repository: {directory}")
+    return _load_catalog(directory, refs_fingerprint(common_dir))
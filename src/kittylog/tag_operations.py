@@ -6,6 +6,7 @@ boundary detection across different modes, and changelog synchronization.
 
 import logging
 import re
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
@@ -14,6 +15,10 @@ from git import InvalidGitRepositoryError, Repo
 
 from kittylog.cache import cached
 from kittylog.errors import GitError
+from kittylog.git_objects import close_object_readers, get_object_reader
+from kittylog.profiling import Phase, timed
+from kittylog.tag_catalog import TagRecord, get_tag_catalog
+from kittylog.tracing import set_attributes
 
 logger = logging.getLogger(__name__)
 
@@ -43,11 +48,10 @@ def get_all_tags() -> list[str]:
     during a single execution.
     """
     try:
-        repo = get_repo()
-        tags = list(repo.tags)
+        tags = get_tag_catalog().records
 
         # Try to sort by semantic version
-        def version_key(tag: git.Tag) -> tuple:
+        def version_key(tag: TagRecord) -> tuple:
             """Extract version components for sorting."""
             # Remove 'v' prefix if present
             version_str = tag.name.lstrip("v")
@@ -63,10 +67,10 @@ def get_all_tags() -> list[str]:
 
         try:
             # Sort by semantic version
-            tags.sort(key=version_key)
+            tags = sorted(tags, key=version_key)
         except (ValueError, TypeError):
             # Fall back to chronological sorting
-            tags.sort(key=lambda t: t.commit.committed_date)
+            tags = sorted(tags, key=lambda t: t.date)
 
         tag_names = [tag.name for tag in tags]
         logger.debug(f"All tags: {tag_names}")
@@ -108,12 +112,15 @@ def get_current_commit_hash() -> str:
     """Get the current commit hash (HEAD).
 
     This function is cached to avoid repeated git operations
-    during a single execution.
+    during a single execution. HEAD is resolved through the shared
+    ``git cat-file`` process.
     """
     try:
-        repo = get_repo()
-        return repo.head.commit.hexsha
-    except (InvalidGitRepositoryError, git.GitCommandError, git.GitError, AttributeError) as e:
+        hexsha = get_object_reader().resolve("HEAD")
+        if hexsha is None:
+            raise git.GitError("HEAD does not point to a commit")
+        return hexsha
+    except (git.GitCommandError, git.GitError) as e:
         logger.error(f"Failed to get current commit hash: {e!s}")
         raise GitError(
             f"Failed to get current commit hash: {e!s}",
@@ -129,11 +136,10 @@ def is_current_commit_tagged() -> bool:
         True if HEAD is tagged, False otherwise.
     """
     try:
-        repo = get_repo()
         current_commit = get_current_commit_hash()
 
         # Check if any tag points to the current commit
-        return any(tag.commit.hexsha == current_commit for tag in repo.tags)
+        return bool(get_tag_catalog().tags_at(current_commit))
     except (InvalidGitRepositoryError, git.GitCommandError, git.GitError, AttributeError) as e:
         logger.error(f"Failed to check if current commit is tagged: {e!s}")
         return False
@@ -227,12 +233,14 @@ def determine_new_tags(changelog_file: str = "CHANGELOG.md") -> tuple[str | None
 def get_tag_date(tag_name: str) -> datetime | None:
     """Get the date when a tag was created."""
     try:
-        repo = get_repo()
-        tag = repo.tags[tag_name]
-        return tag.commit.committed_datetime
-    except (InvalidGitRepositoryError, git.GitCommandError, git.GitError, KeyError, AttributeError, IndexError) as e:
+        tag = get_tag_catalog().get(tag_name)
+    except (InvalidGitRepositoryError, git.GitCommandError, git.GitError) as e:
         logger.warning(f"Failed to get date for tag {tag_name}: {e}")
         return None
+    if tag is None:
+        logger.warning(f"Failed to get date for tag {tag_name}: no such tag")
+        return None
+    return tag.date
 
 
 def generate_boundary_display_name(boundary: dict, mode: str) -> str:
@@ -269,71 +277,22 @@ def generate_boundary_identifier(boundary: dict, mode: str) -> str:
 
 def get_latest_boundary(mode: str = "tags", **kwargs) -> dict | None:
     """Get the latest boundary based on the specified mode."""
-    from kittylog.commit_analyzer import (
-        get_commits_by_date_boundaries,
-        get_commits_by_gap_boundaries,
-    )
-
     if mode == "tags":
+        # The latest tag is the highest version, not necessarily the most recent one
         latest_tag = get_latest_tag()
-        if latest_tag:
-            from kittylog.commit_analyzer import get_all_tags_with_dates
-
-            tags_data = get_all_tags_with_dates()
-            for tag_data in tags_data:
-                if tag_data["identifier"] == latest_tag:
-                    return tag_data
-        return None
+        return get_boundary_catalog("tags").get(latest_tag) if latest_tag else None
     elif mode == "dates":
-        date_grouping = kwargs.get("date_grouping", "daily")
-        boundaries = get_commits_by_date_boundaries(date_grouping=date_grouping)
-        return boundaries[-1] if boundaries else None
+        return get_boundary_catalog(mode, date_grouping=kwargs.get("date_grouping", "daily")).latest
     elif mode == "gaps":
-        gap_threshold_hours = kwargs.get("gap_threshold_hours", 4.0)
-        boundaries = get_commits_by_gap_boundaries(gap_threshold_hours=gap_threshold_hours)
-        return boundaries[-1] if boundaries else None
+        return get_boundary_catalog(mode, gap_threshold_hours=kwargs.get("gap_threshold_hours", 4.0)).latest
     else:
         raise ValueError(f"Unsupported mode: {mode}")
 
 
 def get_previous_boundary(boundary: dict, mode: str, **kwargs) -> dict | None:
     """Get the previous boundary before the given boundary."""
-    from kittylog.commit_analyzer import (
-        get_all_tags_with_dates,
-        get_commits_by_date_boundaries,
-        get_commits_by_gap_boundaries,
-    )
-
     try:
-        if mode == "tags":
-            all_boundaries = get_all_tags_with_dates()
-        elif mode == "dates":
-            date_grouping = kwargs.get("date_grouping", "daily")
-            all_boundaries = get_commits_by_date_boundaries(date_grouping=date_grouping)
-        elif mode == "gaps":
-            gap_threshold_hours = kwargs.get("gap_threshold_hours", 4.0)
-            all_boundaries = get_commits_by_gap_boundaries(gap_threshold_hours=gap_threshold_hours)
-        else:
-            raise ValueError(f"Unsupported mode: {mode}")
-
-        # Find the target boundary in the list
-        target_index = None
-        for i, b in enumerate(all_boundaries):
-            if boundary["hash"] == b["hash"]:
-                target_index = i
-                break
-
-        if target_index is None:
-            # Target boundary not found in the list
-            return None
-
-        # Return the previous boundary if it exists
-        if target_index > 0:
-            return all_boundaries[target_index - 1]
-        else:
-            # This is the first boundary, so return None
-            return None
-
+        return get_boundary_catalog(mode, **kwargs).previous(boundary)
     except (IndexError, KeyError, ValueError) as e:
         logger.debug(
             f"Could not determine previous boundary for {boundary.get('identifier', boundary.get('hash', 'unknown'))}: {e}"
@@ -341,6 +300,7 @@ def get_previous_boundary(boundary: dict, mode: str, **kwargs) -> dict | None:
         return None
 
 
+@timed(Phase.BOUNDARIES)
 def get_all_boundaries(mode: str = "tags", **kwargs) -> list[dict]:
     """Get all boundaries based on the specified mode.
 
@@ -359,6 +319,7 @@ def get_all_boundaries(mode: str = "tags", **kwargs) -> list[dict]:
         get_commits_by_gap_boundaries,
     )
 
+    set_attributes(**{"kittylog.mode": mode})
     if mode == "tags":
         return get_all_tags_with_dates()
     elif mode == "dates":
@@ -382,11 +343,99 @@ def get_boundary_by_identifier(identifier: str, mode: str = "tags", **kwargs) ->
     Returns:
         Boundary dictionary or None if not found
     """
-    boundaries = get_all_boundaries(mode=mode, **kwargs)
-    for boundary in boundaries:
-        if boundary.get("identifier") == identifier:
-            return boundary
-    return None
+    return get_boundary_catalog(mode, **kwargs).get(identifier)
+
+
+def boundary_key(boundary: dict) -> str:
+    """Return the identifier a boundary is known by in the changelog.
+
+    Falls back from the identifier to the name, the display name and finally the commit hash.
+    """
+    return (
+        boundary.get("identifier")
+        or boundary.get("name")
+        or boundary.get("display_name")
+        or boundary.get("hash", "unknown")
+    )
+
+
+class BoundaryCatalog:
+    """Boundaries of one mode in history order, indexed for constant-time lookups.
+
+    Holds three maps built in a single pass: commit hash to position,
+    identifier to position (the first boundary wins when identifiers repeat,
+    e.g. two gap boundaries on the same day) and, for tags mode, commit hash
+    to the tags pointing at it.
+    """
+
+    def __init__(self, boundaries: list[dict], mode: str = "tags"):
+        self.boundaries = boundaries
+        self.mode = mode
+        self._by_hash: dict[str, int] = {}
+        self._positions: dict[str, int] = {}
+        self._tags_by_commit: dict[str, list[str]] = {}
+        for position, boundary in enumerate(boundaries):
+            commit = boundary.get("hash")
+            if commit:
+                self._by_hash.setdefault(commit, position)
+                if mode == "tags":
+                    self._tags_by_commit.setdefault(commit, []).append(boundary_key(boundary))
+            self._positions.setdefault(boundary_key(boundary), position)
+
+    def __len__(self) -> int:
+        return len(self.boundaries)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.boundaries)
+
+    def __contains__(self, identifier: object) -> bool:
+        return identifier in self._positions
+
+    def position(self, identifier: str) -> int | None:
+        """Return the position of a boundary in history order, or None if unknown."""
+        return self._positions.get(identifier)
+
+    def get(self, identifier: str) -> dict | None:
+        """Return the boundary with the given identifier, or None."""
+        position = self._positions.get(identifier)
+        return self.boundaries[position] if position is not None else None
+
+    def by_hash(self, commit: str) -> dict | None:
+        """Return the boundary at a commit, or None."""
+        position = self._by_hash.get(commit)
+        return self.boundaries[position] if position is not None else None
+
+    def previous(self, boundary: dict) -> dict | None:
+        """Return the boundary before ``boundary``, or None for the first or an unknown boundary."""
+        position = self._by_hash.get(boundary["hash"])
+        if position is None or position == 0:
+            return None
+        return self.boundaries[position - 1]
+
+    def tags_at(self, commit: str) -> list[str]:
+        """Return the tags pointing at a commit (tags mode only)."""
+        return self._tags_by_commit.get(commit, [])
+
+    @property
+    def latest(self) -> dict | None:
+        """The most recent boundary in history order."""
+        return self.boundaries[-1] if self.boundaries else None
+
+
+@cached
+def get_boundary_catalog(mode: str = "tags", **kwargs) -> BoundaryCatalog:
+    """Get the indexed boundaries of a mode, built once per run.
+
+    Args:
+        mode: Boundary detection mode ('tags', 'dates', or 'gaps')
+        **kwargs: Additional parameters for specific modes (see get_all_boundaries)
+
+    Returns:
+        The boundary catalog
+    """
+    catalog = BoundaryCatalog(get_all_boundaries(mode=mode, **kwargs), mode)
+    logger.debug(f"Indexed {len(catalog)} boundaries in {mode} mode")
+    return catalog
 
 
 def clear_git_cache() -> None:
@@ -399,6 +448,8 @@ def clear_git_cache() -> None:
     get_all_tags.cache_clear()
     get_latest_tag.cache_clear()
     get_current_commit_hash.cache_clear()
+    get_boundary_catalog.cache_clear()
+    close_object_readers()
     # Also clear caches from the commit_analyzer module
     try:
         from kittylog.commit_analyzer import clear_commit_analyzer_cache
@@ -0,0 +1,427 @@
+"""Token counting for prompt budgets and usage reporting.
+
+Counts are produced by a tokenizer chosen per model family:
+
+- OpenAI models map to their tiktoken encoding (``o200k_base`` for GPT-4o,
+  GPT-4.1, GPT-5 and the o-series, ``cl100k_base`` for GPT-4 and GPT-3.5).
+  Other providers do not publish tokenizers, so ``cl100k_base`` is used as
+  the closest proxy.
+- When the encoding's BPE rank file is available locally (in
+  ``$KITTYLOG_TOKENIZER_DIR`` as ``<encoding>.tiktoken``, or in tiktoken's
+  download cache) text is tokenized exactly, with tiktoken's native encoder
+  or, if tiktoken is unavailable, the pure-Python :class:`BPETokenizer`.
+- Otherwise :class:`PretokenEstimator` splits text with the encoding's own
+  pre-tokenization regex and estimates tokens per piece. This never touches
+  the network and, unlike a characters-per-token ratio, follows how code,
+  markdown and non-English text are actually split.
+
+``KITTYLOG_TOKENIZER`` overrides the choice: ``auto`` (default), ``bpe``
+(pure Python, needs a local rank file), ``estimate`` or ``heuristic`` (the
+previous ``len(text) // 4`` estimate).
+
+Counts for long texts are memoized in an LRU keyed by a hash of the text, so
+repeatedly measured prompts (budget checks, usage reports, retries) are only
+tokenized once.
+"""
+
+import base64
+import hashlib
+import logging
+import math
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+# regex (not re) is needed for the \p{...} classes
+import regex
+
+from kittylog.cache import CacheManager
+
+logger = logging.getLogger(__name__)
+
+CL100K_BASE = "cl100k_base"
+O200K_BASE = "o200k_base"
+
+# Pre-tokenization patterns of the tiktoken encodings
+_PATTERNS = {
+    CL100K_BASE: (
+        r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}++|\p{N}{1,3}+| ?[^\s\p{L}\p{N}]++[\r\n]*+|\s++$|\s*[\r\n]|"""
+        r"""\s+(?!\S)|\s"""
+    ),
+    O200K_BASE: "|".join(
+        [
+            r"""[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]*[\p{Ll}\p{Lm}\p{Lo}\p{M}]+(?i:'s|'t|'re|'ve|'m|'ll|'d)?""",
+            r"""[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]+[\p{Ll}\p{Lm}\p{Lo}\p{M}]*(?i:'s|'t|'re|'ve|'m|'ll|'d)?""",
+            r"""\p{N}{1,3}""",
+            r""" ?[^\s\p{L}\p{N}]+[\r\n/]*""",
+            r"""\s*[\r\n]+""",
+            r"""\s+(?!\S)""",
+            r"""\s+""",
+        ]
+    ),
+}
+
+# Model name prefixes (after stripping "provider:" and "org/") using o200k_base; other
+# OpenAI models and every non-OpenAI family fall back to cl100k_base
+_O200K_PREFIXES = ("gpt-4o", "chatgpt-4o", "gpt-4.1", "gpt-4.5", "gpt-5", "gpt-oss", "o1", "o3", "o4")
+
+_TIKTOKEN_URL = "https://openaipublic.blob.core.windows.net/encodings/{name}.tiktoken"
+
+# Texts shorter than this are counted directly: hashing and LRU bookkeeping would cost more
+MEMO_MIN_LENGTH = 256
+MEMO_MAXSIZE = 1024
+
+
+def encoding_for_model(model: str) -> str:
+    """Return the tiktoken encoding used to count tokens for a model.
+
+    Args:
+        model: Model name, optionally prefixed with "provider:" (e.g. "openai:gpt-4o")
+
+    Returns:
+        Encoding name
+    """
+    name = model.split(":", 1)[-1].rsplit("/", 1)[-1].lower()
+    if name.startswith(_O200K_PREFIXES):
+        return O200K_BASE
+    return CL100K_BASE
+
+
+class Tokenizer(ABC):
+    """Base class for token counters."""
+
+    name = "tokenizer"
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Count the tokens in ``text``."""
+        pass
+
+    def count_many(self, texts: Sequence[str]) -> list[int]:
+        """Count the tokens in each of ``texts``."""
+        return [self.count(text) for text in texts]
+
+
+class HeuristicTokenizer(Tokenizer):
+    """Characters-per-token estimate (the original kittylog behaviour)."""
+
+    name = "heuristic"
+
+    def __init__(self, chars_per_token: int = 4):
+        self.chars_per_token = chars_per_token
+
+    def count(self, text: str) -> int:
+        return len(text) // self.chars_per_token
+
+
+class PretokenEstimator(Tokenizer):
+    """Offline estimate based on the encoding's pre-tokenization.
+
+    BPE never merges across pre-token boundaries, so the number of pieces is a
+    lower bound on the real count. Common words, short numbers and whitespace
+    runs are a single token; only long words, symbol runs and non-ASCII text
+    are split further, which is estimated from their length.
+    """
+
+    name = "estimate"
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        self._pattern = regex.compile(_PATTERNS[encoding])
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def _estimate_piece(piece: str) -> int:
+        if not piece.isascii():
+            # Accented and non-Latin scripts average roughly one token per 3 UTF-8 bytes
+            return max(1, math.ceil(len(piece.encode("utf-8")) / 3))
+        body = piece.lstrip(" ")
+        if not body or body.isspace() or body.isdigit():
+            return 1
+        if body.isalpha():
+            # Words up to 8 letters are almost always in the vocabulary
+            return 1 if len(body) <= 8 else 1 + math.ceil((len(body) - 8) / 5)
+        return math.ceil(len(body.rstrip("\r\n")) / 2) or 1
+
+    def count(self, text: str) -> int:
+        estimate = self._estimate_piece
+        return sum(estimate(piece) for piece in self._pattern.findall(text))
+
+
+class BPETokenizer(Tokenizer):
+    """Pure-Python byte-level BPE over a tiktoken rank table.
+
+    Slower than tiktoken's native encoder but exact, and needs nothing but a
+    local rank file.
+    """
+
+    name = "bpe"
+
+    def __init__(self, encoding: str, ranks: dict[bytes, int]):
+        self.encoding = encoding
+        self.ranks = ranks
+        self._pattern = regex.compile(_PATTERNS[encoding])
+        self._count_piece = lru_cache(maxsize=65536)(self._merge_count)
+
+    def _merge_count(self, piece: bytes) -> int:
+        if piece in self.ranks:
+            return 1
+        ranks = self.ranks
+        parts = [piece[i : i + 1] for i in range(len(piece))]
+        while len(parts) > 1:
+            # Merge the adjacent pair with the lowest rank, as the encoder did in training
+            best_rank = None
+            best_index = -1
+            for i in range(len(parts) - 1):
+                rank = ranks.get(parts[i] + parts[i + 1])
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_rank = rank
+                    best_index = i
+            if best_rank is None:
+                break
+            parts[best_index : best_index + 2] = [parts[best_index] + parts[best_index + 1]]
+        return len(parts)
+
+    def count(self, text: str) -> int:
+        count_piece = self._count_piece
+        return sum(count_piece(piece.encode("utf-8")) for piece in self._pattern.findall(text))
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Exact counts with tiktoken's native encoder built from a local rank file."""
+
+    name = "tiktoken"
+
+    def __init__(self, encoding: str, ranks: dict[bytes, int]):
+        import tiktoken
+
+        self.encoding = encoding
+        self._encoder = tiktoken.Encoding(
+            name=f"kittylog-{encoding}", pat_str=_PATTERNS[encoding], mergeable_ranks=ranks, special_tokens={}
+        )
+
+    def count(self, text: str) -> int:
+        return len(self._encoder.encode_ordinary(text))
+
+    def count_many(self, texts: Sequence[str]) -> list[int]:
+        return [len(tokens) for tokens in self._encoder.encode_ordinary_batch(list(texts))]
+
+
+def load_bpe_ranks(path: Path) -> dict[bytes, int]:
+    """Read a tiktoken rank file (one base64 token and its rank per line).
+
+    Args:
+        path: Path of the ``.tiktoken`` file
+
+    Returns:
+        Mapping of token bytes to merge rank
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is malformed
+    """
+    ranks: dict[bytes, int] = {}
+    with path.open("rb") as f:
+        for line in f:
+            if line.strip():
+                token, rank = line.split()
+                ranks[base64.b64decode(token)] = int(rank)
+    return ranks
+
+
+def _rank_file_candidates(encoding: str) -> list[Path]:
+    candidates = []
+    tokenizer_dir = os.getenv("KITTYLOG_TOKENIZER_DIR")
+    if tokenizer_dir:
+        candidates.append(Path(tokenizer_dir).expanduser() / f"{encoding}.tiktoken")
+    # tiktoken caches downloads under the SHA-1 of their URL
+    cache_dir = (
+        os.getenv("TIKTOKEN_CACHE_DIR")
+        or os.getenv("DATA_GYM_CACHE_DIR")
+        or str(Path(tempfile.gettempdir()) / "data-gym-cache")
+    )
+    url = _TIKTOKEN_URL.format(name=encoding)
+    candidates.append(Path(cache_dir) / hashlib.sha1(url.encode()).hexdigest())
+    return candidates
+
+
+def _find_bpe_ranks(encoding: str) -> dict[bytes, int] | None:
+    for path in _rank_file_candidates(encoding):
+        if path.is_file():
+            try:
+                return load_bpe_ranks(path)
+            except (OSError, ValueError) as e:
+                logger.debug(f"Ignoring unreadable BPE rank file {path}: {e}")
+    return None
+
+
+@lru_cache(maxsize=16)
+def _build_tokenizer(encoding: str, mode: str) -> Tokenizer:
+    if mode == "heuristic":
+        return HeuristicTokenizer()
+    if mode in ("auto", "bpe"):
+        ranks = _find_bpe_ranks(encoding)
+        if ranks is not None:
+            if mode == "auto":
+                try:
+                    return TiktokenTokenizer(encoding, ranks)
+                except ImportError:
+                    pass
+            return BPETokenizer(encoding, ranks)
+        logger.debug(f"No local BPE ranks for {encoding}, estimating token counts")
+    return PretokenEstimator(encoding)
+
+
+def get_tokenizer(model: str) -> Tokenizer:
+    """Return the tokenizer used to count tokens for a model.
+
+    Args:
+        model: Model name, optionally prefixed with "provider:"
+
+    Returns:
+        Tokenizer for the model's family (built once and reused)
+    """
+    mode = (os.getenv("KITTYLOG_TOKENIZER") or "auto").lower()
+    if mode not in ("auto", "bpe", "estimate", "heuristic"):
+        mode = "auto"
+    return _build_tokenizer(encoding_for_model(model), mode)
+
+
+class TokenCountInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _TokenCountMemo:
+    """Thread-safe LRU of token counts keyed by tokenizer and text digest.
+
+    Keys hold a 16-byte digest instead of the text, so memoizing large prompts
+    does not keep them alive. Quacks like an ``lru_cache`` function so that
+    :class:`~kittylog.cache.CacheManager` can report and clear it.
+    """
+
+    __name__ = "token_counts"
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key(tokenizer: Tokenizer, text: str) -> tuple[str, bytes]:
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        return f"{tokenizer.name}:{getattr(tokenizer, 'encoding', '')}", digest
+
+    def get(self, key: tuple[str, bytes]) -> int | None:
+        with self._lock:
+            count = self._entries.get(key)
+            if count is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return count
+
+    def put(self, key: tuple[str, bytes], count: int) -> None:
+        with self._lock:
+            self._entries[key] = count
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def cache_info(self) -> TokenCountInfo:
+        with self._lock:
+            return TokenCountInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_memo = _TokenCountMemo(MEMO_MAXSIZE)
+CacheManager.register(_memo)  # type: ignore[arg-type]
+
+
+def count_tokens(text: str, model: str) -> int:
+    """Count the tokens in ``text`` for ``model``.
+
+    Args:
+        text: Text to count tokens in
+        model: Model name, optionally prefixed with "provider:"
+
+    Returns:
+        Token count (0 for empty text)
+    """
+    if not text:
+        return 0
+    tokenizer = get_tokenizer(model)
+    if len(text) < MEMO_MIN_LENGTH:
+        return tokenizer.count(text)
+
+    key = _memo.key(tokenizer, text)
+    count = _memo.get(key)
+    if count is None:
+        count = tokenizer.count(text)
+        _memo.put(key, count)
+    return count
+
+
+def count_tokens_batch(texts: Iterable[str], model: str) -> list[int]:
+    """Count tokens for many texts at once (e.g. every commit message in a range).
+
+    The tokenizer is resolved once and uncached texts are counted in a single
+    call, which lets tiktoken encode them in parallel.
+
+    Args:
+        texts: Texts to count
+        model: Model name, optionally prefixed with "provider:"
+
+    Returns:
+        Token counts in the order of ``texts``
+    """
+    texts = list(texts)
+    tokenizer = get_tokenizer(model)
+    counts: list[int | None] = [None] * len(texts)
+    pending: list[int] = []
+    keys: dict[int, tuple[str, bytes]] = {}
+
+    for i, text in enumerate(texts):
+        if not text:
+            counts[i] = 0
+            continue
+        if len(text) >= MEMO_MIN_LENGTH:
+            keys[i] = _memo.key(tokenizer, text)
+            counts[i] = _memo.get(keys[i])
+        if counts[i] is None:
+            pending.append(i)
+
+    if pending:
+        for i, count in zip(pending, tokenizer.count_many([texts[i] for i in pending]), strict=True):
+            counts[i] = count
+            if i in keys:
+                _memo.put(keys[i], count)
+
+    return [count or 0 for count in counts]
+
+
+def token_count_cache_info() -> TokenCountInfo:
+    """Return hit/miss statistics of the token count memo."""
+    return _memo.cache_info()
+
+
+def clear_token_count_cache() -> None:
+    """Clear memoized token counts and built tokenizers."""
+    _memo.cache_clear()
+    _build_tokenizer.cache_clear()
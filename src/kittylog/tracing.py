@@ -0,0 +1,285 @@
+"""Local trace export in the OpenTelemetry (OTLP/JSON) format.
+
+When tracing is enabled (``kittylog --trace FILE`` or ``KITTYLOG_TRACE_FILE``)
+each run records a tree of spans: the CLI command at the root, with boundary
+discovery, commit reads, entry generation, LLM attempts, provider HTTP
+requests and changelog writes below it. Structured log messages
+(:func:`kittylog.utils.logging.log_with_context`) become events of the span
+they were logged in.
+
+At the end of the run the spans are appended to the file as one line of
+OTLP/JSON (an ``ExportTraceServiceRequest``), the format the OpenTelemetry
+Collector's file exporter writes and its ``otlpjson`` receiver reads. If the
+``TRACEPARENT`` environment variable holds a W3C trace context, as set by
+traced build pipelines, the run joins that trace.
+
+With tracing disabled every hook is a single global lookup.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import re
+import secrets
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+SCOPE_NAME = "kittylog"
+
+# OTLP enum values
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_TRACEPARENT = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+@dataclass
+class TraceSpan:
+    """A span being recorded; attributes and events may be added until it ends."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    kind: int = SPAN_KIND_INTERNAL
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    events: list[tuple[int, str, dict[str, Any]]] = field(default_factory=list)
+    error: str | None = None
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update((key, value) for key, value in attributes.items() if value is not None)
+
+    def add_event(self, name: str, **attributes: Any) -> None:
+        self.events.append((time.time_ns(), name, attributes))
+
+    def to_otlp(self) -> dict[str, Any]:
+        """The span in OTLP/JSON form."""
+        span: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or time.time_ns()),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": STATUS_ERROR, "message": self.error} if self.error else {"code": STATUS_OK},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.events:
+            span["events"] = [
+                {"timeUnixNano": str(ts), "name": name, "attributes": _otlp_attributes(attributes)}
+                for ts, name, attributes in self.events
+            ]
+        return span
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    # bool before int: bool is an int subclass
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}  # int64 is a string in proto3 JSON
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+
+class Tracer:
+    """Collects the finished spans of one run."""
+
+    def __init__(self, trace_id: str | None = None, parent_span_id: str | None = None) -> None:
+        self.trace_id = trace_id or secrets.token_hex(16)
+        self.parent_span_id = parent_span_id
+        self.spans: list[TraceSpan] = []
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str, parent: TraceSpan | None, kind: int, attributes: dict[str, Any]) -> TraceSpan:
+        span = TraceSpan(
+            name=name,
+            trace_id=self.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_span_id=parent.span_id if parent else self.parent_span_id,
+            kind=kind,
+        )
+        span.set_attributes(**attributes)
+        return span
+
+    def finish(self, span: TraceSpan) -> None:
+        span.end_ns = time.time_ns()
+        with self._lock:
+            self.spans.append(span)
+
+    def to_otlp(self, resource: dict[str, Any]) -> dict[str, Any]:
+        """All finished spans as an OTLP ``ExportTraceServiceRequest``."""
+        from kittylog.__version__ import __version__
+
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start_ns)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": _otlp_attributes(resource)},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": SCOPE_NAME, "version": __version__},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+_tracer: Tracer | None = None
+_current: contextvars.ContextVar[TraceSpan | None] = contextvars.ContextVar("kittylog_trace_span", default=None)
+
+
+def is_tracing() -> bool:
+    """Return whether spans are being recorded."""
+    return _tracer is not None
+
+
+def current_span() -> TraceSpan | None:
+    """Return the innermost open span in this context, if tracing."""
+    return _current.get() if _tracer is not None else None
+
+
+@contextmanager
+def trace_span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Iterator[TraceSpan | None]:
+    """Record the enclosed block as a child of the current span.
+
+    Yields:
+        The span, to add attributes discovered while it runs, or None when not tracing
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield None
+        return
+    span = tracer.start_span(name, _current.get(), kind, attributes)
+    token = _current.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.error = f"{type(e).__name__}: {e}"
+        span.add_event("exception", **{"exception.type": type(e).__name__, "exception.message": str(e)})
+        raise
+    finally:
+        # A span held open across a generator's yields may be closed from another
+        # context (e.g. an abandoned async generator finalized by the event loop)
+        with suppress(ValueError):
+            _current.reset(token)
+        tracer.finish(span)
+
+
+def add_event(name: str, **attributes: Any) -> None:
+    """Attach an event to the current span, if tracing."""
+    span = current_span()
+    if span is not None:
+        span.add_event(name, **attributes)
+
+
+def set_attributes(**attributes: Any) -> None:
+    """Set attributes on the current span, if tracing."""
+    span = current_span()
+    if span is not None:
+        span.set_attributes(**attributes)
+
+
+def http_request_attributes(provider: str, url: str, method: str = "POST") -> dict[str, Any]:
+    """Attributes of a provider HTTP request span, following the OpenTelemetry HTTP conventions.
+
+    The query string is dropped, as some providers pass the API key in it.
+    """
+    parts = urlsplit(url)
+    return {
+        "http.request.method": method,
+        "url.full": f"{parts.scheme}://{parts.netloc}{parts.path}",
+        "server.address": parts.hostname,
+        "kittylog.provider": provider,
+    }
+
+
+def http_response_attributes(response: Any) -> dict[str, Any]:
+    """Status and body sizes of an ``httpx.Response``; whatever cannot be read is left out."""
+    attributes: dict[str, Any] = {}
+    readers = {
+        "http.response.status_code": lambda: int(response.status_code),
+        "http.request.body.size": lambda: len(response.request.content),
+        "http.response.body.size": lambda: len(response.content),
+    }
+    for key, read in readers.items():
+        try:
+            attributes[key] = read()
+        except (AttributeError, RuntimeError, TypeError):
+            # Responses built without a request (e.g. in tests) have no request body to measure
+            continue
+    return attributes
+
+
+def trace_file_from_env() -> str | None:
+    """Return the trace file configured in ``KITTYLOG_TRACE_FILE``, if any."""
+    return os.getenv("KITTYLOG_TRACE_FILE") or None
+
+
+def _parse_traceparent(value: str | None) -> tuple[str | None, str | None]:
+    match = _TRACEPARENT.match((value or "").strip().lower())
+    return (match.group(1), match.group(2)) if match else (None, None)
+
+
+@contextmanager
+def trace_run(path: str | Path, name: str, **attributes: Any) -> Iterator[TraceSpan | None]:
+    """Trace a whole run under a root span and append it to ``path`` when the block exits.
+
+    Args:
+        path: OTLP/JSON lines file to append the trace to
+        name: Name of the root span, e.g. the CLI command
+        **attributes: Attributes of the root span
+
+    Yields:
+        The root span
+    """
+    global _tracer
+    tracer = Tracer(*_parse_traceparent(os.getenv("TRACEPARENT")))
+    _tracer = tracer
+    try:
+        with trace_span(name, **attributes) as root:
+            yield root
+    finally:
+        _tracer = None
+        write_trace(tracer, path)
+
+
+def write_trace(tracer: Tracer, path: str | Path) -> None:
+    """Append the tracer's spans to ``path`` as one line of OTLP/JSON.
+
+    A trace that cannot be written is logged and dropped rather than failing the run.
+    """
+    from kittylog.__version__ import __version__
+
+    resource = {"service.name": SCOPE_NAME, "service.version": __version__, "process.pid": os.getpid()}
+    line = json.dumps(tracer.to_otlp(resource), separators=(",", ":"))
+    try:
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with target.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError as e:
+        logger.warning(f"Failed to write trace to {path}: {e}")
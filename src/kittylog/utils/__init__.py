@@ -27,6 +27,7 @@ from .system import (
 )
 from .text import (
     count_tokens,
+    count_tokens_batch,
     detect_changelog_version_style,
     determine_next_version,
     find_changelog_file,
@@ -42,6 +43,7 @@ __all__ = [
     "StructuredLoggerAdapter",
     "clean_changelog_content",
     "count_tokens",
+    "count_tokens_batch",
     "detect_changelog_version_style",
     "determine_next_version",
     "exit_with_error",
@@ -1,7 +1,12 @@
 """Commit formatting utilities for kittylog."""
 
+from collections.abc import Mapping
+from typing import Any
 
-def format_commit_for_display(commit: dict, max_message_length: int | None = None, max_files: int | None = None) -> str:
+
+def format_commit_for_display(
+    commit: Mapping[str, Any], max_message_length: int | None = None, max_files: int | None = None
+) -> str:
     """Format a commit dictionary for display.
 
     Args:
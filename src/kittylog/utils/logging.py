@@ -11,6 +11,7 @@ from typing import Any
 from kittylog.config import load_config
 from kittylog.constants import EnvDefaults, Logging
 from kittylog.output import set_output_mode
+from kittylog.tracing import add_event, is_tracing
 
 
 def get_safe_encodings() -> list[str]:
@@ -106,6 +107,10 @@ def log_with_context(
             provider="openai"
         )
     """
+    if is_tracing():
+        # Structured messages become events of the span they were logged in
+        add_event(message, **{"log.severity": logging.getLevelName(level)}, **context)
+
     if context:
         # Format context for readability
         context_str = " ".join(f"{k}={v}" for k, v in context.items())
@@ -1,30 +1,37 @@
 """Text processing utilities for kittylog."""
 
 import re
+from collections.abc import Iterable, Mapping, Sequence
 from pathlib import Path
+from typing import Any
+
+from kittylog import tokenizer
 
 
 def count_tokens(text: str, model: str) -> int:
-    """Count tokens in text using simple estimation.
+    """Count tokens in text with the tokenizer for the model's family.
 
     Args:
         text: Text to count tokens in
         model: Model name for tokenization rules
 
     Returns:
-        Estimated token count
+        Token count (at least 1)
     """
-    # Simple character-based estimation as fallback
-    # This is approximate - real tokenization would use model-specific tokenizers
-    chars_per_token: float = 4  # Rough estimate for most models
+    return max(1, tokenizer.count_tokens(text, model))
+
 
-    # Adjust for different models
-    if "claude" in model.lower():
-        chars_per_token = 3.5
-    elif "gpt" in model.lower():
-        chars_per_token = 4
+def count_tokens_batch(texts: Iterable[str], model: str) -> list[int]:
+    """Count tokens for many texts at once, such as every commit message in a range.
 
-    return max(1, len(text) // int(chars_per_token))
+    Args:
+        texts: Texts to count tokens in
+        model: Model name for tokenization rules
+
+    Returns:
+        Token counts in the order of ``texts`` (each at least 1)
+    """
+    return [max(1, count) for count in tokenizer.count_tokens_batch(texts, model)]
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
@@ -144,7 +151,7 @@ def get_changelog_file_patterns() -> list[str]:
     ]
 
 
-def determine_next_version(latest_version: str | None, commits: list[dict]) -> str:
+def determine_next_version(latest_version: str | None, commits: Sequence[Mapping[str, Any]]) -> str:
     """Determine the next version based on commits.
 
     Args:
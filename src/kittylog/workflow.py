@@ -4,6 +4,10 @@ This module contains the core business logic for changelog generation
 workflow including mode selection, boundary processing, and coordination.
 """
 
+import threading
+from collections.abc import Mapping, Sequence
+from typing import Any
+
 from kittylog.ai import generate_changelog_entry
 from kittylog.changelog.content import extract_preceding_entries
 from kittylog.changelog.io import read_changelog
@@ -13,6 +17,7 @@ from kittylog.mode_handlers import (
     handle_single_boundary_mode,
     handle_unreleased_mode,
 )
+from kittylog.profiling import boundary_scope
 from kittylog.utils.logging import get_logger, log_debug, log_info
 from kittylog.workflow_ui import handle_dry_run_and_save
 from kittylog.workflow_validation import validate_and_setup_workflow
@@ -37,6 +42,38 @@ def _extract_bullet_points(entry: str) -> list[str]:
     return bullets
 
 
+class _SessionItems:
+    """Bullet points generated so far in this session, ordered by boundary position.
+
+    Entries may be generated concurrently, so each entry only sees the items of
+    entries at earlier positions that have already finished. Reads never wait
+    for unfinished entries, which keeps generation from serializing on this store.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._items: dict[int, list[str]] = {}
+        self._next_position = 0
+
+    def claim(self, position: int | None) -> int:
+        """Return the position to use, assigning the next one after all known positions if None."""
+        with self._lock:
+            if position is None:
+                position = self._next_position
+            self._next_position = max(self._next_position, position + 1)
+            return position
+
+    def snapshot(self, position: int) -> list[str]:
+        """Return items from finished entries before ``position``, in position order."""
+        with self._lock:
+            return [item for pos in sorted(self._items) if pos < position for item in self._items[pos]]
+
+    def publish(self, position: int, items: list[str]) -> None:
+        """Record the items generated for the entry at ``position``."""
+        with self._lock:
+            self._items.setdefault(position, []).extend(items)
+
+
 def _create_entry_generator(
     model: str,
     hint: str,
@@ -49,15 +86,25 @@ def _create_entry_generator(
     changelog_file: str = "",
     context_entries_count: int = 0,
     detail_level: str = "normal",
+    use_cache: bool = True,
 ):
     """Create a changelog entry generator function with captured parameters.
 
     Returns a function that can be passed to mode handlers as generate_entry_func.
+    The function is thread-safe; handlers generating entries concurrently pass each
+    entry's ``position`` in version order so session context stays well defined.
     """
     # Track what's been generated in this session to prevent duplicates
-    session_generated_items: list[str] = []
+    session_items = _SessionItems()
+
+    def generate_entry(
+        commits: Sequence[Mapping[str, Any]],
+        tag: str,
+        from_boundary: str | None,
+        position: int | None,
+    ) -> str:
+        position = session_items.claim(position)
 
-    def generator(commits: list[dict], tag: str, from_boundary: str | None = None, **kwargs) -> str:
         # Extract context entries fresh each time to include recently generated entries
         # This prevents duplicate content when processing multiple versions sequentially
         context_entries = ""
@@ -76,7 +123,8 @@ def _create_entry_generator(
                 # No existing changelog, so no context to extract
                 pass
 
-        # Build cumulative session context from previously generated items
+        # Build cumulative session context from items generated for earlier boundaries
+        session_generated_items = session_items.snapshot(position)
         session_context = ""
         if session_generated_items:
             session_context = "ITEMS ALREADY GENERATED IN THIS SESSION:\n" + "\n".join(
@@ -97,11 +145,12 @@ def _create_entry_generator(
             context_entries=context_entries,
             session_context=session_context,
             detail_level=detail_level,
+            use_cache=use_cache,
         )
 
         # Extract and accumulate bullet points from this entry for future reference
         new_items = _extract_bullet_points(entry)
-        session_generated_items.extend(new_items)
+        session_items.publish(position, new_items)
         if new_items and not quiet:
             log_debug(
                 logger,
@@ -112,6 +161,17 @@ def _create_entry_generator(
 
         return entry
 
+    def generator(
+        commits: Sequence[Mapping[str, Any]],
+        tag: str,
+        from_boundary: str | None = None,
+        position: int | None = None,
+        **kwargs,
+    ) -> str:
+        # Attribute the time spent on this entry to its boundary in --profile reports
+        with boundary_scope(tag):
+            return generate_entry(commits, tag, from_boundary, position)
+
     return generator
 
 
@@ -166,6 +226,7 @@ def process_workflow_modes(
         changelog_file=changelog_file,
         context_entries_count=context_entries_count,
         detail_level=workflow_opts.detail_level,
+        use_cache=not workflow_opts.no_cache,
     )
 
     # Handle special unreleased mode
@@ -219,6 +280,7 @@ def process_workflow_modes(
             quiet=quiet,
             dry_run=dry_run,
             incremental_save=incremental_save,
+            jobs=workflow_opts.jobs,
         )
         return content, None
 
@@ -235,6 +297,7 @@ def process_workflow_modes(
             quiet=quiet,
             dry_run=dry_run,
             incremental_save=incremental_save,
+            jobs=workflow_opts.jobs,
         )
         return content, None
 
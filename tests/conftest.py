@@ -87,6 +87,12 @@ def clear_caches_between_tests():
             os.chdir(str(Path.home()))
 
 
+@pytest.fixture(autouse=True)
+def disable_response_cache(monkeypatch):
+    """Keep the on-disk LLM response cache out of tests unless a test opts in."""
+    monkeypatch.setenv("KITTYLOG_CACHE", "false")
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests."""
@@ -308,8 +314,8 @@ def mock_api_calls(request):
         yield None
         return
 
-    # Mock httpx.post for all providers
-    with patch("httpx.post") as mock_post:
+    # Mock the shared provider connection pool, plus httpx.post for direct callers (OAuth, Replicate)
+    with patch("httpx.post") as mock_post, patch("kittylog.providers.http_client.post", mock_post):
         # Create mock response for HTTP calls
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None  # Don't raise exceptions
@@ -417,6 +423,7 @@ def isolated_config_test(temp_dir, monkeypatch):
         "KITTYLOG_LANGUAGE",
         "KITTYLOG_TRANSLATE_HEADINGS",
         "KITTYLOG_AUDIENCE",
+        "KITTYLOG_JOBS",
     ]
 
     for var in env_vars_to_clear:
@@ -120,7 +120,7 @@ def mock_provider(builder: MockProviderBuilder | None = None):
     if builder is None:
         builder = MockProviderBuilder()
 
-    with patch("httpx.post", builder.build()) as mock:
+    with patch("kittylog.providers.http_client.post", builder.build()) as mock:
         yield mock
 
 
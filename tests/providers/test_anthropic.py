@@ -16,7 +16,7 @@ class TestAnthropicProvider:
     """Test Anthropic provider functionality."""
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": API_KEY})
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     def test_call_anthropic_api_success(
         self, mock_post, dummy_messages_with_system, mock_http_response_factory, api_test_helper
     ):
@@ -52,7 +52,7 @@ class TestAnthropicProvider:
         assert data["messages"][0]["role"] == "user"
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": API_KEY})
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     def test_call_anthropic_api_no_system_message(
         self, mock_post, dummy_messages, mock_http_response_factory, api_test_helper
     ):
@@ -90,7 +90,7 @@ class TestAnthropicProvider:
         assert "ANTHROPIC_API_KEY not found" in str(exc_info.value)
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": API_KEY})
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     def test_call_anthropic_api_http_error(self, mock_post, dummy_messages, mock_http_response_factory):
         """Test Anthropic API call handles HTTP errors."""
         mock_post.return_value = mock_http_response_factory.create_error_response(
@@ -108,7 +108,7 @@ class TestAnthropicProvider:
         assert "Anthropic" in str(exc_info.value)
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": API_KEY})
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     def test_call_anthropic_api_general_error(self, mock_post, dummy_messages):
         """Test Anthropic API call handles general errors."""
         mock_post.side_effect = Exception("Connection failed")
@@ -124,7 +124,7 @@ class TestAnthropicProvider:
         assert "Anthropic" in str(exc_info.value)
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": API_KEY})
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     def test_call_anthropic_api_with_conversation(
         self, mock_post, dummy_conversation, mock_http_response_factory, api_test_helper
     ):
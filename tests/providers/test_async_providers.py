@@ -0,0 +1,226 @@
+"""Tests for the async provider API."""
+
+import asyncio
+import json
+import os
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from kittylog.ai_utils import agenerate_with_retries, agenerate_with_retries_stream
+from kittylog.errors import AIError
+from kittylog.providers import (
+    ASYNC_PROVIDER_REGISTRY,
+    ASYNC_STREAMING_PROVIDER_REGISTRY,
+    PROVIDER_REGISTRY,
+    SUPPORTED_PROVIDERS,
+    http_client,
+)
+from kittylog.providers.base import AnthropicCompatibleProvider, OpenAICompatibleProvider, ProviderConfig
+from kittylog.providers.registry import create_async_provider_func, create_async_streaming_provider_func
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class AsyncTestProvider(OpenAICompatibleProvider):
+    config = ProviderConfig(name="Async Test", api_key_env="ASYNC_TEST_API_KEY", base_url="https://async.example")
+
+
+class AsyncAnthropicTestProvider(AnthropicCompatibleProvider):
+    config = ProviderConfig(
+        name="Async Anthropic Test", api_key_env="ASYNC_TEST_API_KEY", base_url="https://anthropic.example/v1/messages"
+    )
+
+
+class CustomFlowProvider(OpenAICompatibleProvider):
+    config = ProviderConfig(name="Custom Flow", api_key_env="ASYNC_TEST_API_KEY", base_url="https://custom.example")
+
+    def _make_http_request(self, url, body, headers):
+        return {"choices": [{"message": {"content": "from thread"}}]}
+
+
+@pytest.fixture
+def async_transport():
+    """Route async pooled clients through an in-memory transport."""
+    state = {"status": 200, "requests": []}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        state["requests"].append(request)
+        if state["status"] != 200:
+            return httpx.Response(state["status"], text="nope")
+        body = json.loads(request.content)
+        if "anthropic" in str(request.url):
+            if body.get("stream"):
+                text = (
+                    'data: {"type": "content_block_delta", "delta": {"text": "Hel"}}\n\n'
+                    'data: {"type": "content_block_delta", "delta": {"text": "lo"}}\n\n'
+                )
+                return httpx.Response(200, text=text)
+            return httpx.Response(200, json={"content": [{"type": "text", "text": "anthropic async"}]})
+        if body.get("stream"):
+            text = 'data: {"choices": [{"delta": {"content": "Hi"}}]}\n\ndata: [DONE]\n\n'
+            return httpx.Response(200, text=text)
+        return httpx.Response(200, json={"choices": [{"message": {"content": "async ok"}}]})
+
+    def create_client(key, settings):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    with patch.object(http_client, "_create_async_client", side_effect=create_client) as mock_create:
+        state["create"] = mock_create
+        yield state
+
+
+@pytest.mark.asyncio
+@patch.dict(os.environ, {"ASYNC_TEST_API_KEY": "key"})
+class TestAsyncProviders:
+    """Test agenerate/agenerate_stream and the async registry functions."""
+
+    async def test_agenerate(self, async_transport):
+        provider_func = create_async_provider_func(AsyncTestProvider)
+
+        results = [await provider_func("model", MESSAGES, 0.5, 10) for _ in range(2)]
+        await http_client.aclose_clients()
+
+        assert results == ["async ok", "async ok"]
+        request = async_transport["requests"][0]
+        assert request.url == "https://async.example/v1/chat/completions"
+        assert request.headers["Authorization"] == "Bearer key"
+        assert json.loads(request.content)["model"] == "model"
+        async_transport["create"].assert_called_once()
+
+    async def test_agenerate_anthropic(self, async_transport):
+        provider_func = create_async_provider_func(AsyncAnthropicTestProvider)
+
+        result = await provider_func("claude", MESSAGES, 0.5, 10)
+        await http_client.aclose_clients()
+
+        assert result == "anthropic async"
+
+    async def test_agenerate_stream(self, async_transport):
+        stream_func = create_async_streaming_provider_func(AsyncAnthropicTestProvider)
+
+        chunks = [chunk async for chunk in stream_func("claude", MESSAGES, 0.5, 10)]
+        await http_client.aclose_clients()
+
+        assert chunks[:2] == [("Hel", None), ("lo", None)]
+        assert chunks[-1][0] == ""
+        assert chunks[-1][1]["completion_tokens"] >= 0
+
+    async def test_http_errors_are_translated(self, async_transport):
+        async_transport["status"] = 401
+        provider_func = create_async_provider_func(AsyncTestProvider)
+        stream_func = create_async_streaming_provider_func(AsyncTestProvider)
+
+        with pytest.raises(AIError) as exc_info:
+            await provider_func("model", MESSAGES, 0.5, 10)
+        assert exc_info.value.error_type == "authentication"
+
+        with pytest.raises(AIError) as exc_info:
+            _ = [chunk async for chunk in stream_func("model", MESSAGES, 0.5, 10)]
+        assert exc_info.value.error_type == "authentication"
+        await http_client.aclose_clients()
+
+    async def test_custom_request_flow_runs_in_thread(self):
+        provider_func = create_async_provider_func(CustomFlowProvider)
+
+        with patch("kittylog.providers.base.asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+            result = await provider_func("model", MESSAGES, 0.5, 10)
+
+        assert result == "from thread"
+        mock_to_thread.assert_called_once()
+
+    async def test_concurrency_is_capped(self):
+        class SlowProvider(OpenAICompatibleProvider):
+            config = ProviderConfig(
+                name="Slow Async", api_key_env="ASYNC_TEST_API_KEY", base_url="https://slow.example", max_concurrency=2
+            )
+
+        active = peak = 0
+
+        async def fake_agenerate(self, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return "done"
+
+        with patch.object(SlowProvider, "agenerate", fake_agenerate):
+            provider_func = create_async_provider_func(SlowProvider)
+            results = await asyncio.gather(*(provider_func("m", MESSAGES, 0.5, 10) for _ in range(6)))
+
+        assert results == ["done"] * 6
+        assert peak == 2
+
+
+def test_async_registries_cover_every_provider():
+    """Every registered provider has async counterparts."""
+    assert set(ASYNC_PROVIDER_REGISTRY) == set(PROVIDER_REGISTRY)
+    assert set(ASYNC_STREAMING_PROVIDER_REGISTRY) == set(PROVIDER_REGISTRY)
+    assert ASYNC_PROVIDER_REGISTRY["openai"].__name__ == "acall_openai_api"
+    assert ASYNC_STREAMING_PROVIDER_REGISTRY["openai"].__name__ == "astream_openai_api"
+
+
+@pytest.mark.asyncio
+class TestAsyncRetries:
+    """Test agenerate_with_retries and agenerate_with_retries_stream."""
+
+    async def test_retries_then_succeeds(self):
+        provider_func = AsyncMock(side_effect=[Exception("Temporary error"), "  Recovered  "])
+
+        with patch("kittylog.ai_utils.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await agenerate_with_retries(
+                {"openai": provider_func}, "openai:gpt-4", "system", "user", 0.7, 100, max_retries=3, quiet=True
+            )
+
+        assert result == "Recovered"
+        mock_sleep.assert_awaited_once()
+        assert 0.5 <= mock_sleep.await_args.args[0] <= 1
+
+    async def test_non_retryable_error(self):
+        provider_func = AsyncMock(side_effect=Exception("authentication failed"))
+
+        with (
+            patch("kittylog.ai_utils.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            pytest.raises(AIError),
+        ):
+            await agenerate_with_retries(
+                {"openai": provider_func}, "openai:gpt-4", "system", "user", 0.7, 100, max_retries=3
+            )
+
+        assert provider_func.await_count == 1
+        mock_sleep.assert_not_awaited()
+
+    async def test_gives_up_after_max_retries(self):
+        provider_func = AsyncMock(side_effect=Exception("Temporary error"))
+
+        with (
+            patch("kittylog.ai_utils.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            pytest.raises(AIError, match="after 2 attempts"),
+        ):
+            await agenerate_with_retries(
+                {"openai": provider_func}, "openai:gpt-4", "system", "user", 0.7, 100, max_retries=2, quiet=True
+            )
+
+        assert mock_sleep.await_count == 1
+
+    async def test_rejects_unknown_provider(self):
+        with pytest.raises(AIError, match="Unsupported provider"):
+            await agenerate_with_retries({}, "nope:model", "system", "user", 0.7, 100, max_retries=1)
+        assert "openai" in SUPPORTED_PROVIDERS
+
+    async def test_stream_estimates_usage(self):
+        async def stream(**kwargs):
+            yield ("Hello ", None)
+            yield ("world", None)
+
+        chunks = [
+            chunk
+            async for chunk in agenerate_with_retries_stream(
+                {"openai": stream}, "openai:gpt-4", "system", "user", 0.7, 100, max_retries=1
+            )
+        ]
+
+        assert chunks[:2] == [("Hello ", None), ("world", None)]
+        assert chunks[-1] == ("", {"prompt_tokens": 0, "completion_tokens": 2, "total_tokens": 0})
@@ -24,7 +24,7 @@ class TestAzureOpenAIProvider:
             "AZURE_OPENAI_API_VERSION": API_VERSION,
         },
     )
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     def test_call_azure_openai_api_success(
         self, mock_post, dummy_messages_with_system, mock_http_response_factory, api_test_helper
     ):
@@ -89,7 +89,7 @@ class TestAzureOpenAIProvider:
             "AZURE_OPENAI_ENDPOINT": API_ENDPOINT,
         },
     )
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     def test_call_azure_openai_api_missing_api_version(self, mock_post, dummy_messages, mock_http_response_factory):
         """Test Azure OpenAI API call uses default version when not set."""
         response_data = {"choices": [{"message": {"content": "Test response"}}]}
@@ -113,7 +113,7 @@ class TestAzureOpenAIProvider:
             "AZURE_OPENAI_API_VERSION": API_VERSION,
         },
     )
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     def test_call_azure_openai_api_http_error(self, mock_post, dummy_messages, mock_http_response_factory):
         """Test Azure OpenAI API call handles HTTP errors."""
         mock_post.return_value = mock_http_response_factory.create_error_response(
@@ -138,7 +138,7 @@ class TestAzureOpenAIProvider:
             "AZURE_OPENAI_API_VERSION": API_VERSION,
         },
     )
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     def test_call_azure_openai_api_general_error(self, mock_post, dummy_messages):
         """Test Azure OpenAI API call handles general errors."""
         mock_post.side_effect = Exception("Connection failed")
@@ -161,7 +161,7 @@ class TestAzureOpenAIProvider:
             "AZURE_OPENAI_API_VERSION": API_VERSION,
         },
     )
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     def test_call_azure_openai_api_with_conversation(
         self, mock_post, dummy_conversation, mock_http_response_factory, api_test_helper
     ):
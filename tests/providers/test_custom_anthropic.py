@@ -16,7 +16,7 @@ API_VERSION = "2023-06-01"
 class TestCustomAnthropicProvider:
     """Test Custom Anthropic provider functionality."""
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(
         os.environ,
         {
@@ -82,7 +82,7 @@ class TestCustomAnthropicProvider:
 
         assert "CUSTOM_ANTHROPIC_API_KEY" in str(exc_info.value)
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(
         os.environ,
         {
@@ -107,7 +107,7 @@ class TestCustomAnthropicProvider:
 
         assert "Custom Anthropic" in str(exc_info.value)
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(
         os.environ,
         {
@@ -130,7 +130,7 @@ class TestCustomAnthropicProvider:
 
         assert "Custom Anthropic" in str(exc_info.value)
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(
         os.environ,
         {"CUSTOM_ANTHROPIC_API_KEY": API_KEY, "CUSTOM_ANTHROPIC_BASE_URL": API_BASE_URL},
@@ -156,7 +156,7 @@ class TestCustomAnthropicProvider:
         # Should default to "2023-06-01"
         assert headers["anthropic-version"] == "2023-06-01"
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(
         os.environ,
         {
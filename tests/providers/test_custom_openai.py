@@ -15,7 +15,7 @@ API_BASE_URL = "https://custom.openai.ai"
 class TestCustomOpenAIProvider:
     """Test Custom OpenAI provider functionality."""
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"CUSTOM_OPENAI_API_KEY": API_KEY, "CUSTOM_OPENAI_BASE_URL": API_BASE_URL})
     def test_call_custom_openai_api_success(
         self, mock_post, dummy_messages, mock_http_response_factory, api_test_helper
@@ -72,7 +72,7 @@ class TestCustomOpenAIProvider:
 
         assert "CUSTOM_OPENAI_API_KEY" in str(exc_info.value)
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"CUSTOM_OPENAI_API_KEY": API_KEY, "CUSTOM_OPENAI_BASE_URL": API_BASE_URL})
     def test_call_custom_openai_api_http_error(self, mock_post, dummy_messages, mock_http_response_factory):
         """Test Custom OpenAI API call handles HTTP errors."""
@@ -90,7 +90,7 @@ class TestCustomOpenAIProvider:
 
         assert "Custom OpenAI" in str(exc_info.value)
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"CUSTOM_OPENAI_API_KEY": API_KEY, "CUSTOM_OPENAI_BASE_URL": API_BASE_URL})
     def test_call_custom_openai_api_general_error(self, mock_post, dummy_messages):
         """Test Custom OpenAI API call handles general errors."""
@@ -106,7 +106,7 @@ class TestCustomOpenAIProvider:
 
         assert "Custom OpenAI" in str(exc_info.value)
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"CUSTOM_OPENAI_API_KEY": API_KEY, "CUSTOM_OPENAI_BASE_URL": API_BASE_URL})
     def test_call_custom_openai_api_with_system_message(
         self, mock_post, dummy_messages_with_system, mock_http_response_factory, api_test_helper
@@ -129,7 +129,7 @@ class TestCustomOpenAIProvider:
         assert data["messages"][0]["role"] == "system"
         assert data["messages"][1]["role"] == "user"
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"CUSTOM_OPENAI_API_KEY": API_KEY, "CUSTOM_OPENAI_BASE_URL": API_BASE_URL})
     def test_call_custom_openai_api_with_conversation(
         self, mock_post, dummy_conversation, mock_http_response_factory, api_test_helper
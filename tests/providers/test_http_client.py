@@ -0,0 +1,149 @@
+"""Tests for the shared provider HTTP connection pool."""
+
+import json
+import os
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from kittylog.providers import http_client
+from kittylog.providers.base import OpenAICompatibleProvider, ProviderConfig
+from kittylog.providers.registry import create_provider_func, create_streaming_provider_func
+
+# The autouse API mock replaces http_client.post; these tests exercise the real one
+REAL_POST = http_client.post
+
+
+@pytest.fixture
+def mock_transport_pool():
+    """Route pooled clients through an in-memory transport and record requests."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if json.loads(request.content or b"{}").get("stream"):
+            body = 'data: {"choices": [{"delta": {"content": "Hi"}}]}\n\ndata: [DONE]\n\n'
+            return httpx.Response(200, text=body)
+        return httpx.Response(200, json={"choices": [{"message": {"content": "pooled"}}]})
+
+    def create_client(key, settings):
+        return httpx.Client(transport=httpx.MockTransport(handler))
+
+    http_client.close_clients()
+    with (
+        patch.object(http_client, "post", REAL_POST),
+        patch.object(http_client, "_create_client", side_effect=create_client) as mock_create,
+    ):
+        yield requests, mock_create
+    http_client.close_clients()
+
+
+class PooledTestProvider(OpenAICompatibleProvider):
+    config = ProviderConfig(name="Pooled Test", api_key_env="POOLED_TEST_API_KEY", base_url="https://pool.example")
+    instances = 0
+
+    def __init__(self, config):
+        super().__init__(config)
+        type(self).instances += 1
+
+
+class TestConnectionPool:
+    """Test client reuse and lifecycle."""
+
+    def test_clients_are_shared_per_origin(self, mock_transport_pool):
+        """Test that one client serves every path on the same host."""
+        first = http_client.get_client("https://api.example.com/v1/chat")
+        second = http_client.get_client("https://api.example.com/v1/other")
+        other_host = http_client.get_client("https://other.example.com/v1/chat")
+        other_port = http_client.get_client("https://api.example.com:8443/v1/chat")
+
+        assert first is second
+        assert first is not other_host
+        assert first is not other_port
+
+    def test_close_clients(self, mock_transport_pool):
+        """Test that closing the pool closes clients and later calls reopen them."""
+        client = http_client.get_client("https://api.example.com/v1")
+
+        http_client.close_clients()
+        http_client.close_clients()
+
+        assert client.is_closed
+        assert http_client.get_client("https://api.example.com/v1") is not client
+
+    def test_settings_from_environment(self, monkeypatch):
+        """Test that pool limits are configurable."""
+        monkeypatch.setenv("KITTYLOG_HTTP_MAX_CONNECTIONS", "5")
+        monkeypatch.setenv("KITTYLOG_HTTP_MAX_KEEPALIVE_CONNECTIONS", "2")
+        monkeypatch.setenv("KITTYLOG_HTTP_KEEPALIVE_EXPIRY", "7.5")
+        monkeypatch.setenv("KITTYLOG_HTTP2", "false")
+
+        settings = http_client.get_pool_settings()
+
+        assert settings == http_client.PoolSettings(
+            max_connections=5, max_keepalive_connections=2, keepalive_expiry=7.5, http2=False
+        )
+
+    def test_invalid_settings_fall_back_to_defaults(self, monkeypatch):
+        """Test that bad values do not break requests."""
+        monkeypatch.setenv("KITTYLOG_HTTP_MAX_CONNECTIONS", "0")
+        monkeypatch.setenv("KITTYLOG_HTTP_KEEPALIVE_EXPIRY", "soon")
+
+        settings = http_client.get_pool_settings()
+
+        assert settings.max_connections == http_client.PoolSettings().max_connections
+        assert settings.keepalive_expiry == http_client.PoolSettings().keepalive_expiry
+
+    def test_http2_requires_h2(self):
+        """Test that HTTP/2 is only requested when the h2 package is installed."""
+        with patch.object(http_client, "_http2_available", return_value=False):
+            client = http_client._create_client("https://api.example.com", http_client.PoolSettings(http2=True))
+        try:
+            assert isinstance(client, httpx.Client)
+        finally:
+            client.close()
+
+
+class TestProvidersUsePool:
+    """Test that providers send requests through the pool."""
+
+    @patch.dict(os.environ, {"POOLED_TEST_API_KEY": "key"})
+    def test_generate_reuses_client_and_instance(self, mock_transport_pool):
+        """Test that repeated calls share one client and one provider instance."""
+        requests, mock_create = mock_transport_pool
+        PooledTestProvider.instances = 0
+        provider_func = create_provider_func(PooledTestProvider)
+
+        results = [provider_func("model", [{"role": "user", "content": "hi"}], 0.5, 10) for _ in range(3)]
+
+        assert results == ["pooled"] * 3
+        assert len(requests) == 3
+        assert requests[0].url == "https://pool.example/v1/chat/completions"
+        assert requests[0].headers["Authorization"] == "Bearer key"
+        mock_create.assert_called_once()
+        assert PooledTestProvider.instances == 1
+
+    @patch.dict(os.environ, {"POOLED_TEST_API_KEY": "key"})
+    def test_streaming_uses_pool(self, mock_transport_pool):
+        """Test that streaming requests go through the pooled client."""
+        requests, mock_create = mock_transport_pool
+        stream_func = create_streaming_provider_func(PooledTestProvider)
+
+        chunks = list(stream_func("model", [{"role": "user", "content": "hi"}], 0.5, 10))
+
+        assert chunks[0] == ("Hi", None)
+        assert chunks[-1][1] is not None
+        assert len(requests) == 1
+        mock_create.assert_called_once()
+
+    def test_stateful_providers_get_fresh_instances(self):
+        """Test that providers reading settings at construction opt out of reuse."""
+        from kittylog.providers.azure_openai import AzureOpenAIProvider
+        from kittylog.providers.lmstudio import LMStudioProvider
+        from kittylog.providers.qwen import QwenProvider
+
+        assert PooledTestProvider.reuse_instance
+        assert not AzureOpenAIProvider.reuse_instance
+        assert not LMStudioProvider.reuse_instance
+        assert not QwenProvider.reuse_instance
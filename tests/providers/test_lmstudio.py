@@ -15,7 +15,7 @@ API_ENDPOINT = "http://localhost:1234/v1/chat/completions"
 class TestLmstudioProvider:
     """Test Lmstudio provider functionality."""
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"LMSTUDIO_API_KEY": API_KEY})
     def test_call_lmstudio_api_success(self, mock_post, dummy_messages, mock_http_response_factory, api_test_helper):
         """Test successful Lmstudio API call."""
@@ -45,7 +45,7 @@ class TestLmstudioProvider:
         assert data["temperature"] == 0.7
         assert data["max_tokens"] == 100
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     def test_call_lmstudio_api_missing_api_key(self, mock_post, monkeypatch, dummy_messages):
         """Test Lmstudio provider works without API key (optional) but fails on connection error.
 
@@ -70,7 +70,7 @@ class TestLmstudioProvider:
         # Should NOT be an authentication error
         assert "api key" not in error_message and "authentication" not in error_message
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"LMSTUDIO_API_KEY": API_KEY})
     def test_call_lmstudio_api_http_error(self, mock_post, dummy_messages, mock_http_response_factory):
         """Test Lmstudio API call handles HTTP errors."""
@@ -88,7 +88,7 @@ class TestLmstudioProvider:
 
         assert "LM Studio" in str(exc_info.value)
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"LMSTUDIO_API_KEY": API_KEY})
     def test_call_lmstudio_api_general_error(self, mock_post, dummy_messages):
         """Test Lmstudio API call handles general errors."""
@@ -104,7 +104,7 @@ class TestLmstudioProvider:
 
         assert "LM Studio" in str(exc_info.value)
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"LMSTUDIO_API_KEY": API_KEY})
     def test_call_lmstudio_api_with_system_message(
         self, mock_post, dummy_messages_with_system, mock_http_response_factory, api_test_helper
@@ -127,7 +127,7 @@ class TestLmstudioProvider:
         assert data["messages"][0]["role"] == "system"
         assert data["messages"][1]["role"] == "user"
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"LMSTUDIO_API_KEY": API_KEY})
     def test_call_lmstudio_api_with_conversation(
         self, mock_post, dummy_conversation, mock_http_response_factory, api_test_helper
@@ -15,7 +15,7 @@ API_ENDPOINT = "http://localhost:11434/api/chat"
 class TestOllamaProvider:
     """Test Ollama provider functionality."""
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"OLLAMA_API_URL": API_URL})
     def test_call_ollama_api_success(self, mock_post, dummy_messages, mock_http_response_factory, api_test_helper):
         """Test successful Ollama API call."""
@@ -42,7 +42,7 @@ class TestOllamaProvider:
         assert data["temperature"] == 0.7
         assert data["stream"] is False
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     def test_call_ollama_api_default_url(
         self, mock_post, dummy_messages, mock_http_response_factory, api_test_helper, monkeypatch
     ):
@@ -61,7 +61,7 @@ class TestOllamaProvider:
         url = api_test_helper.extract_call_url(mock_post)
         assert url == "http://localhost:11434/api/chat"
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"OLLAMA_HOST": "http://localhost:11434"}, clear=True)
     def test_call_ollama_api_legacy_host_support(
         self, mock_post, dummy_messages, mock_http_response_factory, api_test_helper
@@ -82,7 +82,7 @@ class TestOllamaProvider:
         url = api_test_helper.extract_call_url(mock_post)
         assert url == "http://localhost:11434/api/chat"
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"OLLAMA_API_URL": API_URL})
     def test_call_ollama_api_http_error(self, mock_post, dummy_messages, mock_http_response_factory):
         """Test Ollama API call handles HTTP errors."""
@@ -100,7 +100,7 @@ class TestOllamaProvider:
 
         assert "Ollama" in str(exc_info.value)
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"OLLAMA_API_URL": API_URL})
     def test_call_ollama_api_general_error(self, mock_post, dummy_messages):
         """Test Ollama API call handles general errors."""
@@ -136,7 +136,7 @@ class TestOllamaProvider:
 
         assert len(result) > 0  # Any response is considered success
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"OLLAMA_API_URL": API_URL})
     def test_call_ollama_api_with_system_message(
         self, mock_post, dummy_messages_with_system, mock_http_response_factory, api_test_helper
@@ -159,7 +159,7 @@ class TestOllamaProvider:
         assert data["messages"][0]["role"] == "system"
         assert data["messages"][1]["role"] == "user"
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"OLLAMA_API_URL": API_URL})
     def test_call_ollama_api_format_conversion(
         self, mock_post, dummy_conversation, mock_http_response_factory, api_test_helper
@@ -180,7 +180,7 @@ class TestOllamaProvider:
         data = api_test_helper.extract_call_data(mock_post)
         assert len(data["messages"]) == 3
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"OLLAMA_API_URL": API_URL})
     def test_call_ollama_api_data_structure(
         self, mock_post, dummy_messages, mock_http_response_factory, api_test_helper
@@ -201,7 +201,7 @@ class TestOllamaProvider:
         assert data["stream"] is False
         assert data["model"] == "llama2"
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"OLLAMA_API_URL": "http://localhost:11434/"})
     def test_call_ollama_api_custom_url_trailing_slash(
         self, mock_post, dummy_messages, mock_http_response_factory, api_test_helper
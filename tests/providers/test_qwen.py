@@ -48,7 +48,7 @@ class TestCallQwenApi:
         """Test successful API call with OAuth."""
         with (
             patch("kittylog.providers.qwen.QwenOAuthProvider") as mock_provider_class,
-            patch("kittylog.providers.base.httpx.post") as mock_post,
+            patch("kittylog.providers.http_client.post") as mock_post,
         ):
             mock_oauth_provider = mock.Mock()
             mock_oauth_provider.get_token.return_value = {
@@ -82,7 +82,7 @@ class TestCallQwenApi:
         """Test Qwen OAuth with dynamic resource URL."""
         with (
             patch("kittylog.providers.qwen.QwenOAuthProvider") as mock_provider_class,
-            patch("kittylog.providers.base.httpx.post") as mock_post,
+            patch("kittylog.providers.http_client.post") as mock_post,
         ):
             mock_oauth_provider = mock.Mock()
             mock_oauth_provider.get_token.return_value = {
@@ -108,7 +108,7 @@ class TestCallQwenApi:
         """Test handling of response without choices field."""
         with (
             patch("kittylog.providers.qwen.QwenOAuthProvider") as mock_provider_class,
-            patch("kittylog.providers.base.httpx.post") as mock_post,
+            patch("kittylog.providers.http_client.post") as mock_post,
         ):
             mock_oauth_provider = mock.Mock()
             mock_oauth_provider.get_token.return_value = {
@@ -131,7 +131,7 @@ class TestCallQwenApi:
         """Test error when API returns null content."""
         with (
             patch("kittylog.providers.qwen.QwenOAuthProvider") as mock_provider_class,
-            patch("kittylog.providers.base.httpx.post") as mock_post,
+            patch("kittylog.providers.http_client.post") as mock_post,
         ):
             mock_oauth_provider = mock.Mock()
             mock_oauth_provider.get_token.return_value = {
@@ -159,7 +159,7 @@ class TestCallQwenApi:
         """Test that API returning empty content raises an error."""
         with (
             patch("kittylog.providers.qwen.QwenOAuthProvider") as mock_provider_class,
-            patch("kittylog.providers.base.httpx.post") as mock_post,
+            patch("kittylog.providers.http_client.post") as mock_post,
         ):
             mock_oauth_provider = mock.Mock()
             mock_oauth_provider.get_token.return_value = {
@@ -187,7 +187,7 @@ class TestCallQwenApi:
         """Test 401 authentication error."""
         with (
             patch("kittylog.providers.qwen.QwenOAuthProvider") as mock_provider_class,
-            patch("kittylog.providers.base.httpx.post") as mock_post,
+            patch("kittylog.providers.http_client.post") as mock_post,
         ):
             mock_oauth_provider = mock.Mock()
             mock_oauth_provider.get_token.return_value = {
@@ -218,7 +218,7 @@ class TestCallQwenApi:
         """Test 429 rate limit error."""
         with (
             patch("kittylog.providers.qwen.QwenOAuthProvider") as mock_provider_class,
-            patch("kittylog.providers.base.httpx.post") as mock_post,
+            patch("kittylog.providers.http_client.post") as mock_post,
         ):
             mock_oauth_provider = mock.Mock()
             mock_oauth_provider.get_token.return_value = {
@@ -251,7 +251,7 @@ class TestCallQwenApi:
         """Test timeout error."""
         with (
             patch("kittylog.providers.qwen.QwenOAuthProvider") as mock_provider_class,
-            patch("kittylog.providers.base.httpx.post") as mock_post,
+            patch("kittylog.providers.http_client.post") as mock_post,
         ):
             mock_oauth_provider = mock.Mock()
             mock_oauth_provider.get_token.return_value = {
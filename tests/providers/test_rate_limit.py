@@ -0,0 +1,274 @@
+"""Tests for rate-limit-aware pacing of provider requests."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from kittylog.ai_utils import generate_with_retries
+from kittylog.errors import AIError, classify_error
+from kittylog.providers import http_client, rate_limit
+from kittylog.providers.base import OpenAICompatibleProvider, ProviderConfig
+from kittylog.providers.rate_limit import (
+    MAX_RETRY_AFTER_SECONDS,
+    UTILIZATION,
+    RateLimiter,
+    estimate_request_tokens,
+    parse_rate_limit_headers,
+    retry_after_seconds,
+)
+from kittylog.tokenizer import count_tokens
+
+# The autouse API mock replaces http_client.post; these tests exercise the real one
+REAL_POST = http_client.post
+
+MESSAGES = [{"role": "user", "content": "x" * 400}]
+
+
+@pytest.fixture(autouse=True)
+def reset_limits():
+    rate_limit.reset_rate_limits()
+    yield
+    rate_limit.reset_rate_limits()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class PacedTestProvider(OpenAICompatibleProvider):
+    config = ProviderConfig(name="Paced Test", api_key_env="PACED_TEST_API_KEY", base_url="https://paced.example")
+
+
+@pytest.fixture
+def mock_transport(monkeypatch):
+    """Serve provider requests from a queue of canned responses."""
+    monkeypatch.setenv("PACED_TEST_API_KEY", "test-key")
+    responses: list[httpx.Response] = []
+
+    def create_client(key, settings):
+        return httpx.Client(transport=httpx.MockTransport(lambda request: responses.pop(0)))
+
+    http_client.close_clients()
+    with (
+        patch.object(http_client, "post", REAL_POST),
+        patch.object(http_client, "_create_client", side_effect=create_client),
+    ):
+        yield responses
+    http_client.close_clients()
+
+
+def _ok(headers: dict[str, str]) -> httpx.Response:
+    return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]}, headers=headers)
+
+
+class TestHeaderParsing:
+    """Test reading limits and retry hints from response headers."""
+
+    def test_openai_style_headers(self):
+        """Test x-ratelimit-* headers with Go-style durations."""
+        reported = parse_rate_limit_headers(
+            {
+                "x-ratelimit-limit-requests": "60",
+                "x-ratelimit-remaining-requests": "59",
+                "x-ratelimit-reset-requests": "1s",
+                "x-ratelimit-limit-tokens": "150000",
+                "x-ratelimit-remaining-tokens": "149000",
+                "x-ratelimit-reset-tokens": "6m0.5s",
+            }
+        )
+
+        assert reported == {"requests": (60, 59, 1.0), "tokens": (150000, 149000, 360.5)}
+
+    def test_anthropic_style_headers(self):
+        """Test anthropic-ratelimit-* headers with RFC 3339 reset times."""
+        reset = (datetime.now(timezone.utc) + timedelta(seconds=30)).isoformat()
+
+        limit, remaining, seconds = parse_rate_limit_headers(
+            {
+                "anthropic-ratelimit-requests-limit": "50",
+                "anthropic-ratelimit-requests-remaining": "10",
+                "anthropic-ratelimit-requests-reset": reset,
+            }
+        )["requests"]
+
+        assert (limit, remaining) == (50, 10)
+        assert seconds is not None and 28 < seconds <= 30
+
+    def test_anthropic_reset_with_z_suffix(self):
+        """Test the UTC "Z" suffix Anthropic uses, which Python 3.10's fromisoformat rejects."""
+        reset = (datetime.now(timezone.utc) + timedelta(seconds=30)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        _limit, _remaining, seconds = parse_rate_limit_headers(
+            {
+                "anthropic-ratelimit-tokens-limit": "1000",
+                "anthropic-ratelimit-tokens-remaining": "10",
+                "anthropic-ratelimit-tokens-reset": reset,
+            }
+        )["tokens"]
+
+        assert seconds is not None and 28 < seconds <= 30
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({"retry-after": "3"}, 3.0),
+            ({"retry-after-ms": "1500", "retry-after": "3"}, 1.5),
+            ({"retry-after": "soon"}, None),
+            ({}, None),
+        ],
+    )
+    def test_retry_after(self, headers, expected):
+        """Test Retry-After in seconds and milliseconds."""
+        assert retry_after_seconds(headers) == expected
+
+    def test_retry_after_http_date(self):
+        """Test Retry-After given as an HTTP date."""
+        date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=20), usegmt=True)
+
+        seconds = retry_after_seconds(httpx.Headers({"Retry-After": date}))
+
+        assert seconds is not None and 18 < seconds <= 20
+
+
+class TestRateLimiter:
+    """Test the request and token buckets."""
+
+    def test_unknown_provider_is_not_delayed(self):
+        """Test that requests go straight out until a provider reports its limits."""
+        assert RateLimiter().reserve("openai", 10_000) == 0
+
+    def test_requests_queue_under_the_limit(self):
+        """Test that requests beyond the remaining quota are spread at the provider's rate."""
+        clock = FakeClock()
+        limiter = RateLimiter(clock)
+        limiter.observe("openai", 200, {"x-ratelimit-limit-requests": "60", "x-ratelimit-remaining-requests": "1"})
+        interval = 1 / UTILIZATION  # 60 requests per minute, less headroom
+
+        assert limiter.reserve("openai", 0) == 0
+        assert limiter.reserve("openai", 0) == pytest.approx(interval)
+        assert limiter.reserve("openai", 0) == pytest.approx(2 * interval)
+        clock.now += 10 * interval
+        assert limiter.reserve("openai", 0) == 0
+
+    def test_token_bucket(self):
+        """Test that large requests wait for enough tokens, and no longer than for a full bucket."""
+        limiter = RateLimiter(FakeClock())
+        limiter.observe(
+            "openai",
+            200,
+            {"x-ratelimit-limit-tokens": "6000", "x-ratelimit-remaining-tokens": "1000"},
+        )
+        tokens_per_second = 6000 / 60 * UTILIZATION
+
+        assert limiter.reserve("openai", 1000) == 0
+        assert limiter.reserve("openai", 500) == pytest.approx(500 / tokens_per_second)
+        assert limiter.reserve("openai", 100_000) == pytest.approx(6500 / tokens_per_second)
+
+    def test_retry_after_pauses_the_provider(self):
+        """Test that a 429's Retry-After delays every request to that provider only."""
+        clock = FakeClock()
+        limiter = RateLimiter(clock)
+        limiter.observe("openai", 429, {"retry-after": "5"})
+
+        assert limiter.reserve("openai", 0) == 5
+        assert limiter.reserve("anthropic", 0) == 0
+        clock.now += 5
+        assert limiter.reserve("openai", 0) == 0
+
+    def test_long_retry_after_is_capped(self):
+        """Test that a quota reset hours away pauses the provider for at most the cap."""
+        limiter = RateLimiter(FakeClock())
+        limiter.observe("openai", 429, {"retry-after": "86400"})
+
+        assert limiter.reserve("openai", 0) == MAX_RETRY_AFTER_SECONDS
+
+    def test_provider_reports_tighten_local_estimate(self):
+        """Test that the provider's remaining count lowers, but never raises, the local level."""
+        limiter = RateLimiter(FakeClock())
+        headers = {"x-ratelimit-limit-requests": "100", "x-ratelimit-remaining-requests": "50"}
+        limiter.observe("openai", 200, headers)
+        for _ in range(50):
+            limiter.reserve("openai", 0)
+
+        limiter.observe("openai", 200, {**headers, "x-ratelimit-remaining-requests": "40"})
+
+        assert limiter.reserve("openai", 0) > 0
+
+
+def test_request_estimate_uses_the_prompt_tokenizer():
+    """Test that requests reserve what the prompt packer would count, plus the completion allowance."""
+    messages = [
+        {"role": "system", "content": "You write changelogs."},
+        {"role": "user", "content": "def f(x):\n    return {'a': [x, x ** 2]}\n" * 20},
+    ]
+
+    expected = sum(count_tokens(message["content"], "gpt-4o") for message in messages) + 500
+    assert estimate_request_tokens(messages, 500, "gpt-4o") == expected
+
+
+class TestProviderPacing:
+    """Test that providers feed and honour the limiter."""
+
+    def test_provider_waits_for_capacity(self, mock_transport):
+        """Test that a provider out of quota waits before its next request."""
+        headers = {"x-ratelimit-limit-requests": "60", "x-ratelimit-remaining-requests": "0"}
+        mock_transport.extend([_ok(headers), _ok(headers)])
+        provider = PacedTestProvider(PacedTestProvider.config)
+
+        with patch.object(rate_limit.time, "sleep") as mock_sleep:
+            provider.generate("gpt-4", MESSAGES)
+            mock_sleep.assert_not_called()
+            provider.generate("gpt-4", MESSAGES)
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(1 / UTILIZATION, rel=0.05)
+
+    def test_429_carries_retry_after(self, mock_transport):
+        """Test that a 429 raises a rate limit error with the provider's Retry-After."""
+        mock_transport.append(httpx.Response(429, headers={"Retry-After": "7"}, text="slow down"))
+        provider = PacedTestProvider(PacedTestProvider.config)
+
+        with pytest.raises(AIError) as exc_info:
+            provider.generate("gpt-4", MESSAGES)
+
+        assert exc_info.value.error_type == "rate_limit"
+        assert exc_info.value.retry_after == 7
+
+
+class TestRetries:
+    """Test the retry policy for rate limited requests."""
+
+    @patch("kittylog.ai_utils.time.sleep")
+    def test_retry_waits_as_long_as_asked(self, mock_sleep):
+        """Test that a Retry-After replaces the exponential backoff."""
+        provider_func = Mock(side_effect=[AIError.rate_limit_error("Rate limit exceeded", retry_after=7), "ok"])
+
+        result = generate_with_retries({"openai": provider_func}, "openai:gpt-4", "s", "u", 0.7, 100, 3, quiet=True)
+
+        assert result == "ok"
+        mock_sleep.assert_called_once_with(7)
+
+    @patch("kittylog.ai_utils.time.sleep")
+    def test_retry_after_beyond_the_cap_fails_immediately(self, mock_sleep):
+        """Test that an hourly or daily quota's Retry-After fails the run instead of stalling it."""
+        error = AIError.rate_limit_error("Daily quota exceeded", retry_after=MAX_RETRY_AFTER_SECONDS * 60)
+        provider_func = Mock(side_effect=[error, "ok"])
+
+        with pytest.raises(AIError) as exc_info:
+            generate_with_retries({"openai": provider_func}, "openai:gpt-4", "s", "u", 0.7, 100, 3, quiet=True)
+
+        assert exc_info.value is error
+        assert provider_func.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_typed_errors_are_not_classified_by_message(self):
+        """Test that an error's type wins over words in its message."""
+        assert classify_error(AIError.rate_limit_error("API key tier limit reached")) == "rate_limit"
+        assert classify_error(Exception("API key tier limit reached")) == "authentication"
@@ -15,8 +15,8 @@ API_ENDPOINT = "https://api.replicate.com/v1/predictions"
 class TestReplicateProvider:
     """Test Replicate provider functionality."""
 
-    @patch("kittylog.providers.replicate.httpx.get")
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.get")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"REPLICATE_API_TOKEN": API_KEY})
     def test_call_replicate_api_success(
         self, mock_post, mock_get, dummy_messages, mock_http_response_factory, api_test_helper
@@ -66,7 +66,7 @@ class TestReplicateProvider:
 
         assert "REPLICATE_API_TOKEN" in str(exc_info.value)
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"REPLICATE_API_TOKEN": API_KEY})
     def test_call_replicate_api_http_error(self, mock_post, dummy_messages, mock_http_response_factory):
         """Test Replicate API call handles HTTP errors."""
@@ -84,7 +84,7 @@ class TestReplicateProvider:
 
         assert "Replicate API error" in str(exc_info.value) or "Replicate" in str(exc_info.value)
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"REPLICATE_API_TOKEN": API_KEY})
     def test_call_replicate_api_general_error(self, mock_post, dummy_messages):
         """Test Replicate API call handles general errors."""
@@ -100,8 +100,8 @@ class TestReplicateProvider:
 
         assert "Replicate" in str(exc_info.value)
 
-    @patch("kittylog.providers.replicate.httpx.get")
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.get")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"REPLICATE_API_TOKEN": API_KEY})
     def test_call_replicate_api_with_system_message(
         self, mock_post, mock_get, dummy_messages_with_system, mock_http_response_factory, api_test_helper
@@ -130,8 +130,8 @@ class TestReplicateProvider:
         assert "Human: Test message" in prompt
         assert "Assistant:" in prompt
 
-    @patch("kittylog.providers.replicate.httpx.get")
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.get")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"REPLICATE_API_TOKEN": API_KEY})
     def test_call_replicate_api_with_conversation(
         self, mock_post, mock_get, dummy_conversation, mock_http_response_factory, api_test_helper
@@ -15,7 +15,7 @@ API_ENDPOINT = "https://api.synthetic.new/openai/v1/chat/completions"
 class TestSyntheticProvider:
     """Test Synthetic provider functionality."""
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"SYNTHETIC_API_KEY": API_KEY})
     def test_call_synthetic_api_success(self, mock_post, dummy_messages, mock_http_response_factory, api_test_helper):
         """Test successful Synthetic API call."""
@@ -55,7 +55,7 @@ class TestSyntheticProvider:
 
         assert "SYNTHETIC_API_KEY" in str(exc_info.value) or "SYN_API_KEY" in str(exc_info.value)
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"SYNTHETIC_API_KEY": API_KEY})
     def test_call_synthetic_api_http_error(self, mock_post, dummy_messages, mock_http_response_factory):
         """Test Synthetic API call handles HTTP errors."""
@@ -73,7 +73,7 @@ class TestSyntheticProvider:
 
         assert "API error" in str(exc_info.value) or "Synthetic" in str(exc_info.value)
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"SYNTHETIC_API_KEY": API_KEY})
     def test_call_synthetic_api_general_error(self, mock_post, dummy_messages):
         """Test Synthetic API call handles general errors."""
@@ -89,7 +89,7 @@ class TestSyntheticProvider:
 
         assert "Synthetic" in str(exc_info.value)
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"SYNTHETIC_API_KEY": API_KEY})
     def test_call_synthetic_api_with_system_message(
         self, mock_post, dummy_messages_with_system, mock_http_response_factory, api_test_helper
@@ -112,7 +112,7 @@ class TestSyntheticProvider:
         assert data["messages"][0]["role"] == "system"
         assert data["messages"][1]["role"] == "user"
 
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"SYNTHETIC_API_KEY": API_KEY})
     def test_call_synthetic_api_with_conversation(
         self, mock_post, dummy_conversation, mock_http_response_factory, api_test_helper
@@ -134,7 +134,7 @@ class TestSyntheticProvider:
         assert len(data["messages"]) == 3
 
     @pytest.mark.integration
-    @patch("kittylog.providers.base.httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch.dict(os.environ, {"SYNTHETIC_API_KEY": "test-synthetic-key"})
     def test_synthetic_provider_integration(self, mock_post, dummy_messages, mock_http_response_factory):
         """Test Synthetic provider integration with mocked API call."""
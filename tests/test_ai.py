@@ -118,7 +118,7 @@ class TestGenerateChangelogEntry:
 class TestGenerateWithRetries:
     """Test generate_with_retries function."""
 
-    @patch("httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch("os.getenv")
     def testgenerate_with_retries_success(self, mock_getenv, mock_post):
         """Test successful generation on first try."""
@@ -192,7 +192,8 @@ class TestGenerateWithRetries:
 
         assert result == "Success"
         assert mock_provider_func.call_count == 2
-        mock_sleep.assert_called_once_with(1)  # 2^0 = 1 second wait
+        mock_sleep.assert_called_once()
+        assert 0.5 <= mock_sleep.call_args.args[0] <= 1  # Jittered 2^0 = 1 second wait
 
     def testgenerate_with_retries_non_retryable_error(self):
         """Test handling of non-retryable errors."""
@@ -310,7 +311,7 @@ class TestClassifyError:
 class TestAIIntegration:
     """Integration tests for AI operations."""
 
-    @patch("httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch("kittylog.ai.build_changelog_prompt")
     @patch("kittylog.ai.count_tokens")
     @patch("kittylog.ai.clean_changelog_content")
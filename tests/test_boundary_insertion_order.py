@@ -24,6 +24,15 @@ MISSING_MODULE = "kittylog.mode_handlers.missing"
 CHANGELOG_IO_MODULE = "kittylog.changelog.io"
 
 
+def commits_for_every_boundary(commits):
+    """Build a partition_commits_by_boundaries stand-in giving each boundary ``commits``."""
+
+    def partition(boundaries, only=None):
+        return [list(commits) for _ in boundaries]
+
+    return partition
+
+
 class TestUpdateAllModeDateBoundaryOrder:
     """Tests for handle_update_all_mode with dates mode insertion order."""
 
@@ -46,7 +55,7 @@ class TestUpdateAllModeDateBoundaryOrder:
 
         with (
             patch(f"{BOUNDARY_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{BOUNDARY_MODULE}.get_commits_between_boundaries") as mock_get_commits,
+            patch(f"{BOUNDARY_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{CHANGELOG_IO_MODULE}.write_changelog"),
         ):
             # Boundaries returned in chronological order (oldest first)
@@ -76,7 +85,7 @@ class TestUpdateAllModeDateBoundaryOrder:
                     "mode": "dates",
                 },
             ]
-            mock_get_commits.return_value = [{"hash": "abc", "message": "test commit"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test commit"}])
 
             success, content = handle_update_all_mode(
                 changelog_file=str(changelog_file),
@@ -124,7 +133,7 @@ class TestUpdateAllModeDateBoundaryOrder:
 
         with (
             patch(f"{BOUNDARY_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{BOUNDARY_MODULE}.get_commits_between_boundaries") as mock_get_commits,
+            patch(f"{BOUNDARY_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{CHANGELOG_IO_MODULE}.write_changelog"),
         ):
             mock_get_boundaries.return_value = [
@@ -141,7 +150,7 @@ class TestUpdateAllModeDateBoundaryOrder:
                     "mode": "dates",
                 },
             ]
-            mock_get_commits.return_value = [{"hash": "abc", "message": "test"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test"}])
 
             success, content = handle_update_all_mode(
                 changelog_file=str(changelog_file),
@@ -183,7 +192,7 @@ class TestUpdateAllModeGapBoundaryOrder:
 
         with (
             patch(f"{BOUNDARY_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{BOUNDARY_MODULE}.get_commits_between_boundaries") as mock_get_commits,
+            patch(f"{BOUNDARY_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{CHANGELOG_IO_MODULE}.write_changelog"),
         ):
             # Gap boundaries - represent development sessions
@@ -207,7 +216,7 @@ class TestUpdateAllModeGapBoundaryOrder:
                     "mode": "gaps",
                 },
             ]
-            mock_get_commits.return_value = [{"hash": "abc", "message": "test"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test"}])
 
             success, content = handle_update_all_mode(
                 changelog_file=str(changelog_file),
@@ -249,8 +258,8 @@ class TestMissingEntriesModeDateBoundaryOrder:
             return f"### Added\n\n- Changes for {tag}"
 
         with (
-            patch(f"{MISSING_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{MISSING_MODULE}.get_commits_between_boundaries") as mock_get_commits,
+            patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries,
+            patch(f"{MISSING_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{CHANGELOG_IO_MODULE}.read_changelog") as mock_read,
             patch(f"{CHANGELOG_IO_MODULE}.write_changelog"),
         ):
@@ -274,7 +283,7 @@ class TestMissingEntriesModeDateBoundaryOrder:
                     "mode": "dates",
                 },
             ]
-            mock_get_commits.return_value = [{"hash": "abc", "message": "test"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test"}])
             mock_read.return_value = changelog_file.read_text()
 
             success, content = handle_missing_entries_mode(
@@ -320,8 +329,8 @@ class TestMissingEntriesModeGapBoundaryOrder:
             return f"### Added\n\n- Session {tag}"
 
         with (
-            patch(f"{MISSING_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{MISSING_MODULE}.get_commits_between_boundaries") as mock_get_commits,
+            patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries,
+            patch(f"{MISSING_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{CHANGELOG_IO_MODULE}.read_changelog") as mock_read,
             patch(f"{CHANGELOG_IO_MODULE}.write_changelog"),
         ):
@@ -345,7 +354,7 @@ class TestMissingEntriesModeGapBoundaryOrder:
                     "mode": "gaps",
                 },
             ]
-            mock_get_commits.return_value = [{"hash": "abc", "message": "test"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test"}])
             mock_read.return_value = changelog_file.read_text()
 
             success, content = handle_missing_entries_mode(
@@ -389,7 +398,7 @@ class TestInsertionOrderWithManyBoundaries:
 
         with (
             patch(f"{BOUNDARY_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{BOUNDARY_MODULE}.get_commits_between_boundaries") as mock_get_commits,
+            patch(f"{BOUNDARY_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{CHANGELOG_IO_MODULE}.write_changelog"),
         ):
             # Full year of monthly boundaries
@@ -402,7 +411,7 @@ class TestInsertionOrderWithManyBoundaries:
                 }
                 for month in range(1, 13)  # Jan through Dec
             ]
-            mock_get_commits.return_value = [{"hash": "abc", "message": "test"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test"}])
 
             success, content = handle_update_all_mode(
                 changelog_file=str(changelog_file),
@@ -452,7 +461,7 @@ class TestInsertionOrderEdgeCases:
 
         with (
             patch(f"{BOUNDARY_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{BOUNDARY_MODULE}.get_commits_between_boundaries") as mock_get_commits,
+            patch(f"{BOUNDARY_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{CHANGELOG_IO_MODULE}.write_changelog"),
         ):
             mock_get_boundaries.return_value = [
@@ -463,7 +472,7 @@ class TestInsertionOrderEdgeCases:
                     "mode": "dates",
                 }
             ]
-            mock_get_commits.return_value = [{"hash": "abc", "message": "test"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test"}])
 
             success, content = handle_update_all_mode(
                 changelog_file=str(changelog_file),
@@ -490,7 +499,7 @@ class TestInsertionOrderEdgeCases:
 
         with (
             patch(f"{BOUNDARY_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{BOUNDARY_MODULE}.get_commits_between_boundaries") as mock_get_commits,
+            patch(f"{BOUNDARY_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{CHANGELOG_IO_MODULE}.write_changelog"),
         ):
             mock_get_boundaries.return_value = [
@@ -507,7 +516,7 @@ class TestInsertionOrderEdgeCases:
                     "mode": "dates",
                 },
             ]
-            mock_get_commits.return_value = [{"hash": "abc", "message": "test"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test"}])
 
             success, content = handle_update_all_mode(
                 changelog_file=str(changelog_file),
@@ -0,0 +1,218 @@
+"""Tests for the parsed changelog document model."""
+
+import random
+import re
+
+import pytest
+
+from kittylog.changelog.document import ChangelogDocument, parse_changelog
+from kittylog.changelog.insertion import (
+    find_insertion_point_by_version,
+    insert_section_at,
+    insert_sections_at,
+    insert_version_section,
+    insert_version_sections,
+)
+
+CHANGELOG = """# Changelog
+
+All notable changes to this project will be documented in this file.
+
+## [Unreleased]
+
+### Added
+- Pending feature
+
+## [v1.1.0] - 2024-02-01
+
+### Fixed
+- Crash on start
+- Wrong exit code
+
+### Added
+- Export command
+
+## [1.0.0] - 2024-01-01
+
+### Added
+- Initial release
+
+## [2023-12-01]
+
+- Dated entry
+"""
+
+
+class TestParsing:
+    """Test sections, index and round-trip."""
+
+    @pytest.mark.parametrize(
+        "content", [CHANGELOG, "", "# Changelog", "\n\n## [1.0.0]\n\n", CHANGELOG.replace("\n", "\r\n")]
+    )
+    def test_round_trip(self, content):
+        assert ChangelogDocument(content).text() == content
+
+    def test_sections(self):
+        document = ChangelogDocument(CHANGELOG)
+
+        assert [section.identifier for section in document.sections] == [None, "1.1.0", "1.0.0", "2023-12-01"]
+        assert document.header_end == 4
+        assert document.unreleased is document.sections[0]
+        assert [section.version for section in document.versions()] == ["v1.1.0", "1.0.0"]
+        assert document.sections[1].end == document.sections[2].start
+
+    def test_lookup(self):
+        document = ChangelogDocument(CHANGELOG)
+
+        assert document.find("1.1.0") is document.find("v1.1.0") is document.find_version("1.1.0")
+        assert document.find("UNRELEASED") is document.unreleased
+        assert document.find("2023-12-01").header == "## [2023-12-01]"
+        assert document.find_version("2023-12-01") is None
+        assert document.find("9.9.9") is None
+
+    def test_subsections(self):
+        document = ChangelogDocument(CHANGELOG)
+        fixed, added = document.subsections(document.find("1.1.0"))
+
+        assert (fixed.title, added.title) == ("Fixed", "Added")
+        assert [document.lines[index] for index in fixed.bullets] == ["- Crash on start", "- Wrong exit code"]
+        assert fixed.end == added.start
+
+    def test_parse_changelog_is_memoized(self):
+        assert parse_changelog(CHANGELOG) is parse_changelog(CHANGELOG)
+
+
+class TestEditing:
+    """Test splicing sections in place."""
+
+    def test_insert_reindexes_following_sections(self):
+        document = parse_changelog(CHANGELOG).copy()
+        old_start = document.find("1.0.0").start
+
+        document.insert(old_start, ["## [1.0.1] - 2024-01-15", "", "### Fixed", "- Patch", ""])
+
+        assert document.find("1.0.1").start == old_start
+        assert document.find("1.0.0").start == old_start + 5
+        assert document.find("1.0.0").header == document.lines[old_start + 5]
+        assert document.text() == ChangelogDocument(document.text()).text()
+        # The shared parsed document is untouched
+        assert parse_changelog(CHANGELOG).find("1.0.1") is None
+
+    def test_replace_and_remove_section(self):
+        document = ChangelogDocument(CHANGELOG)
+
+        document.replace_section(document.find("1.1.0"), ["## [1.1.0] - 2024-02-02", "", "- Rewritten", ""])
+        document.remove_section(document.unreleased)
+
+        assert document.unreleased is None
+        assert document.find("1.1.0").header == "## [1.1.0] - 2024-02-02"
+        assert [section.start for section in document.sections] == [
+            section.start for section in ChangelogDocument(document.text()).sections
+        ]
+
+
+def insert_one_by_one(content: str, sections: list[tuple[str, str]]) -> str:
+    """The previous per-section insertion, as a reference."""
+    for version, text in sections:
+        lines = content.split("\n")
+        insert_point = find_insertion_point_by_version(content, version)
+        for j, line in enumerate(text.split("\n")):
+            lines.insert(insert_point + j, line)
+        content = "\n".join(lines)
+    return content
+
+
+def squeeze_blank_lines(content: str) -> str:
+    return re.sub(r"\n{3,}", "\n\n", content).rstrip("\n")
+
+
+class TestBatchInsertion:
+    """Test inserting many sections in one pass."""
+
+    def test_insert_many_matches_repeated_inserts(self):
+        batched = parse_changelog(CHANGELOG).copy()
+        sequential = parse_changelog(CHANGELOG).copy()
+        insertions = [
+            (4, ["## [Top]"]),
+            (9, ["## [2.0.0]", "", "- a"]),
+            (4, ["## [Second]", ""]),
+            (len(CHANGELOG), ["x"]),
+        ]
+
+        batched.insert_many(insertions)
+        offset = 0
+        for position, block in sorted(insertions, key=lambda insertion: insertion[0]):
+            sequential.insert(min(position, len(parse_changelog(CHANGELOG).lines)) + offset, block)
+            offset += len(block)
+
+        assert batched.text() == sequential.text()
+        assert [(s.header, s.start, s.end) for s in batched.sections] == [
+            (s.header, s.start, s.end) for s in ChangelogDocument(batched.text()).sections
+        ]
+        assert batched.find("2.0.0").start == batched.lines.index("## [2.0.0]")
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            CHANGELOG,
+            "# Changelog\n",
+            "# Changelog\n\n## [Unreleased]\n\n- Pending\n",
+            "# Changelog\n\n## [0.5.0] - 2023-01-01\n\n- Old\n\n## [0.1.0]\n\n- Oldest",
+        ],
+    )
+    def test_version_order_matches_one_by_one_insertion(self, content):
+        versions = ["0.3.0", "1.2.0", "v1.0.1", "0.0.1", "3.0.0", "1.0.0-rc.1", "0.6.0"]
+        random.Random(7).shuffle(versions)
+        sections = [
+            (version, f"## [{version.lstrip('v')}] - 2024-01-01\n\n### Added\n- {version}\n") for version in versions
+        ]
+
+        # Blank lines at the insertion gap may differ; write_changelog normalizes those
+        assert squeeze_blank_lines(insert_version_sections(content, sections)) == squeeze_blank_lines(
+            insert_one_by_one(content, sections)
+        )
+
+    @pytest.mark.parametrize("content", [CHANGELOG, "# Changelog\n\n"])
+    def test_mixed_numeric_and_named_tags(self, content):
+        sections = [(version, f"## [{version.lstrip('v')}]\n\n- {version}\n") for version in ["v1.0.0", "nightly"]]
+
+        merged = insert_version_sections(content, sections)
+
+        assert merged == insert_version_sections(content, sections[::-1])
+        assert squeeze_blank_lines(merged) == squeeze_blank_lines(insert_one_by_one(content, sections))
+        headers = [section.header for section in ChangelogDocument(merged).sections]
+        assert headers.index("## [nightly]") < headers.index("## [1.0.0]")
+
+    @pytest.mark.parametrize("content", [CHANGELOG, "# Changelog\n", "# Changelog\n\n## [Unreleased]\n\n- Pending\n"])
+    def test_single_version_inserts_match_one_by_one_insertion(self, content):
+        sections = [(version, f"## [{version}] - 2024-01-01\n\n- {version}") for version in ["0.3.0", "1.2.0", "0.0.1"]]
+        document = ChangelogDocument(content)
+
+        for version, text in sections:
+            insert_version_section(document, version, text)
+
+        assert document.text() == insert_one_by_one(content, sections)
+        assert [section.header for section in document.sections] == [
+            section.header for section in ChangelogDocument(document.text()).sections
+        ]
+
+    def test_single_inserts_at_one_position_match_batch(self):
+        content = "# Changelog\n\n## [Unreleased]\n\n- x\n\n## [2024-01-01]\n\n- y"
+        position = content.split("\n").index("## [2024-01-01]")
+        sections = ["## [2024-01-02]\n\n- a", "## [2024-01-03]\n\n- b"]
+        document = ChangelogDocument(content)
+
+        for text in sections:
+            insert_section_at(document, position, text)
+
+        assert document.text() == insert_sections_at(content, position, sections)
+
+    def test_sections_at_one_position_stack_newest_first(self):
+        content = "# Changelog\n\n## [Unreleased]\n\n- x\n\n## [2024-01-01]\n\n- y"
+        position = content.split("\n").index("## [2024-01-01]")
+
+        updated = insert_sections_at(content, position, ["## [2024-01-02]\n\n- a", "## [2024-01-03]\n\n- b"])
+
+        headers = [section.header for section in ChangelogDocument(updated).sections]
+        assert headers == ["## [Unreleased]", "## [2024-01-03]", "## [2024-01-02]", "## [2024-01-01]"]
+        assert "- b\n\n## [2024-01-02]\n\n- a\n\n## [2024-01-01]" in updated
@@ -0,0 +1,136 @@
+"""Tests for commit range helpers in commit_analyzer."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from kittylog import commit_index
+from kittylog.commit_analyzer import (
+    get_all_tags_with_dates,
+    get_commits_between_tags,
+    get_commits_by_date_boundaries,
+    get_commits_by_gap_boundaries,
+    partition_commits_by_boundaries,
+)
+from kittylog.errors import GitError
+from kittylog.mode_handlers.boundary import handle_update_all_mode
+
+
+def _hashes(commits):
+    return [commit["hash"] for commit in commits]
+
+
+class TestPartitionCommitsByBoundaries:
+    """Test single-pass partitioning of history into boundary buckets."""
+
+    def test_matches_pairwise_ranges(self, git_repo_with_tags):
+        """Test that each bucket equals the range from the previous boundary."""
+        boundaries = get_all_tags_with_dates()
+
+        buckets = partition_commits_by_boundaries(boundaries)
+
+        assert len(buckets) == len(boundaries)
+        previous = None
+        for boundary, bucket in zip(boundaries, buckets, strict=True):
+            assert bucket == get_commits_between_tags(previous, boundary["identifier"])
+            previous = boundary["identifier"]
+
+    def test_buckets_cover_history_once(self, git_repo_with_tags):
+        """Test that every commit up to the last boundary lands in exactly one bucket."""
+        boundaries = get_all_tags_with_dates()
+
+        buckets = partition_commits_by_boundaries(boundaries)
+
+        all_hashes = [h for bucket in buckets for h in _hashes(bucket)]
+        assert len(all_hashes) == len(set(all_hashes))
+        assert set(all_hashes) == set(_hashes(get_commits_between_tags(None, boundaries[-1]["identifier"])))
+
+    def test_only_populates_requested_buckets(self, git_repo_with_tags):
+        """Test that unrequested buckets are left empty."""
+        boundaries = get_all_tags_with_dates()
+
+        buckets = partition_commits_by_boundaries(boundaries, only=[1])
+
+        assert buckets[0] == []
+        assert buckets[1] == get_commits_between_tags(boundaries[0]["identifier"], boundaries[1]["identifier"])
+        assert buckets[2] == []
+
+    def test_merged_branch_assigned_to_first_reaching_boundary(self, git_repo):
+        """Test that commits merged in later belong to the boundary that first reaches them."""
+        repo = git_repo
+        work = Path(repo.working_dir)
+        main_branch = repo.active_branch
+
+        feature = repo.create_head("feature")
+        feature.checkout()
+        (work / "feature.py").write_text("feature\n")
+        repo.index.add(["feature.py"])
+        feature_commit = repo.index.commit("Add feature")
+
+        main_branch.checkout()
+        (work / "main.py").write_text("main\n")
+        repo.index.add(["main.py"])
+        first = repo.index.commit("Main change")
+        repo.git.merge("feature", "--no-ff", "-m", "Merge feature")
+        second = repo.head.commit
+
+        buckets = partition_commits_by_boundaries([{"hash": first.hexsha}, {"hash": second.hexsha}])
+
+        assert feature_commit.hexsha not in _hashes(buckets[0])
+        assert set(_hashes(buckets[1])) == {feature_commit.hexsha, second.hexsha}
+
+    def test_empty_boundaries(self):
+        """Test that no boundaries yield no buckets."""
+        assert partition_commits_by_boundaries([]) == []
+
+    def test_unknown_hash_raises_git_error(self, git_repo):
+        """Test that git failures surface as GitError."""
+        with pytest.raises(GitError):
+            partition_commits_by_boundaries([{"hash": "0" * 40}])
+
+
+class TestBoundaryDiscoveryIsMetadataOnly:
+    """Test that date and gap boundaries never read changed-file lists."""
+
+    def test_no_file_lists_read(self, git_repo_with_tags):
+        """Test that boundary discovery only walks commits."""
+        with (
+            patch.object(commit_index, "read_commit_files") as mock_index_read,
+            patch("kittylog.git_log.read_commit_files") as mock_git_read,
+        ):
+            assert get_commits_by_date_boundaries("daily")
+            assert get_commits_by_gap_boundaries(4.0)
+
+        mock_index_read.assert_not_called()
+        mock_git_read.assert_not_called()
+
+
+class TestUpdateAllUsesBuckets:
+    """Test that update_all generates each entry from its own commits."""
+
+    def test_entries_get_commits_since_previous_boundary(self, git_repo_with_tags, temp_dir):
+        """Test that each boundary sees only its own commits, not all history."""
+        changelog_file = temp_dir / "CHANGELOG.md"
+        changelog_file.write_text("# Changelog\n\n## [Unreleased]\n")
+        received = {}
+
+        def generate_entry(commits, tag, from_boundary=None, **kwargs):
+            received[tag] = (from_boundary, [commit["summary"] for commit in commits])
+            return f"### Added\n\n- {tag}"
+
+        with patch("kittylog.mode_handlers.boundary.partition_commits_by_boundaries") as mock_partition:
+            mock_partition.side_effect = partition_commits_by_boundaries
+            success, _content = handle_update_all_mode(
+                changelog_file=str(changelog_file),
+                generate_entry_func=generate_entry,
+                mode="tags",
+                quiet=True,
+                dry_run=True,
+            )
+
+        assert success
+        mock_partition.assert_called_once()
+        assert received["v0.1.0"] == (None, ["Add user authentication", "Initial commit"])
+        assert received["v0.2.0"] == ("v0.1.0", ["Add dashboard feature", "Fix login bug"])
+        assert received["v0.2.1"] == ("v0.2.0", ["Fix security issue", "Update documentation"])
@@ -0,0 +1,138 @@
+"""Tests for the persistent commit index."""
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from kittylog import commit_index
+from kittylog.commit_index import SCHEMA_VERSION, CommitIndex, find_index_path, get_indexed_commits
+from kittylog.git_log import get_log_commits
+
+
+def _add_commit(repo, name: str, message: str) -> str:
+    path = Path(repo.working_dir) / name
+    path.write_text(f"{message}\n")
+    repo.index.add([name])
+    return repo.index.commit(message).hexsha
+
+
+@pytest.fixture
+def index_path(git_repo):
+    """Location of the index inside the test repository."""
+    return Path(git_repo.git_dir) / "kittylog" / "commits.sqlite3"
+
+
+class TestFindIndexPath:
+    """Test index location discovery."""
+
+    def test_inside_repository(self, git_repo, index_path):
+        """Test that the index lives under the git directory."""
+        assert find_index_path() == index_path
+
+    def test_outside_repository(self, temp_dir):
+        """Test that no path is returned outside a repository."""
+        assert find_index_path(str(temp_dir)) is None
+
+
+class TestCommitIndex:
+    """Test CommitIndex storage and incremental updates."""
+
+    def test_round_trip_matches_git_log(self, git_repo, index_path):
+        """Test that stored commits equal freshly streamed ones."""
+        _add_commit(git_repo, "a.py", "feat: add a\n\nWith body")
+        _add_commit(git_repo, "b.py", "fix: b")
+
+        with CommitIndex(index_path) as index:
+            first = index.get_commits("HEAD")
+        with CommitIndex(index_path) as index:
+            second = index.get_commits("HEAD")
+            assert len(index) == 3
+
+        assert first == get_log_commits("HEAD")
+        assert second == first
+
+    def test_only_new_commits_are_parsed(self, git_repo, index_path):
+        """Test that a repeat query only reads commits added since the last run."""
+        _add_commit(git_repo, "a.py", "first")
+        with CommitIndex(index_path) as index:
+            index.get_commits("HEAD")
+
+        new_hash = _add_commit(git_repo, "b.py", "second")
+        with (
+            CommitIndex(index_path) as index,
+            patch.object(commit_index, "read_commits", wraps=commit_index.read_commits) as mock_read,
+        ):
+            commits = index.get_commits("HEAD")
+
+        mock_read.assert_called_once()
+        assert mock_read.call_args.args[0] == [new_hash]
+        assert commits[0]["hash"] == new_hash
+        assert len(commits) == 3
+
+    def test_ranges_are_served_from_index(self, git_repo, index_path):
+        """Test that sub-ranges are answered without reading git log."""
+        base = _add_commit(git_repo, "a.py", "first")
+        _add_commit(git_repo, "b.py", "second")
+        with CommitIndex(index_path) as index:
+            index.get_commits("HEAD")
+
+        with (
+            CommitIndex(index_path) as index,
+            patch.object(commit_index, "read_commits") as mock_read,
+        ):
+            commits = index.get_commits(f"{base}..HEAD")
+
+        mock_read.assert_not_called()
+        assert commits == get_log_commits(f"{base}..HEAD")
+
+    def test_file_lists_are_read_on_demand_and_stored(self, git_repo, index_path):
+        """Test that file lists are read in one batch when first used, then kept."""
+        _add_commit(git_repo, "a.py", "first")
+        _add_commit(git_repo, "b.py", "second")
+
+        with patch.object(commit_index, "read_commit_files", wraps=commit_index.read_commit_files) as mock_read:
+            with CommitIndex(index_path) as index:
+                commits = index.get_commits("HEAD")
+            mock_read.assert_not_called()
+
+            assert commits[0]["files"] == ["b.py"]
+            mock_read.assert_called_once()
+            assert sorted(mock_read.call_args.args[0]) == sorted(commit["hash"] for commit in commits)
+
+            assert commits[1]["files"] == ["a.py"]
+            with CommitIndex(index_path) as index:
+                assert index.get_commits("HEAD") == get_log_commits("HEAD")
+            mock_read.assert_called_once()
+
+    def test_schema_mismatch_rebuilds(self, git_repo, index_path):
+        """Test that an index from another schema version is discarded."""
+        with CommitIndex(index_path) as index:
+            index.get_commits("HEAD")
+        conn = sqlite3.connect(index_path)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+        conn.commit()
+        conn.close()
+
+        with CommitIndex(index_path) as index:
+            assert len(index) == 0
+            assert index.get_commits("HEAD") == get_log_commits("HEAD")
+
+
+class TestGetIndexedCommits:
+    """Test the index entry point used by commit_analyzer."""
+
+    def test_creates_index(self, git_repo, index_path):
+        """Test that the first query creates the index file."""
+        commits = get_indexed_commits("HEAD")
+
+        assert index_path.exists()
+        assert commits == get_log_commits("HEAD")
+
+    def test_falls_back_when_index_unusable(self, git_repo, index_path):
+        """Test that a corrupt database falls back to git log."""
+        index_path.parent.mkdir(parents=True)
+        index_path.write_bytes(b"not a sqlite database" * 10)
+
+        assert get_indexed_commits("HEAD") == get_log_commits("HEAD")
@@ -0,0 +1,162 @@
+"""Tests for the compact commit record type."""
+
+import pickle
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from kittylog.commit_analyzer import get_commits_by_date_boundaries, get_commits_by_gap_boundaries
+from kittylog.commit_record import CommitRecord, FileListLoader
+
+HASH = "c" * 40
+DATE = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=2)))
+
+
+def _record(**overrides) -> CommitRecord:
+    fields = {"message": "feat: add x\n\nBody", "author": "Jane Doe", "date": DATE, "files": ["a.py", "src/b.py"]}
+    fields.update(overrides)
+    return CommitRecord.from_datetime(HASH, fields["message"], fields["author"], fields["date"], fields["files"])
+
+
+class TestCommitRecord:
+    """Test the dict-compatible view and immutability of commit records."""
+
+    def test_equals_legacy_dictionary(self):
+        """Test that a record compares equal to the dictionary it replaces."""
+        expected = {
+            "hash": HASH,
+            "short_hash": HASH[:8],
+            "message": "feat: add x\n\nBody",
+            "author": "Jane Doe",
+            "date": DATE,
+            "summary": "feat: add x",
+            "files": ["a.py", "src/b.py"],
+        }
+
+        record = _record()
+
+        assert record == expected
+        assert expected == record
+        assert dict(record) == expected
+        assert record.to_dict() == expected
+
+    def test_date_keeps_utc_offset(self):
+        """Test that dates round-trip through the epoch timestamp with their offset."""
+        record = _record()
+
+        assert record.date == DATE
+        assert record.date.utcoffset() == timedelta(hours=2)
+        assert record["date"].isoformat() == DATE.isoformat()
+
+    def test_mapping_access(self):
+        """Test item access, get and membership like a dictionary."""
+        record = _record()
+
+        assert record["short_hash"] == HASH[:8]
+        assert record.get("files") == ["a.py", "src/b.py"]
+        assert record.get("identifier") is None
+        assert "files" in record
+        assert "boundary_type" not in record
+        with pytest.raises(KeyError):
+            record["identifier"]
+
+    def test_is_immutable(self):
+        """Test that records cannot be changed in place."""
+        record = _record()
+
+        with pytest.raises(TypeError):
+            record["identifier"] = "v1.0.0"  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            record.message = "changed"  # type: ignore[misc]
+
+    def test_files_are_materialised_per_access(self):
+        """Test that mutating a returned file list does not affect the record."""
+        record = _record()
+
+        record["files"].append("c.py")
+
+        assert record["files"] == ["a.py", "src/b.py"]
+        assert _record(files=[])["files"] == []
+
+    def test_authors_are_interned(self):
+        """Test that records of the same author share one string."""
+        first = _record(author="".join(["Jane", " Doe"]))
+        second = _record(author="".join(["Jane ", "Doe"]))
+
+        assert first.author is second.author
+
+    def test_summary_of_unstripped_message(self):
+        """Test that an explicit summary differing from the message is kept."""
+        record = CommitRecord(HASH, "fix: y", "Jane Doe", 0, summary="  fix: y")
+
+        assert record.summary == "  fix: y"
+        assert CommitRecord(HASH, "fix: y\n\nBody", "Jane Doe", 0, summary="fix: y").summary == "fix: y"
+
+    def test_pickle_round_trip(self):
+        """Test that records survive pickling despite being immutable."""
+        record = _record()
+
+        assert pickle.loads(pickle.dumps(record)) == record
+
+
+class TestFileListLoader:
+    """Test deferred, batched file lists."""
+
+    def test_first_access_loads_whole_batch(self):
+        """Test that one fetch serves every record sharing the loader."""
+        calls = []
+
+        def fetch(hashes):
+            calls.append(hashes)
+            return {hexsha: f"{hexsha[:1]}.py" for hexsha in hashes}
+
+        loader = FileListLoader(fetch)
+        records = [CommitRecord(letter * 40, "m", "Jane Doe", 0, files=loader) for letter in "abc"]
+
+        assert not any(record.files_loaded for record in records)
+        assert records[1]["files"] == ["b.py"]
+        assert all(record.files_loaded for record in records)
+        assert [record["files"] for record in records] == [["a.py"], ["b.py"], ["c.py"]]
+        assert calls == [["a" * 40, "b" * 40, "c" * 40]]
+
+    def test_pickle_materialises_files(self):
+        """Test that pickled records carry their file list instead of the loader."""
+        record = CommitRecord(HASH, "m", "Jane Doe", 0, files=FileListLoader(lambda hashes: {HASH: "x.py"}))
+
+        restored = pickle.loads(pickle.dumps(record))
+
+        assert restored.files_loaded
+        assert restored["files"] == ["x.py"]
+
+
+class TestBoundariesDoNotMutateCommits:
+    """Test that boundary detection leaves the cached commit records untouched."""
+
+    @pytest.fixture
+    def commits(self):
+        base = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        records = [
+            CommitRecord.from_datetime(f"{i:040x}", f"commit {i}", "Jane Doe", base + timedelta(hours=hours))
+            for i, hours in enumerate([0, 1, 30, 31])
+        ]
+        with patch("kittylog.commit_analyzer.get_all_commits_chronological", return_value=records):
+            yield records
+
+    def test_date_boundaries(self, commits):
+        """Test that date boundaries are new dicts carrying the boundary keys."""
+        boundaries = get_commits_by_date_boundaries(date_grouping="daily")
+
+        assert [boundary["hash"] for boundary in boundaries] == [commits[1].hash, commits[3].hash]
+        assert all(boundary["boundary_type"] == "date" for boundary in boundaries)
+        assert boundaries[0]["identifier"] == "2024-01-01"
+        assert all("identifier" not in commit for commit in commits)
+
+    def test_gap_boundaries(self, commits):
+        """Test that gap boundaries are new dicts carrying the boundary keys."""
+        boundaries = get_commits_by_gap_boundaries(gap_threshold_hours=4.0)
+
+        assert [boundary["hash"] for boundary in boundaries] == [commits[0].hash, commits[2].hash]
+        assert all(boundary["boundary_type"] == "gap" for boundary in boundaries)
+        assert [boundary["identifier"] for boundary in boundaries] == ["2024-01-01", "2024-01-02"]
+        assert all("boundary_type" not in commit for commit in commits)
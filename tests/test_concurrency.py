@@ -0,0 +1,332 @@
+"""Tests for concurrent changelog entry generation."""
+
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from kittylog.cli import update_cli
+from kittylog.concurrency import map_in_order
+from kittylog.config import load_config, reset_env_files_cache
+from kittylog.mode_handlers.boundary import handle_update_all_mode
+from kittylog.mode_handlers.missing import handle_missing_entries_mode
+from kittylog.providers.base import ProviderConfig
+from kittylog.providers.registry import create_provider_func, get_provider_semaphore
+from kittylog.workflow import _create_entry_generator
+
+BOUNDARIES = [
+    {"name": f"v0.{n}.0", "identifier": f"v0.{n}.0", "date": datetime(2024, n, 1, tzinfo=timezone.utc)}
+    for n in range(1, 6)
+]
+
+
+def slow_first_generator(commits, tag, from_boundary=None, **kwargs):
+    """Entry generator where older boundaries take longer, so completion order is reversed."""
+    time.sleep(0.02 * (6 - int(tag.split(".")[1])))
+    return f"### Added\n\n- Changes for {tag}"
+
+
+class TestMapInOrder:
+    """Test the ordered bounded executor."""
+
+    @pytest.mark.parametrize("jobs", [1, 4])
+    def test_results_in_input_order(self, jobs):
+        """Test that results come back in input order regardless of completion order."""
+
+        def work(n):
+            time.sleep(0.01 * (5 - n))
+            return n * n
+
+        results = [(item, future.result()) for item, future in map_in_order(work, range(5), jobs)]
+
+        assert results == [(n, n * n) for n in range(5)]
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_exceptions_are_captured_per_item(self, jobs):
+        """Test that one failing item does not stop the others."""
+
+        def work(n):
+            if n == 1:
+                raise ValueError("boom")
+            return n
+
+        outcomes = list(map_in_order(work, [0, 1, 2], jobs))
+
+        assert outcomes[0][1].result() == 0
+        with pytest.raises(ValueError, match="boom"):
+            outcomes[1][1].result()
+        assert outcomes[2][1].result() == 2
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than ``jobs`` calls run at once."""
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def work(_):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+
+        list(map_in_order(work, range(12), jobs=3))
+
+        assert 1 < peak <= 3
+
+    def test_sequential_mode_is_lazy(self):
+        """Test that jobs=1 only runs an item when the consumer asks for it."""
+        calls = []
+
+        results = map_in_order(calls.append, [1, 2, 3], jobs=1)
+        next(results)
+
+        assert calls == [1]
+
+
+class TestConcurrentModeHandlers:
+    """Test that concurrent generation keeps version order and incremental saves."""
+
+    def _run_missing(self, changelog_file, jobs):
+        saved = []
+        with (
+            patch("kittylog.tag_operations.get_all_boundaries", return_value=BOUNDARIES),
+            patch(
+                "kittylog.mode_handlers.missing.partition_commits_by_boundaries",
+                side_effect=lambda boundaries, only=None: [[{"hash": "abc"}] for _ in boundaries],
+            ),
+            patch("kittylog.mode_handlers.missing.get_tag_date", return_value=datetime(2024, 1, 1)),
+            patch("kittylog.changelog.io.write_changelog", side_effect=lambda _path, content: saved.append(content)),
+        ):
+            success, content = handle_missing_entries_mode(
+                changelog_file=str(changelog_file),
+                generate_entry_func=slow_first_generator,
+                quiet=True,
+                jobs=jobs,
+            )
+        assert success
+        return content, saved
+
+    def test_missing_mode_matches_sequential_output(self, temp_dir):
+        """Test that jobs > 1 produces the same changelog and saves as jobs = 1."""
+        changelog_file = temp_dir / "CHANGELOG.md"
+        changelog_file.write_text("# Changelog\n\n## [Unreleased]\n\n")
+
+        sequential_content, sequential_saves = self._run_missing(changelog_file, jobs=1)
+        concurrent_content, concurrent_saves = self._run_missing(changelog_file, jobs=4)
+
+        assert concurrent_content == sequential_content
+        assert concurrent_saves == sequential_saves
+        assert len(concurrent_saves) == len(BOUNDARIES)
+        # Each incremental save adds exactly the next version in order
+        for n, saved in enumerate(concurrent_saves, start=1):
+            assert f"## [0.{n}.0]" in saved
+            assert f"## [0.{n + 1}.0]" not in saved
+
+    def test_update_all_mode_keeps_version_order(self, temp_dir):
+        """Test that update_all inserts entries newest first when generated concurrently."""
+        changelog_file = temp_dir / "CHANGELOG.md"
+        changelog_file.write_text("# Changelog\n\n## [Unreleased]\n\n")
+
+        with (
+            patch("kittylog.mode_handlers.boundary.get_all_boundaries", return_value=BOUNDARIES),
+            patch(
+                "kittylog.mode_handlers.boundary.partition_commits_by_boundaries",
+                side_effect=lambda boundaries: [[{"hash": "abc"}] for _ in boundaries],
+            ),
+        ):
+            success, content = handle_update_all_mode(
+                changelog_file=str(changelog_file),
+                generate_entry_func=slow_first_generator,
+                mode="tags",
+                quiet=True,
+                dry_run=True,
+                jobs=5,
+            )
+
+        assert success
+        positions = [content.find(f"## [0.{n}.0]") for n in range(5, 0, -1)]
+        assert all(pos >= 0 for pos in positions)
+        assert positions == sorted(positions)
+
+    def test_failed_boundary_does_not_block_others(self, temp_dir):
+        """Test that an AI failure for one boundary is reported while the rest are written."""
+        from kittylog.errors import AIError
+
+        changelog_file = temp_dir / "CHANGELOG.md"
+        changelog_file.write_text("# Changelog\n\n## [Unreleased]\n\n")
+
+        def generate(commits, tag, from_boundary=None, **kwargs):
+            if tag == "v0.2.0":
+                raise AIError.generation_error("provider down")
+            return f"### Added\n\n- Changes for {tag}"
+
+        with (
+            patch("kittylog.tag_operations.get_all_boundaries", return_value=BOUNDARIES),
+            patch(
+                "kittylog.mode_handlers.missing.partition_commits_by_boundaries",
+                side_effect=lambda boundaries, only=None: [[{"hash": "abc"}] for _ in boundaries],
+            ),
+            patch("kittylog.mode_handlers.missing.get_tag_date", return_value=None),
+        ):
+            success, content = handle_missing_entries_mode(
+                changelog_file=str(changelog_file),
+                generate_entry_func=generate,
+                quiet=True,
+                dry_run=True,
+                jobs=3,
+            )
+
+        assert not success
+        assert "## [0.2.0]" not in content
+        assert all(f"## [0.{n}.0]" in content for n in (1, 3, 4, 5))
+
+
+class TestSessionContextOrdering:
+    """Test session-context deduplication with positioned entries."""
+
+    def _generator(self, contexts):
+        def fake_generate(**kwargs):
+            contexts[kwargs["tag"]] = kwargs["session_context"]
+            return f"### Added\n\n- Item from {kwargs['tag']}", {}
+
+        patcher = patch("kittylog.workflow.generate_changelog_entry", side_effect=fake_generate)
+        patcher.start()
+        generator = _create_entry_generator(
+            model="openai:gpt-4",
+            hint="",
+            show_prompt=False,
+            quiet=True,
+            include_diff=False,
+            language=None,
+            translate_headings=False,
+            audience=None,
+        )
+        return generator, patcher
+
+    def test_sequential_calls_accumulate(self):
+        """Test that calls without positions see everything generated before them."""
+        contexts = {}
+        generator, patcher = self._generator(contexts)
+        try:
+            generator(commits=[], tag="v1")
+            generator(commits=[], tag="v2")
+            generator(commits=[], tag="v3")
+        finally:
+            patcher.stop()
+
+        assert contexts["v1"] == ""
+        assert "- Item from v1" in contexts["v2"]
+        assert contexts["v3"].index("Item from v1") < contexts["v3"].index("Item from v2")
+
+    def test_only_earlier_positions_are_included(self):
+        """Test that out-of-order completion never leaks later entries into earlier ones."""
+        contexts = {}
+        generator, patcher = self._generator(contexts)
+        try:
+            # Position 2 finishes first, then position 0, then position 1
+            generator(commits=[], tag="v3", position=2)
+            generator(commits=[], tag="v1", position=0)
+            generator(commits=[], tag="v2", position=1)
+            generator(commits=[], tag="unreleased")
+        finally:
+            patcher.stop()
+
+        assert contexts["v3"] == ""
+        assert contexts["v1"] == ""
+        assert "Item from v1" in contexts["v2"]
+        assert "Item from v3" not in contexts["v2"]
+        unreleased = contexts["unreleased"]
+        assert unreleased.index("Item from v1") < unreleased.index("Item from v2") < unreleased.index("Item from v3")
+
+
+class TestProviderConcurrencyCap:
+    """Test per-provider limits on in-flight requests."""
+
+    def test_provider_calls_respect_max_concurrency(self):
+        """Test that concurrent calls to one provider never exceed its cap."""
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        class CappedProvider:
+            config = ProviderConfig(name="Capped Test", api_key_env="", base_url="", max_concurrency=2)
+
+            def __init__(self, config):
+                self.config = config
+
+            def generate(self, model, messages, temperature, max_tokens, **kwargs):
+                nonlocal running, peak
+                with lock:
+                    running += 1
+                    peak = max(peak, running)
+                time.sleep(0.02)
+                with lock:
+                    running -= 1
+                return "ok"
+
+            def generate_stream(self, **kwargs):
+                yield "ok", None
+
+        provider_func = create_provider_func(CappedProvider)
+        results = list(
+            map_in_order(lambda _: provider_func("model", [], temperature=0.0, max_tokens=10), range(8), jobs=8)
+        )
+
+        assert [future.result() for _, future in results] == ["ok"] * 8
+        assert peak == 2
+
+    def test_local_providers_are_serialized(self):
+        """Test that local model servers allow one request at a time."""
+        from kittylog.providers.lmstudio import LMStudioProvider
+        from kittylog.providers.ollama import OllamaProvider
+
+        for provider_class in (OllamaProvider, LMStudioProvider):
+            semaphore = get_provider_semaphore(provider_class)
+            assert semaphore.acquire(blocking=False)
+            try:
+                assert not semaphore.acquire(blocking=False)
+            finally:
+                semaphore.release()
+
+
+class TestJobsOption:
+    """Test how the jobs setting is configured."""
+
+    @patch("kittylog.cli.main_business_logic", return_value=(True, None))
+    def test_cli_jobs_option(self, mock_main_logic):
+        """Test that --jobs reaches the workflow options."""
+        result = CliRunner().invoke(update_cli, ["--no-interactive", "--quiet", "--jobs", "4"])
+
+        assert result.exit_code == 0
+        assert mock_main_logic.call_args[1]["workflow_opts"].jobs == 4
+
+    def test_cli_rejects_zero_jobs(self):
+        """Test that --jobs must be positive."""
+        result = CliRunner().invoke(update_cli, ["--no-interactive", "--quiet", "--jobs", "0"])
+
+        assert result.exit_code != 0
+
+    @patch("kittylog.cli.main_business_logic", return_value=(True, None))
+    def test_cli_falls_back_to_config(self, mock_main_logic, isolated_config_test, monkeypatch):
+        """Test that KITTYLOG_JOBS is used when --jobs is not given."""
+        monkeypatch.setenv("KITTYLOG_JOBS", "3")
+        reset_env_files_cache()
+
+        result = CliRunner().invoke(update_cli, ["--no-interactive", "--quiet"])
+
+        assert result.exit_code == 0
+        assert mock_main_logic.call_args[1]["workflow_opts"].jobs == 3
+
+    @pytest.mark.parametrize(("value", "expected"), [("6", 6), ("0", 1), ("many", 1)])
+    def test_load_config_jobs(self, isolated_config_test, monkeypatch, value, expected):
+        """Test that KITTYLOG_JOBS is parsed with a minimum of one."""
+        monkeypatch.setenv("KITTYLOG_JOBS", value)
+        reset_env_files_cache()
+
+        assert load_config().jobs == expected
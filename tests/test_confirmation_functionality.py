@@ -171,7 +171,7 @@ All notable changes will be documented in this file.
             os.chdir(original_cwd)
 
     @patch("os.getenv", return_value="")
-    @patch("httpx.post")
+    @patch("kittylog.providers.http_client.post")
     @patch(
         "kittylog.ai.load_config",
     )
@@ -0,0 +1,189 @@
+"""Tests for budget-aware diff hunk selection."""
+
+from pathlib import Path
+
+import pytest
+
+from kittylog.commit_analyzer import get_git_diff
+from kittylog.diff_selection import (
+    FileKind,
+    FilePatch,
+    Hunk,
+    classify_path,
+    parse_patch,
+    score_hunk,
+    select_hunks,
+)
+from kittylog.tokenizer import count_tokens
+
+MODEL = "openai:gpt-4"
+
+PATCH = """diff --git a/src/app.py b/src/app.py
+index 1111111..2222222 100644
+--- a/src/app.py
++++ b/src/app.py
+@@ -1,3 +1,4 @@ import os
+ import sys
++def main():
++    return run()
+ x = 1
+@@ -20,2 +21,2 @@ def helper():
+-# old comment
++# new comment
+diff --git a/logo.png b/logo.png
+new file mode 100644
+Binary files /dev/null and b/logo.png differ
+diff --git a/old.py b/new.py
+similarity index 100%
+rename from old.py
+rename to new.py"""
+
+
+def _patch(path: str, *hunks: list[str]) -> FilePatch:
+    return FilePatch(
+        path,
+        f"diff --git a/{path} b/{path}\n--- a/{path}\n+++ b/{path}",
+        [Hunk(f"@@ -{i},1 +{i},1 @@", lines) for i, lines in enumerate(hunks, 1)],
+    )
+
+
+class TestClassifyPath:
+    """Test file classification by path."""
+
+    @pytest.mark.parametrize(
+        ("path", "kind"),
+        [
+            ("src/kittylog/cli.py", FileKind.SOURCE),
+            ("package-lock.json", FileKind.LOCKFILE),
+            ("frontend/yarn.lock", FileKind.LOCKFILE),
+            ("go.sum", FileKind.LOCKFILE),
+            ("vendor/github.com/pkg/errors/errors.go", FileKind.VENDORED),
+            ("web/node_modules/left-pad/index.js", FileKind.VENDORED),
+            ("static/app.min.js", FileKind.GENERATED),
+            ("api/service_pb2.py", FileKind.GENERATED),
+            ("dist/bundle.js", FileKind.GENERATED),
+            ("tests/test_cli.py", FileKind.TEST),
+            ("pkg/server_test.go", FileKind.TEST),
+            ("web/src/app.spec.ts", FileKind.TEST),
+            ("src/test/java/AppTest.java", FileKind.TEST),
+        ],
+    )
+    def test_kinds(self, path, kind):
+        """Test that common layouts are recognised."""
+        assert classify_path(path) == kind
+
+
+class TestParsePatch:
+    """Test splitting patches into files and hunks."""
+
+    def test_files_and_hunks(self):
+        """Test that headers, hunks, binaries and renames are separated."""
+        patches = parse_patch(PATCH)
+
+        assert [patch.path for patch in patches] == ["src/app.py", "logo.png", "new.py"]
+        app = patches[0]
+        assert app.header == "diff --git a/src/app.py b/src/app.py\n--- a/src/app.py\n+++ b/src/app.py"
+        assert [hunk.header for hunk in app.hunks] == ["@@ -1,3 +1,4 @@ import os", "@@ -20,2 +21,2 @@ def helper():"]
+        assert app.hunks[0].lines == [" import sys", "+def main():", "+    return run()", " x = 1"]
+        assert patches[1].hunks == []
+        assert "rename to new.py" in patches[2].header
+
+    def test_empty(self):
+        """Test that an empty patch has no files."""
+        assert parse_patch("") == []
+
+
+class TestScoreHunk:
+    """Test hunk significance."""
+
+    def test_comment_only_hunk_scores_zero(self):
+        """Test that comment and blank line churn is ignored."""
+        hunk = parse_patch(PATCH)[0].hunks[1]
+
+        assert score_hunk(hunk, FileKind.SOURCE) == 0
+
+    def test_definitions_and_kind_weight(self):
+        """Test that definitions raise the score and tests weigh less than source."""
+        plain = Hunk("@@", ["+x = compute()", "+y = x + 1"])
+        definition = Hunk("@@", ["+def compute():", "+    return 1"])
+
+        assert score_hunk(definition, FileKind.SOURCE) > score_hunk(plain, FileKind.SOURCE)
+        assert score_hunk(plain, FileKind.TEST) < score_hunk(plain, FileKind.SOURCE)
+        assert score_hunk(plain, FileKind.LOCKFILE) == 0
+
+    def test_markdown_headings_and_bullets_count_in_prose(self):
+        """Test that "#" and "*" lines of documentation are not mistaken for comments."""
+        hunk = Hunk("@@", ["+# Installation", "+* Run `pip install kittylog`", "+<!-- badge -->"])
+
+        assert score_hunk(hunk, FileKind.SOURCE) == 0
+        assert score_hunk(hunk, FileKind.SOURCE, prose=True) > 0
+        assert parse_patch("diff --git a/README.md b/README.md\n+++ b/README.md\n@@ -0,0 +1 @@\n+# X")[0].is_prose
+
+
+class TestSelectHunks:
+    """Test packing hunks under a budget."""
+
+    def test_best_hunks_in_diff_order(self):
+        """Test that low-value hunks are dropped and the rest keep their order."""
+        patches = [
+            _patch("tests/test_a.py", ["+assert True"]),
+            _patch("src/a.py", ["+# comment"], ["+def feature():", "+    return 1"]),
+        ]
+
+        selection = select_hunks(
+            patches, MODEL, token_budget=1000, per_file_tokens=1000, max_chars=10_000, max_lines=100
+        )
+
+        assert selection.text.index("tests/test_a.py") < selection.text.index("def feature")
+        assert "# comment" not in selection.text
+        assert not selection.truncated
+
+    def test_per_file_cap_spreads_budget(self):
+        """Test that one large file cannot use the whole budget."""
+        big = _patch("src/big.py", [f"+value_{i} = compute({i})" for i in range(500)])
+        small = _patch("src/small.py", ["+def small():", "+    return 1"])
+
+        selection = select_hunks(
+            [big, small], MODEL, token_budget=400, per_file_tokens=200, max_chars=100_000, max_lines=1000
+        )
+
+        assert "def small" in selection.text
+        assert selection.truncated
+        assert count_tokens(selection.text, MODEL) <= 400
+        assert "value_0 = compute(0)" in selection.text
+        assert "value_499" not in selection.text
+
+    def test_char_and_line_budgets(self):
+        """Test that the character and line limits are honoured."""
+        patches = [_patch(f"src/m{i}.py", [f"+line_{j} = {j}" for j in range(50)]) for i in range(5)]
+
+        selection = select_hunks(
+            patches, MODEL, token_budget=10_000, per_file_tokens=10_000, max_chars=800, max_lines=40
+        )
+
+        assert len(selection.text) <= 800
+        assert len(selection.text.splitlines()) <= 40
+        assert selection.truncated
+
+
+class TestGetGitDiffSelection:
+    """Test diff selection against a real repository."""
+
+    def test_lockfiles_and_vendored_code_are_not_shown(self, git_repo):
+        """Test that source changes are shown even when bulk files sort first."""
+        base = git_repo.head.commit.hexsha
+        Path("package-lock.json").write_text("".join(f'  "dep{i}": "1.0.{i}",\n' for i in range(3000)))
+        Path("vendor").mkdir()
+        Path("vendor/lib.js").write_text("var a = 1;\n" * 2000)
+        Path("app.py").write_text("def main():\n    return run()\n")
+        git_repo.git.add(A=True)
+        git_repo.git.commit("-m", "Add app")
+
+        diff = get_git_diff(base, None, model=MODEL)
+
+        stat, note, patch = diff.split("\n\n", 2)
+        assert "package-lock.json" in stat and "vendor/lib.js" in stat
+        assert note == "Not shown below (see the diffstat): 1 lockfile, 1 vendored files"
+        assert patch.startswith("diff --git a/app.py b/app.py")
+        assert "+def main():" in patch
+        assert '"dep0"' not in diff
@@ -0,0 +1,167 @@
+"""Tests for size-capped diff reading and structured diffstats."""
+
+from pathlib import Path
+
+from kittylog.commit_analyzer import get_git_diff
+from kittylog.git_diff import (
+    TRUNCATION_NOTE,
+    DiffExcerpt,
+    DiffStat,
+    FileDiffStat,
+    format_diff_for_prompt,
+    parse_diffstat,
+    read_diff_excerpt,
+    read_diffstat,
+)
+
+
+def _commit_all(repo, message: str) -> str:
+    repo.git.add(A=True)
+    repo.git.commit("-m", message)
+    return repo.head.commit.hexsha
+
+
+class TestParseDiffstat:
+    """Test parsing of ``git diff --raw --numstat -z`` output."""
+
+    def test_modified_renamed_and_binary(self):
+        """Test that statuses, counts, renames and binary markers are combined."""
+        output = (
+            b":100644 100644 1111111 2222222 M\0src/a.py\0"
+            b":100644 100644 3333333 3333333 R100\0old.py\0new.py\0"
+            b":000000 100644 0000000 4444444 A\0logo.png\0"
+            b"3\t1\tsrc/a.py\0"
+            b"0\t0\t\0old.py\0new.py\0"
+            b"-\t-\tlogo.png\0"
+        )
+
+        stat = parse_diffstat(output)
+
+        assert stat.files == [
+            FileDiffStat(path="src/a.py", status="M", added=3, deleted=1),
+            FileDiffStat(path="new.py", status="R", added=0, deleted=0, old_path="old.py"),
+            FileDiffStat(path="logo.png", status="A", added=None, deleted=None),
+        ]
+        assert stat.files[2].binary
+        assert (stat.added, stat.deleted) == (3, 1)
+
+    def test_empty_output(self):
+        """Test that an empty diff has no entries."""
+        assert parse_diffstat(b"").files == []
+        assert DiffStat().format() == ""
+
+
+class TestDiffStatFormat:
+    """Test rendering of diffstats for the prompt."""
+
+    def test_largest_changes_first_and_capped(self):
+        """Test that files are ranked by churn and the remainder is counted."""
+        stat = DiffStat(
+            [
+                FileDiffStat(path="small.py", status="M", added=1, deleted=0),
+                FileDiffStat(path="image.png", status="A", added=None, deleted=None),
+                FileDiffStat(path="big.py", status="M", added=50, deleted=20),
+            ]
+        )
+
+        text = stat.format(max_files=2)
+
+        assert text.splitlines() == [
+            "3 files changed, +51 -20, 1 binary",
+            "M big.py (+50 -20)",
+            "M small.py (+1 -0)",
+            "... and 1 more files",
+        ]
+
+    def test_prompt_text_notes_truncation(self):
+        """Test that a cut excerpt is marked after the diffstat."""
+        stat = DiffStat([FileDiffStat(path="a.py", status="M", added=1, deleted=1)])
+
+        text = format_diff_for_prompt(stat, DiffExcerpt("diff --git a/a.py b/a.py", truncated=True))
+
+        assert text.startswith("Diffstat:\n1 files changed")
+        assert text.endswith(TRUNCATION_NOTE)
+
+
+class TestReadDiff:
+    """Test reading diffs from a real repository."""
+
+    def test_excerpt_stops_at_budget(self, git_repo):
+        """Test that only the budgeted part of a large diff is kept."""
+        base = git_repo.head.commit.hexsha
+        Path("big.txt").write_text("".join(f"line {i}\n" for i in range(50_000)))
+        _commit_all(git_repo, "Add big file")
+
+        excerpt = read_diff_excerpt(f"{base}..HEAD", max_chars=1000, max_lines=10_000)
+
+        assert excerpt.truncated
+        assert len(excerpt.text) <= 1000
+        assert excerpt.text.startswith("diff --git a/big.txt b/big.txt")
+
+    def test_excerpt_line_budget(self, git_repo):
+        """Test that the line budget is honoured."""
+        base = git_repo.head.commit.hexsha
+        Path("lines.txt").write_text("".join(f"{i}\n" for i in range(100)))
+        _commit_all(git_repo, "Add lines")
+
+        excerpt = read_diff_excerpt(f"{base}..HEAD", max_chars=100_000, max_lines=20)
+
+        assert excerpt.truncated
+        assert len(excerpt.text.splitlines()) == 20
+
+    def test_small_diff_is_complete(self, git_repo):
+        """Test that a diff within budget is returned whole."""
+        base = git_repo.head.commit.hexsha
+        Path("README.md").write_text("# Changed\n")
+        _commit_all(git_repo, "Edit readme")
+
+        excerpt = read_diff_excerpt(f"{base}..HEAD", max_chars=100_000, max_lines=500)
+
+        assert not excerpt.truncated
+        assert excerpt.text == git_repo.git.diff(base, "HEAD")
+
+    def test_diff_of_exactly_max_lines_is_complete(self, git_repo):
+        """Test that a diff ending right at the line budget is not reported as cut."""
+        base = git_repo.head.commit.hexsha
+        Path("README.md").write_text("# Changed\n")
+        _commit_all(git_repo, "Edit readme")
+        diff = git_repo.git.diff(base, "HEAD")
+        line_count = len(diff.split("\n"))
+
+        exact = read_diff_excerpt(f"{base}..HEAD", max_chars=100_000, max_lines=line_count)
+        short = read_diff_excerpt(f"{base}..HEAD", max_chars=100_000, max_lines=line_count - 1)
+
+        assert exact == DiffExcerpt(diff, truncated=False)
+        assert short.truncated
+        assert short.text == "\n".join(diff.split("\n")[:-1])
+
+    def test_diffstat_reports_renames(self, git_repo):
+        """Test that renames are detected with their source path."""
+        base = git_repo.head.commit.hexsha
+        Path("README.md").rename("README.rst")
+        _commit_all(git_repo, "Rename readme")
+
+        stat = read_diffstat(f"{base}..HEAD")
+
+        assert stat.files == [FileDiffStat(path="README.rst", status="R", added=0, deleted=0, old_path="README.md")]
+
+
+class TestGetGitDiff:
+    """Test the commit_analyzer entry point."""
+
+    def test_respects_max_chars_and_lists_all_files(self, git_repo):
+        """Test that the diffstat names every file while the patch is cut."""
+        base = git_repo.head.commit.hexsha
+        for i in range(5):
+            Path(f"file_{i}.txt").write_text("x\n" * 2000)
+        _commit_all(git_repo, "Add files")
+
+        diff = get_git_diff(base, None, max_chars=2000)
+
+        assert len(diff) <= 2000
+        assert all(f"file_{i}.txt" in diff.split("\n\n", 1)[0] for i in range(5))
+        assert diff.endswith(TRUNCATION_NOTE)
+
+    def test_invalid_range_returns_empty(self, git_repo):
+        """Test that git failures produce an empty diff."""
+        assert get_git_diff("v9.9.9", "HEAD") == ""
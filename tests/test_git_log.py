@@ -0,0 +1,204 @@
+"""Tests for streaming commit ingestion from git log."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import git
+import pytest
+
+from kittylog import git_log
+from kittylog.commit_analyzer import (
+    get_all_commits_chronological,
+    get_commits_between_hashes,
+    get_commits_between_tags,
+)
+from kittylog.commit_record import FileListLoader
+from kittylog.errors import GitError
+from kittylog.git_log import build_log_command, get_log_commits, iter_log_commits, lazy_files, parse_log_stream
+
+HASH_A = "a" * 40
+HASH_B = "b" * 40
+
+
+def _record(hexsha: str, message: str, entries: list[bytes]) -> bytes:
+    """Build one raw record the way ``git log -z --name-status`` emits it."""
+    header = b"\0" + b"\0".join([hexsha.encode(), b"Jane Doe", b"2024-01-02T03:04:05+01:00", message.encode()]) + b"\0"
+    if not entries:
+        return header
+    return header + b"\n" + b"\0".join(entries) + b"\0"
+
+
+def _legacy_commits(repo: git.Repo, rev: str) -> list[dict]:
+    """Reproduce the per-commit GitPython extraction used before streaming."""
+    commits = []
+    for commit in repo.iter_commits(rev):
+        parent = commit.parents[0] if commit.parents else git.NULL_TREE
+        commits.append(
+            {
+                "hash": commit.hexsha,
+                "short_hash": commit.hexsha[:8],
+                "message": commit.message.strip(),
+                "author": str(commit.author),
+                "date": commit.committed_datetime,
+                "summary": commit.summary,
+                "files": [item.a_path for item in commit.diff(parent, create_patch=False)],
+            }
+        )
+    return commits
+
+
+def _commit(repo: git.Repo, message: str) -> None:
+    repo.git.add(A=True)
+    repo.git.commit("-m", message, "--allow-empty", "--allow-empty-message")
+
+
+class TestParseLogStream:
+    """Test the raw record parser."""
+
+    def test_parses_fields_and_files(self):
+        """Test that header fields and changed files are extracted."""
+        data = _record(HASH_A, "feat: add thing\n\nLonger body\n", [b"M", b"src/a.py", b"A", b"src/b.py"])
+
+        commits = list(parse_log_stream([data]))
+
+        assert len(commits) == 1
+        commit = commits[0]
+        assert commit["hash"] == HASH_A
+        assert commit["short_hash"] == HASH_A[:8]
+        assert commit["author"] == "Jane Doe"
+        assert commit["summary"] == "feat: add thing"
+        assert commit["message"] == "feat: add thing\n\nLonger body"
+        assert commit["date"].isoformat() == "2024-01-02T03:04:05+01:00"
+        assert commit["files"] == ["src/a.py", "src/b.py"]
+
+    def test_rename_reports_new_path_in_source_order(self):
+        """Test that renames list the new path, ordered by the old one."""
+        data = _record(HASH_A, "rename", [b"M", b"b", b"R100", b"a", b"c"])
+
+        commits = list(parse_log_stream([data]))
+
+        assert commits[0]["files"] == ["c", "b"]
+
+    def test_multiple_records_and_empty_commits(self):
+        """Test records without files and with empty messages."""
+        data = _record(HASH_A, "", []) + _record(HASH_B, "second\n", [b"D", b"gone.txt"])
+
+        commits = list(parse_log_stream([data]))
+
+        assert [c["hash"] for c in commits] == [HASH_A, HASH_B]
+        assert commits[0]["message"] == ""
+        assert commits[0]["files"] == []
+        assert commits[1]["files"] == ["gone.txt"]
+
+    def test_tokens_split_across_chunks(self):
+        """Test that tokens spanning read boundaries are reassembled."""
+        data = _record(HASH_A, "first", [b"A", b"one.txt"]) + _record(HASH_B, "second", [b"A", b"two.txt"])
+        chunks = [data[i : i + 7] for i in range(0, len(data), 7)]
+
+        assert list(parse_log_stream(chunks)) == list(parse_log_stream([data]))
+
+    def test_invalid_utf8_is_replaced(self):
+        """Test that undecodable bytes do not abort parsing."""
+        data = _record(HASH_A, "msg", [b"A", b"bad\xffname"])
+
+        commits = list(parse_log_stream([data]))
+
+        assert commits[0]["files"] == ["bad�name"]
+
+    def test_records_without_diff_section_defer_to_loader(self):
+        """Test that output read without file lists takes them from the loader."""
+        data = _record(HASH_A, "first", []) + _record(HASH_B, "", [])
+        fetched = []
+
+        def fetch(hashes):
+            fetched.append(hashes)
+            return {HASH_A: "a.py", HASH_B: "b.py\0c.py"}
+
+        commits = list(parse_log_stream([data], files=FileListLoader(fetch)))
+
+        assert not fetched
+        assert commits[1]["files"] == ["b.py", "c.py"]
+        assert commits[0]["files"] == ["a.py"]
+        assert fetched == [[HASH_A, HASH_B]]
+
+
+class TestBuildLogCommand:
+    """Test the git log command line."""
+
+    def test_metadata_only_skips_tree_diffs(self):
+        """Test that file lists are only requested when wanted."""
+        assert "--name-status" in build_log_command("HEAD")
+        assert "--name-status" not in build_log_command("HEAD", with_files=False)
+
+
+class TestGitLogIntegration:
+    """Test streaming ingestion against a real repository."""
+
+    @pytest.fixture
+    def history_repo(self, git_repo):
+        """Repository with renames, deletions, unicode names and a merge."""
+        repo = git_repo
+        work = Path(repo.working_dir)
+
+        for name in ("a.txt", "b.txt", "sp ace.txt"):
+            (work / name).write_text(f"{name}\n" * 20)
+        _commit(repo, "Add files")
+
+        (work / "b.txt").write_text("changed\n")
+        (work / "a.txt").rename(work / "z.txt")
+        _commit(repo, "Rename and modify")
+
+        (work / "sp ace.txt").unlink()
+        (work / "ünïcode ✓.txt").write_text("x\n")
+        _commit(repo, "Delete and unicode\n\nWith a body")
+        repo.create_tag("v1.0.0")
+
+        main_branch = repo.active_branch
+        side = repo.create_head("side")
+        side.checkout()
+        (work / "side.txt").write_text("side\n")
+        _commit(repo, "Side work")
+        main_branch.checkout()
+        (work / "main.txt").write_text("main\n")
+        _commit(repo, "Main work")
+        repo.git.merge("side", "--no-ff", "-m", "Merge side")
+        _commit(repo, "")  # no files and no message
+        return repo
+
+    def test_matches_gitpython_extraction(self, history_repo):
+        """Test that streamed commits equal the GitPython-derived dictionaries."""
+        for rev in ("HEAD", "v1.0.0..HEAD", "v1.0.0", "side"):
+            assert get_log_commits(rev) == _legacy_commits(history_repo, rev)
+
+    def test_lazy_files_match_and_load_once(self, history_repo):
+        """Test that deferred file lists equal eager ones and are read in one batch."""
+        with patch.object(git_log, "read_commit_files", wraps=git_log.read_commit_files) as mock_read:
+            lazy = get_log_commits("HEAD", files=lazy_files())
+            assert mock_read.call_count == 0
+
+            assert lazy == _legacy_commits(history_repo, "HEAD")
+            mock_read.assert_called_once()
+
+    def test_commit_analyzer_ranges(self, history_repo):
+        """Test the commit_analyzer entry points built on the stream."""
+        head = history_repo.head.commit.hexsha
+        tag_hash = history_repo.tags["v1.0.0"].commit.hexsha
+
+        chronological = get_all_commits_chronological()
+        assert chronological == list(reversed(_legacy_commits(history_repo, "HEAD")))
+
+        assert get_commits_between_tags("v1.0.0", None) == _legacy_commits(history_repo, "v1.0.0..HEAD")
+        assert get_commits_between_hashes(tag_hash, head) == _legacy_commits(history_repo, f"{tag_hash}..{head}")
+
+    def test_invalid_range_raises_git_error(self, git_repo):
+        """Test that git failures surface as GitError."""
+        with pytest.raises(GitError):
+            get_commits_between_tags("v9.9.9", "v10.0.0")
+
+    def test_early_stop_terminates_process(self, history_repo):
+        """Test that abandoning the iterator does not raise."""
+        stream = iter_log_commits("HEAD")
+        first = next(stream)
+        stream.close()
+
+        assert first["hash"] == history_repo.head.commit.hexsha
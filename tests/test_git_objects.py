@@ -0,0 +1,132 @@
+"""Tests for the persistent git cat-file object reader."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import git
+import pytest
+
+from kittylog import git_objects
+from kittylog.commit_analyzer import get_git_diff
+from kittylog.commit_record import FileListLoader
+from kittylog.git_log import get_log_commits, read_commit_files
+from kittylog.git_objects import ObjectReader, close_object_readers, get_object_reader, read_commits
+
+
+def _add_commit(repo, name: str, message: str) -> str:
+    Path(name).write_text(f"{name}\n")
+    repo.git.add(A=True)
+    repo.git.commit("-m", message)
+    return repo.head.commit.hexsha
+
+
+class _PreBatchCommandReader(ObjectReader):
+    """Reader whose first command fails like ``--batch-command`` on git < 2.36."""
+
+    @property
+    def _command(self) -> list[str]:
+        if self._legacy:
+            return super()._command
+        return ["git", "cat-file", "--no-such-option"]
+
+
+class TestObjectReader:
+    """Test object lookups over one long-lived process."""
+
+    def test_info_and_contents(self, git_repo):
+        """Test that revisions resolve, unknown ones are None and contents are raw."""
+        head = git_repo.head.commit.hexsha
+
+        with ObjectReader() as reader:
+            commit, missing, blob = reader.info_many(["HEAD", "does-not-exist", "HEAD:README.md"])
+            obj = reader.read("HEAD")
+
+        assert (commit.hexsha, commit.type) == (head, "commit")
+        assert missing is None
+        assert blob.type == "blob"
+        assert blob.size == len("# Test Project\n")
+        assert obj.data.startswith(b"tree ")
+
+    def test_one_process_for_many_rounds(self, git_repo):
+        """Test that requests larger than the pipeline depth share one process."""
+        for i in range(5):
+            _add_commit(git_repo, f"file_{i}.txt", f"commit {i}")
+        revisions = [f"HEAD~{i}" for i in range(6)]
+
+        with ObjectReader() as reader, patch.object(git_objects, "PIPELINE_DEPTH", 2):
+            first = reader.info_many(revisions)
+            process = reader._process
+            second = reader.info_many(revisions)
+
+            assert reader._process is process
+        assert [info.hexsha for info in first] == [info.hexsha for info in second]
+        assert len({info.hexsha for info in first}) == 6
+
+    def test_falls_back_to_batch(self, git_repo):
+        """Test that git without --batch-command is served by --batch."""
+        with _PreBatchCommandReader() as reader:
+            info = reader.info("HEAD")
+            obj = reader.read("HEAD:README.md")
+
+            assert reader._legacy
+        assert info.hexsha == git_repo.head.commit.hexsha
+        assert obj.data == b"# Test Project\n"
+
+    def test_rejects_newlines(self, git_repo):
+        """Test that a revision cannot inject a second command."""
+        with ObjectReader() as reader, pytest.raises(ValueError):
+            reader.info("HEAD\ncontents HEAD")
+
+    def test_shared_per_directory(self, git_repo):
+        """Test that callers share one reader until readers are closed."""
+        reader = get_object_reader()
+
+        assert get_object_reader(".") is reader
+        close_object_readers()
+        assert get_object_reader() is not reader
+
+
+class TestReadCommits:
+    """Test building commit records from raw commit objects."""
+
+    def test_matches_git_log(self, git_repo):
+        """Test that records read from objects equal those read from git log."""
+        _add_commit(git_repo, "a.py", "feat: add a\n\nWith a body")
+        _add_commit(git_repo, "b.py", "fix: b")
+        hashes = [commit["hash"] for commit in get_log_commits("HEAD")]
+
+        commits = read_commits(hashes, FileListLoader(read_commit_files))
+
+        assert commits == get_log_commits("HEAD")
+
+    def test_reencodes_legacy_encodings(self, git_repo):
+        """Test that messages in a declared encoding are decoded like git log does."""
+        Path("latin.txt").write_text("x\n")
+        git_repo.git.add(A=True)
+        subprocess.run(
+            ["git", "-c", "i18n.commitEncoding=ISO-8859-1", "commit", "-q", "-F", "-"],
+            input="Café résumé".encode("latin-1"),
+            check=True,
+        )
+
+        (commit,) = read_commits([git_repo.head.commit.hexsha], FileListLoader(read_commit_files))
+
+        assert commit["message"] == "Café résumé"
+        assert commit == get_log_commits("HEAD^..HEAD")[0]
+
+    def test_unknown_hash(self, git_repo):
+        """Test that unknown commits are reported as git errors."""
+        with pytest.raises(git.GitCommandError):
+            read_commits(["0" * 40], FileListLoader(read_commit_files))
+
+
+class TestGitDiffEndpoints:
+    """Test that diff endpoints are resolved through the object reader."""
+
+    def test_root_commit_is_diffed_against_empty_tree(self, git_repo):
+        """Test that the first commit's diff shows the files it added."""
+        diff = get_git_diff(None, git_repo.head.commit.hexsha)
+
+        assert "A README.md" in diff
+        assert "+# Test Project" in diff
@@ -0,0 +1,101 @@
+"""Regression tests for CLI start-up cost.
+
+Each check runs in a fresh interpreter, since the test session has already imported everything.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from kittylog.cli import LAZY_SUBCOMMANDS, cli
+
+# Cumulative import time of kittylog.cli; the eager tree took ~300ms, the lazy one ~50ms
+IMPORT_BUDGET_MS = 150
+
+HEAVY_MODULES = ["git", "httpx", "rich", "tiktoken", "questionary", "kittylog.providers.base", "kittylog.workflow"]
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env, check=True)
+
+
+def _imported_modules(code: str) -> set[str]:
+    result = _run_python("-c", f"import json, sys\n{code}\nprint(json.dumps(sorted(sys.modules)))")
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+def test_cli_import_time_within_budget():
+    """Test that importing the CLI stays within its start-up budget."""
+    # Import once first so the measured run reads compiled bytecode
+    _run_python("-c", "import kittylog.cli")
+
+    result = _run_python("-X", "importtime", "-c", "import kittylog.cli")
+
+    cumulative_us = next(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.rstrip().endswith("| kittylog.cli")
+    )
+    assert cumulative_us / 1000 < IMPORT_BUDGET_MS
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import kittylog.cli",
+        "from kittylog.cli import cli\ntry:\n    cli(['--help'])\nexcept SystemExit:\n    pass",
+    ],
+    ids=["import", "help"],
+)
+def test_cli_defers_heavy_imports(code):
+    """Test that importing the CLI and printing help load neither git, the AI stack nor the providers."""
+    modules = _imported_modules(code)
+
+    assert [name for name in HEAVY_MODULES if name in modules] == []
+
+
+def test_unchanged_run_defers_heavy_imports(git_repo_with_tags):
+    """Test that a repeated run with nothing new to document stops before git and the AI stack load."""
+    Path("CHANGELOG.md").write_text(
+        "".join(f"## [{tag.name[1:]}] - 2024-01-01\n\n- Change\n\n" for tag in git_repo_with_tags.tags)
+    )
+    # The banner is suppressed by looking for -q in sys.argv
+    run = (
+        "from kittylog.cli import cli\n"
+        "sys.argv = ['kittylog', 'update', '-q', '-m', 'openai:gpt-4']\n"
+        "try:\n    cli()\nexcept SystemExit:\n    pass"
+    )
+
+    first_run = _imported_modules(run)
+    second_run = _imported_modules(run)
+
+    assert "git" in first_run
+    assert [name for name in HEAVY_MODULES if name in second_run] == []
+
+
+def test_provider_modules_imported_on_first_use():
+    """Test that only the provider whose name is looked up is imported."""
+    modules = _imported_modules(
+        "from kittylog.providers import PROVIDER_REGISTRY, SUPPORTED_PROVIDERS\n"
+        "assert 'openai' in PROVIDER_REGISTRY and len(PROVIDER_REGISTRY) == len(SUPPORTED_PROVIDERS)\n"
+        "PROVIDER_REGISTRY['openai']"
+    )
+
+    assert "kittylog.providers.openai" in modules
+    assert "kittylog.providers.anthropic" not in modules
+
+
+@pytest.mark.parametrize("name", sorted(LAZY_SUBCOMMANDS))
+def test_lazy_subcommand_help_matches_command(name):
+    """Test that the help listed for a lazy subcommand is the command's own short help."""
+    _target, short_help = LAZY_SUBCOMMANDS[name]
+
+    command = cli.get_command(None, name)
+
+    assert command is not None
+    assert command.get_short_help_str(limit=200) == short_help
@@ -6,6 +6,7 @@ from kittylog.prompt.json_schema import (
     _remap_json_keys,
     format_changelog_from_json,
     json_to_markdown,
+    merge_json_sections,
     parse_json_response,
 )
 
@@ -213,6 +214,25 @@ class TestKeyRemapping:
         assert "Security B" in result["bug_fixes"]
 
 
+class TestMergeJsonSections:
+    """Tests for merging partial results."""
+
+    def test_merges_in_section_order_and_drops_duplicates(self):
+        parts = [
+            {"fixed": ["Fix crash on start"], "added": ["Add export"]},
+            {"added": ["add export.", "Add import"], "fixed": ["- Fix crash on start"]},
+        ]
+        result = merge_json_sections(parts, "developers")
+
+        assert list(result) == ["added", "fixed"]
+        assert result["added"] == ["Add export", "Add import"]
+        assert result["fixed"] == ["Fix crash on start"]
+
+    def test_remaps_to_audience_keys(self):
+        result = merge_json_sections([{"added": ["A"]}, {"whats_new": ["B"], "fixed": ["C"]}], "users")
+        assert result == {"whats_new": ["A", "B"], "bug_fixes": ["C"]}
+
+
 class TestJsonToMarkdownWithRemapping:
     """Test json_to_markdown with developer keys for non-developer audiences."""
 
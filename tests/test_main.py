@@ -18,7 +18,6 @@ class TestMainBusinessLogic:
     @patch("kittylog.changelog.io.write_changelog")
     @patch("kittylog.changelog.io.read_changelog")
     @patch("kittylog.changelog.updater.update_changelog")
-    @patch("kittylog.mode_handlers.missing.get_all_boundaries")
     @patch("kittylog.tag_operations.get_all_boundaries")
     @patch("kittylog.changelog.boundaries.find_existing_boundaries")
     @patch("kittylog.tag_operations.get_latest_boundary")
@@ -26,7 +25,7 @@ class TestMainBusinessLogic:
     @patch("kittylog.tag_operations.generate_boundary_identifier")
     @patch("kittylog.tag_operations.generate_boundary_display_name")
     @patch("kittylog.commit_analyzer.get_commits_between_tags")
-    @patch("kittylog.mode_handlers.missing.get_commits_between_tags")
+    @patch("kittylog.mode_handlers.missing.partition_commits_by_boundaries")
     @patch("kittylog.mode_handlers.unreleased.get_commits_between_tags")
     @patch("kittylog.mode_handlers.missing.get_tag_date")
     @patch("kittylog.tag_operations.get_previous_boundary")
@@ -35,7 +34,7 @@ class TestMainBusinessLogic:
         mock_get_previous_boundary,
         mock_get_tag_date,
         mock_get_commits_unreleased,
-        mock_get_commits_between_tags_missing,
+        mock_partition_missing,
         mock_get_commits_between_tags,
         mock_generate_display,
         mock_generate_identifier,
@@ -43,7 +42,6 @@ class TestMainBusinessLogic:
         mock_get_latest_boundary,
         mock_find_existing,
         mock_get_all_boundaries,
-        mock_get_all_boundaries_missing,
         mock_update,
         mock_read,
         mock_write,
@@ -77,12 +75,11 @@ class TestMainBusinessLogic:
 
         # Mock for unreleased mode - need to mock get_all_boundaries to return empty for special mode
         mock_get_all_boundaries.return_value = []
-        mock_get_all_boundaries_missing.return_value = []
         mock_get_latest_boundary.return_value = mock_boundary
         mock_is_tagged.return_value = False
         mock_read.return_value = "# Changelog\n"
         mock_get_tag_date.return_value = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        mock_get_commits_between_tags_missing.return_value = []
+        mock_partition_missing.side_effect = lambda boundaries, only=None: [[] for _ in boundaries]
         mock_get_commits_unreleased.return_value = []
 
         # Mock commits to simulate unreleased changes - need all required fields
@@ -136,11 +133,10 @@ class TestMainBusinessLogic:
         # Just verify the function completed successfully
 
     @patch("kittylog.workflow_validation.get_output_manager")
-    @patch("kittylog.mode_handlers.missing.get_all_boundaries")
     @patch("kittylog.tag_operations.get_all_boundaries")
     @patch("kittylog.tag_operations.get_repo")
     def test_main_logic_no_boundaries_warning(
-        self, mock_get_repo, mock_get_all_boundaries, mock_get_all_boundaries_missing, mock_output_manager, temp_dir
+        self, mock_get_repo, mock_get_all_boundaries, mock_output_manager, temp_dir
     ):
         """Test handling when no boundaries are found."""
         # Mock repository with iterable tags and commits
@@ -155,7 +151,6 @@ class TestMainBusinessLogic:
 
         # Mock no boundaries
         mock_get_all_boundaries.return_value = []
-        mock_get_all_boundaries_missing.return_value = []
 
         # Mock output manager
         mock_output = Mock()
@@ -195,7 +190,6 @@ class TestMainBusinessLogic:
     @patch("kittylog.changelog.io.write_changelog")
     @patch("kittylog.changelog.io.read_changelog")
     @patch("kittylog.changelog.updater.update_changelog")
-    @patch("kittylog.mode_handlers.missing.get_all_boundaries")
     @patch("kittylog.tag_operations.get_all_boundaries")
     @patch("kittylog.workflow_validation.get_all_boundaries")
     @patch("kittylog.changelog.boundaries.find_existing_boundaries")
@@ -203,14 +197,14 @@ class TestMainBusinessLogic:
     @patch("kittylog.tag_operations.is_current_commit_tagged")
     @patch("kittylog.tag_operations.generate_boundary_identifier")
     @patch("kittylog.tag_operations.generate_boundary_display_name")
-    @patch("kittylog.mode_handlers.missing.get_commits_between_tags")
+    @patch("kittylog.mode_handlers.missing.partition_commits_by_boundaries")
     @patch("kittylog.mode_handlers.unreleased.get_commits_between_tags")
     @patch("kittylog.mode_handlers.missing.get_tag_date")
     def test_main_logic_dates_mode(
         self,
         mock_get_tag_date,
         mock_get_commits_unreleased,
-        mock_get_commits_between_tags_missing,
+        mock_partition_missing,
         mock_generate_display,
         mock_generate_identifier,
         mock_is_tagged,
@@ -218,7 +212,6 @@ class TestMainBusinessLogic:
         mock_find_existing,
         mock_get_all_boundaries_validation,
         mock_get_all_boundaries,
-        mock_get_all_boundaries_missing,
         mock_update,
         mock_read,
         mock_write,
@@ -256,14 +249,13 @@ class TestMainBusinessLogic:
         ]
 
         mock_get_all_boundaries.return_value = mock_boundaries
-        mock_get_all_boundaries_missing.return_value = mock_boundaries
         mock_get_all_boundaries_validation.return_value = mock_boundaries
         mock_find_existing.return_value = set()
         mock_get_latest_boundary.return_value = mock_boundaries[0]
         mock_is_tagged.return_value = False
         mock_read.return_value = "# Changelog\n"
         mock_get_tag_date.return_value = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        mock_get_commits_between_tags_missing.return_value = []
+        mock_partition_missing.side_effect = lambda boundaries, only=None: [[] for _ in boundaries]
         mock_get_commits_unreleased.return_value = []
 
         mock_generate_identifier.return_value = "2024-01-01"
@@ -347,14 +339,13 @@ class TestMainBusinessLogic:
     @patch("kittylog.changelog.io.write_changelog")
     @patch("kittylog.changelog.io.read_changelog")
     @patch("kittylog.changelog.updater.update_changelog")
-    @patch("kittylog.mode_handlers.missing.get_all_boundaries")
     @patch("kittylog.tag_operations.get_all_boundaries")
     @patch("kittylog.changelog.boundaries.find_existing_boundaries")
     @patch("kittylog.tag_operations.get_latest_boundary")
     @patch("kittylog.tag_operations.is_current_commit_tagged")
     @patch("kittylog.tag_operations.generate_boundary_identifier")
     @patch("kittylog.tag_operations.generate_boundary_display_name")
-    @patch("kittylog.mode_handlers.missing.get_commits_between_tags")
+    @patch("kittylog.mode_handlers.missing.partition_commits_by_boundaries")
     @patch("kittylog.mode_handlers.unreleased.get_commits_between_tags")
     @patch("kittylog.mode_handlers.missing.get_tag_date")
     @patch("kittylog.tag_operations.get_tag_date")
@@ -363,14 +354,13 @@ class TestMainBusinessLogic:
         mock_get_tag_date_ops,
         mock_get_tag_date_missing,
         mock_get_commits_unreleased,
-        mock_get_commits_between_tags_missing,
+        mock_partition_missing,
         mock_generate_display,
         mock_generate_identifier,
         mock_is_tagged,
         mock_get_latest_boundary,
         mock_find_existing,
         mock_get_all_boundaries,
-        mock_get_all_boundaries_missing,
         mock_update,
         mock_read,
         mock_write,
@@ -408,14 +398,13 @@ class TestMainBusinessLogic:
         ]
 
         mock_get_all_boundaries.return_value = mock_boundaries
-        mock_get_all_boundaries_missing.return_value = mock_boundaries
         mock_find_existing.return_value = set()
         mock_get_latest_boundary.return_value = mock_boundaries[0]
         mock_is_tagged.return_value = False
         mock_read.return_value = "# Changelog\n"
         mock_get_tag_date_ops.return_value = datetime(2024, 1, 1, tzinfo=timezone.utc)
         mock_get_tag_date_missing.return_value = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        mock_get_commits_between_tags_missing.return_value = []
+        mock_partition_missing.side_effect = lambda boundaries, only=None: [[] for _ in boundaries]
         mock_get_commits_unreleased.return_value = []
 
         mock_generate_identifier.return_value = "v1.0.0"
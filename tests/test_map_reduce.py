@@ -0,0 +1,145 @@
+"""Tests for map-reduce changelog generation."""
+
+import json
+import re
+import threading
+from datetime import datetime
+from unittest.mock import patch
+
+from kittylog.ai import generate_changelog_entry
+from kittylog.map_reduce import chunk_commits, generate_map_reduce, needs_map_reduce, parse_partial_result
+
+MODEL = "openai:gpt-4"
+
+
+def word(index: int) -> str:
+    """Spell an index in letters; subjects differing only in numbers are packed as duplicates."""
+    return "".join(chr(ord("a") + int(digit)) for digit in str(index))
+
+
+def make_commits(count: int) -> list[dict]:
+    return [
+        {
+            "hash": f"{i:040x}",
+            "short_hash": f"{i:07x}",
+            "message": f"feat: add feature {word(i)}",
+            "author": "Dev",
+            "date": datetime(2024, 1, 1),
+            "files": [f"src/feature_{i}.py"],
+        }
+        for i in range(count)
+    ]
+
+
+class FakeModel:
+    """Answers map prompts with one item per commit and reduce prompts with their drafts."""
+
+    def __init__(self):
+        self.prompts: list[str] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, system_prompt: str, user_prompt: str) -> str:
+        with self.lock:
+            self.prompts.append(user_prompt)
+        if "## Draft changelog items to consolidate:" in user_prompt:
+            drafts = json.loads(re.search(r"```json\n(.*?)\n```", user_prompt, re.DOTALL).group(1))
+            return json.dumps(drafts)
+        names = re.findall(r"feat: add feature (\w+)", user_prompt)
+        return json.dumps({"added": [f"Feature {name}" for name in names] + ["Shared improvement"]})
+
+    @property
+    def map_prompts(self) -> list[str]:
+        return [p for p in self.prompts if "## Commits to analyze:" in p]
+
+    @property
+    def reduce_prompts(self) -> list[str]:
+        return [p for p in self.prompts if "## Draft changelog items to consolidate:" in p]
+
+
+class TestHelpers:
+    """Test chunking, detection and parsing."""
+
+    def test_chunk_commits(self):
+        chunks = chunk_commits(make_commits(25), 10)
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+
+    def test_needs_map_reduce(self):
+        commits = make_commits(50)
+        assert not needs_map_reduce(commits, 50, MODEL, 10)
+        assert not needs_map_reduce(commits, 10, MODEL, 100_000)
+        assert needs_map_reduce(commits, 10, MODEL, 100)
+
+    def test_parse_partial_result_falls_back_to_bullets(self):
+        assert parse_partial_result('{"fixed": ["A"]}') == {"fixed": ["A"]}
+        assert parse_partial_result("### Added\n- One\n* Two\n") == {"changed": ["One", "Two"]}
+        assert parse_partial_result("nothing useful") == {}
+
+
+class TestGenerateMapReduce:
+    """Test the map and reduce steps."""
+
+    def test_map_then_single_reduce(self):
+        model = FakeModel()
+        content = generate_map_reduce(
+            make_commits(30),
+            model,
+            tag="v1.0.0",
+            model=MODEL,
+            token_budget=6_000,
+            chunk_size=10,
+            jobs=3,
+            language="German",
+            context_entries="## [0.9.0]\n- Old feature",
+        )
+
+        assert len(model.map_prompts) == 3
+        assert len(model.reduce_prompts) == 1
+        # Language and context entries only go to the final reduce
+        assert all("German" not in prompt for prompt in model.map_prompts)
+        assert "German" in model.reduce_prompts[0] and "Old feature" in model.reduce_prompts[0]
+        result = json.loads(content)
+        assert len(result["added"]) == 31  # 30 features plus the shared item, deduplicated
+        assert "30 commits" in model.reduce_prompts[0]
+
+    def test_oversized_drafts_are_reduced_in_rounds(self):
+        model = FakeModel()
+        generate_map_reduce(make_commits(400), model, tag="v1.0.0", model=MODEL, token_budget=3_000, chunk_size=40)
+
+        assert len(model.map_prompts) == 10
+        # Intermediate rounds ran before the final reduce
+        assert len(model.reduce_prompts) > 1
+
+
+class TestGenerateChangelogEntryMapReduce:
+    """Test map-reduce through the public entry point."""
+
+    def test_forced_map_reduce(self):
+        fake = FakeModel()
+
+        def provider(**kwargs):
+            return fake(kwargs["system_prompt"], kwargs["user_prompt"])
+
+        with patch("kittylog.ai.generate_with_retries", side_effect=provider):
+            content, usage = generate_changelog_entry(
+                make_commits(12),
+                "v1.0.0",
+                model=MODEL,
+                quiet=True,
+                map_reduce=True,
+                map_reduce_chunk_size=5,
+                map_reduce_jobs=2,
+            )
+
+        assert len(fake.map_prompts) == 3
+        assert len(fake.reduce_prompts) == 1
+        assert content.startswith("### Added")
+        assert f"- Feature {word(11)}" in content
+        assert usage["prompt_tokens"] > 0
+
+    def test_small_release_uses_single_call(self):
+        fake = FakeModel()
+        with patch("kittylog.ai.generate_with_retries", side_effect=lambda **kw: fake("", kw["user_prompt"])):
+            generate_changelog_entry(make_commits(5), "v1.0.0", model=MODEL, quiet=True)
+
+        assert len(fake.prompts) == 1
+        assert not fake.reduce_prompts
@@ -15,6 +15,15 @@ MISSING_MODULE = "kittylog.mode_handlers.missing"
 CHANGELOG_IO_MODULE = "kittylog.changelog.io"
 
 
+def commits_for_every_boundary(commits):
+    """Build a partition_commits_by_boundaries stand-in giving each boundary ``commits``."""
+
+    def partition(boundaries, only=None):
+        return [list(commits) for _ in boundaries]
+
+    return partition
+
+
 class TestDetermineMissingEntries:
     """Tests for determine_missing_entries function."""
 
@@ -38,7 +47,7 @@ class TestDetermineMissingEntries:
 """)
 
         # Mock get_all_boundaries to return tags WITH 'v' prefix (git tag format)
-        with patch("kittylog.mode_handlers.missing.get_all_boundaries") as mock_get_boundaries:
+        with patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries:
             mock_get_boundaries.return_value = [
                 {"name": "v0.1.0", "identifier": "v0.1.0", "date": datetime(2024, 1, 1, tzinfo=timezone.utc)},
                 {"name": "v0.2.0", "identifier": "v0.2.0", "date": datetime(2024, 1, 2, tzinfo=timezone.utc)},
@@ -59,7 +68,7 @@ class TestDetermineMissingEntries:
 - Initial release
 """)
 
-        with patch("kittylog.mode_handlers.missing.get_all_boundaries") as mock_get_boundaries:
+        with patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries:
             mock_get_boundaries.return_value = [
                 {"name": "1.0.0", "identifier": "1.0.0", "date": datetime(2024, 1, 1, tzinfo=timezone.utc)},
                 {"name": "1.1.0", "identifier": "1.1.0", "date": datetime(2024, 1, 2, tzinfo=timezone.utc)},
@@ -79,7 +88,7 @@ class TestDetermineMissingEntries:
 - Initial release
 """)
 
-        with patch("kittylog.mode_handlers.missing.get_all_boundaries") as mock_get_boundaries:
+        with patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries:
             # Tags also have 'v' prefix
             mock_get_boundaries.return_value = [
                 {"name": "v1.0.0", "identifier": "v1.0.0", "date": datetime(2024, 1, 1, tzinfo=timezone.utc)},
@@ -101,7 +110,7 @@ class TestDetermineMissingEntries:
 Nothing here yet.
 """)
 
-        with patch("kittylog.mode_handlers.missing.get_all_boundaries") as mock_get_boundaries:
+        with patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries:
             mock_get_boundaries.return_value = [
                 {"name": "v0.1.0", "identifier": "v0.1.0", "date": datetime(2024, 1, 1, tzinfo=timezone.utc)},
                 {"name": "v0.2.0", "identifier": "v0.2.0", "date": datetime(2024, 1, 15, tzinfo=timezone.utc)},
@@ -123,7 +132,7 @@ Nothing here yet.
 - Initial
 """)
 
-        with patch("kittylog.mode_handlers.missing.get_all_boundaries") as mock_get_boundaries:
+        with patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries:
             mock_get_boundaries.return_value = [
                 {"name": "v0.1.0", "identifier": "v0.1.0", "date": datetime(2024, 1, 1, tzinfo=timezone.utc)},
                 {"name": "v0.2.0", "identifier": "v0.2.0", "date": datetime(2024, 1, 15, tzinfo=timezone.utc)},
@@ -137,7 +146,7 @@ Nothing here yet.
         """Test that all tags are returned when changelog doesn't exist."""
         nonexistent_file = temp_dir / "NONEXISTENT.md"
 
-        with patch("kittylog.mode_handlers.missing.get_all_boundaries") as mock_get_boundaries:
+        with patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries:
             mock_get_boundaries.return_value = [
                 {"name": "v1.0.0", "identifier": "v1.0.0", "date": datetime(2024, 6, 15, tzinfo=timezone.utc)}
             ]
@@ -167,8 +176,8 @@ class TestHandleMissingEntriesMode:
             return f"### Added\n\n- Changes for {tag}"
 
         with (
-            patch(f"{MISSING_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{MISSING_MODULE}.get_commits_between_tags") as mock_get_commits,
+            patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries,
+            patch(f"{MISSING_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{MISSING_MODULE}.get_tag_date") as mock_get_date,
             patch(f"{CHANGELOG_IO_MODULE}.read_changelog") as mock_read,
         ):
@@ -178,7 +187,7 @@ class TestHandleMissingEntriesMode:
                 {"name": "v0.2.0", "identifier": "v0.2.0", "date": datetime(2024, 2, 1, tzinfo=timezone.utc)},
                 {"name": "v0.3.0", "identifier": "v0.3.0", "date": datetime(2024, 3, 1, tzinfo=timezone.utc)},
             ]
-            mock_get_commits.return_value = [{"hash": "abc", "message": "test"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test"}])
             mock_get_date.side_effect = [
                 datetime(2024, 1, 1, tzinfo=timezone.utc),
                 datetime(2024, 2, 1, tzinfo=timezone.utc),
@@ -204,6 +213,39 @@ class TestHandleMissingEntriesMode:
                 f"Expected newest first (0.3.0 < 0.2.0 < 0.1.0)"
             )
 
+    def test_boundaries_computed_once_and_each_save_adds_one_section(self, temp_dir):
+        """Test that one run lists boundaries once and every incremental save has one more entry."""
+        changelog_file = temp_dir / "CHANGELOG.md"
+        changelog_file.write_text("# Changelog\n\n## [Unreleased]\n\n## [0.1.0] - 2024-01-01\n\n- First\n")
+        saved = []
+
+        def record_write(file_path, content):
+            saved.append(content)
+
+        with (
+            patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries,
+            patch(f"{MISSING_MODULE}.partition_commits_by_boundaries") as mock_partition,
+            patch(f"{MISSING_MODULE}.get_tag_date", return_value=datetime(2024, 2, 1, tzinfo=timezone.utc)),
+            patch(f"{CHANGELOG_IO_MODULE}.write_changelog", side_effect=record_write),
+        ):
+            mock_get_boundaries.return_value = [
+                {"name": f"v0.{minor}.0", "identifier": f"v0.{minor}.0", "date": datetime(2024, minor, 1)}
+                for minor in range(1, 5)
+            ]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test"}])
+
+            success, content = handle_missing_entries_mode(
+                changelog_file=str(changelog_file),
+                generate_entry_func=lambda commits, tag, **kwargs: f"- Changes for {tag}",
+                quiet=True,
+            )
+
+        assert success
+        mock_get_boundaries.assert_called_once()
+        assert [text.count("## [0.") for text in saved] == [2, 3, 4]
+        assert saved[-1] == content
+        assert content.index("## [0.4.0]") < content.index("## [0.3.0]") < content.index("## [0.2.0]")
+
     def test_insertion_uses_semantic_version_ordering(self, temp_dir):
         """Test that entries are inserted at correct positions based on semantic version."""
         changelog_file = temp_dir / "CHANGELOG.md"
@@ -223,8 +265,8 @@ class TestHandleMissingEntriesMode:
             return f"### Added\n\n- Changes for {tag}"
 
         with (
-            patch(f"{MISSING_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{MISSING_MODULE}.get_commits_between_tags") as mock_get_commits,
+            patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries,
+            patch(f"{MISSING_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{MISSING_MODULE}.get_tag_date") as mock_get_date,
             patch(f"{CHANGELOG_IO_MODULE}.read_changelog") as mock_read,
             patch(f"{MISSING_MODULE}.find_existing_boundaries") as mock_find_existing,
@@ -236,7 +278,7 @@ class TestHandleMissingEntriesMode:
                 {"name": "v0.3.0", "identifier": "v0.3.0", "date": datetime(2024, 3, 1, tzinfo=timezone.utc)},
             ]
             mock_find_existing.return_value = {"0.2.0"}  # Only 0.2.0 exists
-            mock_get_commits.return_value = [{"hash": "abc", "message": "test"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test"}])
             mock_get_date.side_effect = [
                 datetime(2024, 1, 1, tzinfo=timezone.utc),  # v0.1.0 (processed first, oldest)
                 datetime(2024, 3, 1, tzinfo=timezone.utc),  # v0.3.0 (processed second, newest)
@@ -273,15 +315,15 @@ class TestHandleMissingEntriesMode:
             return "### Added\n\n- Test feature"
 
         with (
-            patch(f"{MISSING_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{MISSING_MODULE}.get_commits_between_tags") as mock_get_commits,
+            patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries,
+            patch(f"{MISSING_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{MISSING_MODULE}.get_tag_date") as mock_get_date,
             patch(f"{CHANGELOG_IO_MODULE}.read_changelog") as mock_read,
         ):
             mock_get_boundaries.return_value = [
                 {"name": "v1.0.0", "identifier": "v1.0.0", "date": datetime(2024, 6, 15, tzinfo=timezone.utc)}
             ]
-            mock_get_commits.return_value = [{"hash": "abc", "message": "test"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test"}])
             mock_get_date.return_value = datetime(2024, 6, 15, tzinfo=timezone.utc)
             mock_read.return_value = changelog_file.read_text()
 
@@ -311,7 +353,7 @@ class TestHandleMissingEntriesMode:
             return "### Added\n\n- Should not be called"
 
         with (
-            patch(f"{MISSING_MODULE}.get_all_boundaries") as mock_get_boundaries,
+            patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries,
             patch(f"{CHANGELOG_IO_MODULE}.read_changelog") as mock_read,
         ):
             mock_get_boundaries.return_value = [
@@ -338,8 +380,8 @@ class TestHandleMissingEntriesMode:
             return "### Added\n\n- Test"
 
         with (
-            patch(f"{MISSING_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{MISSING_MODULE}.get_commits_between_tags") as mock_get_commits,
+            patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries,
+            patch(f"{MISSING_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{CHANGELOG_IO_MODULE}.read_changelog") as mock_read,
         ):
             mock_get_boundaries.return_value = [
@@ -348,7 +390,7 @@ class TestHandleMissingEntriesMode:
             ]
             # Chronological processing order: v1.0.0 first, then v1.1.0
             # v1.0.0 has commits, v1.1.0 has no commits (skipped)
-            mock_get_commits.side_effect = [
+            mock_partition.return_value = [
                 [{"hash": "abc", "message": "test"}],  # v1.0.0 has commits (processed first)
                 [],  # No commits for v1.1.0 (skipped)
             ]
@@ -379,14 +421,14 @@ class TestHandleMissingEntriesMode:
             return ""  # Empty response
 
         with (
-            patch(f"{MISSING_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{MISSING_MODULE}.get_commits_between_tags") as mock_get_commits,
+            patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries,
+            patch(f"{MISSING_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{CHANGELOG_IO_MODULE}.read_changelog") as mock_read,
         ):
             mock_get_boundaries.return_value = [
                 {"name": "v1.0.0", "identifier": "v1.0.0", "date": datetime(2024, 6, 15, tzinfo=timezone.utc)}
             ]
-            mock_get_commits.return_value = [{"hash": "abc", "message": "test"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test"}])
             mock_read.return_value = original_content
 
             success, content = handle_missing_entries_mode(
@@ -412,7 +454,7 @@ class TestTagNormalizationEdgeCases:
 - Test
 """)
 
-        with patch("kittylog.mode_handlers.missing.get_all_boundaries") as mock_get_boundaries:
+        with patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries:
             # Unusual but possible: double v prefix
             mock_get_boundaries.return_value = [
                 {"name": "vv1.0.0", "identifier": "vv1.0.0", "date": datetime(2024, 1, 1, tzinfo=timezone.utc)},
@@ -434,7 +476,7 @@ class TestTagNormalizationEdgeCases:
 - Test
 """)
 
-        with patch("kittylog.mode_handlers.missing.get_all_boundaries") as mock_get_boundaries:
+        with patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries:
             mock_get_boundaries.return_value = [
                 {
                     "name": "v1.0.0-alpha",
@@ -458,7 +500,7 @@ class TestTagNormalizationEdgeCases:
 - Test
 """)
 
-        with patch("kittylog.mode_handlers.missing.get_all_boundaries") as mock_get_boundaries:
+        with patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries:
             mock_get_boundaries.return_value = [
                 {"name": "V1.0.0", "identifier": "V1.0.0", "date": datetime(2024, 1, 1, tzinfo=timezone.utc)},
                 {"name": "V2.0.0", "identifier": "V2.0.0", "date": datetime(2024, 1, 15, tzinfo=timezone.utc)},
@@ -497,15 +539,15 @@ class TestVersionStrippingInMissingMode:
             return "### Added\n\n- Feature for " + tag
 
         with (
-            patch(f"{MISSING_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{MISSING_MODULE}.get_commits_between_tags") as mock_get_commits,
+            patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries,
+            patch(f"{MISSING_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{MISSING_MODULE}.get_tag_date") as mock_get_date,
             patch(f"{CHANGELOG_IO_MODULE}.read_changelog") as mock_read,
         ):
             mock_get_boundaries.return_value = [
                 {"name": "v1.0.0", "identifier": "v1.0.0", "date": datetime(2024, 6, 15, tzinfo=timezone.utc)}
             ]
-            mock_get_commits.return_value = [{"hash": "abc", "message": "test"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test"}])
             mock_get_date.return_value = datetime(2024, 6, 15, tzinfo=timezone.utc)
             mock_read.return_value = changelog_file.read_text()
 
@@ -540,15 +582,15 @@ class TestVersionStrippingInMissingMode:
             return "### Added\n\n- Feature"
 
         with (
-            patch(f"{MISSING_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{MISSING_MODULE}.get_commits_between_tags") as mock_get_commits,
+            patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries,
+            patch(f"{MISSING_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{MISSING_MODULE}.get_tag_date") as mock_get_date,
             patch(f"{CHANGELOG_IO_MODULE}.read_changelog") as mock_read,
         ):
             mock_get_boundaries.return_value = [
                 {"name": "2.0.0", "identifier": "2.0.0", "date": datetime(2024, 7, 20, tzinfo=timezone.utc)}
             ]
-            mock_get_commits.return_value = [{"hash": "xyz", "message": "test"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "xyz", "message": "test"}])
             mock_get_date.return_value = datetime(2024, 7, 20, tzinfo=timezone.utc)
             mock_read.return_value = changelog_file.read_text()
 
@@ -578,8 +620,8 @@ class TestVersionStrippingInMissingMode:
             return f"### Added\n\n- Changes for {tag}"
 
         with (
-            patch(f"{MISSING_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{MISSING_MODULE}.get_commits_between_tags") as mock_get_commits,
+            patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries,
+            patch(f"{MISSING_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{MISSING_MODULE}.get_tag_date") as mock_get_date,
             patch(f"{CHANGELOG_IO_MODULE}.read_changelog") as mock_read,
         ):
@@ -588,7 +630,7 @@ class TestVersionStrippingInMissingMode:
                 {"name": "v1.1.0", "identifier": "v1.1.0", "date": datetime(2024, 2, 1, tzinfo=timezone.utc)},
                 {"name": "v1.2.0", "identifier": "v1.2.0", "date": datetime(2024, 3, 1, tzinfo=timezone.utc)},
             ]
-            mock_get_commits.return_value = [{"hash": "abc", "message": "test"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "abc", "message": "test"}])
             mock_get_date.side_effect = [
                 datetime(2024, 1, 1, tzinfo=timezone.utc),
                 datetime(2024, 2, 1, tzinfo=timezone.utc),
@@ -632,8 +674,8 @@ class TestVersionStrippingInMissingMode:
             return "### Added\n\n- Beta feature"
 
         with (
-            patch(f"{MISSING_MODULE}.get_all_boundaries") as mock_get_boundaries,
-            patch(f"{MISSING_MODULE}.get_commits_between_tags") as mock_get_commits,
+            patch("kittylog.tag_operations.get_all_boundaries") as mock_get_boundaries,
+            patch(f"{MISSING_MODULE}.partition_commits_by_boundaries") as mock_partition,
             patch(f"{MISSING_MODULE}.get_tag_date") as mock_get_date,
             patch(f"{CHANGELOG_IO_MODULE}.read_changelog") as mock_read,
         ):
@@ -644,7 +686,7 @@ class TestVersionStrippingInMissingMode:
                     "date": datetime(2024, 8, 15, tzinfo=timezone.utc),
                 }
             ]
-            mock_get_commits.return_value = [{"hash": "def", "message": "beta"}]
+            mock_partition.side_effect = commits_for_every_boundary([{"hash": "def", "message": "beta"}])
             mock_get_date.return_value = datetime(2024, 8, 1, tzinfo=timezone.utc)
             mock_read.return_value = changelog_file.read_text()
 
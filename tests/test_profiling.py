@@ -0,0 +1,141 @@
+"""Tests for per-phase run profiling."""
+
+import json
+import pstats
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from kittylog.cli import update_cli
+from kittylog.concurrency import map_in_order
+from kittylog.profiling import (
+    SHARED,
+    Phase,
+    boundary_scope,
+    format_report,
+    get_session,
+    profile_session,
+    timed,
+    write_json_report,
+)
+
+
+@timed(Phase.COMMITS)
+def read_commits(nested: bool = False) -> str:
+    return read_commits() if nested else "commits"
+
+
+@timed(Phase.LLM)
+def call_model(tag: str) -> str:
+    return f"entry for {tag}"
+
+
+class TestSpans:
+    """Test recording of timed calls."""
+
+    def test_nothing_recorded_without_session(self):
+        """Test that instrumented functions run unchanged outside a session."""
+        assert get_session() is None
+        assert read_commits() == "commits"
+
+        with profile_session() as session:
+            read_commits()
+
+        assert [span.name for span in session.spans] == [read_commits.__qualname__]
+        assert get_session() is None
+
+    def test_nested_calls_of_one_phase_counted_once(self):
+        """Test that a phase calling itself is not double counted."""
+        with profile_session() as session:
+            read_commits(nested=True)
+
+        assert session.by_phase()[Phase.COMMITS].calls == 1
+
+    def test_spans_attributed_to_boundaries_across_threads(self):
+        """Test that spans in worker threads are attributed to the boundary being generated."""
+
+        def generate(tag: str) -> str:
+            with boundary_scope(tag):
+                return call_model(tag)
+
+        with profile_session() as session:
+            read_commits()
+            results = [future.result() for _tag, future in map_in_order(generate, ["v1.0.0", "v1.1.0"], jobs=2)]
+
+        assert results == ["entry for v1.0.0", "entry for v1.1.0"]
+        breakdown = session.by_boundary()
+        assert set(breakdown) == {"v1.0.0", "v1.1.0", SHARED}
+        assert list(breakdown)[-1] == SHARED
+        assert breakdown["v1.0.0"][Phase.LLM].calls == 1
+        assert list(breakdown[SHARED]) == [Phase.COMMITS]
+
+
+class TestReports:
+    """Test rendering and exporting a session."""
+
+    def test_report_lists_phases_in_pipeline_order(self):
+        """Test the aggregate and per-boundary tables."""
+        with profile_session() as session:
+            with boundary_scope("v2.0.0"):
+                call_model("v2.0.0")
+            read_commits()
+
+        report = format_report(session)
+
+        assert report.index("commits") < report.index("llm")
+        assert "wall" in report
+        assert "v2.0.0" in report
+        assert SHARED in report
+
+    def test_json_and_pstats_exports(self, tmp_path):
+        """Test that the JSON report and cProfile dump can be read back."""
+        stats_path = tmp_path / "run.pstats"
+        json_path = tmp_path / "run.json"
+
+        with profile_session(stats_path) as session, boundary_scope("v1.0.0"):
+            call_model("v1.0.0")
+        write_json_report(session, json_path)
+
+        data = json.loads(json_path.read_text())
+        assert data["phases"][Phase.LLM]["calls"] == 1
+        assert data["boundaries"]["v1.0.0"][Phase.LLM]["calls"] == 1
+        assert data["spans"][0]["boundary"] == "v1.0.0"
+        assert data["wall_seconds"] >= data["spans"][0]["duration"]
+        assert pstats.Stats(str(stats_path)).total_calls > 0
+
+
+class TestProfileOption:
+    """Test the --profile command-line options."""
+
+    @patch("kittylog.cli.main_business_logic")
+    def test_profile_json_implies_profile(self, mock_main_logic, tmp_path):
+        """Test that --profile-json profiles the run and writes the report."""
+
+        def run(**kwargs):
+            assert get_session() is not None
+            call_model("v1.0.0")
+            return True, None
+
+        mock_main_logic.side_effect = run
+        json_path = tmp_path / "profile.json"
+
+        result = CliRunner().invoke(update_cli, ["--no-interactive", "--profile-json", str(json_path)])
+
+        assert result.exit_code == 0, result.output
+        assert "Profile" in result.output
+        assert json.loads(json_path.read_text())["phases"][Phase.LLM]["calls"] == 1
+
+    @patch("kittylog.cli.main_business_logic")
+    def test_not_profiled_by_default(self, mock_main_logic):
+        """Test that runs without --profile record nothing."""
+
+        def run(**kwargs):
+            assert get_session() is None
+            return True, None
+
+        mock_main_logic.side_effect = run
+
+        result = CliRunner().invoke(update_cli, ["--no-interactive"])
+
+        assert result.exit_code == 0, result.output
+        assert "Profile" not in result.output
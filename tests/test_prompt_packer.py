@@ -0,0 +1,143 @@
+"""Tests for packing commits into a model's context budget."""
+
+from datetime import datetime
+
+import pytest
+
+from kittylog.prompt import build_changelog_prompt
+from kittylog.prompt.packer import (
+    collapse_files,
+    context_window_for_model,
+    format_commit,
+    pack_commits,
+    prompt_token_budget,
+    rank_commit,
+)
+from kittylog.prompt.user import build_user_prompt
+from kittylog.tokenizer import count_tokens
+
+MODEL = "openai:gpt-4"
+
+
+def make_commit(index: int, message: str, author: str = "Dev", files: list[str] | None = None) -> dict:
+    return {
+        "hash": f"{index:040x}",
+        "short_hash": f"{index:07x}",
+        "message": message,
+        "author": author,
+        "date": datetime(2024, 1, 1, 12, 0, index % 60),
+        "files": files if files is not None else [f"src/module_{index}.py"],
+    }
+
+
+def word(index: int) -> str:
+    """Spell an index in letters; subjects differing only in numbers are merged as duplicates."""
+    return "".join(chr(ord("a") + int(digit)) for digit in str(index))
+
+
+@pytest.fixture(autouse=True)
+def no_window_override(monkeypatch):
+    monkeypatch.delenv("KITTYLOG_CONTEXT_WINDOW", raising=False)
+
+
+class TestContextWindow:
+    """Test context window resolution."""
+
+    @pytest.mark.parametrize(
+        ("model", "window"),
+        [
+            ("openai:gpt-4", 8_192),
+            ("openai:gpt-4o-mini", 128_000),
+            ("anthropic:claude-3-5-haiku-latest", 200_000),
+            ("openrouter:google/gemini-2.5-pro", 1_048_576),
+            ("ollama:some-local-model", 32_768),
+        ],
+    )
+    def test_known_models(self, model, window):
+        assert context_window_for_model(model) == window
+
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv("KITTYLOG_CONTEXT_WINDOW", "4096")
+        assert context_window_for_model("anthropic:claude-3-5-haiku-latest") == 4096
+
+    def test_budget_reserves_output_and_margin(self):
+        assert prompt_token_budget(MODEL, 1024) == int(8_192 * 0.9) - 1024
+
+
+class TestRanking:
+    """Test commit importance scores."""
+
+    def test_type_order(self):
+        scores = [rank_commit(make_commit(0, message, files=[])) for message in ["feat!: x", "feat: x", "fix: x"]]
+        assert scores == sorted(scores, reverse=True)
+        assert rank_commit(make_commit(0, "fix: x", files=[])) > rank_commit(make_commit(0, "chore: x", files=[]))
+        assert rank_commit(make_commit(0, "Merge pull request #1 from a/b", files=[])) < rank_commit(
+            make_commit(0, "docs: x", files=[])
+        )
+
+    def test_more_files_rank_higher(self):
+        assert rank_commit(make_commit(0, "fix: x", files=["a", "b", "c"])) > rank_commit(
+            make_commit(0, "fix: x", files=["a"])
+        )
+
+    def test_collapse_files(self):
+        files = ["src/kittylog/a.py", "src/kittylog/b.py", "tests/test_a.py", "README.md"]
+        assert collapse_files(files) == "src/kittylog/ (2), tests/test_a.py, README.md"
+
+
+class TestPackCommits:
+    """Test the packing levels."""
+
+    def test_fits_unchanged(self):
+        commits = [make_commit(i, f"feat: feature {i}") for i in range(5)]
+        assert pack_commits(commits, 10_000, MODEL) == "".join(format_commit(c) for c in commits)
+
+    def test_duplicates_and_bots_are_compressed(self):
+        commits = [make_commit(i, f"fix typo (#{i})") for i in range(20)]
+        commits += [make_commit(100 + i, f"Bump lib{i} from 1.0 to 1.1", author="dependabot[bot]") for i in range(20)]
+        commits.append(make_commit(200, "feat: add exporter"))
+        full = sum(count_tokens(format_commit(c), MODEL) for c in commits)
+
+        packed = pack_commits(commits, full // 2, MODEL)
+
+        assert count_tokens(packed, MODEL) <= full // 2
+        assert "(and 19 similar)" in packed
+        assert "**Automated commits** (20 by bots)" in packed
+        assert "feat: add exporter" in packed
+        assert "omitted" not in packed
+
+    def test_ranking_keeps_important_commits(self):
+        commits = [make_commit(i, f"chore: tidy {word(i)}\n\nLong explanation {word(i)}") for i in range(200)]
+        commits.insert(50, make_commit(1000, "feat: add streaming output"))
+        commits.insert(150, make_commit(1001, "fix: crash on empty tag"))
+
+        packed = pack_commits(commits, 300, MODEL)
+
+        assert count_tokens(packed, MODEL) <= 300
+        assert packed.index("feat: add streaming output") < packed.index("fix: crash on empty tag")
+        assert "lower-priority commits (chore x" in packed
+
+    @pytest.mark.parametrize("budget", [100, 500, 5_000])
+    def test_always_within_budget(self, budget):
+        commits = [make_commit(i, f"refactor: change {word(i)} " + "detail " * 30) for i in range(300)]
+        assert count_tokens(pack_commits(commits, budget, MODEL), MODEL) <= budget
+
+    def test_no_budget_leaves_only_the_note(self):
+        commits = [make_commit(i, f"refactor: change {i}") for i in range(10)]
+        assert pack_commits(commits, 0, MODEL).startswith("Note: 10 lower-priority commits (refactor x10)")
+
+
+class TestPromptIntegration:
+    """Test the budget threading through the prompt builders."""
+
+    def test_no_budget_keeps_every_commit(self):
+        commits = [make_commit(i, f"chore: change {i}") for i in range(300)]
+        prompt = build_user_prompt(commits, "v1.0.0")
+        assert all(f"chore: change {i}\n" in prompt for i in range(300))
+
+    def test_prompts_fit_budget(self):
+        commits = [make_commit(i, f"refactor: change {word(i)} " + "detail " * 30) for i in range(500)]
+        system_prompt, user_prompt = build_changelog_prompt(commits, "v1.0.0", model=MODEL, token_budget=6_000)
+
+        assert count_tokens(system_prompt, MODEL) + count_tokens(user_prompt, MODEL) <= 6_000
+        assert "## Instructions:" in user_prompt
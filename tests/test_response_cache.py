@@ -0,0 +1,179 @@
+"""Tests for the on-disk LLM response cache."""
+
+import sqlite3
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from kittylog import response_cache
+from kittylog.ai import generate_changelog_entry, generate_changelog_entry_stream
+from kittylog.cache import get_cache_info
+from kittylog.response_cache import (
+    clear_response_cache,
+    get_cache_settings,
+    get_cached_response,
+    make_cache_key,
+    store_response,
+)
+
+COMMITS = [
+    {
+        "hash": "abc123",
+        "short_hash": "abc123",
+        "message": "feat: add thing",
+        "author": "Test User",
+        "date": datetime(2024, 1, 1),
+        "files": ["a.py"],
+    }
+]
+RESPONSE = "### Added\n\n- Thing"
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Enable the response cache in a temporary directory with fresh counters."""
+    monkeypatch.setenv("KITTYLOG_CACHE", "true")
+    monkeypatch.setenv("KITTYLOG_CACHE_DIR", str(tmp_path))
+    clear_response_cache()
+    yield tmp_path
+    clear_response_cache()
+
+
+class TestCacheKey:
+    """Test cache key derivation."""
+
+    def test_key_is_stable(self):
+        assert make_cache_key("openai:gpt-4", "sys", "user", 0.7, 100) == make_cache_key(
+            "openai:gpt-4", "sys", "user", 0.7, 100
+        )
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            ("openai:gpt-5", "sys", "user", 0.7, 100),
+            ("openai:gpt-4", "sys2", "user", 0.7, 100),
+            ("openai:gpt-4", "sys", "user2", 0.7, 100),
+            ("openai:gpt-4", "sys", "user", 0.8, 100),
+            ("openai:gpt-4", "sys", "user", 0.7, 101),
+        ],
+    )
+    def test_every_input_changes_key(self, changed):
+        assert make_cache_key(*changed) != make_cache_key("openai:gpt-4", "sys", "user", 0.7, 100)
+
+
+class TestResponseCache:
+    """Test storage, eviction and statistics."""
+
+    def test_store_and_get(self, cache_dir):
+        assert get_cached_response("k") is None
+        store_response("k", RESPONSE)
+
+        assert get_cached_response("k") == RESPONSE
+        info = get_cache_info()["llm_response_cache"]
+        assert info["hits"] == 1
+        assert info["misses"] == 1
+        assert info["stores"] == 1
+        assert info["currsize"] == 1
+        assert info["hit_rate"] == 0.5
+
+    def test_disabled(self, cache_dir, monkeypatch):
+        monkeypatch.setenv("KITTYLOG_CACHE", "false")
+        store_response("k", RESPONSE)
+
+        assert get_cached_response("k") is None
+        assert not (cache_dir / response_cache.CACHE_FILE_NAME).exists()
+
+    def test_expired_entries_are_ignored_and_evicted(self, cache_dir, monkeypatch):
+        monkeypatch.setenv("KITTYLOG_CACHE_MAX_AGE_DAYS", "1")
+        store_response("old", RESPONSE)
+        with patch("kittylog.response_cache.time.time", return_value=time.time() + 2 * 86400):
+            assert get_cached_response("old") is None
+            store_response("new", RESPONSE)
+
+        assert get_cache_info()["llm_response_cache"]["currsize"] == 1
+        assert get_cache_info()["llm_response_cache"]["evictions"] == 1
+
+    def test_size_limit_evicts_least_recently_used(self, cache_dir, monkeypatch):
+        # Room for two 400-byte responses
+        monkeypatch.setenv("KITTYLOG_CACHE_MAX_SIZE_MB", str(1000 / (1024 * 1024)))
+        now = time.time()
+        for offset, key in enumerate(["a", "b"]):
+            with patch("kittylog.response_cache.time.time", return_value=now + offset):
+                store_response(key, "x" * 400)
+        with patch("kittylog.response_cache.time.time", return_value=now + 2):
+            get_cached_response("a")
+        with patch("kittylog.response_cache.time.time", return_value=now + 3):
+            store_response("c", "y" * 400)
+
+        assert get_cached_response("a") is not None
+        assert get_cached_response("b") is None
+        assert get_cached_response("c") is not None
+
+    def test_database_errors_are_misses(self, cache_dir):
+        with patch("kittylog.response_cache.sqlite3.connect", side_effect=sqlite3.OperationalError("locked")):
+            store_response("k", RESPONSE)
+            assert get_cached_response("k") is None
+
+    def test_default_location(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("KITTYLOG_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert get_cache_settings().path == tmp_path / "kittylog" / response_cache.CACHE_FILE_NAME
+
+
+@patch("kittylog.ai.count_tokens", return_value=10)
+class TestGenerateChangelogEntryCache:
+    """Test the cache integration in the AI entry points."""
+
+    def test_repeat_run_skips_provider(self, _mock_count, cache_dir):
+        with patch("kittylog.ai.generate_with_retries", return_value=RESPONSE) as mock_generate:
+            first, _ = generate_changelog_entry(COMMITS, "v1.0.0", model="openai:gpt-4", quiet=True)
+            second, _ = generate_changelog_entry(COMMITS, "v1.0.0", model="openai:gpt-4", quiet=True)
+
+        assert first == second
+        mock_generate.assert_called_once()
+
+    def test_no_cache_bypasses_cache(self, _mock_count, cache_dir):
+        with patch("kittylog.ai.generate_with_retries", return_value=RESPONSE) as mock_generate:
+            generate_changelog_entry(COMMITS, "v1.0.0", model="openai:gpt-4", quiet=True, use_cache=False)
+            generate_changelog_entry(COMMITS, "v1.0.0", model="openai:gpt-4", quiet=True, use_cache=False)
+
+        assert mock_generate.call_count == 2
+        assert get_cache_info()["llm_response_cache"]["currsize"] == 0
+
+    def test_stream_populates_and_replays_cache(self, _mock_count, cache_dir):
+        def stream(**kwargs):
+            yield ("### Added\n\n", None)
+            yield ("- Thing", None)
+            yield ("", {"completion_tokens": 2})
+
+        with patch("kittylog.ai.generate_with_retries_stream", side_effect=stream) as mock_stream:
+            first = list(generate_changelog_entry_stream(COMMITS, "v1.0.0", model="openai:gpt-4", quiet=True))
+            second = list(generate_changelog_entry_stream(COMMITS, "v1.0.0", model="openai:gpt-4", quiet=True))
+
+        mock_stream.assert_called_once()
+        assert "".join(chunk for chunk, usage in first if usage is None) == RESPONSE
+        assert second[0] == (RESPONSE, None)
+        assert second[-1][1] == first[-1][1]
+
+    def test_stream_and_non_stream_cache_the_same_text(self, _mock_count, cache_dir):
+        raw = f"\n{RESPONSE}\n\n"
+
+        def stream(**kwargs):
+            yield (raw, None)
+            yield ("", {"completion_tokens": 2})
+
+        with patch("kittylog.ai.generate_with_retries_stream", side_effect=stream):
+            fresh = list(generate_changelog_entry_stream(COMMITS, "v1.0.0", model="openai:gpt-4", quiet=True))
+            replayed = list(generate_changelog_entry_stream(COMMITS, "v1.0.0", model="openai:gpt-4", quiet=True))
+        with patch("kittylog.ai.generate_with_retries", return_value=raw) as mock_generate:
+            from_stream_cache, _ = generate_changelog_entry(COMMITS, "v1.0.0", model="openai:gpt-4", quiet=True)
+            generated, _ = generate_changelog_entry(
+                COMMITS, "v1.0.0", model="openai:gpt-4", quiet=True, use_cache=False
+            )
+
+        assert replayed[0] == fresh[0] == (raw, None)
+        assert from_stream_cache == generated
+        mock_generate.assert_called_once()
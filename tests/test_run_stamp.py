@@ -0,0 +1,115 @@
+"""Tests for the run stamp that skips runs when nothing changed."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from kittylog import run_stamp
+from kittylog.cli import cli
+
+CHANGELOG = """# Changelog
+
+## [0.2.1] - 2024-01-03
+
+- Fix security issue
+
+## [0.2.0] - 2024-01-02
+
+- Add dashboard feature
+
+## [0.1.0] - 2024-01-01
+
+- Add user authentication
+"""
+
+
+def _stamp(key: str = "key") -> None:
+    with run_stamp.recording(key):
+        run_stamp.mark_up_to_date("CHANGELOG.md")
+
+
+@pytest.fixture
+def stamped_repo(git_repo_with_tags):
+    """A tagged repository with a complete changelog, stamped as up to date."""
+    Path("CHANGELOG.md").write_text(CHANGELOG)
+    _stamp()
+    return git_repo_with_tags
+
+
+class TestRunStamp:
+    """Test recording and checking stamps."""
+
+    def test_unchanged_repository(self, stamped_repo):
+        """Test that the stamp matches until something changes, and only for its own key."""
+        assert run_stamp.is_unchanged("key")
+        assert not run_stamp.is_unchanged("other key")
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda repo: repo.index.commit("New work"),
+            lambda repo: repo.create_tag("v0.3.0", repo.commit("HEAD~1")),
+            lambda repo: repo.delete_tag(repo.tags["v0.1.0"]),
+            lambda repo: Path("CHANGELOG.md").write_text(CHANGELOG.replace("security", "auth")),
+            lambda repo: Path("CHANGES.md").write_text("# Changes\n"),
+            lambda repo: repo.git.checkout("-b", "feature", "v0.2.0"),
+        ],
+        ids=["commit", "new tag", "deleted tag", "changelog edit", "other changelog", "checkout"],
+    )
+    def test_changes_invalidate_stamp(self, stamped_repo, change):
+        """Test that changes to HEAD, tags or the changelog invalidate the stamp."""
+        change(stamped_repo)
+
+        assert not run_stamp.is_unchanged("key")
+
+    def test_packed_refs(self, git_repo_with_tags):
+        """Test that HEAD and tags are read from packed refs."""
+        git_repo_with_tags.git.pack_refs("--all")
+        _stamp()
+
+        assert run_stamp.is_unchanged("key")
+        git_repo_with_tags.create_tag("v0.3.0")
+        assert not run_stamp.is_unchanged("key")
+
+    def test_run_not_marked_up_to_date_removes_stamp(self, stamped_repo):
+        """Test that a run that found work to do leaves no stamp behind."""
+        with run_stamp.recording("key"):
+            pass
+
+        assert not run_stamp.is_unchanged("key")
+
+    def test_outside_repository(self, temp_dir, monkeypatch):
+        """Test that nothing is recorded or matched outside a git repository."""
+        monkeypatch.chdir(temp_dir)
+        _stamp()
+
+        assert not run_stamp.is_unchanged("key")
+
+
+class TestUpdateFastPath:
+    """Test that the update command skips runs when nothing changed."""
+
+    ARGS = ["update", "--quiet", "--model", "openai:gpt-4"]
+
+    def test_second_run_is_skipped(self, git_repo_with_tags):
+        """Test that a run finding nothing missing lets the next identical run skip the workflow."""
+        Path("CHANGELOG.md").write_text(CHANGELOG)
+        runner = CliRunner()
+
+        assert runner.invoke(cli, self.ARGS).exit_code == 0
+        with patch("kittylog.cli.main_business_logic", return_value=(True, None)) as workflow:
+            assert runner.invoke(cli, self.ARGS).exit_code == 0
+            assert runner.invoke(cli, [*self.ARGS, "--dry-run"]).exit_code == 0
+            git_repo_with_tags.create_tag("v0.3.0")
+            assert runner.invoke(cli, self.ARGS).exit_code == 0
+
+        assert workflow.call_count == 2
+
+    def test_interactive_runs_are_not_skipped(self, git_repo_with_tags):
+        """Test that runs prompting for options always run the workflow."""
+        with patch("kittylog.run_stamp.is_unchanged", return_value=True) as is_unchanged:
+            CliRunner().invoke(cli, ["update", "--model", "openai:gpt-4"], input="\n")
+
+        is_unchanged.assert_not_called()
@@ -0,0 +1,115 @@
+"""Tests for the git for-each-ref tag catalog."""
+
+from pathlib import Path
+
+import git
+import pytest
+
+from kittylog.tag_catalog import (
+    FOR_EACH_REF_FORMAT,
+    get_tag_catalog,
+    parse_for_each_ref,
+    read_tag_catalog,
+)
+from kittylog.tag_operations import get_all_tags, get_tag_date, is_current_commit_tagged
+
+
+def record(*fields: str) -> str:
+    return "".join(f"{field}\0" for field in fields)
+
+
+class TestParseForEachRef:
+    """Test parsing of raw for-each-ref output."""
+
+    def test_lightweight_and_annotated_tags(self):
+        output = (
+            record(
+                "refs/tags/v1.0.0",
+                "c1",
+                "commit",
+                "",
+                "",
+                "2024-01-01T10:00:00+00:00",
+                "Ann",
+                "Release\n\nBody",
+                "",
+                "",
+                "",
+            )
+            + "\n"
+            + record(
+                "refs/tags/v2.0.0",
+                "t2",
+                "tag",
+                "c2",
+                "commit",
+                "",
+                "",
+                "Tag message",
+                "2024-02-01T10:00:00+00:00",
+                "Bob",
+                "Fix",
+            )
+            + "\n"
+        )
+
+        records = parse_for_each_ref(output)
+
+        assert [(r.name, r.commit, r.annotated) for r in records] == [("v1.0.0", "c1", False), ("v2.0.0", "c2", True)]
+        assert records[0].summary == "Release"
+        assert records[1].object_hash == "t2"
+        assert records[1].author == "Bob"
+        assert records[1].date.month == 2
+
+    def test_skips_tags_of_non_commits(self):
+        output = record("refs/tags/tree-tag", "t1", "tag", "abc", "tree", "", "", "", "", "", "") + "\n"
+
+        assert parse_for_each_ref(output) == []
+
+    def test_format_has_one_terminator_per_field(self):
+        assert FOR_EACH_REF_FORMAT.count("%00") == 11
+
+
+class TestTagCatalogInRepository:
+    """Test the catalog against a real repository."""
+
+    def test_matches_gitpython(self, git_repo_with_tags):
+        repo = git_repo_with_tags
+        repo.create_tag("v0.3.0", repo.head.commit, message="Annotated release")
+
+        catalog = read_tag_catalog()
+
+        assert sorted(catalog.names()) == sorted(tag.name for tag in repo.tags)
+        for tag in repo.tags:
+            entry = catalog.get(tag.name)
+            assert entry.commit == tag.commit.hexsha
+            assert entry.date == tag.commit.committed_datetime
+            assert entry.summary == tag.commit.summary
+        assert catalog.get("v0.3.0").annotated
+        assert not catalog.get("v0.1.0").annotated
+        assert [tag.name for tag in catalog.tags_at(repo.head.commit.hexsha)] == ["v0.2.1", "v0.3.0"]
+
+    def test_memoized_until_tags_change(self, git_repo_with_tags):
+        repo = git_repo_with_tags
+        first = get_tag_catalog()
+        assert get_tag_catalog() is first
+
+        repo.create_tag("v0.3.0", repo.head.commit)
+        second = get_tag_catalog()
+
+        assert second is not first
+        assert "v0.3.0" in second
+
+        repo.delete_tag(repo.tags["v0.3.0"])
+        assert "v0.3.0" not in get_tag_catalog()
+
+    def test_outside_repository(self, temp_dir):
+        with pytest.raises(git.GitCommandError):
+            get_tag_catalog(str(Path(temp_dir)))
+
+    def test_tag_helpers(self, git_repo_with_tags):
+        repo = git_repo_with_tags
+
+        assert get_all_tags() == ["v0.1.0", "v0.2.0", "v0.2.1"]
+        assert get_tag_date("v0.2.1") == repo.head.commit.committed_datetime
+        assert is_current_commit_tagged()
@@ -5,11 +5,14 @@ from unittest import mock
 
 import pytest
 
+from kittylog.tag_catalog import TagCatalog, TagRecord
 from kittylog.tag_operations import (
+    BoundaryCatalog,
     clear_git_cache,
     get_all_boundaries,
     get_all_tags,
     get_boundary_by_identifier,
+    get_boundary_catalog,
     get_current_commit_hash,
     get_latest_boundary,
     get_latest_tag,
@@ -20,6 +23,22 @@ from kittylog.tag_operations import (
 )
 
 
+def make_tag(name: str, commit: str = "abc123", date: datetime | None = None) -> TagRecord:
+    return TagRecord(
+        name=name,
+        object_hash=commit,
+        commit=commit,
+        annotated=False,
+        date=date or datetime(2023, 1, 1),
+        author="Dev",
+        message=f"Release {name}",
+    )
+
+
+def make_catalog(*tags: TagRecord) -> TagCatalog:
+    return TagCatalog(list(tags))
+
+
 class TestGetRepo:
     """Test the get_repo function."""
 
@@ -72,61 +91,36 @@ class TestGetAllTags:
 
     def test_returns_sorted_tags(self):
         """Test that get_all_tags returns sorted tags."""
-        mock_tag1 = mock.Mock()
-        mock_tag1.name = "v1.0.0"
-        mock_tag1.commit.committed_date = 1609459200  # 2021-01-01
-
-        mock_tag2 = mock.Mock()
-        mock_tag2.name = "v2.0.0"
-        mock_tag2.commit.committed_date = 1640995200  # 2022-01-01
-
-        mock_tag3 = mock.Mock()
-        mock_tag3.name = "v1.1.0"
-        mock_tag3.commit.committed_date = 1612137600  # 2021-02-01
-
-        with mock.patch("kittylog.tag_operations.get_repo") as mock_get_repo:
-            mock_repo = mock.Mock()
-            mock_repo.tags = [mock_tag2, mock_tag1, mock_tag3]  # Random order
-            mock_get_repo.return_value = mock_repo
+        catalog = make_catalog(
+            make_tag("v2.0.0", date=datetime(2022, 1, 1)),
+            make_tag("v1.0.0", date=datetime(2021, 1, 1)),
+            make_tag("v1.1.0", date=datetime(2021, 2, 1)),
+        )
 
+        with mock.patch("kittylog.tag_operations.get_tag_catalog", return_value=catalog):
             result = get_all_tags()
 
         assert result == ["v1.0.0", "v1.1.0", "v2.0.0"]
 
     def test_handles_tags_without_v_prefix(self):
         """Test handling of tags without 'v' prefix."""
-        mock_tag1 = mock.Mock()
-        mock_tag1.name = "1.0.0"
-        mock_tag1.commit.committed_date = 1609459200
-
-        mock_tag2 = mock.Mock()
-        mock_tag2.name = "2.0.0"
-        mock_tag2.commit.committed_date = 1640995200
-
-        with mock.patch("kittylog.tag_operations.get_repo") as mock_get_repo:
-            mock_repo = mock.Mock()
-            mock_repo.tags = [mock_tag2, mock_tag1]
-            mock_get_repo.return_value = mock_repo
+        catalog = make_catalog(
+            make_tag("2.0.0", date=datetime(2022, 1, 1)), make_tag("1.0.0", date=datetime(2021, 1, 1))
+        )
 
+        with mock.patch("kittylog.tag_operations.get_tag_catalog", return_value=catalog):
             result = get_all_tags()
 
         assert result == ["1.0.0", "2.0.0"]
 
     def test_falls_back_to_chronological_sorting(self):
         """Test fallback to chronological sorting when semantic version sorting fails."""
-        mock_tag1 = mock.Mock()
-        mock_tag1.name = "invalid-version"
-        mock_tag1.commit.committed_date = 1609459200
-
-        mock_tag2 = mock.Mock()
-        mock_tag2.name = "another-invalid"
-        mock_tag2.commit.committed_date = 1640995200
-
-        with mock.patch("kittylog.tag_operations.get_repo") as mock_get_repo:
-            mock_repo = mock.Mock()
-            mock_repo.tags = [mock_tag2, mock_tag1]
-            mock_get_repo.return_value = mock_repo
+        catalog = make_catalog(
+            make_tag("another-invalid", date=datetime(2022, 1, 1)),
+            make_tag("invalid-version", date=datetime(2021, 1, 1)),
+        )
 
+        with mock.patch("kittylog.tag_operations.get_tag_catalog", return_value=catalog):
             result = get_all_tags()
 
         assert result == ["another-invalid", "invalid-version"]
@@ -137,8 +131,8 @@ class TestGetAllTags:
 
         from kittylog.errors import GitError
 
-        with mock.patch("kittylog.tag_operations.get_repo") as mock_get_repo:
-            mock_get_repo.side_effect = GitCommandError("git tag --list", 1)
+        with mock.patch("kittylog.tag_operations.get_tag_catalog") as mock_catalog:
+            mock_catalog.side_effect = GitCommandError("git for-each-ref", 1)
 
             with pytest.raises(GitError, match="Failed to get tags"):
                 get_all_tags()
@@ -153,17 +147,13 @@ class TestGetCurrentCommitHash:
 
     def test_returns_commit_hash(self):
         """Test that get_current_commit_hash returns the commit hash."""
-        mock_commit = mock.Mock()
-        mock_commit.hexsha = "abc123def456"
-
-        with mock.patch("kittylog.tag_operations.get_repo") as mock_get_repo:
-            mock_repo = mock.Mock()
-            mock_repo.head.commit = mock_commit
-            mock_get_repo.return_value = mock_repo
+        with mock.patch("kittylog.tag_operations.get_object_reader") as mock_reader:
+            mock_reader.return_value.resolve.return_value = "abc123def456"
 
             result = get_current_commit_hash()
 
         assert result == "abc123def456"
+        mock_reader.return_value.resolve.assert_called_once_with("HEAD")
 
     def test_handles_git_errors(self):
         """Test handling of git errors - fixed to match actual code behavior."""
@@ -171,9 +161,9 @@ class TestGetCurrentCommitHash:
 
         from kittylog.errors import GitError
 
-        with mock.patch("kittylog.tag_operations.get_repo") as mock_get_repo:
+        with mock.patch("kittylog.tag_operations.get_object_reader") as mock_reader:
             # Simulate various git errors that can occur
-            mock_get_repo.side_effect = git.GitCommandError("git rev-parse HEAD", 1)
+            mock_reader.return_value.resolve.side_effect = git.GitCommandError("git rev-parse HEAD", 1)
 
             with pytest.raises(GitError):
                 get_current_commit_hash()
@@ -182,10 +172,8 @@ class TestGetCurrentCommitHash:
         """Test handling of missing head."""
         from kittylog.errors import GitError
 
-        with mock.patch("kittylog.tag_operations.get_repo") as mock_get_repo:
-            mock_repo = mock.Mock()
-            mock_repo.head.commit = None
-            mock_get_repo.return_value = mock_repo
+        with mock.patch("kittylog.tag_operations.get_object_reader") as mock_reader:
+            mock_reader.return_value.resolve.return_value = None
 
             with pytest.raises(GitError):
                 get_current_commit_hash()
@@ -267,43 +255,25 @@ class TestIsCurrentCommitTagged:
 
     def test_returns_true_when_tagged(self):
         """Test that is_current_commit_tagged returns True when HEAD is tagged."""
-        mock_commit = mock.Mock()
-        mock_commit.hexsha = "abc123"
-
-        mock_tag = mock.Mock()
-        mock_tag.commit = mock_commit
+        catalog = make_catalog(make_tag("v1.0.0", commit="abc123"))
 
-        with mock.patch("kittylog.tag_operations.get_repo") as mock_get_repo:
-            mock_repo = mock.Mock()
-            mock_repo.head.commit = mock_commit
-            mock_repo.tags = [mock_tag]
-            mock_get_repo.return_value = mock_repo
-
-            with mock.patch("kittylog.tag_operations.get_current_commit_hash") as mock_hash:
-                mock_hash.return_value = "abc123"
-
-                result = is_current_commit_tagged()
+        with (
+            mock.patch("kittylog.tag_operations.get_tag_catalog", return_value=catalog),
+            mock.patch("kittylog.tag_operations.get_current_commit_hash", return_value="abc123"),
+        ):
+            result = is_current_commit_tagged()
 
         assert result is True
 
     def test_returns_false_when_not_tagged(self):
         """Test that is_current_commit_tagged returns False when HEAD is not tagged."""
-        mock_commit = mock.Mock()
-        mock_commit.hexsha = "abc123"
-
-        mock_tag = mock.Mock()
-        mock_tag.commit.hexsha = "different_hash"
-
-        with mock.patch("kittylog.tag_operations.get_repo") as mock_get_repo:
-            mock_repo = mock.Mock()
-            mock_repo.head.commit = mock_commit
-            mock_repo.tags = [mock_tag]
-            mock_get_repo.return_value = mock_repo
+        catalog = make_catalog(make_tag("v1.0.0", commit="different_hash"))
 
-            with mock.patch("kittylog.tag_operations.get_current_commit_hash") as mock_hash:
-                mock_hash.return_value = "abc123"
-
-                result = is_current_commit_tagged()
+        with (
+            mock.patch("kittylog.tag_operations.get_tag_catalog", return_value=catalog),
+            mock.patch("kittylog.tag_operations.get_current_commit_hash", return_value="abc123"),
+        ):
+            result = is_current_commit_tagged()
 
         assert result is False
 
@@ -311,8 +281,11 @@ class TestIsCurrentCommitTagged:
         """Test that is_current_commit_tagged returns False on error."""
         import git
 
-        with mock.patch("kittylog.tag_operations.get_repo") as mock_get_repo:
-            mock_get_repo.side_effect = git.GitError("Git error")
+        with (
+            mock.patch("kittylog.tag_operations.get_current_commit_hash", return_value="abc123"),
+            mock.patch("kittylog.tag_operations.get_tag_catalog") as mock_catalog,
+        ):
+            mock_catalog.side_effect = git.GitError("Git error")
 
             result = is_current_commit_tagged()
 
@@ -329,26 +302,16 @@ class TestGetTagDate:
     def test_returns_tag_date(self):
         """Test that get_tag_date returns the tag date."""
         expected_date = datetime(2023, 1, 1, 12, 0, 0)
+        catalog = make_catalog(make_tag("v1.0.0", date=expected_date))
 
-        mock_tag = mock.Mock()
-        mock_tag.commit.committed_datetime = expected_date
-
-        with mock.patch("kittylog.tag_operations.get_repo") as mock_get_repo:
-            mock_repo = mock.Mock()
-            mock_repo.tags = {"v1.0.0": mock_tag}
-            mock_get_repo.return_value = mock_repo
-
+        with mock.patch("kittylog.tag_operations.get_tag_catalog", return_value=catalog):
             result = get_tag_date("v1.0.0")
 
         assert result == expected_date
 
     def test_returns_none_for_nonexistent_tag(self):
         """Test that get_tag_date returns None for nonexistent tag."""
-        with mock.patch("kittylog.tag_operations.get_repo") as mock_get_repo:
-            mock_repo = mock.Mock()
-            mock_repo.tags = {}
-            mock_get_repo.return_value = mock_repo
-
+        with mock.patch("kittylog.tag_operations.get_tag_catalog", return_value=make_catalog()):
             result = get_tag_date("nonexistent")
 
         assert result is None
@@ -364,6 +327,17 @@ class TestGetTagDate:
 
         assert result is None
 
+    def test_handles_catalog_errors(self):
+        """Test that a failing tag catalog yields no date."""
+        import git
+
+        with mock.patch("kittylog.tag_operations.get_tag_catalog") as mock_catalog:
+            mock_catalog.side_effect = git.GitError("Git error")
+
+            result = get_tag_date("v1.0.0")
+
+        assert result is None
+
 
 class TestBoundaryRetrievalExtra:
     """Additional boundary retrieval tests."""
@@ -468,6 +442,53 @@ class TestBoundaryRetrievalExtra:
         assert result == boundaries[0]
 
 
+class TestBoundaryCatalog:
+    """Test the indexed boundary catalog."""
+
+    def setup_method(self):
+        clear_git_cache()
+
+    def test_lookups(self):
+        boundaries = [
+            {"identifier": "v1.0.0", "hash": "abc123", "date": datetime(2023, 1, 1)},
+            {"identifier": "v1.0.1", "hash": "abc123", "date": datetime(2023, 1, 1)},
+            {"identifier": "v1.1.0", "hash": "def456", "date": datetime(2023, 2, 1)},
+        ]
+        catalog = BoundaryCatalog(boundaries, "tags")
+
+        assert len(catalog) == 3
+        assert "v1.1.0" in catalog and "v2.0.0" not in catalog
+        assert catalog.position("v1.1.0") == 2
+        assert catalog.get("v1.0.1") is boundaries[1]
+        assert catalog.by_hash("def456") is boundaries[2]
+        assert catalog.previous(boundaries[2]) is boundaries[1]
+        assert catalog.previous(boundaries[0]) is None
+        assert catalog.previous({"hash": "unknown"}) is None
+        assert catalog.tags_at("abc123") == ["v1.0.0", "v1.0.1"]
+        assert catalog.latest is boundaries[2]
+
+    def test_repeated_identifiers_resolve_to_first(self):
+        boundaries = [
+            {"identifier": "2023-01-01", "hash": "aaa", "date": datetime(2023, 1, 1, 9)},
+            {"identifier": "2023-01-01", "hash": "bbb", "date": datetime(2023, 1, 1, 18)},
+        ]
+        catalog = BoundaryCatalog(boundaries, "gaps")
+
+        assert catalog.get("2023-01-01") is boundaries[0]
+        assert catalog.tags_at("aaa") == []
+
+    def test_built_once_per_mode(self):
+        boundaries = [{"identifier": "v1.0.0", "hash": "abc123", "date": datetime(2023, 1, 1)}]
+
+        with mock.patch("kittylog.tag_operations.get_all_boundaries", return_value=boundaries) as mock_boundaries:
+            for _ in range(3):
+                get_boundary_by_identifier("v1.0.0", "tags")
+                get_previous_boundary(boundaries[0], "tags")
+
+            assert mock_boundaries.call_count == 1
+            assert get_boundary_catalog("tags").boundaries is boundaries
+
+
 class TestClearGitCache:
     """Test the clear_git_cache function."""
 
@@ -503,16 +524,17 @@ class TestTagOperationsIntegration:
 
     def test_complete_tag_workflow(self):
         """Test complete tag workflow."""
-        mock_tag = mock.Mock()
-        mock_tag.name = "v1.0.0"
-        mock_tag.commit.hexsha = "abc123"
-        mock_tag.commit.committed_datetime = datetime(2023, 1, 1)
+        catalog = make_catalog(make_tag("v1.0.0", commit="abc123", date=datetime(2023, 1, 1)))
 
-        with mock.patch("kittylog.tag_operations.get_repo") as mock_get_repo:
+        with (
+            mock.patch("kittylog.tag_operations.get_repo") as mock_get_repo,
+            mock.patch("kittylog.tag_operations.get_object_reader") as mock_reader,
+            mock.patch("kittylog.tag_operations.get_tag_catalog", return_value=catalog),
+        ):
             mock_repo = mock.Mock()
-            mock_repo.tags = [mock_tag]
-            mock_repo.head.commit = mock_tag.commit
+            mock_repo.head.commit.hexsha = "abc123"
             mock_get_repo.return_value = mock_repo
+            mock_reader.return_value.resolve.return_value = "abc123"
 
             # Test getting all tags
             tags = get_all_tags()
@@ -0,0 +1,156 @@
+"""Tests for tokenizer-backed token counting."""
+
+import base64
+
+import pytest
+
+from kittylog import tokenizer
+from kittylog.tokenizer import (
+    BPETokenizer,
+    HeuristicTokenizer,
+    PretokenEstimator,
+    TiktokenTokenizer,
+    count_tokens,
+    count_tokens_batch,
+    encoding_for_model,
+    get_tokenizer,
+    load_bpe_ranks,
+    token_count_cache_info,
+)
+
+# All single bytes plus a few merges, enough to exercise the merge loop
+TINY_RANKS = {bytes([i]): i for i in range(256)} | {
+    b"he": 256,
+    b"ll": 257,
+    b"hell": 258,
+    b" w": 259,
+    b"or": 260,
+    b" wor": 261,
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_tokenizers(monkeypatch, tmp_path):
+    """Isolate tokenizer selection from the environment and from other tests."""
+    monkeypatch.delenv("KITTYLOG_TOKENIZER", raising=False)
+    monkeypatch.delenv("KITTYLOG_TOKENIZER_DIR", raising=False)
+    monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(tmp_path / "tiktoken-cache"))
+    tokenizer.clear_token_count_cache()
+    yield
+    tokenizer.clear_token_count_cache()
+
+
+@pytest.fixture
+def rank_dir(tmp_path, monkeypatch):
+    """Write TINY_RANKS as a local cl100k_base rank file."""
+    lines = [f"{base64.b64encode(token).decode()} {rank}" for token, rank in TINY_RANKS.items()]
+    (tmp_path / "cl100k_base.tiktoken").write_text("\n".join(lines) + "\n")
+    monkeypatch.setenv("KITTYLOG_TOKENIZER_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestTokenizerSelection:
+    """Test model family and tokenizer resolution."""
+
+    @pytest.mark.parametrize(
+        ("model", "encoding"),
+        [
+            ("openai:gpt-4o-mini", "o200k_base"),
+            ("gpt-5", "o200k_base"),
+            ("groq:openai/gpt-oss-120b", "o200k_base"),
+            ("openai:o3-mini", "o200k_base"),
+            ("openai:gpt-4", "cl100k_base"),
+            ("anthropic:claude-3-5-haiku-latest", "cl100k_base"),
+            ("ollama:llama3", "cl100k_base"),
+        ],
+    )
+    def test_encoding_for_model(self, model, encoding):
+        assert encoding_for_model(model) == encoding
+
+    def test_offline_default_is_estimator(self):
+        assert isinstance(get_tokenizer("openai:gpt-4"), PretokenEstimator)
+
+    def test_local_ranks_use_native_encoder(self, rank_dir):
+        assert isinstance(get_tokenizer("openai:gpt-4"), TiktokenTokenizer)
+
+    def test_bpe_mode(self, rank_dir, monkeypatch):
+        monkeypatch.setenv("KITTYLOG_TOKENIZER", "bpe")
+        assert isinstance(get_tokenizer("openai:gpt-4"), BPETokenizer)
+
+    def test_heuristic_mode(self, monkeypatch):
+        monkeypatch.setenv("KITTYLOG_TOKENIZER", "heuristic")
+        assert isinstance(get_tokenizer("openai:gpt-4"), HeuristicTokenizer)
+        assert count_tokens("x" * 40, "openai:gpt-4") == 10
+
+    def test_unreadable_rank_file_falls_back(self, tmp_path, monkeypatch):
+        (tmp_path / "cl100k_base.tiktoken").write_text("not a rank file\n")
+        monkeypatch.setenv("KITTYLOG_TOKENIZER_DIR", str(tmp_path))
+        assert isinstance(get_tokenizer("openai:gpt-4"), PretokenEstimator)
+
+
+class TestBPETokenizer:
+    """Test the pure-Python BPE against tiktoken's encoder."""
+
+    def test_load_ranks(self, rank_dir):
+        assert load_bpe_ranks(rank_dir / "cl100k_base.tiktoken") == TINY_RANKS
+
+    @pytest.mark.parametrize("text", ["hello world", "hell", "", "well, hello\n\nworld 12345", "héllo"])
+    def test_matches_tiktoken(self, text):
+        bpe = BPETokenizer("cl100k_base", TINY_RANKS)
+        native = TiktokenTokenizer("cl100k_base", TINY_RANKS)
+        assert bpe.count(text) == native.count(text)
+
+    def test_merges(self):
+        bpe = BPETokenizer("cl100k_base", TINY_RANKS)
+        # "hello" -> hell + o; " world" -> " w" + or -> " wor" + l + d
+        assert bpe.count("hello world") == 5
+
+
+class TestPretokenEstimator:
+    """Test the offline estimate."""
+
+    def test_common_words_are_single_tokens(self):
+        assert PretokenEstimator("cl100k_base").count("add the new feature") == 4
+
+    def test_long_words_and_symbols_split(self):
+        estimator = PretokenEstimator("cl100k_base")
+        assert estimator.count(" internationalization") > 1
+        assert estimator.count("-->>=") > 1
+
+    def test_non_ascii(self):
+        assert PretokenEstimator("o200k_base").count("日本語のテキスト") >= 4
+
+
+class TestMemoAndBatch:
+    """Test memoization and the batched API."""
+
+    def test_long_texts_are_memoized(self):
+        text = "word " * 200
+        first = count_tokens(text, "openai:gpt-4")
+        second = count_tokens(text, "openai:gpt-4")
+
+        info = token_count_cache_info()
+        assert first == second
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_short_texts_skip_memo(self):
+        count_tokens("short", "openai:gpt-4")
+        assert token_count_cache_info().currsize == 0
+
+    def test_batch_matches_individual_counts(self):
+        texts = ["feat: add thing", "", "fix: " + "long message " * 50, "docs: readme"]
+        expected = [count_tokens(text, "openai:gpt-4") for text in texts]
+        tokenizer.clear_token_count_cache()
+
+        assert count_tokens_batch(texts, "openai:gpt-4") == expected
+        # The long message was memoized by the batch call
+        count_tokens(texts[2], "openai:gpt-4")
+        assert token_count_cache_info().hits == 1
+
+    def test_batch_uses_native_batch_encoding(self, rank_dir):
+        texts = ["hello world", "hell"]
+        assert count_tokens_batch(texts, "openai:gpt-4") == [5, 1]
+
+    def test_empty_text(self):
+        assert count_tokens("", "openai:gpt-4") == 0
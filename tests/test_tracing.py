@@ -0,0 +1,218 @@
+"""Tests for local OTLP/JSON trace export."""
+
+import asyncio
+import json
+import logging
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from kittylog.ai_utils import generate_with_retries_stream
+from kittylog.concurrency import map_in_order
+from kittylog.profiling import Phase, boundary_scope, timed
+from kittylog.providers import http_client
+from kittylog.providers.base import OpenAICompatibleProvider, ProviderConfig
+from kittylog.tracing import STATUS_ERROR, current_span, is_tracing, trace_run, trace_span
+from kittylog.utils.logging import get_logger, log_info
+
+
+class TracedTestProvider(OpenAICompatibleProvider):
+    config = ProviderConfig(name="Traced Test", api_key_env="TRACED_TEST_API_KEY", base_url="https://trace.example")
+
+
+@timed(Phase.COMMITS)
+def read_commits() -> list[str]:
+    return ["abc123"]
+
+
+def _read_spans(path) -> dict[str, dict]:
+    (line,) = path.read_text().splitlines()
+    (resource_spans,) = json.loads(line)["resourceSpans"]
+    (scope_spans,) = resource_spans["scopeSpans"]
+    return {span["name"]: span for span in scope_spans["spans"]}
+
+
+def _attributes(span: dict) -> dict:
+    return {attr["key"]: next(iter(attr["value"].values())) for attr in span.get("attributes", [])}
+
+
+SSE_BODY = b'data: {"choices": [{"delta": {"content": "traced"}}]}\n\ndata: [DONE]\n\n'
+
+
+@pytest.fixture
+def sse_transport(monkeypatch):
+    """Answer every provider request, sync or async, with a short SSE stream (or JSON when not streaming)."""
+    monkeypatch.setenv("TRACED_TEST_API_KEY", "secret")
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        if json.loads(request.content).get("stream"):
+            return httpx.Response(200, stream=httpx.ByteStream(SSE_BODY), headers={"Content-Type": "text/event-stream"})
+        return httpx.Response(200, json={"choices": [{"message": {"content": "traced"}}]})
+
+    transport = httpx.MockTransport(respond)
+    http_client.close_clients()
+    with (
+        patch.object(http_client, "_create_client", lambda key, settings: httpx.Client(transport=transport)),
+        patch.object(http_client, "_create_async_client", lambda key, settings: httpx.AsyncClient(transport=transport)),
+    ):
+        yield
+    http_client.close_clients()
+
+
+class TestTraceRun:
+    """Test span recording and export."""
+
+    def test_disabled_by_default(self):
+        """Test that spans are no-ops outside a traced run."""
+        assert not is_tracing()
+        with trace_span("ignored") as span:
+            assert span is None
+        assert current_span() is None
+
+    def test_span_tree_is_written_as_otlp_json(self, tmp_path):
+        """Test that children are parented to the root span and the trace is appended as one line."""
+        path = tmp_path / "trace.jsonl"
+
+        with trace_run(path, "kittylog update", **{"kittylog.dry_run": True}):
+            read_commits()
+            with boundary_scope("v1.0.0"):
+                log_info(get_logger(__name__), "Generating changelog entry", tag="v1.0.0", commit_count=3)
+
+        spans = _read_spans(path)
+        root = spans["kittylog update"]
+        assert "parentSpanId" not in root
+        assert _attributes(root) == {"kittylog.dry_run": True}
+        assert spans["read_commits"]["parentSpanId"] == root["spanId"]
+        assert _attributes(spans["read_commits"])["kittylog.phase"] == Phase.COMMITS
+        entry = spans["generate_entry"]
+        (event,) = entry["events"]
+        assert event["name"] == "Generating changelog entry"
+        assert _attributes(event) == {"log.severity": "INFO", "tag": "v1.0.0", "commit_count": "3"}
+        assert {span["traceId"] for span in spans.values()} == {root["traceId"]}
+        assert not is_tracing()
+
+    def test_errors_mark_span_status(self, tmp_path):
+        """Test that an exception is recorded on the span and the trace is still written."""
+        path = tmp_path / "trace.jsonl"
+
+        with pytest.raises(ValueError), trace_run(path, "kittylog update"), trace_span("write"):
+            raise ValueError("disk full")
+
+        spans = _read_spans(path)
+        assert spans["write"]["status"] == {"code": STATUS_ERROR, "message": "ValueError: disk full"}
+        assert spans["write"]["events"][0]["name"] == "exception"
+
+    def test_joins_traceparent(self, tmp_path, monkeypatch):
+        """Test that a W3C trace context from the pipeline becomes the parent of the run."""
+        trace_id, parent_id = "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"
+        monkeypatch.setenv("TRACEPARENT", f"00-{trace_id}-{parent_id}-01")
+        path = tmp_path / "trace.jsonl"
+
+        with trace_run(path, "kittylog update"):
+            pass
+
+        root = _read_spans(path)["kittylog update"]
+        assert (root["traceId"], root["parentSpanId"]) == (trace_id, parent_id)
+
+    def test_worker_threads_inherit_parent(self, tmp_path):
+        """Test that spans in concurrent entry generation are parented to the span that started them."""
+        path = tmp_path / "trace.jsonl"
+
+        def generate(tag: str) -> list[str]:
+            with boundary_scope(tag):
+                return read_commits()
+
+        with trace_run(path, "kittylog update"):
+            for _tag, future in map_in_order(generate, ["v1.0.0", "v1.1.0"], jobs=2):
+                future.result()
+
+        (line,) = path.read_text().splitlines()
+        spans = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        entries = {
+            span["spanId"]: _attributes(span)["kittylog.boundary"] for span in spans if span["name"] == "generate_entry"
+        }
+        reads = [span for span in spans if span["name"] == "read_commits"]
+        assert sorted(entries.values()) == ["v1.0.0", "v1.1.0"]
+        assert {entries[span["parentSpanId"]] for span in reads} == {"v1.0.0", "v1.1.0"}
+
+
+class TestProviderRequests:
+    """Test that provider HTTP requests are recorded as client spans."""
+
+    def test_request_span_has_status_and_sizes(self, tmp_path, monkeypatch):
+        """Test the HTTP attributes, without the query string."""
+        monkeypatch.setenv("TRACED_TEST_API_KEY", "secret")
+        url = "https://trace.example/v1/chat/completions?key=secret"
+        body = {"choices": [{"message": {"content": "traced"}}]}
+        response = httpx.Response(200, json=body, request=httpx.Request("POST", url, json={"model": "m"}))
+        path = tmp_path / "trace.jsonl"
+
+        provider = TracedTestProvider(TracedTestProvider.config)
+        with (
+            patch("kittylog.providers.http_client.post", return_value=response),
+            trace_run(path, "kittylog update"),
+        ):
+            provider._make_http_request(url, {"model": "m"}, {})
+
+        span = _read_spans(path)["POST"]
+        attributes = _attributes(span)
+        assert span["kind"] == 3
+        assert attributes["url.full"] == "https://trace.example/v1/chat/completions"
+        assert attributes["http.response.status_code"] == "200"
+        assert int(attributes["http.response.body.size"]) == len(response.content)
+        assert int(attributes["http.request.body.size"]) > 0
+        assert attributes["kittylog.provider"] == "Traced Test"
+
+    def test_streamed_request_span(self, tmp_path, sse_transport):
+        """Test that a streamed request is a client span sized by the bytes streamed, under its LLM attempt."""
+        path = tmp_path / "trace.jsonl"
+        provider = TracedTestProvider(TracedTestProvider.config)
+
+        with trace_run(path, "kittylog update"):
+            chunks = list(
+                generate_with_retries_stream(
+                    {"openai": provider.generate_stream}, "openai:m", "s", "u", 0.7, 100, 3, quiet=True
+                )
+            )
+
+        spans = _read_spans(path)
+        attributes = _attributes(spans["POST"])
+        assert chunks[0] == ("traced", None)
+        assert spans["POST"]["parentSpanId"] == spans["llm_attempt"]["spanId"]
+        assert attributes["http.response.status_code"] == "200"
+        assert int(attributes["http.response.body.size"]) == len(SSE_BODY)
+        assert _attributes(spans["llm_attempt"])["gen_ai.request.model"] == "m"
+
+    def test_async_request_spans(self, tmp_path, sse_transport):
+        """Test that async requests, streamed or not, are recorded as client spans too."""
+        path = tmp_path / "trace.jsonl"
+        provider = TracedTestProvider(TracedTestProvider.config)
+        messages = [{"role": "user", "content": "u"}]
+
+        async def run() -> None:
+            await provider.agenerate("m", messages)
+            async for _chunk in provider.agenerate_stream("m", messages):
+                pass
+            await http_client.aclose_clients()
+
+        with trace_run(path, "kittylog update"):
+            asyncio.run(run())
+
+        (line,) = path.read_text().splitlines()
+        spans = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        requests = [_attributes(span) for span in spans if span["name"] == "POST"]
+        assert len(requests) == 2
+        assert all(attributes["http.response.status_code"] == "200" for attributes in requests)
+        assert int(requests[0]["http.response.body.size"]) > 0
+        assert int(requests[1]["http.response.body.size"]) == len(SSE_BODY)
+
+
+def test_unwritable_trace_file_does_not_fail_the_run(tmp_path, caplog):
+    """Test that a trace that cannot be written is only logged."""
+    (tmp_path / "blocked").write_text("a file, not a directory")
+
+    with caplog.at_level(logging.WARNING), trace_run(tmp_path / "blocked" / "trace.jsonl", "kittylog update"):
+        pass
+
+    assert "Failed to write trace" in caplog.text
@@ -15,25 +15,23 @@ from kittylog.utils import (
 
 
 class TestCountTokens:
-    """Test count_tokens function with character-based estimation."""
+    """Test count_tokens with the offline tokenizer."""
 
     def test_count_tokens_success(self):
         """Test token counting with GPT model."""
-        # Implementation uses len(text) // chars_per_token, max(1, ...)
-        # For GPT models, chars_per_token = 4
-        text = "test text here"  # 14 characters -> 14 // 4 = 3
+        # One token per common word
+        text = "test text here"
         count = count_tokens(text, "gpt-4")
-        assert count == max(1, len(text) // 4)
+        assert count == 3
 
     def test_count_tokens_fallback_encoding(self):
         """Test token counting with different model types."""
-        text = "test text here"  # 14 characters
-        # Claude model uses chars_per_token = 3.5 -> 14 // 3.5 = 4
+        text = "test text here"
+        # Non-OpenAI families are counted with cl100k_base as a proxy
         count_claude = count_tokens(text, "claude-3-opus")
         count_gpt = count_tokens(text, "gpt-4")
 
-        # Claude should have slightly higher count due to smaller chars_per_token
-        assert count_claude >= count_gpt
+        assert count_claude == count_gpt
 
     def test_count_tokens_error_handling(self):
         """Test token counting returns minimum of 1."""
@@ -416,9 +414,8 @@ class TestUtilsIntegration:
 
         token_count = count_tokens(changelog_content, "gpt-4")
 
-        # Simple character-based estimation: len(text) // 4 for GPT models
-        expected_count = max(1, len(changelog_content) // 4)
-        assert token_count == expected_count
+        # Roughly one token per word or symbol; never more than one per character
+        assert len(changelog_content.split()) <= token_count < len(changelog_content)
 
     def test_version_handling_pipeline(self):
         """Test complete version handling pipeline."""